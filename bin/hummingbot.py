@@ -23,6 +23,7 @@ from hummingbot import (
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.stdout_redirection import patch_stdout
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.import_profiler import ImportProfiler
 
 
 def detect_available_port(starting_port: int) -> int:
@@ -56,6 +57,10 @@ async def main():
         init_logging("hummingbot_logs.yml",
                      override_log_level=global_config_map.get("log_level").value,
                      dev_mode=dev_mode)
+        import_profiler: ImportProfiler = ImportProfiler.get_instance()
+        if import_profiler.started:
+            import_profiler.stop()
+            hb.app.log(f"Import time profile:\n{import_profiler.report()}")
         tasks: List[Coroutine] = [hb.run()]
         if global_config_map.get("debug_console").value:
             if not hasattr(__builtins__, "help"):
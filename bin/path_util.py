@@ -14,3 +14,9 @@ else:
     from os.path import join, realpath
     import sys
     sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import os
+if os.environ.get("HUMMINGBOT_PROFILE_IMPORTS"):
+    # Times the imports of the startup, its report is logged once the application is created
+    from hummingbot.core.utils.import_profiler import ImportProfiler
+    ImportProfiler.get_instance().start()
@@ -21,6 +21,7 @@ from .trades_command import TradesCommand
 from .pnl_command import PnlCommand
 from .script_command import ScriptCommand
 from .rate_command import RateCommand
+from .ticks_command import TicksCommand
 
 
 __all__ = [
@@ -47,4 +48,5 @@ __all__ = [
     PnlCommand,
     ScriptCommand,
     RateCommand,
+    TicksCommand,
 ]
@@ -2,6 +2,7 @@
 
 import asyncio
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -27,8 +28,13 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            # Commits the trade history still queued for the database
+            self.markets_recorder.stop()
+
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
 
+        await HttpClientRegistry.shared_instance().close()
         self.app.exit()
@@ -92,6 +92,9 @@ class ExportCommand:
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        if self.markets_recorder is not None:
+            # Commits the fills still queued by the recorder
+            self.markets_recorder.flush()
         session: Session = self.trade_fill_db.get_shared_session()
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
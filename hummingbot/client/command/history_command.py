@@ -3,6 +3,7 @@ import pandas as pd
 import threading
 import time
 from typing import (
+    Dict,
     Set,
     Tuple,
     TYPE_CHECKING,
@@ -21,6 +22,7 @@ from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import PerformanceTracker
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -50,9 +52,14 @@ class HistoryCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        trades: Optional[List[TradeFill]] = None
+        tracker: Optional[PerformanceTracker] = self.get_performance_tracker()
+        if tracker is not None:
+            trade_count: int = tracker.trade_count(int(start_time * 1e3))
+        else:
+            trades = self._get_trades_from_session(int(start_time * 1e3), config_file_path=self.strategy_file_name)
+            trade_count = len(trades)
+        if trade_count == 0:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
@@ -62,17 +69,26 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance of each market traded since the start time, from the trades if given, or else from
+        the performance tracker of the markets recorder.
+        """
+        start_timestamp: int = int(start_time * 1e3)
+        if trades is None and self.get_performance_tracker() is None:
+            trades = self._get_trades_from_session(start_timestamp, config_file_path=self.strategy_file_name)
+        if trades is not None:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        else:
+            market_info = set(self.get_performance_tracker().markets(start_timestamp))
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             cur_balances = await self.get_current_balances(market)
-            perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+            perf = await self.market_performance(market, symbol, start_timestamp, cur_balances, trades)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -81,6 +97,31 @@ class HistoryCommand:
             self._notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def get_performance_tracker(self,  # type: HummingbotApplication
+                                ) -> Optional[PerformanceTracker]:
+        if self.markets_recorder is not None and self.markets_recorder.config_file_path == self.strategy_file_name:
+            return self.markets_recorder.performance_tracker
+        return None
+
+    async def market_performance(self,  # type: HummingbotApplication
+                                 market: str,
+                                 symbol: str,
+                                 start_timestamp: int,
+                                 current_balances: Dict[str, Decimal],
+                                 trades: Optional[List[TradeFill]] = None) -> PerformanceMetrics:
+        """
+        Performance of a market since the start timestamp, in milliseconds. Without trades, it comes from the
+        aggregates of the performance tracker, unless derivative positions were traded, which need the trades.
+        """
+        tracker: Optional[PerformanceTracker] = self.get_performance_tracker()
+        if trades is None and tracker is not None and not tracker.has_positions(market, symbol):
+            aggregates = tracker.aggregates(market, symbol, start_timestamp)
+            return await PerformanceMetrics.create_from_aggregates(market, symbol, aggregates, current_balances)
+        if trades is None:
+            trades = self._get_trades_from_session(start_timestamp, config_file_path=self.strategy_file_name)
+        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        return await PerformanceMetrics.create(market, symbol, cur_trades, current_balances)
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -198,9 +239,7 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(start_time, None, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -13,6 +13,7 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_mode import TickOverrunPolicy
 from hummingbot import init_logging
 from hummingbot.client.config.config_helpers import (
     get_strategy_starter_file,
@@ -67,11 +68,16 @@ class StartCommand:
             if not (await self.confirm_oracle_conversion_rate()):
                 self._notify("The strategy failed to start.")
                 return
-            else:
-                RateOracle.get_instance().start()
         is_valid = await self.status_check_all(notify_success=False)
         if not is_valid:
             return
+        if settings.required_rate_oracle:
+            # Subscribed once the start checks passed, stop unsubscribes the same pairs
+            if len(self._rate_oracle_pairs) > 0:
+                RateOracle.get_instance().unsubscribe(self._rate_oracle_pairs)
+            self._rate_oracle_pairs = list(settings.rate_oracle_pairs)
+            RateOracle.get_instance().subscribe(self._rate_oracle_pairs)
+            RateOracle.get_instance().start()
         if self._last_started_strategy_file != self.strategy_file_name:
             init_logging("hummingbot_logs.yml",
                          override_log_level=log_level.upper() if log_level else None,
@@ -118,7 +124,9 @@ class StartCommand:
         try:
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            tick_overrun_policy = TickOverrunPolicy[global_config_map["tick_overrun_policy"].value or
+                                                    TickOverrunPolicy.SKIP.name]
+            self.clock = Clock(ClockMode.REALTIME, tick_overrun_policy=tick_overrun_policy)
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
             for market in self.markets.values():
@@ -143,7 +151,7 @@ class StartCommand:
                 else:
                     self._script_iterator = ScriptIterator(script_file, list(self.markets.values()),
                                                            self.strategy, 0.1)
-                    self.clock.add_iterator(self._script_iterator)
+                    self.clock.add_iterator(self._script_iterator, low_priority=True)
                     self._notify(f"Script ({script_file}) started.")
 
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
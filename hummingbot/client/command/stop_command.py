@@ -45,6 +45,9 @@ class StopCommand:
         if self.strategy_task is not None and not self.strategy_task.cancelled():
             self.strategy_task.cancel()
 
+        if len(self._rate_oracle_pairs) > 0:
+            RateOracle.get_instance().unsubscribe(self._rate_oracle_pairs)
+            self._rate_oracle_pairs = []
         if RateOracle.get_instance().started:
             RateOracle.get_instance().stop()
 
@@ -0,0 +1,29 @@
+from typing import TYPE_CHECKING
+
+from hummingbot.core.clock_tick_stats import ClockTickStats
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class TicksCommand:
+    def ticks(self,  # type: HummingbotApplication
+              histogram: bool = False):
+        if self.clock is None:
+            self._notify("\n This command can only be used while a strategy is running")
+            return
+        stats: ClockTickStats = self.clock.tick_stats
+        lines = [
+            f"\n  Tick size: {stats.tick_size:g}s  Overrun policy: {self.clock.tick_overrun_policy.name}",
+            f"  Ticks: {stats.ticks}  Overruns: {stats.overrun_ticks}  Skipped: {stats.skipped_ticks}  "
+            f"Caught up: {stats.caught_up_ticks}  Degraded: {stats.degraded_ticks}",
+        ]
+        if stats.ticks == 0:
+            lines.append("\n  No ticks recorded yet.")
+        else:
+            summary: str = stats.summary_df().to_string(index=False, float_format="%.2f")
+            lines.extend(["", "  Durations:"] + ["    " + line for line in summary.split("\n")])
+            if histogram:
+                histogram_str: str = stats.histogram_df().to_string(index=False)
+                lines.extend(["", "  Histogram:"] + ["    " + line for line in histogram_str.split("\n")])
+        self._notify("\n".join(lines))
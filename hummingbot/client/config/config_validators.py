@@ -75,10 +75,12 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
     """
     Since trading pair validation and autocomplete are UI optimizations that do not impact bot performances,
     in case of network issues or slow wifi, this check returns true and does not prevent users from proceeding,
+    as it does when the trading pairs of the market only come from the cache (they are refreshed then).
     """
     from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
     trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
-    if trading_pair_fetcher.ready:
+    trading_pair_fetcher.refresh(market)
+    if trading_pair_fetcher.ready and trading_pair_fetcher.is_fetched(market):
         trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
         if len(trading_pairs) == 0:
             return None
@@ -7,9 +7,12 @@ import hummingbot.client.settings as settings
 from hummingbot.client.config.config_methods import paper_trade_disabled, using_exchange as using_exchange_pointer
 from hummingbot.client.config.config_validators import (
     validate_bool,
-    validate_decimal
+    validate_decimal,
+    validate_int,
 )
 from hummingbot.core.rate_oracle.rate_oracle import RateOracleSource, RateOracle
+from hummingbot.core.clock_mode import TickOverrunPolicy
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
 
 
 def generate_client_id() -> str:
@@ -54,6 +57,27 @@ def rate_oracle_source_on_validated(value: str):
     RateOracle.source = RateOracleSource[value]
 
 
+def validate_tick_overrun_policy(value: str) -> Optional[str]:
+    if value not in (p.name for p in TickOverrunPolicy):
+        return f"Invalid policy, please choose value from {','.join(p.name for p in TickOverrunPolicy)}"
+
+
+def http_pool_limit_on_validated(value: str):
+    HttpClientRegistry.shared_instance().configure(limit=int(value))
+
+
+def http_pool_limit_per_host_on_validated(value: str):
+    HttpClientRegistry.shared_instance().configure(limit_per_host=int(value))
+
+
+def http_dns_cache_ttl_on_validated(value: str):
+    HttpClientRegistry.shared_instance().configure(ttl_dns_cache=int(value))
+
+
+def http_keepalive_timeout_on_validated(value: str):
+    HttpClientRegistry.shared_instance().configure(keepalive_timeout=float(value))
+
+
 def global_token_on_validated(value: str):
     RateOracle.global_token = value.upper()
 
@@ -352,6 +376,85 @@ main_config_map = {
                   required_if=lambda: False,
                   on_validated=global_token_symbol_on_validated,
                   default="$"),
+    "tick_overrun_policy":
+        ConfigVar(key="tick_overrun_policy",
+                  prompt=f"What should the clock do with the ticks missed while a tick runs late? "
+                         f"({','.join(p.name for p in TickOverrunPolicy)}) >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=validate_tick_overrun_policy,
+                  default=TickOverrunPolicy.SKIP.name),
+    "event_log_max_events":
+        ConfigVar(key="event_log_max_events",
+                  prompt="How many market events should each connector keep in memory? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  default=100000),
+    "event_log_max_age":
+        ConfigVar(key="event_log_max_age",
+                  prompt="For how many seconds should each connector keep market events in memory "
+                         "(leave empty to keep them regardless of age)? >>> ",
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=Decimal(0), inclusive=False),
+                  default=None),
+    "trade_fill_index_max_entries":
+        ConfigVar(key="trade_fill_index_max_entries",
+                  prompt="How many recorded trade fills and exchange order ids should each connector keep in memory "
+                         "to detect duplicated fills? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  default=100000),
+    "db_write_batch_interval":
+        ConfigVar(key="db_write_batch_interval",
+                  prompt="For how many seconds at most should trade history records be queued before they are "
+                         "written to the database? >>> ",
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=Decimal(0), inclusive=False),
+                  default=0.5),
+    "db_write_batch_size":
+        ConfigVar(key="db_write_batch_size",
+                  prompt="How many trade history records at most should be written to the database at once? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  default=500),
+    "http_pool_limit":
+        ConfigVar(key="http_pool_limit",
+                  prompt="How many HTTP connections at most should the shared connection pool keep open? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  on_validated=http_pool_limit_on_validated,
+                  default=HttpClientRegistry.DEFAULT_LIMIT),
+    "http_pool_limit_per_host":
+        ConfigVar(key="http_pool_limit_per_host",
+                  prompt="How many HTTP connections at most should the shared connection pool keep open to each "
+                         "host? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  on_validated=http_pool_limit_per_host_on_validated,
+                  default=HttpClientRegistry.DEFAULT_LIMIT_PER_HOST),
+    "http_dns_cache_ttl":
+        ConfigVar(key="http_dns_cache_ttl",
+                  prompt="For how many seconds should resolved host names be cached? >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0),
+                  on_validated=http_dns_cache_ttl_on_validated,
+                  default=HttpClientRegistry.DEFAULT_TTL_DNS_CACHE),
+    "http_keepalive_timeout":
+        ConfigVar(key="http_keepalive_timeout",
+                  prompt="For how many seconds should idle HTTP connections be kept open? >>> ",
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=Decimal(0), inclusive=False),
+                  on_validated=http_keepalive_timeout_on_validated,
+                  default=HttpClientRegistry.DEFAULT_KEEPALIVE_TIMEOUT),
 }
 
 global_config_map = {**key_config_map, **main_config_map}
@@ -93,6 +93,8 @@ class HummingbotApplication(*commands):
         self._app_warnings: Deque[ApplicationWarning] = deque()
         self._trading_required: bool = True
         self._last_started_strategy_file: Optional[str] = None
+        # Trading pairs the running strategy subscribed to on the rate oracle
+        self._rate_oracle_pairs: List[str] = []
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
@@ -279,6 +281,8 @@ class HummingbotApplication(*commands):
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
+            # The connector is imported now, its cached trading pairs can be refreshed
+            TradingPairFetcher.get_instance().refresh(connector_name)
 
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
@@ -5,12 +5,16 @@ from typing import (
     Optional,
     List,
     Any,
-    Tuple
+    Tuple,
+    TYPE_CHECKING,
 )
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.core.utils.market_price import get_last_price
 from hummingbot.core.event.events import TradeType
 
+if TYPE_CHECKING:
+    from hummingbot.client.performance_accumulator import PerformanceAggregates
+
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
@@ -63,6 +67,19 @@ class PerformanceMetrics:
         await performance._initialize_metrics(exchange, trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_aggregates(cls, exchange: str,
+                                     trading_pair: str,
+                                     aggregates: 'PerformanceAggregates',
+                                     current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Same metrics as create(), from the aggregates of the trades instead of the trades. Derivative positions aren't
+        paired, so their PnL needs the trades.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_aggregates(exchange, trading_pair, aggregates, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -182,6 +199,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount * trade.price))
 
+        self._calculate_totals_and_averages()
+
+        return buys, sells
+
+    def _calculate_totals_and_averages(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -192,8 +214,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, exchange: str, quote: str, trades: List[Any]):
         for trade in trades:
             if self._is_trade_fill(trade):
@@ -215,6 +235,9 @@ class PerformanceMetrics:
                         self.fees[flat_fee[0]] = s_decimal_0
                     self.fees[flat_fee[0]] += flat_fee[1]
 
+        await self._convert_fees(exchange, quote)
+
+    async def _convert_fees(self, exchange: str, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -265,15 +288,56 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(exchange, trading_pair, current_balances,
+                                                  Decimal(str(trades[0].price)), Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(exchange, quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_aggregates(self,
+                                                  exchange: str,
+                                                  trading_pair: str,
+                                                  aggregates: 'PerformanceAggregates',
+                                                  current_balances: Dict[str, Decimal]):
+        _, quote = trading_pair.split("-")
+        self.num_buys = aggregates.num_buys
+        self.num_sells = aggregates.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = aggregates.b_vol_base
+        self.b_vol_quote = aggregates.b_vol_quote
+        self.s_vol_base = aggregates.s_vol_base
+        self.s_vol_quote = aggregates.s_vol_quote
+        self._calculate_totals_and_averages()
+
+        await self._calculate_balances_and_values(exchange, trading_pair, current_balances,
+                                                  aggregates.start_price, aggregates.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        self.fees = dict(aggregates.fees)
+        await self._convert_fees(exchange, quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             exchange: str,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal):
+        base, quote = trading_pair.split("-")
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -281,9 +345,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(exchange, quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -0,0 +1,433 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import (
+    dataclass,
+    field,
+)
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+from sqlalchemy import (
+    and_,
+    select,
+)
+
+from hummingbot import data_path
+from hummingbot.core.event.events import TradeType
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+BUY = 1
+SELL = -1
+
+
+@dataclass
+class PerformanceAggregates:
+    """
+    What PerformanceMetrics needs from the trades of one market, for trades without derivative positions.
+    """
+    num_buys: int = 0
+    num_sells: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+    start_price: Decimal = s_decimal_0
+    last_price: Decimal = s_decimal_0
+
+
+def _to_decimal(value: float) -> Decimal:
+    return Decimal(str(float(value)))
+
+
+class PerformanceAccumulator:
+    """
+    Trades of one market in timestamp order, in NumPy columns, with cumulative sums of the volumes, trade counts and
+    percent fees. The aggregates of any time window are differences of two cumulative sums, found by binary search.
+    Trades are appended in O(1) amortized time. A trade older than the latest one is inserted in place, and the
+    cumulative sums after it are recomputed, vectorized, on the next query.
+    """
+    COLUMNS: Tuple[Tuple[str, Any], ...] = (("trade_ids", np.int64),
+                                            ("timestamps", np.int64),
+                                            ("sides", np.int8),
+                                            ("amounts", np.float64),
+                                            ("prices", np.float64),
+                                            ("percent_fees", np.float64))
+    CUMULATIVE_COLUMNS: Tuple[Tuple[str, Any], ...] = (("num_buys", np.int64),
+                                                       ("num_sells", np.int64),
+                                                       ("b_vol_base", np.float64),
+                                                       ("b_vol_quote", np.float64),
+                                                       ("s_vol_base", np.float64),
+                                                       ("s_vol_quote", np.float64),
+                                                       ("percent_fees", np.float64))
+
+    def __init__(self, market: str, trading_pair: str):
+        self._market: str = market
+        self._trading_pair: str = trading_pair
+        self._size: int = 0
+        self._columns: Dict[str, np.ndarray] = {name: np.empty(0, dtype) for name, dtype in self.COLUMNS}
+        # Cumulative sums have a leading 0, the sum of the trades before index i is at index i.
+        self._cumulative: Dict[str, np.ndarray] = {name: np.zeros(1, dtype) for name, dtype in self.CUMULATIVE_COLUMNS}
+        # Number of trades the cumulative sums are up to date with
+        self._cumulative_size: int = 0
+        # (timestamp, asset, amount)
+        self._flat_fees: List[Tuple[int, str, float]] = []
+        self._has_positions: bool = False
+
+    @property
+    def market(self) -> str:
+        return self._market
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def has_positions(self) -> bool:
+        """
+        True once a trade opened or closed a derivative position, whose PnL the aggregates can't tell.
+        """
+        return self._has_positions
+
+    @property
+    def last_trade_id(self) -> int:
+        return int(self._columns["trade_ids"][:self._size].max()) if self._size > 0 else 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_trades(self,
+                   trade_ids: Iterable[int],
+                   timestamps: Iterable[int],
+                   sides: Iterable[int],
+                   amounts: Iterable[float],
+                   prices: Iterable[float],
+                   percent_fees: Iterable[float],
+                   flat_fees: Iterable[Tuple[int, str, float]] = (),
+                   has_positions: bool = False):
+        """
+        Adds trades given as columns. percent_fees holds the fee paid in the quote asset, price * amount * percent.
+        """
+        new_columns = {
+            "trade_ids": np.asarray(trade_ids, dtype=np.int64),
+            "timestamps": np.asarray(timestamps, dtype=np.int64),
+            "sides": np.asarray(sides, dtype=np.int8),
+            "amounts": np.asarray(amounts, dtype=np.float64),
+            "prices": np.asarray(prices, dtype=np.float64),
+            "percent_fees": np.asarray(percent_fees, dtype=np.float64),
+        }
+        count: int = len(new_columns["trade_ids"])
+        self._flat_fees.extend(flat_fees)
+        self._has_positions = self._has_positions or has_positions
+        if count == 0:
+            return
+        self._reserve(self._size + count)
+        for name, _ in self.COLUMNS:
+            self._columns[name][self._size:self._size + count] = new_columns[name]
+        old_size: int = self._size
+        self._size += count
+
+        timestamps: np.ndarray = self._columns["timestamps"][:self._size]
+        in_order: bool = bool(np.all(timestamps[old_size + 1:] >= timestamps[old_size:-1])) and (
+            old_size == 0 or timestamps[old_size] >= timestamps[old_size - 1])
+        if not in_order:
+            order: np.ndarray = np.lexsort((self._columns["trade_ids"][:self._size], timestamps))
+            for name, _ in self.COLUMNS:
+                self._columns[name][:self._size] = self._columns[name][:self._size][order]
+            first_moved: int = int(np.argmax(order != np.arange(self._size)))
+            self._cumulative_size = min(self._cumulative_size, first_moved)
+
+    def add_trade_fill(self, trade: TradeFill):
+        side, percent_fee, flat_fees = self.trade_fill_values(trade)
+        self.add_trades([trade.id], [trade.timestamp], [side], [trade.amount], [trade.price], [percent_fee],
+                        flat_fees, trade.position not in (None, "NILL"))
+
+    @staticmethod
+    def trade_fill_values(trade: Any) -> Tuple[int, float, List[Tuple[int, str, float]]]:
+        """
+        Side, percent fee in the quote asset and flat fees of a trade fill, as PerformanceMetrics counts them.
+        """
+        trade_type: str = trade.trade_type.upper()
+        side: int = BUY if trade_type == TradeType.BUY.name else SELL if trade_type == TradeType.SELL.name else 0
+        trade_fee: Dict[str, Any] = trade.trade_fee
+        if isinstance(trade_fee, str):
+            trade_fee = json.loads(trade_fee)
+        percent: Optional[float] = trade_fee.get("percent")
+        percent_fee: float = trade.price * trade.amount * percent if percent is not None and percent > 0 else 0.0
+        flat_fees = [(trade.timestamp, flat_fee["asset"], float(flat_fee["amount"]))
+                     for flat_fee in trade_fee.get("flat_fees", [])]
+        return side, percent_fee, flat_fees
+
+    def aggregates(self, start_timestamp: int = 0, end_timestamp: Optional[int] = None) -> Optional[PerformanceAggregates]:
+        """
+        Aggregates of the trades from start_timestamp (included) to end_timestamp (excluded), both in milliseconds, or
+        None if there are none.
+        """
+        start, end = self._window(start_timestamp, end_timestamp)
+        if start >= end:
+            return None
+        self._update_cumulative()
+        cumulative: Dict[str, np.ndarray] = self._cumulative
+        quote: str = self._trading_pair.split("-")[1]
+        fees: Dict[str, Decimal] = {}
+        percent_fees: float = cumulative["percent_fees"][end] - cumulative["percent_fees"][start]
+        if percent_fees > 0:
+            fees[quote] = _to_decimal(percent_fees)
+        end_time: float = end_timestamp if end_timestamp is not None else float("inf")
+        for timestamp, asset, amount in self._flat_fees:
+            if start_timestamp <= timestamp < end_time:
+                fees[asset] = fees.get(asset, s_decimal_0) + Decimal(amount)
+        return PerformanceAggregates(
+            num_buys=int(cumulative["num_buys"][end] - cumulative["num_buys"][start]),
+            num_sells=int(cumulative["num_sells"][end] - cumulative["num_sells"][start]),
+            b_vol_base=_to_decimal(cumulative["b_vol_base"][end] - cumulative["b_vol_base"][start]),
+            b_vol_quote=_to_decimal(cumulative["b_vol_quote"][end] - cumulative["b_vol_quote"][start]),
+            s_vol_base=_to_decimal(cumulative["s_vol_base"][end] - cumulative["s_vol_base"][start]),
+            s_vol_quote=_to_decimal(cumulative["s_vol_quote"][end] - cumulative["s_vol_quote"][start]),
+            fees=fees,
+            start_price=_to_decimal(self._columns["prices"][start]),
+            last_price=_to_decimal(self._columns["prices"][end - 1]),
+        )
+
+    def trade_count(self, start_timestamp: int = 0, end_timestamp: Optional[int] = None) -> int:
+        start, end = self._window(start_timestamp, end_timestamp)
+        return max(end - start, 0)
+
+    def _window(self, start_timestamp: int, end_timestamp: Optional[int]) -> Tuple[int, int]:
+        timestamps: np.ndarray = self._columns["timestamps"][:self._size]
+        start: int = int(np.searchsorted(timestamps, start_timestamp, side="left"))
+        end: int = (self._size if end_timestamp is None
+                    else int(np.searchsorted(timestamps, end_timestamp, side="left")))
+        return start, end
+
+    def _reserve(self, size: int):
+        capacity: int = len(self._columns["trade_ids"])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 1024)
+        for name, dtype in self.COLUMNS:
+            column: np.ndarray = np.empty(capacity, dtype)
+            column[:self._size] = self._columns[name][:self._size]
+            self._columns[name] = column
+
+    def _update_cumulative(self):
+        start: int = self._cumulative_size
+        if start == self._size:
+            return
+        sides: np.ndarray = self._columns["sides"][start:self._size]
+        amounts: np.ndarray = self._columns["amounts"][start:self._size]
+        quote_amounts: np.ndarray = amounts * self._columns["prices"][start:self._size]
+        is_buy: np.ndarray = sides == BUY
+        is_sell: np.ndarray = sides == SELL
+        increments: Dict[str, np.ndarray] = {
+            "num_buys": is_buy.astype(np.int64),
+            "num_sells": is_sell.astype(np.int64),
+            "b_vol_base": np.where(is_buy, amounts, 0.0),
+            "b_vol_quote": np.where(is_buy, -quote_amounts, 0.0),
+            "s_vol_base": np.where(is_sell, -amounts, 0.0),
+            "s_vol_quote": np.where(is_sell, quote_amounts, 0.0),
+            "percent_fees": self._columns["percent_fees"][start:self._size],
+        }
+        for name, dtype in self.CUMULATIVE_COLUMNS:
+            cumulative: np.ndarray = np.empty(self._size + 1, dtype)
+            cumulative[:start + 1] = self._cumulative[name][:start + 1]
+            cumulative[start + 1:] = cumulative[start] + np.cumsum(increments[name])
+            self._cumulative[name] = cumulative
+        self._cumulative_size = self._size
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        arrays: Dict[str, np.ndarray] = {f"{prefix}{name}": self._columns[name][:self._size]
+                                         for name, _ in self.COLUMNS}
+        arrays[f"{prefix}flat_fees"] = np.array(json.dumps(self._flat_fees))
+        arrays[f"{prefix}has_positions"] = np.array(self._has_positions)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, market: str, trading_pair: str, arrays: Any, prefix: str) -> "PerformanceAccumulator":
+        accumulator: PerformanceAccumulator = cls(market, trading_pair)
+        accumulator.add_trades(*(arrays[f"{prefix}{name}"] for name, _ in cls.COLUMNS),
+                               flat_fees=[tuple(flat_fee) for flat_fee in
+                                          json.loads(str(arrays[f"{prefix}flat_fees"]))],
+                               has_positions=bool(arrays[f"{prefix}has_positions"]))
+        return accumulator
+
+
+class PerformanceTracker:
+    """
+    Performance accumulators of the markets traded with one strategy config file, kept up to date by MarketsRecorder
+    as it records trade fills.
+    The accumulators are saved to a checkpoint file. On start, the tracker loads the checkpoint and reads only the
+    trades recorded after it from the database, in one query whose rows are turned into columns without building ORM
+    objects.
+    """
+    CHECKPOINT_VERSION = 1
+
+    _pt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._pt_logger is None:
+            cls._pt_logger = logging.getLogger(__name__)
+        return cls._pt_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 config_file_path: str,
+                 checkpoint_path: Optional[str] = None):
+        self._sql: SQLConnectionManager = sql
+        self._config_file_path: str = config_file_path
+        self._checkpoint_path: str = checkpoint_path or os.path.join(
+            data_path(), f"performance_{config_file_path[:-4]}.npz")
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._last_trade_id: int = 0
+        # Trade fills are added by the database writer thread
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    def load(self):
+        with self._lock:
+            if not self._load_checkpoint():
+                self._accumulators = {}
+                self._last_trade_id = 0
+            self._load_trades_from_db()
+
+    def add_trade_fill(self, trade: TradeFill):
+        if trade.config_file_path != self._config_file_path:
+            return
+        with self._lock:
+            if trade.id is not None and trade.id <= self._last_trade_id:
+                return
+            key: Tuple[str, str] = (trade.market, trade.symbol)
+            if key not in self._accumulators:
+                self._accumulators[key] = PerformanceAccumulator(trade.market, trade.symbol)
+            self._accumulators[key].add_trade_fill(trade)
+            self._last_trade_id = max(self._last_trade_id, trade.id or 0)
+
+    def markets(self, start_timestamp: int = 0) -> List[Tuple[str, str]]:
+        """
+        Markets and trading pairs with trades from the timestamp, in milliseconds.
+        """
+        with self._lock:
+            return [key for key, accumulator in self._accumulators.items()
+                    if accumulator.trade_count(start_timestamp) > 0]
+
+    def trade_count(self, start_timestamp: int = 0) -> int:
+        with self._lock:
+            return sum(accumulator.trade_count(start_timestamp) for accumulator in self._accumulators.values())
+
+    def has_positions(self, market: str, trading_pair: str) -> bool:
+        with self._lock:
+            accumulator: Optional[PerformanceAccumulator] = self._accumulators.get((market, trading_pair))
+            return accumulator is not None and accumulator.has_positions
+
+    def aggregates(self,
+                   market: str,
+                   trading_pair: str,
+                   start_timestamp: int = 0,
+                   end_timestamp: Optional[int] = None) -> Optional[PerformanceAggregates]:
+        with self._lock:
+            accumulator: Optional[PerformanceAccumulator] = self._accumulators.get((market, trading_pair))
+            if accumulator is None:
+                return None
+            return accumulator.aggregates(start_timestamp, end_timestamp)
+
+    def save_checkpoint(self):
+        with self._lock:
+            arrays: Dict[str, np.ndarray] = {
+                "version": np.array(self.CHECKPOINT_VERSION),
+                "config_file_path": np.array(self._config_file_path),
+                "last_trade_id": np.array(self._last_trade_id),
+                "markets": np.array(json.dumps(list(self._accumulators.keys()))),
+            }
+            for i, accumulator in enumerate(self._accumulators.values()):
+                arrays.update(accumulator.to_arrays(f"{i}_"))
+        temp_path: str = f"{self._checkpoint_path}.tmp.npz"
+        try:
+            np.savez(temp_path, **arrays)
+            os.replace(temp_path, self._checkpoint_path)
+        except Exception:
+            self.logger().error(f"Failed to save the performance checkpoint {self._checkpoint_path}.", exc_info=True)
+
+    def _load_checkpoint(self) -> bool:
+        if not os.path.exists(self._checkpoint_path):
+            return False
+        try:
+            with np.load(self._checkpoint_path) as arrays:
+                if (int(arrays["version"]) != self.CHECKPOINT_VERSION
+                        or str(arrays["config_file_path"]) != self._config_file_path):
+                    return False
+                last_trade_id: int = int(arrays["last_trade_id"])
+                if last_trade_id > 0 and not self._is_recorded(last_trade_id):
+                    # The checkpoint is from another database
+                    return False
+                self._accumulators = {
+                    (market, trading_pair): PerformanceAccumulator.from_arrays(market, trading_pair, arrays, f"{i}_")
+                    for i, (market, trading_pair) in enumerate(json.loads(str(arrays["markets"])))
+                }
+                self._last_trade_id = last_trade_id
+            return True
+        except Exception:
+            self.logger().warning(f"Failed to load the performance checkpoint {self._checkpoint_path}. "
+                                  f"Reading all the trades from the database.", exc_info=True)
+            return False
+
+    def _is_recorded(self, trade_id: int) -> bool:
+        table = TradeFill.__table__
+        with self._sql.engine.connect() as conn:
+            return conn.execute(select([table.c.id]).where(and_(table.c.id == trade_id,
+                                                                table.c.config_file_path == self._config_file_path))
+                                ).first() is not None
+
+    def _load_trades_from_db(self):
+        table = TradeFill.__table__
+        query = (select([table.c.id, table.c.market, table.c.symbol, table.c.timestamp, table.c.trade_type,
+                         table.c.price, table.c.amount, table.c.trade_fee, table.c.position])
+                 .where(and_(table.c.config_file_path == self._config_file_path,
+                             table.c.id > self._last_trade_id))
+                 .order_by(table.c.timestamp, table.c.id))
+        with self._sql.engine.connect() as conn:
+            rows = conn.execute(query).fetchall()
+        if len(rows) == 0:
+            return
+
+        # Rows are split by market into columns, then added to each accumulator at once.
+        columns_by_market: Dict[Tuple[str, str], Dict[str, list]] = {}
+        for row in rows:
+            key: Tuple[str, str] = (row.market, row.symbol)
+            columns: Optional[Dict[str, list]] = columns_by_market.get(key)
+            if columns is None:
+                columns = columns_by_market[key] = {"trade_ids": [], "timestamps": [], "sides": [], "amounts": [],
+                                                    "prices": [], "percent_fees": [], "flat_fees": [],
+                                                    "has_positions": False}
+            side, percent_fee, flat_fees = PerformanceAccumulator.trade_fill_values(row)
+            columns["trade_ids"].append(row.id)
+            columns["timestamps"].append(row.timestamp)
+            columns["sides"].append(side)
+            columns["amounts"].append(row.amount)
+            columns["prices"].append(row.price)
+            columns["percent_fees"].append(percent_fee)
+            columns["flat_fees"].extend(flat_fees)
+            columns["has_positions"] = columns["has_positions"] or row.position not in (None, "NILL")
+
+        for (market, trading_pair), columns in columns_by_market.items():
+            if (market, trading_pair) not in self._accumulators:
+                self._accumulators[(market, trading_pair)] = PerformanceAccumulator(market, trading_pair)
+            self._accumulators[(market, trading_pair)].add_trades(**columns)
+        self._last_trade_id = max(self._last_trade_id, max(row.id for row in rows))
@@ -0,0 +1,144 @@
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.client.performance_accumulator import PerformanceAggregates
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+
+s_decimal_0 = Decimal("0")
+
+
+class ProfitabilityTracker:
+    """
+    Running profitability of the markets traded since a start time, as HistoryCommand.history_report averages it.
+
+    The volumes and fees of each market are updated from the fill events, in O(1) per fill, and the return of a market
+    is computed from them with the connector's current balances and mid price, without querying the trades. Fees not
+    paid in the base or quote asset are converted at the Rate Oracle's rate. Derivative positions need the trades to be
+    paired, so `has_positions` tells the caller to fall back on the history report.
+    """
+
+    def __init__(self, connectors: Iterable[Any]):
+        """
+        :param connectors: The connectors traded, markets are identified by the display name of their connector, as the
+        trade fills record them
+        """
+        self._connectors: Dict[str, Any] = {connector.display_name: connector for connector in connectors}
+        self._aggregates: Dict[Tuple[str, str], PerformanceAggregates] = {}
+        self._has_positions: bool = False
+
+    @property
+    def has_positions(self) -> bool:
+        return self._has_positions
+
+    def mark_has_positions(self):
+        """
+        Marks derivative positions as traded, e.g. in the past trades of a market the tracker has no aggregates for.
+        """
+        self._has_positions = True
+
+    @property
+    def markets(self) -> Iterable[Tuple[str, str]]:
+        return self._aggregates.keys()
+
+    def add_aggregates(self, market: str, trading_pair: str, aggregates: PerformanceAggregates):
+        """
+        Adds the aggregates of past trades, e.g. those recorded since the start time before the tracker was created.
+        """
+        current: PerformanceAggregates = self._market_aggregates(market, trading_pair)
+        current.num_buys += aggregates.num_buys
+        current.num_sells += aggregates.num_sells
+        current.b_vol_base += aggregates.b_vol_base
+        current.b_vol_quote += aggregates.b_vol_quote
+        current.s_vol_base += aggregates.s_vol_base
+        current.s_vol_quote += aggregates.s_vol_quote
+        for asset, amount in aggregates.fees.items():
+            current.fees[asset] = current.fees.get(asset, s_decimal_0) + amount
+        if current.start_price == s_decimal_0:
+            current.start_price = aggregates.start_price
+        current.last_price = aggregates.last_price
+
+    def add_fill(self, market: str, event: OrderFilledEvent):
+        if event.position not in (None, "NILL"):
+            self._has_positions = True
+        aggregates: PerformanceAggregates = self._market_aggregates(market, event.trading_pair)
+        # As the markets recorder records it
+        price: Decimal = event.price if event.price == event.price else s_decimal_0
+        quote_amount: Decimal = price * event.amount
+        if event.trade_type is TradeType.BUY:
+            aggregates.num_buys += 1
+            aggregates.b_vol_base += event.amount
+            aggregates.b_vol_quote -= quote_amount
+        elif event.trade_type is TradeType.SELL:
+            aggregates.num_sells += 1
+            aggregates.s_vol_base -= event.amount
+            aggregates.s_vol_quote += quote_amount
+        quote: str = event.trading_pair.split("-")[1]
+        if event.trade_fee.percent > 0:
+            aggregates.fees[quote] = aggregates.fees.get(quote, s_decimal_0) + quote_amount * event.trade_fee.percent
+        for asset, amount in event.trade_fee.flat_fees:
+            aggregates.fees[asset] = aggregates.fees.get(asset, s_decimal_0) + amount
+        if aggregates.start_price == s_decimal_0:
+            aggregates.start_price = price
+        aggregates.last_price = price
+
+    def market_return(self, market: str, trading_pair: str) -> Decimal:
+        """
+        Return of a market, the total PnL over the value the starting balances would have now.
+        """
+        aggregates: Optional[PerformanceAggregates] = self._aggregates.get((market, trading_pair))
+        connector: Any = self._connectors.get(market)
+        if aggregates is None or connector is None:
+            return s_decimal_0
+        base, quote = trading_pair.split("-")
+        price: Decimal = self._current_price(connector, trading_pair, aggregates.last_price)
+        tot_vol_base: Decimal = aggregates.b_vol_base + aggregates.s_vol_base
+        tot_vol_quote: Decimal = aggregates.b_vol_quote + aggregates.s_vol_quote
+        hold_value: Decimal = ((connector.get_balance(base) - tot_vol_base) * price +
+                               connector.get_balance(quote) - tot_vol_quote)
+        trade_pnl: Decimal = tot_vol_base * price + tot_vol_quote
+        fee_in_quote: Decimal = s_decimal_0
+        for asset, amount in aggregates.fees.items():
+            if asset == quote:
+                fee_in_quote += amount
+            elif asset == base:
+                fee_in_quote += amount * price
+            else:
+                rate: Optional[Decimal] = RateOracle.get_instance().rate(f"{asset}-{quote}")
+                if rate is not None:
+                    fee_in_quote += amount * rate
+        return (trade_pnl - fee_in_quote) / hold_value if hold_value != s_decimal_0 else s_decimal_0
+
+    def profitability(self) -> Decimal:
+        """
+        Average return of the markets traded.
+        """
+        if len(self._aggregates) == 0:
+            return s_decimal_0
+        return sum(self.market_return(market, trading_pair)
+                   for market, trading_pair in self._aggregates) / len(self._aggregates)
+
+    def _market_aggregates(self, market: str, trading_pair: str) -> PerformanceAggregates:
+        aggregates: Optional[PerformanceAggregates] = self._aggregates.get((market, trading_pair))
+        if aggregates is None:
+            aggregates = PerformanceAggregates()
+            self._aggregates[(market, trading_pair)] = aggregates
+        return aggregates
+
+    @staticmethod
+    def _current_price(connector: Any, trading_pair: str, last_price: Decimal) -> Decimal:
+        # The mid price of the connector's order book, or the last fill price for connectors without order books
+        if trading_pair in getattr(connector, "order_books", {}):
+            price: Decimal = connector.get_mid_price(trading_pair)
+            if price.is_finite() and price > s_decimal_0:
+                return price
+        return last_price
@@ -74,7 +74,9 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        if market:
+            trading_pair_fetcher.refresh(market)
+        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if market else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
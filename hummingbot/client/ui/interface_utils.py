@@ -1,5 +1,6 @@
 from decimal import Decimal
 from typing import (
+    Optional,
     Set,
     Tuple,
     List
@@ -9,6 +10,7 @@ import datetime
 import asyncio
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import PerformanceTracker
 
 
 s_decimal_0 = Decimal("0")
@@ -56,16 +58,22 @@ async def start_trade_monitor(trade_monitor):
     while True:
         if hb.strategy_task is not None and not hb.strategy_task.done():
             if all(market.ready for market in hb.markets.values()):
-                trades: List[TradeFill] = hb._get_trades_from_session(int(hb.init_time * 1e3),
-                                                                      config_file_path=hb.strategy_file_name)
-                if len(trades) > total_trades:
-                    total_trades = len(trades)
-                    market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                start_timestamp: int = int(hb.init_time * 1e3)
+                trades: Optional[List[TradeFill]] = None
+                tracker: Optional[PerformanceTracker] = hb.get_performance_tracker()
+                if tracker is not None:
+                    trade_count: int = tracker.trade_count(start_timestamp)
+                    market_info: Set[Tuple[str, str]] = set(tracker.markets(start_timestamp))
+                else:
+                    trades = hb._get_trades_from_session(start_timestamp, config_file_path=hb.strategy_file_name)
+                    trade_count = len(trades)
+                    market_info = set((t.market, t.symbol) for t in trades)
+                if trade_count > total_trades:
+                    total_trades = trade_count
                     for market, symbol in market_info:
                         quote_asset = symbol.split("-")[1]  # Note that the qiote asset of the last pair is assumed to be the quote asset of P&L for simplicity
-                        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
                         cur_balances = await hb.get_current_balances(market)
-                        perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+                        perf = await hb.market_performance(market, symbol, start_timestamp, cur_balances, trades)
                         return_pcts.append(perf.return_pct)
                         pnls.append(perf.total_pnl)
                     avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
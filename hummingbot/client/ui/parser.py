@@ -142,6 +142,11 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    ticks_parser = subparsers.add_parser("ticks", help="Show clock tick durations and overruns of the current bot")
+    ticks_parser.add_argument("--histogram", default=False, action="store_true", dest="histogram",
+                              help="Show the tick duration and lateness histogram")
+    ticks_parser.set_defaults(func=hummingbot.ticks)
+
     script_parser = subparsers.add_parser("script", help="Send command to running script instance")
     script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
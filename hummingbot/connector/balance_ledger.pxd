@@ -0,0 +1,23 @@
+from hummingbot.core.event.event_listener cimport EventListener
+
+
+cdef class BalanceLedger(EventListener):
+    cdef:
+        object _in_flight_asset_balances_func
+        bint _record_fills
+        list _fills
+        list _fill_timestamps
+        Py_ssize_t _window_start
+        double _window_timestamp
+        dict _window_balances
+        dict _total_balances
+        object _in_flight_orders
+        Py_ssize_t _in_flight_orders_count
+        dict _in_flight_balances
+        bint _in_flight_stale
+        object _snapshot_orders
+        dict _snapshot_balances
+
+    cdef c_call(self, object event_object)
+    cdef c_add_fill(self, object fill_event)
+    cdef c_move_window(self, double starting_timestamp)
@@ -0,0 +1,167 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+s_decimal_neg_one = Decimal(-1)
+
+
+cdef class BalanceLedger(EventListener):
+    """
+    Keeps the terms of ConnectorBase.apply_balance_update_since_snapshot() up to date as market events come in, so an
+    available balance query costs O(1) instead of a scan of the in flight orders and of the whole event log.
+    - Filled balances are running totals of the order filled events, over all fills and over the fills after the
+      snapshot timestamp. The window only moves forward, like the snapshot timestamp, and the fills it leaves behind
+      are dropped. Connectors with real time balance updates never query the window, so their fills are only added
+      to the totals (see record_fills).
+    - Locked balances of the in flight orders are recomputed only after a market event, or when orders start or stop
+      being tracked, since connectors update the executed amounts and states of their orders along with the events.
+    - Locked balances of the snapshot orders are computed once per snapshot.
+    """
+    PRUNE_THRESHOLD = 10000
+
+    def __init__(self, in_flight_asset_balances_func: Callable[[Dict[str, InFlightOrderBase]], Dict[str, Decimal]]):
+        super().__init__()
+        self._in_flight_asset_balances_func = in_flight_asset_balances_func
+        self._record_fills = True
+        self._fills = []
+        self._fill_timestamps = []
+        self._window_start = 0
+        self._window_timestamp = 0.0
+        self._window_balances = {}
+        self._total_balances = {}
+        self._in_flight_orders = None
+        self._in_flight_orders_count = 0
+        self._in_flight_balances = {}
+        self._in_flight_stale = True
+        self._snapshot_orders = None
+        self._snapshot_balances = {}
+
+    @property
+    def record_fills(self) -> bool:
+        """
+        Whether the fills are kept for filled_balance() after a snapshot timestamp. Turning it off drops the kept fills,
+        so the balances after a timestamp only count the fills that come in after it is turned back on.
+        """
+        return self._record_fills
+
+    @record_fills.setter
+    def record_fills(self, value: bool):
+        if value == self._record_fills:
+            return
+        self._record_fills = value
+        self._fills = []
+        self._fill_timestamps = []
+        self._window_start = 0
+        self._window_timestamp = 0.0
+        self._window_balances = {}
+
+    def __call__(self, event_object):
+        self.c_call(event_object)
+
+    cdef c_call(self, object event_object):
+        if isinstance(event_object, OrderFilledEvent):
+            self.c_add_fill(event_object)
+        self._in_flight_stale = True
+
+    def add_fill(self, fill_event: OrderFilledEvent):
+        self.c_add_fill(fill_event)
+
+    cdef c_add_fill(self, object fill_event):
+        cdef:
+            double timestamp = fill_event.timestamp
+            list assets = fill_event.trading_pair.split("-")
+            object base_value
+            object quote_value
+        if fill_event.trade_type is TradeType.BUY:
+            quote_value = s_decimal_neg_one * fill_event.price * fill_event.amount
+            base_value = fill_event.amount
+        else:
+            quote_value = fill_event.price * fill_event.amount
+            base_value = s_decimal_neg_one * fill_event.amount
+        fill = (assets[0], base_value, assets[1], quote_value)
+
+        # Fills at or before timestamp 0 are left out of the totals too, as order_filled_balances() does.
+        if timestamp > 0:
+            self._add_balances(self._total_balances, fill)
+        if not self._record_fills:
+            return
+        if len(self._fill_timestamps) == 0 or timestamp >= self._fill_timestamps[-1]:
+            self._fills.append(fill)
+            self._fill_timestamps.append(timestamp)
+        else:
+            index = bisect_right(self._fill_timestamps, timestamp)
+            self._fills.insert(index, fill)
+            self._fill_timestamps.insert(index, timestamp)
+        if timestamp > self._window_timestamp:
+            self._add_balances(self._window_balances, fill)
+        else:
+            self._window_start += 1
+
+    @staticmethod
+    def _add_balances(balances: Dict[str, Decimal], fill: tuple, sign: int = 1):
+        base, base_value, quote, quote_value = fill
+        if sign < 0:
+            base_value, quote_value = -base_value, -quote_value
+        balances[base] = balances.get(base, s_decimal_0) + base_value
+        balances[quote] = balances.get(quote, s_decimal_0) + quote_value
+
+    cdef c_move_window(self, double starting_timestamp):
+        cdef:
+            Py_ssize_t new_start
+            Py_ssize_t i
+        if starting_timestamp == self._window_timestamp:
+            return
+        new_start = bisect_right(self._fill_timestamps, starting_timestamp)
+        for i in range(self._window_start, new_start):
+            self._add_balances(self._window_balances, self._fills[i], -1)
+        for i in range(new_start, self._window_start):
+            self._add_balances(self._window_balances, self._fills[i])
+        self._window_start = new_start
+        self._window_timestamp = starting_timestamp
+        if self._window_start > self.PRUNE_THRESHOLD and self._window_start * 2 > len(self._fills):
+            del self._fills[:self._window_start]
+            del self._fill_timestamps[:self._window_start]
+            self._window_start = 0
+
+    def filled_balance(self, currency: str, starting_timestamp: float = 0) -> Decimal:
+        """
+        Balance change of the currency from the fills after the timestamp, as order_filled_balances() computes it.
+        """
+        if starting_timestamp == 0:
+            return self._total_balances.get(currency, s_decimal_0)
+        self.c_move_window(starting_timestamp)
+        return self._window_balances.get(currency, s_decimal_0)
+
+    def in_flight_balance(self, in_flight_orders: Dict[str, InFlightOrderBase], currency: str) -> Decimal:
+        cdef Py_ssize_t count = len(in_flight_orders) if in_flight_orders is not None else 0
+        if (self._in_flight_stale
+                or in_flight_orders is not self._in_flight_orders
+                or count != self._in_flight_orders_count):
+            self._in_flight_balances = self._in_flight_asset_balances_func(in_flight_orders)
+            self._in_flight_orders = in_flight_orders
+            self._in_flight_orders_count = count
+            self._in_flight_stale = False
+        return self._in_flight_balances.get(currency, s_decimal_0)
+
+    def snapshot_balance(self, snapshot_orders: Dict[str, InFlightOrderBase], currency: str) -> Decimal:
+        if snapshot_orders is not self._snapshot_orders:
+            self._snapshot_balances = self._in_flight_asset_balances_func(snapshot_orders)
+            self._snapshot_orders = snapshot_orders
+        return self._snapshot_balances.get(currency, s_decimal_0)
+
+    def invalidate(self):
+        """
+        Forces the locked balances to be recomputed on the next query, for order changes made without a market event.
+        """
+        self._in_flight_stale = True
+        self._snapshot_orders = None
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import (
+    Any,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+
+class BoundedIndex:
+    """
+    Insertion ordered index of at most `max_entries` keys, with an optional value per key. The oldest keys are dropped
+    first once the cap is reached, and a key added again counts as new. Membership checks and lookups are O(1) and
+    never copy the index.
+    It stands in for both the set of recorded trade fills and the dict of recorded exchange order ids of a connector.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries: Optional[int] = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._entries[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def add(self, key: Hashable, value: Any = None):
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = value
+        if self._max_entries is not None:
+            while len(entries) > self._max_entries:
+                entries.popitem(last=False)
+
+    def update(self, entries: Union[Mapping[Hashable, Any], Iterable[Hashable]]):
+        """
+        Adds the items of a mapping, or the keys of any other iterable with no value, in iteration order.
+        """
+        if isinstance(entries, Mapping):
+            for key, value in entries.items():
+                self.add(key, value)
+        else:
+            for key in entries:
+                self.add(key)
+
+    def clear(self):
+        self._entries.clear()
@@ -237,6 +237,10 @@ class BalancerConnector(ConnectorBase):
         """
         return await self.get_quote_price(trading_pair, is_buy, amount)
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     def buy(self, trading_pair: str, amount: Decimal, order_type: OrderType, price: Decimal) -> str:
         """
         Buys an amount of base token for a given price (or cheaper).
@@ -1,19 +1,21 @@
 from hummingbot.core.event.event_reporter cimport EventReporter
 from hummingbot.core.event.event_logger cimport EventLogger
 from hummingbot.core.network_iterator cimport NetworkIterator
+from hummingbot.connector.balance_ledger cimport BalanceLedger
 
 cdef class ConnectorBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
         EventLogger _event_logger
+        BalanceLedger _balance_ledger
         public bint _trading_required
         public dict _account_available_balances
         public dict _account_balances
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
-        public set _current_trade_fills
-        public dict _exchange_order_ids
+        public object _current_trade_fills
+        public object _exchange_order_ids
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
@@ -1,9 +1,12 @@
 from decimal import Decimal
 from typing import (
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Optional,
     Tuple,
-    Set,
+    Type,
 )
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.event.events import (
@@ -13,7 +16,9 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.bounded_index import BoundedIndex
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.client.config.global_config_map import global_config_map
@@ -47,10 +52,15 @@ cdef class ConnectorBase(NetworkIterator):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name,
+                                         max_events=global_config_map.get("event_log_max_events").value,
+                                         max_age=global_config_map.get("event_log_max_age").value)
+        self._balance_ledger = BalanceLedger(self.in_flight_asset_balances)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+            self.c_add_listener(event_tag.value, self._balance_ledger)
+        self.c_add_listener(MarketEvent.OrderFailure.value, self._balance_ledger)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -61,8 +71,10 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
-        self._current_trade_fills = set()
-        self._exchange_order_ids = dict()
+        # Recorded trade fills and exchange order ids, used to tell new fills apart during history reconciliation
+        trade_fill_index_max_entries = global_config_map.get("trade_fill_index_max_entries").value
+        self._current_trade_fills = BoundedIndex(trade_fill_index_max_entries)  # TradeFillOrderDetails
+        self._exchange_order_ids = BoundedIndex(trade_fill_index_max_entries)  # Dict[exchange_order_id:str, order_id:str]
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -71,6 +83,7 @@ cdef class ConnectorBase(NetworkIterator):
     @real_time_balance_update.setter
     def real_time_balance_update(self, value: bool):
         self._real_time_balance_update = value
+        self._balance_ledger.record_fills = not value
 
     @property
     def in_flight_orders_snapshot(self) -> Dict[str, InFlightOrderBase]:
@@ -135,10 +148,8 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
-        for event in order_filled_events:
+        for event in self._event_logger.iter_events(OrderFilledEvent, starting_timestamp):
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
             if event.trade_type is TradeType.BUY:
                 quote_value = Decimal("-1") * event.price * event.amount
@@ -183,6 +194,12 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def iter_events(self, event_type: Optional[Type] = None, since_timestamp: Optional[float] = None) -> Iterator[any]:
+        """
+        Iterates over the logged market events without copying the event log, see EventLogger.iter_events().
+        """
+        return self._event_logger.iter_events(event_type, since_timestamp)
+
     @property
     def ready(self) -> bool:
         """
@@ -205,6 +222,21 @@ cdef class ConnectorBase(NetworkIterator):
         """
         pass
 
+    @property
+    def trade_cursors(self) -> Dict[str, any]:
+        """
+        Positions (e.g. the last trade id seen per trading pair) of the polls reading the exchange trade history, saved
+        along with the tracking states so the polls resume where they stopped after a restart.
+        """
+        return {}
+
+    def restore_trade_cursors(self, saved_cursors: Dict[str, any]):
+        """
+        Restores the trade cursors from a previously saved state.
+        :param saved_cursors: Previously saved trade cursors from `trade_cursors` property.
+        """
+        pass
+
     def tick(self, timestamp: float):
         """
         Is called automatically by the clock for each clock's tick (1 second by default).
@@ -213,6 +245,8 @@ cdef class ConnectorBase(NetworkIterator):
 
     cdef c_tick(self, double timestamp):
         NetworkIterator.c_tick(self, timestamp)
+        # Subclasses set _real_time_balance_update directly, so the ledger is kept in sync here.
+        self._balance_ledger.record_fills = not self._real_time_balance_update
         self.tick(timestamp)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
@@ -303,9 +337,9 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self._balance_ledger.in_flight_balance(self.in_flight_orders, currency)
         limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
+        filled_balance = self._balance_ledger.filled_balance(currency)
         limit += filled_balance
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
@@ -318,10 +352,9 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        snapshot_bal = self._balance_ledger.snapshot_balance(self._in_flight_orders_snapshot, currency)
+        in_flight_bal = self._balance_ledger.in_flight_balance(self.in_flight_orders, currency)
+        orders_filled_bal = self._balance_ledger.filled_balance(currency, self._in_flight_orders_snapshot_timestamp)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
@@ -418,13 +451,22 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        """
+        Whether get_order_price returns the quote price (e.g. for the gateway connectors), so that both prices can be
+        answered with one get_quote_price call.
+        """
+        return False
+
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         return self._account_available_balances
 
-    def add_trade_fills_from_market_recorder(self, current_trade_fills: Set[TradeFillOrderDetails]):
+    def add_trade_fills_from_market_recorder(self, current_trade_fills: Iterable[TradeFillOrderDetails]):
         """
-        Gets updates from new records in TradeFill table. This is used in method is_confirmed_new_order_filled_event
+        Gets updates from new records in TradeFill table. This is used in method is_confirmed_new_order_filled_event.
+        Only the latest trade_fill_index_max_entries fills and exchange order ids are kept.
         """
         self._current_trade_fills.update(current_trade_fills)
 
@@ -441,4 +483,4 @@ cdef class ConnectorBase(NetworkIterator):
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
         return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+               (exchange_order_id in self._exchange_order_ids)
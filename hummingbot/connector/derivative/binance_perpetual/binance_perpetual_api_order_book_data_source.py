@@ -5,17 +5,24 @@ from typing import Dict, List, Optional, Any, AsyncIterable
 
 import aiohttp
 import pandas as pd
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.websocket_message_parser import (
+    WebsocketMessageParser,
+    diff_message_extractor,
+    trade_message_extractor,
+)
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
-from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import (
+    convert_from_exchange_trading_pair,
+    convert_to_exchange_trading_pair,
+)
 
 from hummingbot.connector.derivative.binance_perpetual.constants import (
     PERPETUAL_BASE_URL,
@@ -23,6 +30,7 @@ from hummingbot.connector.derivative.binance_perpetual.constants import (
     DIFF_STREAM_URL,
     TESTNET_STREAM_URL
 )
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 # API OrderBook Endpoints
 SNAPSHOT_REST_URL = "{}/fapi/v1/depth"
@@ -40,6 +48,25 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._stream_url = TESTNET_STREAM_URL if domain == "binance_perpetual_testnet" else DIFF_STREAM_URL
         self._stream_url += "/stream"
         self._domain = domain
+        self._ws_message_parser: WebsocketMessageParser = self._create_ws_message_parser()
+
+    @staticmethod
+    def _create_ws_message_parser() -> WebsocketMessageParser:
+        # Parses the "data" of the combined stream messages
+        parser: WebsocketMessageParser = WebsocketMessageParser(type_key="e")
+        parser.add_extractor("depthUpdate", diff_message_extractor(symbol_key="s",
+                                                                   update_id_key="u",
+                                                                   bids_key="b",
+                                                                   asks_key="a",
+                                                                   convert_trading_pair=convert_from_exchange_trading_pair))
+        parser.add_extractor("aggTrade", trade_message_extractor(symbol_key="s",
+                                                                 trade_id_key="a",
+                                                                 price_key="p",
+                                                                 amount_key="q",
+                                                                 is_sell=lambda msg: msg["m"],
+                                                                 convert_trading_pair=convert_from_exchange_trading_pair,
+                                                                 timestamp_key="E"))
+        return parser
 
     _bpobds_logger: Optional[HummingbotLogger] = None
 
@@ -57,7 +84,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain=None) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
             resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -85,7 +112,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
             BASE_URL = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -118,7 +145,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
@@ -132,7 +159,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     """
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             return_val: Dict[str, OrderBookTrackerEntry] = {}
             for trading_pair in trading_pairs:
@@ -178,13 +205,11 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
-                        timestamp: float = time.time()
-                        order_book_message: OrderBookMessage = BinancePerpetualOrderBook.diff_message_from_exchange(
-                            msg_json,
-                            timestamp
-                        )
-                        output.put_nowait(order_book_message)
+                        msg_json = self._ws_message_parser.decode(raw_msg)
+                        order_book_message: Optional[OrderBookMessage] = self._ws_message_parser.extract(
+                            msg_json.get("data"))
+                        if order_book_message is not None:
+                            output.put_nowait(order_book_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -202,9 +227,10 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinancePerpetualOrderBook.trade_message_from_exchange(msg_json)
-                        output.put_nowait(trade_msg)
+                        msg_json = self._ws_message_parser.decode(raw_msg)
+                        trade_msg: Optional[OrderBookMessage] = self._ws_message_parser.extract(msg_json.get("data"))
+                        if trade_msg is not None:
+                            output.put_nowait(trade_msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -216,7 +242,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 # trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
@@ -4,13 +4,14 @@ import time
 from typing import Optional, Dict, AsyncIterable
 
 import aiohttp
-import ujson
 import websockets
 from websockets import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 BINANCE_USER_STREAM_ENDPOINT = "/fapi/v1/listenKey"
 
@@ -38,7 +39,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         self._wss_stream_url = stream_url + "/ws/"
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.post(self._http_stream_url,
                                    headers={"X-MBX-APIKEY": self._api_key}) as response:
                 response: aiohttp.ClientResponse = response
@@ -49,7 +50,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.put(self._http_stream_url,
                                   headers={"X-MBX-APIKEY": self._api_key},
                                   params={"listenKey": listen_key}) as response:
@@ -85,7 +86,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self.ws_messages(ws):
-                        msg_json: Dict[str, any] = ujson.loads(raw_msg)
+                        msg_json: Dict[str, any] = json_loads(raw_msg)
                         output.put_nowait(msg_json)
             except asyncio.CancelledError:
                 raise
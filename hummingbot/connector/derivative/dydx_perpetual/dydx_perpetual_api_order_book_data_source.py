@@ -18,12 +18,14 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.derivative.dydx_perpetual.dydx_perpetual_order_book import DydxPerpetualOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 MARKETS_URL = "/markets"
@@ -56,7 +58,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             retval = {}
             for pair in trading_pairs:
                 resp = await client.get(f"{DYDX_V3_API_URL}{TICKER_URL}/{pair}")
@@ -84,7 +86,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = DydxPerpetualOrderBook.snapshot_message_from_exchange(
@@ -129,7 +131,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{DYDX_V3_API_URL}{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -157,7 +159,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             if "trades" in msg["contents"]:
                                 if msg["type"] == "channel_data":
@@ -185,7 +187,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "contents" in msg:
                             msg["trading_pair"] = msg["id"]
                             if msg["type"] == "channel_data":
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from datetime import datetime
 import json
@@ -63,6 +62,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -1095,7 +1095,7 @@ class DydxPerpetualDerivative(ExchangeBase, PerpetualTrading):
                           secure: bool = False) -> Dict[str, Any]:
 
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
 
         if data is not None and http_method == "POST":
             data = json.dumps(data).encode('utf8')
@@ -10,6 +10,7 @@ from typing import (
 )
 import ujson
 import websockets
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.dydx_perpetual.dydx_perpetual_auth import DydxPerpetualAuth
@@ -59,7 +60,7 @@ class DydxPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_loads(raw_msg)
                         if diff_msg['type'] in ['subscribed', 'channel_data']:
                             output.put_nowait(diff_msg)
             except asyncio.CancelledError:
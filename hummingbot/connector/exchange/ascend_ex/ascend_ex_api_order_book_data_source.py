@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 import asyncio
 import logging
-import aiohttp
 import websockets
 import ujson
 import time
 import pandas as pd
 
 from typing import Optional, List, Dict, Any, AsyncIterable
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -17,6 +17,7 @@ from hummingbot.connector.exchange.ascend_ex.ascend_ex_active_order_tracker impo
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book import AscendExOrderBook
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import convert_from_exchange_trading_pair, convert_to_exchange_trading_pair
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_constants import EXCHANGE_NAME, REST_URL, WS_URL, PONG_PAYLOAD
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -43,7 +44,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
 
         for trading_pair in trading_pairs:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 resp = await client.get(f"{REST_URL}/trades?symbol={convert_to_exchange_trading_pair(trading_pair)}")
                 if resp.status != 200:
                     raise IOError(
@@ -69,7 +70,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{REST_URL}/ticker")
 
             if resp.status != 200:
@@ -84,7 +85,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{REST_URL}/depth?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             if resp.status != 200:
                 raise IOError(
@@ -132,7 +133,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if (msg is None or msg.get("m") != "trades"):
                             continue
 
@@ -171,7 +172,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(payload))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if msg is None:
                             continue
                         if msg.get("m", '') == "ping":
@@ -3,15 +3,16 @@ import time
 import asyncio
 import logging
 import websockets
-import aiohttp
 import ujson
 
 from typing import Optional, List, AsyncIterable, Any
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_auth import AscendExAuth
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_constants import REST_URL, PONG_PAYLOAD
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import get_ws_url_private
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 
 class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
@@ -50,7 +51,7 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
         while True:
             try:
-                response = await aiohttp.ClientSession().get(f"{REST_URL}/info", headers={
+                response = await get_shared_client().get(f"{REST_URL}/info", headers={
                     **self._ascend_ex_auth.get_headers(),
                     **self._ascend_ex_auth.get_auth_headers("info"),
                 })
@@ -69,7 +70,7 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
                         async for raw_msg in self._inner_messages(ws):
                             try:
-                                msg = ujson.loads(raw_msg)
+                                msg = json_loads(raw_msg)
                                 if msg is None:
                                     continue
 
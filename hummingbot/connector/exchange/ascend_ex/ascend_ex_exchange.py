@@ -43,6 +43,7 @@ from hummingbot.connector.exchange.ascend_ex.ascend_ex_in_flight_order import As
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_utils
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_constants import EXCHANGE_NAME, REST_URL
 from hummingbot.core.data_type.common import OpenOrder
+from hummingbot.core.utils.http_client_registry import get_shared_client
 ctce_logger = None
 s_decimal_NaN = Decimal("nan")
 s_decimal_0 = Decimal("0")
@@ -258,7 +259,7 @@ class AscendExExchange(ExchangePyBase):
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
@@ -334,7 +335,7 @@ class AscendExExchange(ExchangePyBase):
             **self._ascend_ex_auth.get_auth_headers("info"),
         }
         url = f"{REST_URL}/info"
-        response = await aiohttp.ClientSession().get(url, headers=headers)
+        response = await get_shared_client().get(url, headers=headers)
 
         try:
             parsed_response = json.loads(await response.text())
@@ -16,7 +16,9 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.http_client_registry import shared_client_session
 from hummingbot.core.utils.ssl_client_request import SSLClientRequest
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.logger import HummingbotLogger
@@ -106,7 +108,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     async with client.get(f"https://rest.bamboorelay.com/main/0x/markets?perPage=1000&page={page_count}",
                                           timeout=5) as response:
                         if response.status == 200:
@@ -148,7 +150,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return await self.fetch_trading_pairs()
 
     async def get_new_order_book(self, trading_pair: str) -> BambooRelayOrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint,
                                                                self._api_prefix)
             snapshot_timestamp: float = time.time()
@@ -196,7 +198,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if not self._motd_done:
                         try:
                             raw_msg = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             # Print MOTD and announcements if present
                             if "motd" in msg:
                                 self._motd_done = True
@@ -217,7 +219,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         # Try here, else any errors cause the websocket to disconnect
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             # Valid Diff messages from BambooRelay have actions array
                             if "actions" in msg:
                                 diff_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.diff_message_from_exchange(
@@ -12,6 +12,7 @@ from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 from hummingbot.connector.exchange.beaxy.beaxy_constants import BeaxyConstants
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 s_logger = None
 
@@ -86,7 +87,7 @@ class BeaxyAuth:
             start_time = monotonic()
             start_timestamp = datetime.now()
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.post(
                         f'{BeaxyConstants.TradingApi.BASE_URL}{BeaxyConstants.TradingApi.TOKEN_ENDPOINT}',
                         json={'api_key_id': self.api_key, 'api_secret': self.api_secret}
@@ -37,6 +37,7 @@ from hummingbot.connector.exchange.beaxy.beaxy_order_book_tracker import BeaxyOr
 from hummingbot.connector.exchange.beaxy.beaxy_in_flight_order import BeaxyInFlightOrder
 from hummingbot.connector.exchange.beaxy.beaxy_user_stream_tracker import BeaxyUserStreamTracker
 from hummingbot.connector.exchange.beaxy.beaxy_misc import split_trading_pair, trading_pair_to_symbol, BeaxyIOError
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 s_logger = None
 s_decimal_0 = Decimal('0.0')
@@ -1006,7 +1007,7 @@ cdef class BeaxyExchange(ExchangeBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(
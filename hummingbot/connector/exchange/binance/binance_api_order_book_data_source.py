@@ -14,17 +14,26 @@ from typing import (
 from decimal import Decimal
 import re
 import time
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.websocket_message_parser import (
+    WebsocketMessageParser,
+    diff_message_extractor,
+    trade_message_extractor,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
-from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from hummingbot.connector.exchange.binance.binance_utils import (
+    convert_from_exchange_trading_pair,
+    convert_to_exchange_trading_pair,
+)
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
@@ -33,6 +42,10 @@ DIFF_STREAM_URL = "wss://stream.binance.{}:9443/ws"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.{}/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.{}/api/v1/exchangeInfo"
 
+# Binance allows 1200 request weight per minute, a 1000 level depth snapshot weighs 10.
+# Part of the budget is left for the order and account requests sent while the order books initialize.
+SNAPSHOT_RATE_LIMIT = RateLimit(limit=1000, time_interval=60, path_url=SNAPSHOT_REST_URL, weight=10)
+
 
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -51,6 +64,29 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         super().__init__(trading_pairs)
         self._order_book_create_function = lambda: OrderBook()
         self._domain = domain
+        self._ws_message_parser: WebsocketMessageParser = self._create_ws_message_parser()
+
+    @staticmethod
+    def _create_ws_message_parser() -> WebsocketMessageParser:
+        parser: WebsocketMessageParser = WebsocketMessageParser(type_key="e")
+        parser.add_extractor("depthUpdate", diff_message_extractor(symbol_key="s",
+                                                                   update_id_key="u",
+                                                                   bids_key="b",
+                                                                   asks_key="a",
+                                                                   convert_trading_pair=convert_from_exchange_trading_pair,
+                                                                   first_update_id_key="U"))
+        parser.add_extractor("trade", trade_message_extractor(symbol_key="s",
+                                                              trade_id_key="t",
+                                                              price_key="p",
+                                                              amount_key="q",
+                                                              is_sell=lambda msg: msg["m"],
+                                                              convert_trading_pair=convert_from_exchange_trading_pair,
+                                                              timestamp_key="E"))
+        return parser
+
+    @property
+    def snapshot_rate_limit(self) -> Optional[RateLimit]:
+        return SNAPSHOT_RATE_LIMIT
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain: str = "com") -> Dict[str, float]:
@@ -60,7 +96,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com") -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -70,7 +106,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
             resp_json = await resp.json()
@@ -84,7 +120,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
@@ -124,7 +160,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._domain)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
@@ -133,7 +169,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 metadata={"trading_pair": trading_pair}
             )
             order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+            order_book.apply_snapshot_message(snapshot_msg)
             return order_book
 
     async def _inner_messages(self,
@@ -166,9 +202,9 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
+                        trade_msg: Optional[OrderBookMessage] = self._ws_message_parser.parse(raw_msg)
+                        if trade_msg is not None:
+                            output.put_nowait(trade_msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -187,10 +223,9 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
+                        order_book_message: Optional[OrderBookMessage] = self._ws_message_parser.parse(raw_msg)
+                        if order_book_message is not None:
+                            output.put_nowait(order_book_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -201,7 +236,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
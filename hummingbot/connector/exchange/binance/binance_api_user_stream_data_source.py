@@ -9,12 +9,13 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
 import websockets
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 BINANCE_API_ENDPOINT = "https://api.binance.{}/api/v1/"
 BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
@@ -47,7 +48,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = BINANCE_API_ENDPOINT.format(self._domain)
             async with client.post(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                    headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
@@ -58,7 +59,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = BINANCE_API_ENDPOINT.format(self._domain)
             async with client.put(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
@@ -141,7 +142,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             try:
                 async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = json_loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
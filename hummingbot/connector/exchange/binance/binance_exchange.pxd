@@ -26,6 +26,10 @@ cdef class BinanceExchange(ExchangeBase):
         object _set_server_time_offset_task
         object _throttler
         str _domain
+        int _order_status_poll_requests
+        dict _order_fills_trade_cursors
+        dict _history_trade_cursors
+        set _trade_ids
 
     cdef c_did_timeout_tx(self, str tracking_id)
     cdef c_start_tracking_order(self,
@@ -1,7 +1,6 @@
 from traceback import format_exc
 from collections import defaultdict
 from libc.stdint cimport int64_t
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -68,6 +67,7 @@ from .binance_utils import (
     convert_to_exchange_trading_pair)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.utils.http_client_registry import shared_client_session
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_NaN = Decimal("nan")
@@ -115,6 +115,7 @@ cdef class BinanceExchange(ExchangeBase):
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
 
     ORDER_NOT_EXIST_CONFIRMATION_COUNT = 3
+    TRADES_PAGE_LIMIT = 1000
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -152,6 +153,10 @@ cdef class BinanceExchange(ExchangeBase):
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
         self._throttler = Throttler((10.0, 1.0))
+        self._order_status_poll_requests = 0
+        self._order_fills_trade_cursors = {}  # Dict[trading_pair:str, last trade id:int]
+        self._history_trade_cursors = {}  # Dict[trading_pair:str, last trade id:int]
+        self._trade_ids = set()  # Set[(trading_pair:str, trade id:int)] of the trades of the in flight orders
 
     @property
     def name(self) -> str:
@@ -190,6 +195,13 @@ cdef class BinanceExchange(ExchangeBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    @property
+    def order_status_poll_requests(self) -> int:
+        """
+        Number of requests the last order status poll used.
+        """
+        return self._order_status_poll_requests
+
     @property
     def order_book_tracker(self) -> BinanceOrderBookTracker:
         return self._order_book_tracker
@@ -204,6 +216,17 @@ cdef class BinanceExchange(ExchangeBase):
             for key, value in saved_states.items()
         })
 
+    @property
+    def trade_cursors(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "order_fills": self._order_fills_trade_cursors.copy(),
+            "history_reconciliation": self._history_trade_cursors.copy(),
+        }
+
+    def restore_trade_cursors(self, saved_cursors: Dict[str, Dict[str, int]]):
+        self._order_fills_trade_cursors.update(saved_cursors.get("order_fills", {}))
+        self._history_trade_cursors.update(saved_cursors.get("history_reconciliation", {}))
+
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await BinanceAPIOrderBookDataSource.get_active_exchange_markets()
 
@@ -242,7 +265,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
@@ -383,6 +406,23 @@ cdef class BinanceExchange(ExchangeBase):
                 self.logger().error(f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return retval
 
+    async def _fetch_new_trades(self, trading_pairs: List[str], dict cursors) -> List[Any]:
+        """
+        Fetches the trades of each trading pair made after the pair's cursor (the last trade id seen), or the most
+        recent trades for pairs without a cursor yet.
+        """
+        tasks = []
+        for trading_pair in trading_pairs:
+            symbol = convert_to_exchange_trading_pair(trading_pair)
+            if trading_pair in cursors:
+                tasks.append(self.query_api(self._binance_client.get_my_trades,
+                                            symbol=symbol,
+                                            fromId=cursors[trading_pair] + 1,
+                                            limit=self.TRADES_PAGE_LIMIT))
+            else:
+                tasks.append(self.query_api(self._binance_client.get_my_trades, symbol=symbol))
+        return await safe_gather(*tasks, return_exceptions=True)
+
     async def _update_order_fills_from_trades(self):
         cdef:
             # This is intended to be a backup measure to get filled events with trade ID for orders,
@@ -400,10 +440,8 @@ cdef class BinanceExchange(ExchangeBase):
                     trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
                 trading_pairs = list(trading_pairs_to_order_map.keys())
-                tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                         for trading_pair in trading_pairs]
-                self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
-                results = await safe_gather(*tasks, return_exceptions=True)
+                self.logger().debug(f"Polling for order fills of {len(trading_pairs)} trading pairs.")
+                results = await self._fetch_new_trades(trading_pairs, self._order_fills_trade_cursors)
                 for trades, trading_pair in zip(results, trading_pairs):
                     order_map = trading_pairs_to_order_map[trading_pair]
                     if isinstance(trades, Exception):
@@ -412,6 +450,9 @@ cdef class BinanceExchange(ExchangeBase):
                             app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
                         )
                         continue
+                    # A trade of an order not acknowledged yet cannot be matched. The cursor is left before it, so the
+                    # trade is fetched again in the next poll.
+                    awaiting_ack = None in order_map
                     for trade in trades:
                         order_id = str(trade["orderId"])
                         if order_id in order_map:
@@ -419,6 +460,7 @@ cdef class BinanceExchange(ExchangeBase):
                             order_type = tracked_order.order_type
                             applied_trade = order_map[order_id].update_with_trade_update(trade)
                             if applied_trade:
+                                self._trade_ids.add((trading_pair, trade["id"]))
                                 self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
                                                      OrderFilledEvent(
                                                          self._current_timestamp,
@@ -435,6 +477,10 @@ cdef class BinanceExchange(ExchangeBase):
                                                          ),
                                                          exchange_trade_id=trade["id"]
                                                      ))
+                        elif awaiting_ack:
+                            break
+                        self._order_fills_trade_cursors[trading_pair] = max(
+                            trade["id"], self._order_fills_trade_cursors.get(trading_pair, trade["id"]))
 
     async def _history_reconciliation(self):
         cdef:
@@ -446,10 +492,8 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick:
             trading_pairs = self._order_book_tracker._trading_pairs
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                     for trading_pair in trading_pairs]
-            self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
-            exchange_history = await safe_gather(*tasks, return_exceptions=True)
+            self.logger().debug(f"Polling for order fills of {len(trading_pairs)} trading pairs.")
+            exchange_history = await self._fetch_new_trades(trading_pairs, self._history_trade_cursors)
             for trades, trading_pair in zip(exchange_history, trading_pairs):
                 if isinstance(trades, Exception):
                     self.logger().network(
@@ -458,10 +502,12 @@ cdef class BinanceExchange(ExchangeBase):
                     )
                     continue
                 for trade in trades:
+                    self._history_trade_cursors[trading_pair] = max(
+                        trade["id"], self._history_trade_cursors.get(trading_pair, trade["id"]))
                     if self.is_confirmed_new_order_filled_event(str(trade["id"]), str(trade["orderId"]), trading_pair):
                         # Should check if this is a partial filling of a in_flight order.
                         # In that case, user_stream or _update_order_fills_from_trades will take care when fully filled.
-                        if not any(trade["id"] in in_flight_order.trade_id_set for in_flight_order in self._in_flight_orders.values()):
+                        if (trading_pair, trade["id"]) not in self._trade_ids:
                             self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
                                                  OrderFilledEvent(
                                                      trade["time"],
@@ -491,12 +537,39 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
+
+            # One open orders request per trading pair covers all the orders still open. Only the orders missing from
+            # the open orders, which have been filled, cancelled or expired since the last poll, are queried one by one.
+            trading_pairs = list({o.trading_pair for o in tracked_orders})
+            tasks = [self.query_api(self._binance_client.get_open_orders,
+                                    symbol=convert_to_exchange_trading_pair(trading_pair))
+                     for trading_pair in trading_pairs]
+            results = await safe_gather(*tasks, return_exceptions=True)
+            open_orders = {}
+            for open_orders_update, trading_pair in zip(results, trading_pairs):
+                if isinstance(open_orders_update, Exception):
+                    self.logger().network(
+                        f"Error fetching open orders of {trading_pair}: {open_orders_update}.",
+                        app_warning_msg=f"Failed to fetch open orders of {trading_pair}."
+                    )
+                    continue
+                for order_update in open_orders_update:
+                    open_orders[order_update["clientOrderId"]] = order_update
+
+            order_updates = [(open_orders[o.client_order_id], o)
+                             for o in tracked_orders if o.client_order_id in open_orders]
+            missing_orders = [o for o in tracked_orders if o.client_order_id not in open_orders]
             tasks = [self.query_api(self._binance_client.get_order,
                                     symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
+                     for o in missing_orders]
             results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
+            order_updates.extend(zip(results, missing_orders))
+
+            self._order_status_poll_requests = len(trading_pairs) + len(missing_orders)
+            self.logger().debug(f"Polled for order status updates of {len(tracked_orders)} orders with "
+                                f"{self._order_status_poll_requests} requests ({len(trading_pairs)} open orders, "
+                                f"{len(missing_orders)} single order).")
+            for order_update, tracked_order in order_updates:
                 client_order_id = tracked_order.client_order_id
 
                 # If the order has already been cancelled or has failed do nothing
@@ -638,6 +711,8 @@ cdef class BinanceExchange(ExchangeBase):
                         continue
 
                     unique_update = tracked_order.update_with_execution_report(event_message)
+                    if unique_update:
+                        self._trade_ids.add((tracked_order.trading_pair, event_message["t"]))
 
                     if execution_type == "TRADE":
                         order_filled_event = OrderFilledEvent.order_filled_event_from_binance_execution_report(event_message)
@@ -760,6 +835,10 @@ cdef class BinanceExchange(ExchangeBase):
     def ready(self) -> bool:
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return (self._order_book_tracker.is_trading_pair_ready(trading_pair) and
+                all(ready for status, ready in self.status_dict.items() if status != "order_books_initialized"))
+
     async def server_time(self) -> int:
         """
         :return: The current server time in milliseconds since UNIX epoch.
@@ -1028,7 +1107,9 @@ cdef class BinanceExchange(ExchangeBase):
 
     cdef c_stop_tracking_order(self, str order_id):
         if order_id in self._in_flight_orders:
-            del self._in_flight_orders[order_id]
+            tracked_order = self._in_flight_orders.pop(order_id)
+            self._trade_ids.difference_update((tracked_order.trading_pair, trade_id)
+                                              for trade_id in tracked_order.trade_id_set)
         if order_id in self._order_not_found_records:
             del self._order_not_found_records[order_id]
 
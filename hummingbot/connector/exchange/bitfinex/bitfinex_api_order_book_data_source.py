@@ -49,6 +49,7 @@ from hummingbot.connector.exchange.bitfinex.bitfinex_order_book_message import \
     BitfinexOrderBookMessage
 from hummingbot.connector.exchange.bitfinex.bitfinex_order_book_tracker_entry import \
     BitfinexOrderBookTrackerEntry
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 BOOK_RET_TYPE = List[Dict[str, Any]]
 RESPONSE_SUCCESS = 200
@@ -91,7 +92,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get("https://api-pub.bitfinex.com/v2/conf/pub:list:pair:exchange", timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -260,7 +261,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     @async_ttl_cache(ttl=REQUEST_TTL, maxsize=CACHE_SIZE)
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             tickers_response, exchange_conf_response, symbol_details_response = await safe_gather(
                 client.get(f"{BITFINEX_REST_URL}/tickers?symbols=ALL"),
                 client.get(f"{BITFINEX_REST_URL}/conf/pub:info:pair"),
@@ -353,7 +354,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             # https://api-pub.bitfinex.com/v2/ticker/tBTCUSD
             ticker_url: str = join_paths(BITFINEX_REST_URL, f"ticker/{convert_to_exchange_trading_pair(trading_pair)}")
             resp = await client.get(ticker_url)
@@ -403,7 +404,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return self._prepare_snapshot(trading_pair, [BookStructure(*i) for i in raw_data])
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BitfinexOrderBook.snapshot_message_from_exchange(
@@ -422,7 +423,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         trading_pairs: List[str] = await self.get_trading_pairs()
         number_of_pairs: int = len(trading_pairs)
 
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             for idx, trading_pair in enumerate(trading_pairs):
                 try:
                     snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -551,7 +552,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs: List[str] = await self.get_trading_pairs()
 
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -64,6 +64,7 @@ from hummingbot.connector.exchange.bitfinex.bitfinex_utils import (
     convert_to_exchange_trading_pair,
     convert_from_exchange_token,
 )
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -510,7 +511,7 @@ cdef class BitfinexExchange(ExchangeBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size):
@@ -8,6 +8,7 @@ import uuid
 from typing import Optional, AsyncIterable, Any
 from websockets.exceptions import ConnectionClosed
 from async_timeout import timeout
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bitfinex import BITFINEX_WS_URI
 from hummingbot.connector.exchange.bitfinex.bitfinex_auth import BitfinexAuth
@@ -58,7 +59,7 @@ class BitfinexWebsocket():
             while True:
                 try:
                     msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    msg = ujson.loads(msg_str)
+                    msg = json_loads(msg_str)
                     # print("received", msg)
 
                     for queue in self._consumers.values():
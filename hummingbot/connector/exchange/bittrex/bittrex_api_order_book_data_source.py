@@ -9,17 +9,18 @@ from zlib import decompress, MAX_WBITS
 
 import pandas as pd
 import signalr_aio
-import ujson
 from signalr_aio import Connection
 from signalr_aio.hubs import Hub
 from async_timeout import timeout
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.connector.exchange.bittrex.bittrex_order_book import BittrexOrderBook
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 EXCHANGE_NAME = "Bittrex"
@@ -56,7 +57,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -65,7 +66,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return results
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BittrexOrderBook.snapshot_message_from_exchange(
@@ -100,7 +101,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -193,7 +194,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except Exception:
                 return {}
 
-            return ujson.loads(decoded_msg.decode())
+            return json_loads(decoded_msg.decode())
 
         def _is_market_delta(msg) -> bool:
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "orderBook"
@@ -202,7 +203,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "trade"
 
         output: Dict[str, Any] = {"nonce": None, "type": None, "results": {}}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = json_loads(msg)
         if len(msg.get("M", [])) > 0:
             output["results"] = _decode_message(msg["M"][0]["A"][0])
             output["nonce"] = time.time() * 1000
@@ -219,7 +220,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         # Technically this does not listen for snapshot, Instead it periodically queries for snapshots.
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
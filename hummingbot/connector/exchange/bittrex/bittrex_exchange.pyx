@@ -33,6 +33,7 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -969,7 +970,7 @@ cdef class BittrexExchange(ExchangeBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
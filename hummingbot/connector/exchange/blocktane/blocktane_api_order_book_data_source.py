@@ -14,15 +14,16 @@ from typing import (
 )
 import re
 import time
-import ujson
 import websockets
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.blocktane.blocktane_order_book import BlocktaneOrderBook
 from hummingbot.connector.exchange.blocktane.blocktane_utils import convert_to_exchange_trading_pair, convert_from_exchange_trading_pair
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 BLOCKTANE_REST_URL = "https://trade.blocktane.io/api/v2/xt/public"
 DIFF_STREAM_URL = "wss://trade.blocktane.io/api/v2/ws/public"
@@ -54,7 +55,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
             resp_json = await resp.json()
 
@@ -68,7 +69,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(EXCHANGE_INFO_URL, timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -105,7 +106,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return _prepare_snapshot(trading_pair, data["bids"], data["asks"])
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BlocktaneOrderBook.snapshot_message_from_exchange(
@@ -139,7 +140,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 ws: websockets.WebSocketClientProtocol = await self.get_ws_connection(stream_url)
                 async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+                    msg = json_loads(raw_msg)
                     if (list(msg.keys())[0].endswith("trades")):
                         trade_msg: OrderBookMessage = BlocktaneOrderBook.trade_message_from_exchange(msg)
                         output.put_nowait(trade_msg)
@@ -162,7 +163,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 ws: websockets.WebSocketClientProtocol = await self.get_ws_connection(stream_url)
                 async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+                    msg = json_loads(raw_msg)
                     key = list(msg.keys())[0]
                     if ('ob-inc' in key):
                         pair = re.sub(r'\.ob-inc', '', key)
@@ -185,7 +186,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
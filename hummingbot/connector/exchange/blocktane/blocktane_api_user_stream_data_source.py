@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import time
-import ujson
 import websockets
 from typing import (
     AsyncIterable,
@@ -12,6 +11,7 @@ from typing import (
     List
 )
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.blocktane.blocktane_auth import BlocktaneAuth
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -46,7 +46,7 @@ class BlocktaneAPIUserStreamDataSource(UserStreamTrackerDataSource):
             try:
                 ws = await self.get_ws_connection()
                 async for message in self._inner_messages(ws):
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = json_loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
@@ -44,6 +44,7 @@ from hummingbot.connector.exchange.blocktane.blocktane_order_book_tracker import
 from hummingbot.connector.exchange.blocktane.blocktane_user_stream_tracker import BlocktaneUserStreamTracker
 from hummingbot.connector.exchange.blocktane.blocktane_api_order_book_data_source import BlocktaneAPIOrderBookDataSource
 from hummingbot.connector.exchange.blocktane.blocktane_utils import convert_from_exchange_trading_pair, convert_to_exchange_trading_pair, split_trading_pair
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -968,7 +969,7 @@ cdef class BlocktaneExchange(ExchangeBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
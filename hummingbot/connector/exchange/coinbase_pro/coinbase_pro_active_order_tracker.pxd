@@ -1,10 +1,13 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.l3_order_book cimport L3OrderBook
+
 cdef class CoinbaseProActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
+    cdef L3OrderBook _book
 
+    cdef c_apply_diff_message(self, object message)
+    cdef c_apply_snapshot_message(self, object message)
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
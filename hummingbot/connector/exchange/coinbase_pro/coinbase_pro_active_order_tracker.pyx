@@ -4,15 +4,13 @@
 import logging
 import numpy as np
 from decimal import Decimal
-from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.l3_order_book cimport L3OrderBook
+from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 _cbpaot_logger = None
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
-
-CoinbaseProOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
 
 TYPE_OPEN = "open"
 TYPE_CHANGE = "change"
@@ -22,12 +20,9 @@ SIDE_BUY = "buy"
 SIDE_SELL = "sell"
 
 cdef class CoinbaseProActiveOrderTracker:
-    def __init__(self,
-                 active_asks: CoinbaseProOrderBookTrackingDictionary = None,
-                 active_bids: CoinbaseProOrderBookTrackingDictionary = None):
+    def __init__(self):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._book = L3OrderBook()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -37,52 +32,38 @@ cdef class CoinbaseProActiveOrderTracker:
         return _cbpaot_logger
 
     @property
-    def active_asks(self) -> CoinbaseProOrderBookTrackingDictionary:
-        """
-        Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
-        """
-        return self._active_asks
-
-    @property
-    def active_bids(self) -> CoinbaseProOrderBookTrackingDictionary:
+    def book(self) -> L3OrderBook:
         """
-        Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        Get all the active orders of the order book
         """
-        return self._active_bids
+        return self._book
 
     def volume_for_ask_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all ask order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
+        return self._book.c_get_level_amount(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all bid order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
+        return self._book.c_get_level_amount(True, float(price))
 
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+    cdef c_apply_diff_message(self, object message):
         """
-        Interpret an incoming diff message and apply changes to the order book accordingly
-        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        Interpret an incoming diff message and apply changes to the active orders. The price levels it changes are
+        kept in the book until they are popped.
         """
-
         cdef:
             dict content = message.content
             str msg_type = content["type"]
             str order_id
             str order_side
             str price_raw
-            object price
-            dict order_dict
-            str remaining_size
-            double timestamp = message.timestamp
-            double quantity = 0
+            double price
 
         order_id = content.get("order_id") or content.get("maker_order_id")
         order_side = content.get("side")
@@ -94,175 +75,61 @@ cdef class CoinbaseProActiveOrderTracker:
         if price_raw is None:
             raise ValueError(f"Unknown order price for message - '{message}'. Aborting.")
         elif price_raw == "null":  # 'change' messages have 'null' as price for market orders
-            return s_empty_diff, s_empty_diff
-        price = Decimal(price_raw)
+            return
+        price = float(price_raw)
 
         if msg_type == TYPE_OPEN:
-            order_dict = {
-                "order_id": order_id,
-                "remaining_size": content["remaining_size"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            else:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-
+            self._book.c_add_order(order_id.encode("utf8"), order_side == SIDE_BUY, price,
+                                   float(content["remaining_size"]))
         elif msg_type == TYPE_CHANGE:
             if content.get("new_size") is not None:
-                remaining_size = content["new_size"]
+                self._book.c_set_order_amount(order_id.encode("utf8"), float(content["new_size"]))
             elif content.get("new_funds") is not None:
-                remaining_size = str(Decimal(content["new_funds"]) / price)
+                self._book.c_set_order_amount(order_id.encode("utf8"),
+                                              float(Decimal(content["new_funds"]) / Decimal(price_raw)))
             else:
                 raise ValueError(f"Invalid change message - '{message}'. Aborting.")
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    self._active_bids[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    self._active_asks[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-
         elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-                    self._active_bids[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-
+            self._book.c_reduce_order_amount(order_id.encode("utf8"), float(content["size"]))
         elif msg_type == TYPE_DONE:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
-                return s_empty_diff, s_empty_diff
-
+            self._book.c_remove_order(order_id.encode("utf8"))
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
 
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+        """
+        Interpret an incoming diff message and apply changes to the order book accordingly
+        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        """
+        self.c_apply_diff_message(message)
+        return self._book.c_pop_level_update_arrays(message.timestamp, message.update_id)
+
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
         """
         Interpret an incoming snapshot message and apply changes to the order book accordingly
         :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
         """
         cdef:
-            object price
-            str order_id
-            str amount
-            dict order_dict
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
-            for order in snapshot_orders:
-                price = Decimal(order[0])
-                order_id = order[2]
-                amount = order[1]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
+            np.ndarray[np.float64_t, ndim=2] bids
+            np.ndarray[np.float64_t, ndim=2] asks
 
+        self.c_apply_snapshot_message(message)
+        bids, asks = self._book.c_get_level_arrays(message.timestamp, message.update_id)
         # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
+        return bids[np.argsort(-bids[:, 1])], asks[np.argsort(-asks[:, 1])]
 
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
+    cdef c_apply_snapshot_message(self, object message):
+        """
+        Replace all the active orders with the orders of a snapshot message
+        """
+        cdef:
+            object order
 
-        return bids, asks
+        self._book.c_clear()
+        for order in message.content["bids"]:
+            self._book.c_add_order(order[2].encode("utf8"), True, float(order[0]), float(order[1]))
+        for order in message.content["asks"]:
+            self._book.c_add_order(order[2].encode("utf8"), False, float(order[0]), float(order[1]))
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
@@ -296,3 +163,22 @@ cdef class CoinbaseProActiveOrderTracker:
         bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
         asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
         return bids_row, asks_row
+
+    def apply_diff_message(self, message):
+        """
+        Apply an incoming diff message to the active orders only, see apply_level_updates
+        """
+        self.c_apply_diff_message(message)
+
+    def apply_level_updates(self, order_book: OrderBook, update_id: int):
+        """
+        Apply the price levels changed by the diff messages since the last update to the order book, as one diff
+        """
+        self._book.c_apply_level_updates(order_book, update_id)
+
+    def apply_snapshot_message(self, message, order_book: OrderBook):
+        """
+        Replace the active orders and the content of the order book with an incoming snapshot message
+        """
+        self.c_apply_snapshot_message(message)
+        self._book.c_apply_snapshot(order_book, message.update_id)
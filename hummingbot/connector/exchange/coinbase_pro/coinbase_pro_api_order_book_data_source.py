@@ -15,6 +15,7 @@ import time
 import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -24,6 +25,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book_tracker_entry import CoinbaseProOrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 COINBASE_REST_URL = "https://api.pro.coinbase.com"
 COINBASE_WS_FEED = "wss://ws-feed.pro.coinbase.com"
@@ -55,7 +57,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             ticker_url: str = f"{COINBASE_REST_URL}/products/{trading_pair}/ticker"
             resp = await client.get(ticker_url)
             resp_json = await resp.json()
@@ -64,7 +66,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{COINBASE_REST_URL}/products/", timeout=5) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -96,7 +98,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
@@ -118,7 +120,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :returns: A dictionary of order book trackers for each trading pair
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = self._trading_pairs
             retval: Dict[str, OrderBookTrackerEntry] = {}
 
@@ -203,7 +205,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     }
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Coinbase Pro Websocket message does not contain a type - {msg}")
@@ -241,7 +243,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
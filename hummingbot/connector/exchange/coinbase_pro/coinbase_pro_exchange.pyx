@@ -50,6 +50,7 @@ from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_in_flight_order imp
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_in_flight_order cimport CoinbaseProInFlightOrder
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 s_logger = None
 s_decimal_0 = Decimal("0.0")
@@ -292,7 +293,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
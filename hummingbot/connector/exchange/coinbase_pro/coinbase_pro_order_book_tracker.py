@@ -29,6 +29,8 @@ from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_active_order_tracke
 
 
 class CoinbaseProOrderBookTracker(OrderBookTracker):
+    MAX_DIFF_BATCH_SIZE = 1000
+
     _cbpobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -129,6 +131,7 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
 
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        batched_diff_messages: int = 0
 
         while True:
             try:
@@ -141,8 +144,13 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
+                    active_order_tracker.apply_diff_message(message)
+                    # The levels changed by a burst of diffs go to the order book as one diff
+                    batched_diff_messages += 1
+                    if (len(saved_messages) == 0 and message_queue.empty()) or \
+                            batched_diff_messages >= self.MAX_DIFF_BATCH_SIZE:
+                        active_order_tracker.apply_level_updates(order_book, message.update_id)
+                        batched_diff_messages = 0
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -159,11 +167,12 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
                     # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
                     replay_position = bisect.bisect_right(past_diffs, message)
                     replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+                    active_order_tracker.apply_snapshot_message(message, order_book)
                     for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+                        active_order_tracker.apply_diff_message(diff_message)
+                    if len(replay_diffs) > 0:
+                        active_order_tracker.apply_level_updates(order_book, replay_diffs[-1].update_id)
+                    batched_diff_messages = 0
 
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
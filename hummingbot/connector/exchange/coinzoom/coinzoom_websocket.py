@@ -3,6 +3,7 @@ import asyncio
 import logging
 import websockets
 import json
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.coinzoom.coinzoom_constants import Constants
 
 
@@ -65,7 +66,7 @@ class CoinzoomWebsocket():
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = json_loads(raw_msg_str)
 
                         # CoinZoom doesn't support ping or heartbeat messages.
                         # Can handle them here if that changes - use `safe_ensure_future`.
@@ -43,6 +43,7 @@ from hummingbot.connector.exchange.crypto_com import crypto_com_utils
 from hummingbot.connector.exchange.crypto_com import crypto_com_constants as CONSTANTS
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.api_throttler.varied_rate_api_throttler import VariedRateThrottler
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 ctce_logger = None
 s_decimal_NaN = Decimal("nan")
@@ -236,7 +237,7 @@ class CryptoComExchange(ExchangeBase):
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
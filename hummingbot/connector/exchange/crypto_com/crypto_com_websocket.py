@@ -5,6 +5,7 @@ import logging
 import websockets
 import ujson
 import hummingbot.connector.exchange.crypto_com.crypto_com_constants as constants
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
@@ -64,7 +65,7 @@ class CryptoComWebsocket(RequestId):
             while True:
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    raw_msg = ujson.loads(raw_msg_str)
+                    raw_msg = json_loads(raw_msg_str)
                     if "method" in raw_msg and raw_msg["method"] == "public/heartbeat":
                         payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
                         safe_ensure_future(self._client.send(ujson.dumps(payload)))
@@ -2,7 +2,6 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import traceback
 import pandas as pd
 import hummingbot.connector.exchange.digifinex.digifinex_constants as constants
@@ -13,6 +12,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_registry import shared_client_session
 from . import digifinex_utils
 from .digifinex_active_order_tracker import DigifinexActiveOrderTracker
 from .digifinex_order_book import DigifinexOrderBook
@@ -41,7 +41,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{constants.REST_URL}/ticker")
             resp_json = await resp.json()
             for t_pair in trading_pairs:
@@ -53,7 +53,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/ticker", timeout=10) as response:
                 if response.status == 200:
                     from hummingbot.connector.exchange.digifinex.digifinex_utils import \
@@ -71,7 +71,7 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             orderbook_response = await client.get(
                 f"{constants.REST_URL}/order_book?limit=150&symbol="
                 f"{digifinex_utils.convert_to_exchange_trading_pair(trading_pair)}"
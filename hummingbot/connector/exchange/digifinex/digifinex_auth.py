@@ -2,11 +2,11 @@ import hmac
 import hashlib
 import base64
 import urllib
-import aiohttp
 from typing import List, Dict, Any
 # from hummingbot.connector.exchange.digifinex.digifinex_utils import get_ms_timestamp
 from hummingbot.connector.exchange.digifinex import digifinex_constants as Constants
 from hummingbot.connector.exchange.digifinex.time_patcher import TimePatcher
+from hummingbot.core.utils.http_client_registry import shared_client_session
 # import time
 
 _time_patcher: TimePatcher = None
@@ -33,7 +33,7 @@ class DigifinexAuth():
 
     @classmethod
     async def query_time_func() -> float:
-        async with aiohttp.ClientSession() as session:
+        async with shared_client_session() as session:
             async with session.get(Constants.REST_URL + '/time') as resp:
                 resp_data: Dict[str, float] = await resp.json()
                 return float(resp_data["server_time"])
@@ -1,6 +1,7 @@
 import aiohttp
 from hummingbot.connector.exchange.digifinex.digifinex_auth import DigifinexAuth
 from hummingbot.connector.exchange.digifinex.digifinex_rest_api import DigifinexRestApi
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 
 class DigifinexGlobal:
@@ -15,5 +16,5 @@ class DigifinexGlobal:
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
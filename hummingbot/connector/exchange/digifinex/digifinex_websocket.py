@@ -12,6 +12,7 @@ import hummingbot.connector.exchange.digifinex.digifinex_constants as constants
 
 from typing import Optional, AsyncIterable, Any, List
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.digifinex.digifinex_auth import DigifinexAuth
 from hummingbot.connector.exchange.digifinex.digifinex_utils import RequestId
@@ -96,7 +97,7 @@ class DigifinexWebsocket(RequestId):
                 try:
                     raw_msg_bytes: bytes = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
                     inflated_msg: bytes = zlib.decompress(raw_msg_bytes)
-                    raw_msg = ujson.loads(inflated_msg)
+                    raw_msg = json_loads(inflated_msg)
                     # if "method" in raw_msg and raw_msg["method"] == "server.ping":
                     #     payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
                     #     safe_ensure_future(self._client.send(ujson.dumps(payload)))
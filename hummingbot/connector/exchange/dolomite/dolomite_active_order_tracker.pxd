@@ -1,8 +1,9 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.l3_order_book cimport L3OrderBook
+
 cdef class DolomiteActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
+    cdef L3OrderBook _book
 
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
@@ -15,6 +15,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.connector.exchange.dolomite.dolomite_active_order_tracker import DolomiteActiveOrderTracker
 from hummingbot.connector.exchange.dolomite.dolomite_order_book import DolomiteOrderBook
@@ -23,6 +24,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.connector.exchange.dolomite.dolomite_order_book_message import DolomiteOrderBookMessage
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 MARKETS_URL = "/v1/markets"
@@ -59,7 +61,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             # Hard coded to use the live exchange api for auto completing markets (opposed to using testnet)
             markets_response: aiohttp.ClientResponse = await client.get(
                 f"https://exchange-api.dolomite.io{MARKETS_URL}"
@@ -102,7 +104,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.dolomite.dolomite_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get("https://exchange-api.dolomite.io/v1/markets", timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -143,7 +145,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             retval: Dict[str, DolomiteOrderBookTrackerEntry] = {}
             number_of_pairs: int = len(trading_pairs)
@@ -226,7 +228,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(orderbook_subscription_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        message = ujson.loads(raw_msg)
+                        message = json_loads(raw_msg)
 
                         if message["route"] == SNAPSHOT_WS_ROUTE and message["action"] == SNAPSHOT_WS_UPDATE_ACTION:
                             snapshot_timestamp: float = time.time()
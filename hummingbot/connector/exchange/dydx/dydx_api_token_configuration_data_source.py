@@ -11,6 +11,7 @@ from typing import (
 )
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 TOKEN_CONFIGURATIONS_URL = 'https://api.dydx.exchange/v2/markets'
 
@@ -36,7 +37,7 @@ class DydxAPITokenConfigurationDataSource():
         return configuration_data_source
 
     async def _configure(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             response: aiohttp.ClientResponse = await client.get(
                 f"{TOKEN_CONFIGURATIONS_URL}"
             )
@@ -12,6 +12,7 @@ from typing import (
 import time
 import ujson
 import websockets
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.dydx.dydx_auth import DydxAuth
@@ -74,7 +75,7 @@ class DydxAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_loads(raw_msg)
                         if diff_msg["type"] == "channel_data":
                             output.put_nowait(diff_msg)
             except asyncio.CancelledError:
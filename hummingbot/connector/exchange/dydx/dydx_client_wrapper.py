@@ -4,6 +4,7 @@ from functools import partial
 
 from dydx.client import Client
 from dydx.exceptions import DydxAPIError
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 BASE_URL = 'https://api.dydx.exchange'
 FILLS_ROUTE = '/v2/fills'
@@ -52,7 +53,7 @@ class DYDXClientWrapper:
         return await f
 
     async def get_fills(self, exchange_order_id):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             response: aiohttp.ClientResponse = await client.get(
                 f"{BASE_URL}{FILLS_ROUTE}",
                 params={
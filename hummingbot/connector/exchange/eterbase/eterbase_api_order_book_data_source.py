@@ -16,6 +16,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.eterbase.eterbase_order_book import EterbaseOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -27,6 +28,7 @@ import hummingbot.connector.exchange.eterbase.eterbase_constants as constants
 from hummingbot.connector.exchange.eterbase.eterbase_utils import (
     convert_to_exchange_trading_pair,
     convert_from_exchange_trading_pair)
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 MAX_RETRIES = 20
 NaN = float("nan")
@@ -53,7 +55,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{constants.REST_URL}/tickers")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -68,7 +70,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         *required
         Returns all currently active BTC trading pairs from Eterbase, sorted by volume in descending order.
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -156,7 +158,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         """
         tp_map_mid: Dict[str, str] = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -171,7 +173,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.eterbase.eterbase_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get("https://api.eterbase.exchange/api/markets", timeout=10) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -207,7 +209,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             td_map_id: Dict[str, str] = await self.get_map_marketid()
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
@@ -274,7 +276,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     }
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
@@ -312,7 +314,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
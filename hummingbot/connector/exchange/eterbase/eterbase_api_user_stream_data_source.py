@@ -11,6 +11,7 @@ from typing import (
 import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.connector.exchange.eterbase.eterbase_auth import EterbaseAuth
 from hummingbot.logger import HummingbotLogger
@@ -84,7 +85,7 @@ class EterbaseAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         self.logger().debug(f"websocket raw msg: {raw_msg}")
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
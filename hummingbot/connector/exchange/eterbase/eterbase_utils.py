@@ -5,6 +5,7 @@ from hummingbot.connector.exchange.eterbase.eterbase_auth import EterbaseAuth
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.http_client_registry import get_shared_client
 import aiohttp
 import asyncio
 import json
@@ -12,8 +13,6 @@ from threading import Thread
 
 _eu_logger = logging.getLogger(__name__)
 
-shared_client = None
-
 marketid_map = None
 
 API_CALL_TIMEOUT = 10.0
@@ -30,15 +29,8 @@ async def _http_client(loop: Optional = None) -> aiohttp.ClientSession:
     :returns: Shared client session instance
     """
 
-    # calling API from different thread
-    if loop is not None:
-        return aiohttp.ClientSession(loop = loop)
-
-    # calling API fro main thread
-    global shared_client
-    if shared_client is None:
-        shared_client = aiohttp.ClientSession()
-    return shared_client
+    # The registry keeps one session per event loop, so calls from a different thread get their own session
+    return get_shared_client()
 
 
 async def api_request(http_method: str,
@@ -46,6 +46,7 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange.ftx.ftx_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair)
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -855,7 +856,7 @@ cdef class FtxExchange(ExchangeBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
@@ -4,6 +4,7 @@ import logging
 import websockets
 import json
 import time
+from hummingbot.core.utils.json_decoder import get_json_decoder
 from hummingbot.connector.exchange.gate_io.gate_io_constants import Constants
 
 
@@ -41,6 +42,7 @@ class GateIoWebsocket():
         self._WS_URL = Constants.WS_URL
         self._client: Optional[websockets.WebSocketClientProtocol] = None
         self._is_subscribed = False
+        self._json_loads = get_json_decoder()
 
     @property
     def is_subscribed(self):
@@ -66,7 +68,7 @@ class GateIoWebsocket():
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = self._json_loads(raw_msg_str)
 
                         # Raise API error for login failures.
                         if msg.get('error', None) is not None:
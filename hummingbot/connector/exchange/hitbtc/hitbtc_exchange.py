@@ -51,6 +51,7 @@ from hummingbot.connector.exchange.hitbtc.hitbtc_utils import (
 )
 from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
 from hummingbot.core.data_type.common import OpenOrder
+from hummingbot.core.utils.http_client_registry import get_shared_client
 ctce_logger = None
 s_decimal_NaN = Decimal("nan")
 
@@ -240,7 +241,7 @@ class HitbtcExchange(ExchangeBase):
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
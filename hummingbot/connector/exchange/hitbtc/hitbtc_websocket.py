@@ -4,6 +4,7 @@ import copy
 import logging
 import websockets
 import json
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.hitbtc.hitbtc_constants import Constants
 
 
@@ -51,7 +52,7 @@ class HitbtcWebsocket(RequestId):
             auth_params = self._auth.generate_auth_dict_ws(self.generate_request_id())
             await self._emit("login", auth_params, no_id=True)
             raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
-            json_msg = json.loads(raw_msg_str)
+            json_msg = json_loads(raw_msg_str)
             if json_msg.get("result") is not True:
                 err_msg = json_msg.get('error', {}).get('message')
                 raise HitbtcAPIError({"error": f"Failed to authenticate to websocket - {err_msg}."})
@@ -72,7 +73,7 @@ class HitbtcWebsocket(RequestId):
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = json_loads(raw_msg_str)
                         # HitBTC doesn't support ping or heartbeat messages.
                         # Can handle them here if that changes - use `safe_ensure_future`.
                         yield msg
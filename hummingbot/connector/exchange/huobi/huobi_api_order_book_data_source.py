@@ -17,12 +17,14 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.huobi.huobi_order_book import HuobiOrderBook
 from hummingbot.connector.exchange.huobi.huobi_utils import convert_to_exchange_trading_pair
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 HUOBI_SYMBOLS_URL = "https://api.huobi.pro/v1/common/symbols"
 HUOBI_TICKER_URL = "https://api.huobi.pro/market/tickers"
@@ -49,7 +51,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(HUOBI_TICKER_URL)
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -62,7 +64,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.huobi.huobi_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(HUOBI_SYMBOLS_URL, timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -98,7 +100,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
                 snapshot,
@@ -144,7 +146,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
                         # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = json_loads(encoded_msg.decode('utf-8'))
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -182,7 +184,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
                         # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = json_loads(encoded_msg.decode('utf-8'))
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -203,7 +205,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
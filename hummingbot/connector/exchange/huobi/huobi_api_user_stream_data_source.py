@@ -13,6 +13,8 @@ from typing import (
 )
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.http_client_registry import get_shared_client
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.huobi.huobi_auth import HuobiAuth
 
@@ -44,7 +46,6 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
         self._listen_for_user_steam_task = None
         self._last_recv_time: float = 0
         self._auth: HuobiAuth = huobi_auth
-        self._client_session: aiohttp.ClientSession = None
         self._websocket_connection: aiohttp.ClientWebSocketResponse = None
         super().__init__()
 
@@ -87,11 +88,8 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
         self._last_recv_time = time.time()
 
     async def get_ws_connection(self) -> aiohttp.client._WSRequestContextManager:
-        if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
-
         stream_url: str = f"{HUOBI_WS_ENDPOINT}"
-        return self._client_session.ws_connect(stream_url)
+        return get_shared_client().ws_connect(stream_url)
 
     async def _socket_user_stream(self) -> AsyncIterable[str]:
         """
@@ -106,7 +104,7 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     # since all ws messages from huobi are TEXT, any other type should cause ws to reconnect
                     return
 
-                message = raw_msg.json()
+                message = raw_msg.json(loads=json_loads)
 
                 # Handle ping messages
                 if message["action"] == "ping":
@@ -150,6 +148,3 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 if self._websocket_connection is not None:
                     await self._websocket_connection.close()
                     self._websocket_connection = None
-                if self._client_session is not None:
-                    await self._client_session.close()
-                    self._client_session = None
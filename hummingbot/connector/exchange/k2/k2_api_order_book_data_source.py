@@ -2,19 +2,20 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import ujson
 import websockets
 
 import hummingbot.connector.exchange.k2.k2_constants as constants
 
 from typing import Optional, List, Dict, AsyncIterable, Any
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.k2.k2_order_book import K2OrderBook
 from hummingbot.connector.exchange.k2 import k2_utils
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -40,7 +41,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS_STATS}") as resp:
                 resp_json = await resp.json()
                 if resp_json["success"] is False:
@@ -58,7 +59,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS}", timeout=10) as response:
                 if response.status == 200:
                     try:
@@ -74,7 +75,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Obtain orderbook using REST API
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             params = {"symbol": k2_utils.convert_to_exchange_trading_pair(trading_pair)}
             async with client.get(url=f"{constants.REST_URL}{constants.GET_ORDER_BOOK}",
                                   params=params) as resp:
@@ -131,7 +132,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if msg["method"] != "marketchanged":
                             continue
                         for trade_entry in msg["data"]["trades"]:
@@ -160,7 +161,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
-                        response = ujson.loads(raw_msg)
+                        response = json_loads(raw_msg)
                         timestamp = int(time.time() * 1e3)
                         if response["method"] == "SubscribeOrderBook":
                             trading_pair = k2_utils.convert_from_exchange_trading_pair(response["pair"])
@@ -169,7 +170,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
                                 timestamp=timestamp,
                                 metadata={"trading_pair": trading_pair})
                         elif response["method"] == "orderbookchanged":
-                            data = ujson.loads(response["data"])
+                            data = json_loads(response["data"])
                             trading_pair = k2_utils.convert_from_exchange_trading_pair(data["pair"])
                             message: OrderBookMessage = K2OrderBook.diff_message_from_exchange(
                                 msg=data,
@@ -15,6 +15,7 @@ from typing import (
 
 import hummingbot.connector.exchange.k2.k2_constants as constants
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.k2.k2_auth import K2Auth
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -67,7 +68,7 @@ class K2APIUserStreamDataSource(UserStreamTrackerDataSource):
                 await ws.send(ujson.dumps(auth_payload))
                 resp = await ws.recv()
 
-                msg: Dict[str, Any] = ujson.loads(resp)
+                msg: Dict[str, Any] = json_loads(resp)
                 if msg["success"] is not True:
                     raise
                 else:
@@ -92,7 +93,7 @@ class K2APIUserStreamDataSource(UserStreamTrackerDataSource):
             await ws.send(ujson.dumps(params))
             resp = await ws.recv()
 
-            msg: Dict[str, Any] = ujson.loads(resp)
+            msg: Dict[str, Any] = json_loads(resp)
             if msg["success"] is not True:
                 raise
 
@@ -122,7 +123,7 @@ class K2APIUserStreamDataSource(UserStreamTrackerDataSource):
                 await self._subscribe_to_channels(self._websocket_client)
                 self.logger().info("Subscribed to all Private WebSocket streams. ")
                 async for msg in self._inner_messages(self._websocket_client):
-                    output.put_nowait(ujson.loads(msg))
+                    output.put_nowait(json_loads(msg))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -41,6 +41,7 @@ from hummingbot.connector.exchange.k2.k2_in_flight_order import K2InFlightOrder
 from hummingbot.connector.exchange.k2 import k2_utils
 from hummingbot.connector.exchange.k2 import k2_constants as constants
 from hummingbot.core.data_type.common import OpenOrder
+from hummingbot.core.utils.http_client_registry import get_shared_client
 k2_logger = None
 s_decimal_NaN = Decimal("nan")
 
@@ -232,7 +233,7 @@ class K2Exchange(ExchangeBase):
         :returns Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
@@ -16,6 +16,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -25,6 +26,7 @@ from hummingbot.connector.exchange.kraken.kraken_order_book import KrakenOrderBo
 from hummingbot.connector.exchange.kraken.kraken_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair)
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 SNAPSHOT_REST_URL = "https://api.kraken.com/0/public/Depth"
@@ -58,7 +60,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"{TICKER_URL}?pair={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
             record = list(resp_json["result"].values())[0]
@@ -89,7 +91,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
@@ -126,7 +128,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(ASSET_PAIRS_URL, timeout=5) as response:
                     if response.status == 200:
                         from hummingbot.connector.exchange.kraken.kraken_utils import convert_from_exchange_trading_pair
@@ -155,7 +157,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg: List[Any] = ujson.loads(raw_msg)
+                        msg: List[Any] = json_loads(raw_msg)
                         trades: List[Dict[str, Any]] = [{"pair": convert_from_exchange_trading_pair(msg[-1]), "trade": trade} for trade in msg[1]]
                         for trade in trades:
                             trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(trade)
@@ -175,7 +177,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         msg_dict = {"trading_pair": convert_from_exchange_trading_pair(msg[-1]),
                                     "asks": msg[1].get("a", []) or msg[1].get("as", []) or [],
                                     "bids": msg[1].get("b", []) or msg[1].get("bs", []) or []}
@@ -198,7 +200,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
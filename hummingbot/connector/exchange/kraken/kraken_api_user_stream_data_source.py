@@ -12,10 +12,12 @@ from typing import (
 import time
 import ujson
 import websockets
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kraken.kraken_auth import KrakenAuth
 from hummingbot.connector.exchange.kraken.kraken_order_book import KrakenOrderBook
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 KRAKEN_WS_URL = "wss://ws-auth.kraken.com/"
 
@@ -106,7 +108,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_loads(raw_msg)
                         output.put_nowait(diff_msg)
             except asyncio.CancelledError:
                 raise
@@ -118,7 +120,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None or self._shared_client.closed:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _inner_messages(self,
@@ -147,5 +149,4 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
             await ws.close()
 
     async def stop(self):
-        if self._shared_client is not None and not self._shared_client.closed:
-            await self._shared_client.close()
+        self._shared_client = None
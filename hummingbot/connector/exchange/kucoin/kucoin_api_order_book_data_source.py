@@ -25,6 +25,7 @@ from websockets.client import Connect as WSConnectionContext
 from urllib.parse import urlencode
 from yarl import URL
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -37,6 +38,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair,
 )
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 SNAPSHOT_REST_URL = "https://api.kucoin.com/api/v3/market/orderbook/level2"
 SNAPSHOT_REST_URL_NO_AUTH = "https://api.kucoin.com/api/v1/market/orderbook/level2_100"
@@ -100,7 +102,7 @@ class KucoinWSConnectionIterator:
 
     @staticmethod
     async def get_ws_connection_context() -> WSConnectionContext:
-        async with aiohttp.ClientSession() as session:
+        async with shared_client_session() as session:
             async with session.post('https://api.kucoin.com/api/v1/bullet-public', data=b'') as resp:
                 response: aiohttp.ClientResponse = resp
                 if response.status != 200:
@@ -240,7 +242,7 @@ class KucoinWSConnectionIterator:
 
                 # Get messages
                 async for raw_msg in self._inner_messages(ws):
-                    msg: Dict[str, any] = json.loads(raw_msg)
+                    msg: Dict[str, any] = json_loads(raw_msg)
                     yield msg
         finally:
             # Clean up.
@@ -301,7 +303,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -311,7 +313,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
@@ -340,7 +342,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, self._auth)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -517,7 +519,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs if self._trading_pairs else await self.fetch_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, self._auth)
@@ -12,9 +12,11 @@ from typing import (
 import ujson
 import websockets
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 KUCOIN_API_ENDPOINT = "https://api.kucoin.com"
 KUCOIN_USER_STREAM_ENDPOINT = "/api/v1/bullet-private"
@@ -49,7 +51,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             header = self._kucoin_auth.add_auth_to_params("POST", KUCOIN_USER_STREAM_ENDPOINT)
             async with client.post(f"{KUCOIN_API_ENDPOINT}{KUCOIN_USER_STREAM_ENDPOINT}", headers=header) as response:
                 response: aiohttp.ClientResponse = response
@@ -102,7 +104,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     async with (await self.get_ws_connection()) as ws:
                         await self._subscribe_topic(ws)
                         async for msg in self._inner_messages(ws):
-                            decoded: Dict[str, any] = ujson.loads(msg)
+                            decoded: Dict[str, any] = json_loads(msg)
                             output.put_nowait(decoded)
 
             except asyncio.CancelledError:
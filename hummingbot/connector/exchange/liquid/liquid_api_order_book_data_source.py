@@ -8,6 +8,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -16,6 +17,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.liquid.liquid_order_book import LiquidOrderBook
 from hummingbot.connector.exchange.liquid.liquid_order_book_tracker_entry import LiquidOrderBookTrackerEntry
 from hummingbot.connector.exchange.liquid.constants import Constants
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -37,7 +39,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
             resp_json = await resp.json()
             for record in resp_json:
@@ -136,7 +138,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         |-- cfd_enabled: bool
         |-- last_event_timestamp: str
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             exchange_markets_response: aiohttp.ClientResponse = await client.get(
                 Constants.GET_EXCHANGE_MARKETS_URL)
 
@@ -163,7 +165,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
                         products: List[Dict[str, Any]] = await response.json()
@@ -237,7 +239,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         await self.get_trading_pairs()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
@@ -256,7 +258,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         active markets
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
 
             trading_pairs: List[str] = await self.get_trading_pairs()
 
@@ -348,7 +350,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             await ws.send(ujson.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        diff_msg: Dict[str, Any] = json_loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -360,7 +362,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             buy_or_sell = diff_msg.get('channel').split('_')[-1].lower()
                             side = 'asks' if buy_or_sell == Constants.SIDE_ASK else 'bids'
                             diff_msg = {
-                                '{0}'.format(side): ujson.loads(diff_msg.get('data', [])),
+                                '{0}'.format(side): json_loads(diff_msg.get('data', [])),
                                 'trading_pair': trading_pair
                             }
                             diff_timestamp: float = time.time()
@@ -394,7 +396,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
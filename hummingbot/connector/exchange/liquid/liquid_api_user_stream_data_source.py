@@ -14,6 +14,7 @@ import time
 import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.connector.exchange.liquid.constants import Constants
@@ -88,7 +89,7 @@ class LiquidAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = json_loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -53,6 +53,7 @@ from hummingbot.connector.exchange.liquid.liquid_in_flight_order import LiquidIn
 from hummingbot.connector.exchange.liquid.liquid_in_flight_order cimport LiquidInFlightOrder
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -290,7 +291,7 @@ cdef class LiquidExchange(ExchangeBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
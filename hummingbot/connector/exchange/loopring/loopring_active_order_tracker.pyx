@@ -4,10 +4,9 @@
 import logging
 
 import numpy as np
-import math
-from decimal import Decimal
 
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.l3_order_book cimport L3OrderBook
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
 
@@ -15,11 +14,10 @@ s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 _ddaot_logger = None
 
 cdef class LoopringActiveOrderTracker:
-    def __init__(self, token_configuration, active_asks=None, active_bids=None):
+    def __init__(self, token_configuration):
         super().__init__()
         self._token_config: LoopringAPITokenConfigurationDataSource = token_configuration
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._book = L3OrderBook()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -29,77 +27,34 @@ cdef class LoopringActiveOrderTracker:
         return _ddaot_logger
 
     @property
-    def active_asks(self):
-        return self._active_asks
-
-    @property
-    def active_bids(self):
-        return self._active_bids
+    def book(self) -> L3OrderBook:
+        """
+        Get all the active orders of the order book
+        """
+        return self._book
 
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
         cdef:
-            object price
-            str order_id
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-
-        for bid_order in message.bids:
-            order_id = str(message.timestamp)
-            price, totalAmount = self.get_rates_and_quantities(bid_order, message.content["topic"]["market"])
-            order_dict = {
-                "availableAmount": Decimal(totalAmount),
-                "orderId": order_id
-            }
-            if price in self._active_bids:
-                self._active_bids[price][order_id] = order_dict
-            else:
-                self._active_bids[price] = {
-                    order_id: order_dict
-                }
-
-        for ask_order in message.asks:
-            price = Decimal(ask_order[0])
-            order_id = str(message.timestamp)
-            price, totalAmount = self.get_rates_and_quantities(ask_order, message.content["topic"]["market"])
-            order_dict = {
-                "availableAmount": Decimal(totalAmount),
-                "orderId": order_id
-            }
-
-            if price in self._active_asks:
-                self._active_asks[price][order_id] = order_dict
-            else:
-                self._active_asks[price] = {
-                    order_id: order_dict
-                }
-
+            str market = message.content["topic"]["market"]
+            object entry
+            double price
+            double amount
+            np.ndarray[np.float64_t, ndim=2] bids
+            np.ndarray[np.float64_t, ndim=2] asks
+
+        # Refresh all order tracking. The snapshot entries are price levels, an order is identified by its side and
+        # price.
+        self._book.c_clear()
+        for entry in message.bids:
+            price, amount = self.get_rates_and_quantities(entry, market)
+            self._book.c_add_order(f"buy:{price}".encode("utf8"), True, price, amount)
+        for entry in message.asks:
+            price, amount = self.get_rates_and_quantities(entry, market)
+            self._book.c_add_order(f"sell:{price}".encode("utf8"), False, price, amount)
+
+        bids, asks = self._book.c_get_level_arrays(message.timestamp, message.update_id)
         # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  Decimal(price),
-                  sum([Decimal(order_dict["availableAmount"])
-                       for order_dict in self._active_bids[price].values()]),
-                  order_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  Decimal(price),
-                  sum([Decimal(order_dict["availableAmount"])
-                       for order_dict in self._active_asks[price].values()]),
-                  order_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-        return bids, asks
+        return bids[np.argsort(-bids[:, 1])], asks[np.argsort(-asks[:, 1])]
 
     def get_rates_and_quantities(self, entry, market) -> tuple:
         pair_tuple = tuple(market.split('-'))
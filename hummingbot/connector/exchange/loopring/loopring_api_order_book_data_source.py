@@ -12,6 +12,7 @@ from websockets.exceptions import ConnectionClosed
 # from hummingbot.core.utils import async_ttl_cache
 # from hummingbot.core.utils.async_utils import safe_gather
 # from hummingbot.connector.exchange.loopring.loopring_active_order_tracker import LoopringActiveOrderTracker
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.loopring.loopring_order_book import LoopringOrderBook
 # from hummingbot.connector.exchange.loopring.loopring_order_book_tracker_entry import LoopringOrderBookTrackerEntry
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
@@ -22,6 +23,7 @@ from hummingbot.logger import HummingbotLogger
 # from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 MARKETS_URL = "/api/v3/exchange/markets"
@@ -55,7 +57,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
             resp_json = await resp.json()
             return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
@@ -80,7 +82,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot["data"] = {"bids": snapshot["bids"], "asks": snapshot["asks"]}
             snapshot_timestamp: float = time.time()
@@ -114,7 +116,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -148,7 +150,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if "topic" in msg:
                                 for datum in msg["data"]:
                                     trade_msg: OrderBookMessage = LoopringOrderBook.trade_message_from_exchange(datum, msg)
@@ -175,7 +177,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if "topic" in msg:
                                 order_msg: OrderBookMessage = LoopringOrderBook.diff_message_from_exchange(msg)
                                 output.put_nowait(order_msg)
@@ -203,7 +205,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                     async for raw_msg in self._inner_messages(ws):
                         if len(raw_msg) > 4:
-                            msg = ujson.loads(raw_msg)
+                            msg = json_loads(raw_msg)
                             if ("topic" in msg.keys()):
                                 order_msg: OrderBookMessage = LoopringOrderBook.snapshot_message_from_exchange(msg, msg["ts"])
                                 output.put_nowait(order_msg)
@@ -17,6 +17,7 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -29,6 +30,7 @@ from hummingbot.connector.exchange.okex.constants import (
     OKEX_TICKERS_URL,
     OKEX_WS_URI_PUBLIC,
 )
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 from dateutil.parser import parse as dataparse
 
@@ -63,7 +65,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Refer to Calling a Class method for an example on how to test this particular function.
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_TICKERS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -81,7 +83,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         # Returns a List of str, representing each active trading pair on the exchange.
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_INSTRUMENTS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -100,7 +102,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return trading_pairs
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
 
             snapshot_msg: OrderBookMessage = OkexOrderBook.snapshot_message_from_exchange(
@@ -115,7 +117,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     # Move this to OrderBookTrackerDataSource or this needs a whole refactor?
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_TICKERS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -199,7 +201,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         elif '"channel": "orders"' in decoded_msg:
                             self.logger().debug(f"Received new trade: {decoded_msg}")
 
-                            for data in json.loads(decoded_msg)['data']:
+                            for data in json_loads(decoded_msg)['data']:
                                 trading_pair = data['instId']
                                 trade_message: OrderBookMessage = OkexOrderBook.trade_message_from_exchange(
                                     data, data['uTime'], metadata={"trading_pair": trading_pair}
@@ -260,7 +262,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         if '"event":"subscribe"' in decoded_msg:
                             self.logger().debug(f"Subscribed to channel, full message: {decoded_msg}")
                         elif '"action":"update"' in decoded_msg:
-                            msg = json.loads(decoded_msg)
+                            msg = json_loads(decoded_msg)
                             for data in msg['data']:
                                 order_book_message: OrderBookMessage = OkexOrderBook.diff_message_from_exchange(data, int(data['ts']), msg['arg'])
                                 output.put_nowait(order_book_message)
@@ -278,7 +280,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
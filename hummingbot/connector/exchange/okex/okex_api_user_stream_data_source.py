@@ -13,6 +13,7 @@ from typing import (
     Any
 )
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.okex.okex_auth import OKExAuth
@@ -54,7 +55,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
         await self._websocket_connection.send(json.dumps(self._auth.generate_ws_auth()))
 
         resp = await self._websocket_connection.recv()
-        msg = json.loads(resp)
+        msg = json_loads(resp)
 
         if msg["event"] != 'login':
             self.logger().error(f"Error occurred authenticating to websocket API server. {msg}")
@@ -69,7 +70,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
         request = json.dumps(subscribe_request)
         await self._websocket_connection.send(request)
         resp = await self._websocket_connection.recv()
-        msg = json.loads(resp)
+        msg = json_loads(resp)
         if msg["event"] != "subscribe":
             self.logger().error(f"Error occurred subscribing to topic. {topic}. {msg}")
         self.logger().info(f"Successfully subscribed to {topic}")
@@ -87,7 +88,7 @@ class OkexAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 raw_msg = await asyncio.wait_for(self._websocket_connection.recv(), timeout=20)
 
                 # yield json.loads(inflate(raw_msg))
-                yield json.loads(raw_msg)
+                yield json_loads(raw_msg)
             except asyncio.TimeoutError:
                 try:
                     await self._websocket_connection.send('ping')
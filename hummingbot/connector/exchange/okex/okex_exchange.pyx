@@ -54,6 +54,7 @@ from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 from hummingbot.connector.exchange.okex.constants import *
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 
 hm_logger = None
@@ -254,7 +255,7 @@ cdef class OkexExchange(ExchangeBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def _api_request(self,
@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-import aiohttp
 import asyncio
 import logging
 import pandas as pd
@@ -16,12 +15,14 @@ from typing import (
     List,
     Optional,
 )
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.probit import probit_utils
 from hummingbot.connector.exchange.probit.probit_order_book import ProbitOrderBook
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 
 class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -47,7 +48,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain: str = "com") -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{CONSTANTS.TICKER_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json = await response.json()
@@ -60,7 +61,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs(domain: str = "com") -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{CONSTANTS.MARKETS_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json: Dict[str, Any] = await response.json()
@@ -72,7 +73,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(url=f"{CONSTANTS.ORDER_BOOK_URL.format(domain)}",
                                   params={"market_id": trading_pair}) as response:
                 if response.status != 200:
@@ -138,7 +139,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         if "recent_trades" not in msg:
                             # Unrecognized response from "recent_trades" channel
                             continue
@@ -179,7 +180,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(ujson.dumps(params))
                     async for raw_msg in self._inner_messages(ws):
                         msg_timestamp: int = int(time.time() * 1e3)
-                        msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        msg: Dict[str, Any] = json_loads(raw_msg)
                         if "order_books" not in msg:
                             # Unrecognized response from "order_books" channel
                             continue
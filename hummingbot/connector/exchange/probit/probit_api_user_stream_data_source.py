@@ -16,6 +16,7 @@ from typing import (
     Optional,
 )
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.connector.exchange.probit.probit_auth import ProbitAuth
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -76,7 +77,7 @@ class ProbitAPIUserStreamDataSource(UserStreamTrackerDataSource):
             auth_payload: Dict[str, Any] = await self._probit_auth.get_ws_auth_payload()
             await ws.send(ujson.dumps(auth_payload, escape_forward_slashes=False))
             auth_resp = await ws.recv()
-            auth_resp: Dict[str, Any] = ujson.loads(auth_resp)
+            auth_resp: Dict[str, Any] = json_loads(auth_resp)
 
             if auth_resp["result"] != "ok":
                 self.logger().error(f"Response: {auth_resp}",
@@ -137,7 +138,7 @@ class ProbitAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self.logger().info("Successfully subscribed to all Private channels.")
 
                 async for msg in self._inner_messages(ws):
-                    output.put_nowait(ujson.loads(msg))
+                    output.put_nowait(json_loads(msg))
             except asyncio.CancelledError:
                 raise
             except Exception:
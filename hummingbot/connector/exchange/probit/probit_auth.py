@@ -6,8 +6,9 @@ import time
 import ujson
 
 import hummingbot.connector.exchange.probit.probit_constants as CONSTANTS
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 
 class ProbitAuth():
@@ -43,7 +44,8 @@ class ProbitAuth():
     def update_expiration_time(self, expiration_time: int):
         self._oauth_token_expiration_time = expiration_time
 
-    async def get_auth_headers(self, http_client: aiohttp.ClientSession = aiohttp.ClientSession()) -> Dict[str, Any]:
+    async def get_auth_headers(self, http_client: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
+        http_client = http_client or get_shared_client()
         if self.token_has_expired:
             try:
                 now: int = int(time.time())
@@ -16,6 +16,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.radar_relay.radar_relay_order_book import RadarRelayOrderBook
 from hummingbot.connector.exchange.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
@@ -24,6 +25,10 @@ from hummingbot.core.utils import async_ttl_cache
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_client_registry import (
+    get_shared_client,
+    shared_client_session,
+)
 
 TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI)$")
 
@@ -56,7 +61,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         if cls._client is None:
             if not asyncio.get_event_loop().is_running():
                 raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession()
+            cls._client = get_shared_client()
         return cls._client
 
     @classmethod
@@ -104,7 +109,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
@@ -137,7 +142,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return await response.json()
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.snapshot_message_from_exchange(
@@ -190,7 +195,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = json_loads(raw_msg)
                         # Valid Diff messages from RadarRelay have action key
                         if "action" in msg:
                             diff_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.diff_message_from_exchange(
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from collections import deque
@@ -57,6 +56,7 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import fix_signa
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 rrm_logger = None
 s_decimal_0 = Decimal(0)
@@ -594,7 +594,7 @@ cdef class RadarRelayExchange(ExchangeBase):
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None,
                            json: int = 0) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with (
                     client.request(http_method,
                                    url=url,
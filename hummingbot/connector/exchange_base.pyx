@@ -56,6 +56,13 @@ cdef class ExchangeBase(ConnectorBase):
     def limit_orders(self) -> List[LimitOrder]:
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector is ready to trade a trading pair. Connectors whose order book tracker
+        initializes the order books concurrently only wait for the order book of that pair, the others for all.
+        """
+        return self.ready
+
     def get_mid_price(self, trading_pair: str) -> Decimal:
         return (self.get_price(trading_pair, True) + self.get_price(trading_pair, False)) / Decimal("2")
 
@@ -10,6 +10,7 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Callable,
     Dict,
     List,
     Optional,
@@ -18,6 +19,8 @@ from typing import (
 )
 
 from hummingbot import data_path
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.performance_accumulator import PerformanceTracker
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
     SellOrderCreatedEvent,
@@ -42,6 +45,10 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position import RangePosition
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_writer import (
+    SQLWriter,
+    SQLWriterMetrics,
+)
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.funding_payment import FundingPayment
 
@@ -65,12 +72,20 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        # Records are written behind the event loop, in batches, by the writer thread
+        self._writer: SQLWriter = SQLWriter(sql,
+                                            batch_interval=global_config_map.get("db_write_batch_interval").value,
+                                            max_batch_size=global_config_map.get("db_write_batch_size").value)
+        # Performance aggregates of the trades of this config, for the history command
+        self._performance_tracker: PerformanceTracker = PerformanceTracker(sql, config_file_path)
+        self._performance_tracker.load()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
+            # Oldest first, so the connector ages out the oldest fills if it keeps fewer than these
+            market.add_trade_fills_from_market_recorder([TradeFillOrderDetails(tf.market,
                                                                                tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
+                                                                               tf.symbol) for tf in reversed(trade_fills)])
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
@@ -110,6 +125,18 @@ class MarketsRecorder:
     def session(self) -> Session:
         return self._sql.get_shared_session()
 
+    @property
+    def performance_tracker(self) -> PerformanceTracker:
+        return self._performance_tracker
+
+    @property
+    def writer_metrics(self) -> SQLWriterMetrics:
+        return self._writer.metrics
+
+    @property
+    def write_queue_depth(self) -> int:
+        return self._writer.queue_depth
+
     @property
     def config_file_path(self) -> str:
         return self._config_file_path
@@ -123,6 +150,7 @@ class MarketsRecorder:
         return int(time.time() * 1e3)
 
     def start(self):
+        self._writer.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -131,10 +159,20 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        # Commits the records still queued before returning
+        self._writer.stop()
+        self._performance_tracker.save_checkpoint()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the records of the events received so far are committed.
+        """
+        return self._writer.flush(timeout)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         session: Session = self.session
         filters = [Order.config_file_path == config_file_path,
                    Order.market == market.display_name]
@@ -150,6 +188,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -161,30 +200,61 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+        self.flush()
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(session, config_file_path, market.display_name, self.db_timestamp,
+                                 market.tracking_states, market.trade_cursors)
+        if not no_commit:
+            session.commit()
 
+    @staticmethod
+    def _save_market_states(session: Session,
+                            config_file_path: str,
+                            market_name: str,
+                            timestamp: int,
+                            saved_state: Dict[str, any],
+                            trade_cursors: Optional[Dict[str, any]]):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
+            market_states.trade_cursors = trade_cursors
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state,
+                                        trade_cursors=trade_cursors)
             session.add(market_states)
 
-        if not no_commit:
-            session.commit()
+    def _market_states_write(self, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Takes the market states as they are now, on the event loop, for a write that saves them later.
+        """
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+        timestamp: int = self.db_timestamp
+        saved_state: Dict[str, any] = market.tracking_states
+        trade_cursors: Optional[Dict[str, any]] = market.trade_cursors
+
+        def write(session: Session):
+            self._save_market_states(session, config_file_path, market_name, timestamp, saved_state, trade_cursors)
+        return write
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
 
         if market_states is not None:
             market.restore_tracking_states(market_states.saved_state)
+            if market_states.trade_cursors is not None:
+                market.restore_trade_cursors(market_states.trade_cursors)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -201,7 +271,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -224,11 +293,14 @@ class MarketsRecorder:
         order_status: OrderStatus = OrderStatus(order=order_record,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        save_market_states = self._market_states_write(market)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+        self._writer.put(write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -238,18 +310,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
         order_status: OrderStatus = OrderStatus(order_id=order_id,
@@ -271,14 +336,26 @@ class MarketsRecorder:
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id,
                                                  position=evt.position if evt.position else "NILL", )
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
         market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                            trade_fill_record.exchange_trade_id,
                                                                            trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+        save_market_states = self._market_states_write(market)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+            return after_commit
+
+        def after_commit():
+            self._performance_tracker.add_trade_fill(trade_fill_record)
+            self.append_to_csv(trade_fill_record)
+        self._writer.put(write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -288,22 +365,22 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        # Try to find the funding payment has been recorded already.
-        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-            FundingPayment.timestamp == timestamp).one_or_none()
-        if payment_record is None:
-            funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                    config_file_path=self.config_file_path,
-                                                                    market=market.display_name,
-                                                                    rate=evt.funding_rate,
-                                                                    symbol=evt.trading_pair,
-                                                                    amount=float(evt.amount))
-            session.add(funding_payment_record)
-            session.commit()
-            # self.append_to_csv(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+                # self.append_to_csv(funding_payment_record)
+        self._writer.put(write)
 
     @staticmethod
     def _is_primitive_type(obj: object) -> bool:
@@ -356,23 +433,22 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        save_market_states = self._market_states_write(market)
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                save_market_states(session)
+        self._writer.put(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -406,7 +482,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_initiate_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
                                              config_file_path=self._config_file_path,
@@ -422,9 +497,12 @@ class MarketsRecorder:
                                              status=evt.status,
                                              creation_timestamp=timestamp,
                                              last_update_timestamp=timestamp)
-        session.add(r_pos)
-        self.save_market_states(self._config_file_path, connector, no_commit=True)
-        session.commit()
+        save_market_states = self._market_states_write(connector)
+
+        def write(session: Session):
+            session.add(r_pos)
+            save_market_states(session)
+        self._writer.put(write)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -434,20 +512,21 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_update_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
-
-        rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-            RangePosition.hb_id == evt.hb_id).one_or_none()
-        if rp_record is not None:
-            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                 timestamp=timestamp,
-                                                                 tx_hash=evt.tx_hash,
-                                                                 token_id=evt.token_id,
-                                                                 base_amount=float(evt.base_amount),
-                                                                 quote_amount=float(evt.quote_amount),
-                                                                 status=evt.status,
-                                                                 )
-            session.add(rp_update)
-            self.save_market_states(self._config_file_path, connector, no_commit=True)
-            session.commit()
+        save_market_states = self._market_states_write(connector)
+
+        def write(session: Session):
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                                     timestamp=timestamp,
+                                                                     tx_hash=evt.tx_hash,
+                                                                     token_id=evt.token_id,
+                                                                     base_amount=float(evt.base_amount),
+                                                                     quote_amount=float(evt.quote_amount),
+                                                                     status=evt.status,
+                                                                     )
+                session.add(rp_update)
+                save_market_states(session)
+        self._writer.put(write)
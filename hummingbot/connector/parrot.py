@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from typing import List, Dict
 from dataclasses import dataclass
@@ -6,6 +5,7 @@ from decimal import Decimal
 import logging
 from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 PARROT_MINER_BASE_URL = "https://papi.hummingbot.io/v1/mining_data/"
 
@@ -53,7 +53,7 @@ async def get_campaign_summary(exchange: str, trading_pairs: List[str] = []) ->
 
 
 async def get_market_snapshots(market_id: int):
-    async with aiohttp.ClientSession() as client:
+    async with shared_client_session() as client:
         url = f"{PARROT_MINER_BASE_URL}market_snapshots/{market_id}?aggregate=1m"
         resp = await client.get(url)
         resp_json = await resp.json()
@@ -62,7 +62,7 @@ async def get_market_snapshots(market_id: int):
 
 async def get_active_campaigns(exchange: str, trading_pairs: List[str] = []) -> Dict[int, CampaignSummary]:
     campaigns = {}
-    async with aiohttp.ClientSession() as client:
+    async with shared_client_session() as client:
         url = f"{PARROT_MINER_BASE_URL}campaigns"
         resp = await client.get(url)
         resp_json = await resp.json()
@@ -4,6 +4,7 @@ import time
 from abc import ABC, abstractmethod
 from typing import (
     Deque,
+    Optional,
 )
 
 from hummingbot.core.api_throttler.data_types import (
@@ -15,21 +16,23 @@ from hummingbot.core.api_throttler.data_types import (
 
 class APIRequestContextBase(ABC):
 
-    _lock = asyncio.Lock()
-
     def __init__(self,
                  task_logs: Deque[TaskLog],
                  rate_limit: RateLimit,
                  period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 lock: Optional[asyncio.Lock] = None):
         """
         Asynchronous context associated with each API request.
         :param task_logs: Shared task logs
         :param rate_limit: Rate limit for the associated API request
         :param period_safety_margin: estimate for the network latency
         :param retry_interval: Time between each limit check
+        :param lock: Lock of the throttler the request goes through, so requests of different throttlers don't
+        wait on each other
         """
         self._task_logs: Deque[TaskLog] = task_logs
+        self._lock: asyncio.Lock = lock if lock is not None else asyncio.Lock()
 
         self._rate_limit: RateLimit = rate_limit
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from abc import ABC, abstractmethod
 from collections import deque
 from typing import (
@@ -43,6 +45,9 @@ class APIThrottlerBase(ABC):
         self._retry_interval: float = retry_interval
         self._period_safety_margin = period_safety_margin
 
+        # Requests of this throttler acquire capacity one at a time.
+        self._lock: asyncio.Lock = asyncio.Lock()
+
     @abstractmethod
     def execute_task(self):
         raise NotImplementedError
@@ -0,0 +1,195 @@
+import asyncio
+import time
+
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Tuple,
+)
+
+from hummingbot.core.api_throttler.api_throttler_base import APIThrottlerBase
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PATH,
+    RateLimit,
+    RequestPath,
+    RequestWeight,
+    Seconds,
+)
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the requests counted against one rate limit, along with the running total of their weight.
+    """
+
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds = 0.1):
+        self._capacity: int = rate_limit.limit
+        # Same expiry as APIRequestContextBase.flush()
+        self._window: float = rate_limit.time_interval - period_safety_margin
+        self._entries: Deque[Tuple[float, RequestWeight]] = deque()
+        self._used_weight: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def used_weight(self) -> int:
+        return self._used_weight
+
+    def flush(self, now: float):
+        entries: Deque[Tuple[float, RequestWeight]] = self._entries
+        while entries and now - entries[0][0] >= self._window:
+            self._used_weight -= entries.popleft()[1]
+
+    def has_capacity(self, weight: RequestWeight) -> bool:
+        return self._used_weight + weight <= self._capacity
+
+    def add(self, now: float, weight: RequestWeight):
+        self._entries.append((now, weight))
+        self._used_weight += weight
+
+    def time_until_capacity(self, weight: RequestWeight, now: float) -> float:
+        """
+        Seconds until enough weight leaves the window for a request of the given weight to fit. Expects the window to
+        be flushed at `now`.
+        """
+        excess: int = self._used_weight + weight - self._capacity
+        if excess <= 0:
+            return 0.0
+        for timestamp, logged_weight in self._entries:
+            excess -= logged_weight
+            if excess <= 0:
+                return max(0.0, timestamp + self._window - now)
+        raise ValueError(f"Request weight {weight} exceeds the capacity {self._capacity} of the rate limit.")
+
+
+class AsyncThrottler(APIThrottlerBase):
+    """
+    Throttler keeping a running weight total per rate limit, so a capacity check costs O(1) amortized instead of a scan
+    of the task logs. A request counts against the rate limit of its path and against the linked limits declared in
+    that RateLimit. Requests that do not fit wait in a FIFO queue per path and are woken by a timer set to the moment
+    enough weight leaves the windows, instead of polling.
+    Checking and recording capacity never awaits, so the throttler needs no lock and throttlers never wait on each
+    other.
+    """
+
+    def __init__(self,
+                 rate_limit_list: List[RateLimit],
+                 period_safety_margin: Seconds = 0.1,
+                 retry_interval: Seconds = 0.1):
+        super().__init__(rate_limit_list, period_safety_margin=period_safety_margin, retry_interval=retry_interval)
+
+        self._windows: Dict[RequestPath, RateLimitWindow] = {
+            limit.path_url: RateLimitWindow(limit, period_safety_margin)
+            for limit in self._rate_limit_list
+        }
+        self._path_windows: Dict[RequestPath, List[Tuple[RateLimitWindow, RequestWeight]]] = {
+            limit.path_url: self._windows_for_rate_limit(limit)
+            for limit in self._rate_limit_list
+        }
+        self._waiters: Dict[RequestPath, Deque[asyncio.Future]] = {
+            limit.path_url: deque()
+            for limit in self._rate_limit_list
+        }
+        self._wakeup_handles: Dict[RequestPath, asyncio.TimerHandle] = {}
+
+    def _windows_for_rate_limit(self, rate_limit: RateLimit) -> List[Tuple[RateLimitWindow, RequestWeight]]:
+        windows: List[Tuple[RateLimitWindow, RequestWeight]] = [(self._windows[rate_limit.path_url],
+                                                                 rate_limit.weight)]
+        for linked_limit in rate_limit.linked_limits:
+            if linked_limit.path_url not in self._windows:
+                raise ValueError(f"Linked limit {linked_limit.path_url} of {rate_limit.path_url} "
+                                 f"is not in the rate limit list.")
+            windows.append((self._windows[linked_limit.path_url], linked_limit.weight))
+        for window, weight in windows:
+            if weight > window.capacity:
+                raise ValueError(f"Request weight {weight} of {rate_limit.path_url} exceeds "
+                                 f"the capacity {window.capacity} of one of its rate limits.")
+        return windows
+
+    def execute_task(self, path_url: RequestPath = DEFAULT_PATH) -> "AsyncRequestContext":
+        if path_url not in self._path_windows:
+            raise KeyError(f"No rate limit defined for {path_url}.")
+        return AsyncRequestContext(self, path_url)
+
+    def used_weight(self, path_url: RequestPath = DEFAULT_PATH) -> int:
+        window: RateLimitWindow = self._windows[path_url]
+        window.flush(time.monotonic())
+        return window.used_weight
+
+    def _try_acquire(self, path_url: RequestPath, now: float) -> bool:
+        windows: List[Tuple[RateLimitWindow, RequestWeight]] = self._path_windows[path_url]
+        for window, weight in windows:
+            window.flush(now)
+            if not window.has_capacity(weight):
+                return False
+        for window, weight in windows:
+            window.add(now, weight)
+        return True
+
+    async def acquire(self, path_url: RequestPath = DEFAULT_PATH):
+        waiters: Deque[asyncio.Future] = self._waiters[path_url]
+        if len(waiters) == 0 and self._try_acquire(path_url, time.monotonic()):
+            return
+
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        waiters.append(future)
+        self._schedule_wakeup(path_url)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in waiters:
+                waiters.remove(future)
+                self._schedule_wakeup(path_url)
+            raise
+
+    def _schedule_wakeup(self, path_url: RequestPath):
+        if path_url in self._wakeup_handles:
+            return
+        waiters: Deque[asyncio.Future] = self._waiters[path_url]
+        if len(waiters) == 0:
+            return
+        now: float = time.monotonic()
+        delay: float = 0.0
+        for window, weight in self._path_windows[path_url]:
+            window.flush(now)
+            delay = max(delay, window.time_until_capacity(weight, now))
+        self._wakeup_handles[path_url] = asyncio.get_event_loop().call_later(delay, self._wake_waiters, path_url)
+
+    def _wake_waiters(self, path_url: RequestPath):
+        del self._wakeup_handles[path_url]
+        waiters: Deque[asyncio.Future] = self._waiters[path_url]
+        now: float = time.monotonic()
+        while len(waiters) > 0:
+            future: asyncio.Future = waiters[0]
+            if future.done():
+                waiters.popleft()
+                continue
+            if not self._try_acquire(path_url, now):
+                break
+            waiters.popleft()
+            future.set_result(None)
+        self._schedule_wakeup(path_url)
+
+    def stop(self):
+        for handle in self._wakeup_handles.values():
+            handle.cancel()
+        self._wakeup_handles.clear()
+        for waiters in self._waiters.values():
+            while len(waiters) > 0:
+                waiters.popleft().cancel()
+
+
+class AsyncRequestContext:
+    def __init__(self, throttler: AsyncThrottler, path_url: RequestPath):
+        self._throttler: AsyncThrottler = throttler
+        self._path_url: RequestPath = path_url
+
+    async def __aenter__(self):
+        await self._throttler.acquire(self._path_url)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
@@ -10,12 +11,21 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+@dataclass
+class LinkedLimitWeightPair():
+    path_url: RequestPath
+    weight: RequestWeight = DEFAULT_WEIGHT
+
+
 @dataclass
 class RateLimit():
     limit: Limit
     time_interval: Seconds
     path_url: RequestPath = DEFAULT_PATH
     weight: RequestWeight = DEFAULT_WEIGHT
+    # Other rate limits (e.g. a global weight pool) a request on this path also counts against.
+    # Only AsyncThrottler and the throttlers built on it take them into account.
+    linked_limits: List[LinkedLimitWeightPair] = field(default_factory=list)
 
 
 @dataclass
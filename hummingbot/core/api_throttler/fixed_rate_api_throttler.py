@@ -18,6 +18,7 @@ class FixedRateThrottler(APIThrottlerBase):
             task_logs=task_logs,
             rate_limit=rate_limit,
             retry_interval=self._retry_interval,
+            lock=self._lock,
         )
 
 
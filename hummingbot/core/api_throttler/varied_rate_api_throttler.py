@@ -2,7 +2,7 @@ import asyncio
 import time
 
 from collections import deque
-from typing import Deque, List
+from typing import Deque, List, Optional
 
 from hummingbot.core.api_throttler.api_request_context_base import APIRequestContextBase
 from hummingbot.core.api_throttler.api_throttler_base import APIThrottlerBase
@@ -34,6 +34,7 @@ class VariedRateThrottler(APIThrottlerBase):
             rate_limit=rate_limit,
             period_safety_margin=self._period_safety_margin,
             retry_interval=self._retry_interval,
+            lock=self._lock,
         )
 
 
@@ -44,12 +45,14 @@ class VariedRateRequestContext(APIRequestContextBase):
                  pending_tasks: Deque[str],
                  rate_limit: RateLimit,
                  period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 lock: Optional[asyncio.Lock] = None):
         super().__init__(
             task_logs,
             rate_limit,
             period_safety_margin=period_safety_margin,
-            retry_interval=retry_interval)
+            retry_interval=retry_interval,
+            lock=lock)
 
         # VariedRateThrottler has a pending_task to ensure the order in which the requests are being executed.
         self._pending_tasks = pending_tasks
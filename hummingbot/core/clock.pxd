@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _tick_overrun_policy
+        object _tick_stats
+        set _low_priority_iterators
+        dict _iterator_labels
+        bint _fast_forward
+        list _wake_up_times
+
+    cdef bint c_run_realtime_tick(self, double lateness, bint degraded)
+    cdef double c_next_wake_up_tick(self, double end_time)
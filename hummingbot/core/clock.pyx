@@ -1,19 +1,27 @@
 # distutils: language=c++
 
 import asyncio
+import heapq
 import logging
+import math
 import time
 from typing import List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
-from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_mode import (
+    ClockMode,
+    TickOverrunPolicy,
+)
+from hummingbot.core.clock_tick_stats import ClockTickStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
 cdef class Clock:
+    MAX_CATCH_UP_TICKS = 10
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,12 +29,22 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 tick_overrun_policy: TickOverrunPolicy = TickOverrunPolicy.SKIP,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param tick_overrun_policy: (real time mode only) what to do with the tick boundaries that passed while a tick
+        was running
+        :param fast_forward: (back testing mode only) jump straight to the next tick any iterator or data feed needs,
+        see TimeIterator.next_wake_up_time() and schedule_wake_up()
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +54,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_overrun_policy = tick_overrun_policy
+        self._tick_stats = ClockTickStats(tick_size)
+        self._low_priority_iterators = set()
+        self._iterator_labels = {}
+        self._fast_forward = fast_forward
+        self._wake_up_times = []
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +81,26 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_overrun_policy(self) -> TickOverrunPolicy:
+        return self._tick_overrun_policy
+
+    @property
+    def tick_stats(self) -> ClockTickStats:
+        return self._tick_stats
+
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    def schedule_wake_up(self, timestamp: float):
+        """
+        Makes a fast forward back test stop at the first tick at or after the timestamp, e.g. for the next event of a
+        data feed.
+        """
+        if self._fast_forward and timestamp > self._current_tick:
+            heapq.heappush(self._wake_up_times, timestamp)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,18 +113,33 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, low_priority: bool = False):
+        """
+        :param iterator: the iterator to tick
+        :param low_priority: whether the iterator can be left out of late ticks under TickOverrunPolicy.DEGRADE
+        """
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        if low_priority:
+            self._low_priority_iterators.add(iterator)
+        self._iterator_labels[iterator] = self._make_iterator_label(iterator)
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._low_priority_iterators.discard(iterator)
+        self._iterator_labels.pop(iterator, None)
+
+    def _make_iterator_label(self, iterator: TimeIterator) -> str:
+        label = getattr(iterator, "display_name", None) or type(iterator).__name__
+        if label in self._iterator_labels.values():
+            label = f"{label} #{len(self._child_iterators)}"
+        return label
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +149,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            bint behind_schedule
+            int missed_ticks
+            int skipped_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -107,26 +169,73 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                next_tick_time = self._current_tick + self._tick_size
+                behind_schedule = now >= next_tick_time
+                if behind_schedule:
+                    # The previous tick ran past one or more tick boundaries.
+                    missed_ticks = <int>((now - next_tick_time) // self._tick_size) + 1
+                    if self._tick_overrun_policy is TickOverrunPolicy.CATCH_UP:
+                        skipped_ticks = max(0, missed_ticks - self.MAX_CATCH_UP_TICKS)
+                        self._tick_stats.caught_up_ticks += 1
+                    elif self._tick_overrun_policy is TickOverrunPolicy.DEGRADE:
+                        skipped_ticks = missed_ticks - 1
+                        self._tick_stats.degraded_ticks += 1
+                    else:
+                        skipped_ticks = missed_ticks
+                        behind_schedule = False
+                    self._tick_stats.skipped_ticks += skipped_ticks
+                    next_tick_time += skipped_ticks * self._tick_size
+
+                if behind_schedule:
+                    # Let the other tasks run before the next late tick.
+                    await asyncio.sleep(0)
+                else:
+                    # Sleep until the next tick. The event loop may wake up a little early, so sleep again until the
+                    # tick boundary is reached, instead of running the same tick twice.
+                    while now < next_tick_time:
+                        await asyncio.sleep(next_tick_time - now)
+                        now = time.time()
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if not self.c_run_realtime_tick(
+                    time.time() - next_tick_time,
+                    behind_schedule and self._tick_overrun_policy is TickOverrunPolicy.DEGRADE
+                ):
+                    return
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef bint c_run_realtime_tick(self, double lateness, bint degraded):
+        """
+        Runs through the child iterators and records how long each of them took. Low priority iterators are left out of
+        degraded ticks.
+
+        :return: False if an iterator raised StopIteration
+        """
+        cdef:
+            TimeIterator child_iterator
+            double tick_start = time.perf_counter()
+            double iterator_start
+
+        for ci in self._current_context:
+            if degraded and ci in self._low_priority_iterators:
+                continue
+            child_iterator = ci
+            iterator_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            self._tick_stats.record_iterator(self._iterator_labels.get(ci, type(ci).__name__),
+                                             time.perf_counter() - iterator_start)
+        self._tick_stats.record_tick(lateness, time.perf_counter() - tick_start)
+        return True
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -138,7 +247,10 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._fast_forward:
+                    self._current_tick = self.c_next_wake_up_tick(timestamp)
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
@@ -154,5 +266,37 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_next_wake_up_tick(self, double end_time):
+        """
+        The first tick at or after the earliest wake up time of the child iterators, the scheduled wake ups and the
+        end time. The ticks in between are counted with the same additions the stepwise back test makes, so both modes
+        tick at bit for bit identical timestamps.
+        """
+        cdef:
+            double current_tick = self._current_tick
+            double wake_up_time = end_time if not math.isnan(end_time) else math.inf
+            double iterator_wake_up_time
+            list wake_up_times = self._wake_up_times
+            TimeIterator child_iterator
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            iterator_wake_up_time = child_iterator.next_wake_up_time(current_tick)
+            if not (iterator_wake_up_time > current_tick):
+                # NaN, or the iterator is due: it needs every tick.
+                return current_tick + self._tick_size
+            wake_up_time = min(wake_up_time, iterator_wake_up_time)
+        while len(wake_up_times) > 0 and wake_up_times[0] <= current_tick:
+            heapq.heappop(wake_up_times)
+        if len(wake_up_times) > 0:
+            wake_up_time = min(wake_up_time, wake_up_times[0])
+        if math.isinf(wake_up_time):
+            return current_tick + self._tick_size
+
+        current_tick += self._tick_size
+        while current_tick < wake_up_time:
+            current_tick += self._tick_size
+        return current_tick
+
     def backtest(self):
         self.backtest_til(self._end_time)
@@ -6,3 +6,16 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+
+
+class TickOverrunPolicy(Enum):
+    """
+    What a real time clock does when a tick boundary has already passed by the time the previous tick returns.
+    SKIP: wait for the next tick boundary in the future, dropping the ones that have passed.
+    CATCH_UP: run the missed ticks back to back, up to Clock.MAX_CATCH_UP_TICKS of them.
+    DEGRADE: run the latest missed tick right away, leaving out the low priority iterators until the clock is back
+    on schedule.
+    """
+    SKIP = 1
+    CATCH_UP = 2
+    DEGRADE = 3
@@ -0,0 +1,124 @@
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+import pandas as pd
+
+
+class TickDurationHistogram:
+    """
+    Histogram of durations in seconds, bucketed by upper bounds in milliseconds.
+    """
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def bucket_counts(self) -> List[Tuple[str, int]]:
+        labels: List[str] = [f"<={bound:g}ms" for bound in self.BUCKET_BOUNDS_MS]
+        labels.append(f">{self.BUCKET_BOUNDS_MS[-1]:g}ms")
+        return list(zip(labels, self._bucket_counts))
+
+    def add(self, duration: float):
+        duration_ms: float = duration * 1e3
+        index: int = len(self.BUCKET_BOUNDS_MS)
+        for i, bound in enumerate(self.BUCKET_BOUNDS_MS):
+            if duration_ms <= bound:
+                index = i
+                break
+        self._bucket_counts[index] += 1
+        self._count += 1
+        self._total += duration
+        self._max = max(self._max, duration)
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound in seconds of the bucket holding the q-th percentile (0 < q <= 100). The maximum stands in for the
+        overflow bucket.
+        """
+        if self._count == 0:
+            return 0.0
+        rank: float = self._count * q / 100
+        cumulative: int = 0
+        for i, bucket_count in enumerate(self._bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return self.BUCKET_BOUNDS_MS[i] / 1e3 if i < len(self.BUCKET_BOUNDS_MS) else self._max
+        return self._max
+
+
+class ClockTickStats:
+    """
+    Tick accounting of a real time clock: how late each tick started relative to its boundary, how long the ticks and
+    each child iterator took, and how many ticks overran the tick size or were skipped, caught up or degraded.
+    """
+
+    def __init__(self, tick_size: float):
+        self._tick_size: float = tick_size
+        self.tick_lateness: TickDurationHistogram = TickDurationHistogram()
+        self.tick_duration: TickDurationHistogram = TickDurationHistogram()
+        self.iterator_durations: Dict[str, TickDurationHistogram] = {}
+        self.overrun_ticks: int = 0
+        self.skipped_ticks: int = 0
+        self.caught_up_ticks: int = 0
+        self.degraded_ticks: int = 0
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def ticks(self) -> int:
+        return self.tick_duration.count
+
+    def record_iterator(self, label: str, duration: float):
+        if label not in self.iterator_durations:
+            self.iterator_durations[label] = TickDurationHistogram()
+        self.iterator_durations[label].add(duration)
+
+    def record_tick(self, lateness: float, duration: float):
+        self.tick_lateness.add(lateness)
+        self.tick_duration.add(duration)
+        if duration > self._tick_size:
+            self.overrun_ticks += 1
+
+    def summary_df(self) -> pd.DataFrame:
+        """
+        One row for the whole tick, one for the lateness and one per child iterator, with durations in milliseconds.
+        """
+        rows: List[Tuple[str, TickDurationHistogram]] = [("Tick", self.tick_duration), ("Lateness", self.tick_lateness)]
+        rows.extend(sorted(self.iterator_durations.items()))
+        data: List[List] = [
+            [label, histogram.count, histogram.mean * 1e3, histogram.percentile(99) * 1e3, histogram.max * 1e3]
+            for label, histogram in rows
+        ]
+        return pd.DataFrame(data=data, columns=["Name", "Count", "Mean (ms)", "P99 (ms)", "Max (ms)"])
+
+    def histogram_df(self) -> pd.DataFrame:
+        """
+        Tick duration and lateness counts per bucket.
+        """
+        buckets = zip(self.tick_duration.bucket_counts, self.tick_lateness.bucket_counts)
+        data: List[List] = [
+            [label, duration_count, lateness_count]
+            for (label, duration_count), (_, lateness_count) in buckets
+        ]
+        return pd.DataFrame(data=data, columns=["Bucket", "Tick", "Lateness"])
@@ -1,8 +1,9 @@
 # distutils: language=c++
-from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book cimport OrderBook, OrderBookDepthIndex
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy, Py_ssize_t depth=*)
     cdef double c_get_price(self, bint is_buy) except? -1
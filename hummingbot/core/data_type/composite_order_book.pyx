@@ -1,6 +1,7 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+from itertools import islice
 from typing import Iterator
 from libcpp.set cimport set
 from cython.operator cimport(
@@ -9,6 +10,7 @@ from cython.operator cimport(
     address as ref
 )
 from libcpp.vector cimport vector
+import numpy as np
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -32,6 +34,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._bid_depth_index = None
+        self._ask_depth_index = None
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +79,8 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._bid_depth_index = None
+        self._ask_depth_index = None
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -179,6 +185,32 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy, Py_ssize_t depth=-1):
+        """
+        Returns a depth index of the composite entries, built and kept as OrderBook.c_get_depth_index does. The
+        composite entries also change with the traded order book, so recording a filled order drops the indexes too.
+        """
+        cdef:
+            OrderBookDepthIndex index = self._ask_depth_index if is_buy else self._bid_depth_index
+            list entries
+
+        if index is not None and (index.complete or 0 <= depth <= index._size):
+            return index
+        if depth >= 0 and index is not None:
+            depth = max(depth, index._size * 4)
+        entries_it = self.ask_entries() if is_buy else self.bid_entries()
+        entries = list(entries_it) if depth < 0 else list(islice(entries_it, depth + 1))
+        # One more entry than asked for tells whether the entries are all the levels
+        complete = depth < 0 or len(entries) <= depth
+        if not complete:
+            entries = entries[:depth]
+        index = OrderBookDepthIndex(np.array(entries, dtype=np.float64).reshape(-1, 3), not is_buy, complete)
+        if is_buy:
+            self._ask_depth_index = index
+        else:
+            self._bid_depth_index = index
+        return index
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -0,0 +1,47 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+from libcpp.unordered_set cimport unordered_set
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+cdef struct L3Order:
+    double price
+    double amount
+    bint is_bid
+
+cdef struct L3Level:
+    double amount
+    int64_t orders
+    # Orders of the level whose remaining amount is 0 (or below)
+    int64_t empty_orders
+
+ctypedef unordered_map[string, L3Order] L3Orders
+ctypedef unordered_map[double, L3Level] L3Levels
+
+
+cdef class L3OrderBook:
+    cdef:
+        L3Orders _orders
+        L3Levels _bid_levels
+        L3Levels _ask_levels
+        unordered_set[double] _updated_bids
+        unordered_set[double] _updated_asks
+
+    cdef c_add_order(self, string order_id, bint is_bid, double price, double amount)
+    cdef bint c_set_order_amount(self, string order_id, double amount)
+    cdef bint c_reduce_order_amount(self, string order_id, double amount)
+    cdef bint c_remove_order(self, string order_id)
+    cdef bint c_get_order(self, string order_id, L3Order *order)
+    cdef double c_get_level_amount(self, bint is_bid, double price)
+    cdef c_clear(self)
+    cdef c_pop_level_updates(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_get_levels(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_level_updates(self, OrderBook order_book, int64_t update_id)
+    cdef c_apply_snapshot(self, OrderBook order_book, int64_t update_id)
+    cdef tuple c_pop_level_update_arrays(self, double timestamp, int64_t update_id)
+    cdef tuple c_get_level_arrays(self, double timestamp, int64_t update_id)
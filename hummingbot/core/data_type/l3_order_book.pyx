@@ -0,0 +1,266 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import (
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+cimport numpy as np
+from cython.operator cimport dereference as deref
+from libc.stdint cimport int64_t
+from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+# Level totals below this amount are rounding errors of the additions and subtractions of order amounts
+cdef double L3_AMOUNT_EPSILON = 1e-12
+
+
+cdef inline void c_add_to_level(L3Levels &levels, double price, double amount, int64_t orders, int64_t empty_orders):
+    cdef L3Level *level = &levels[price]
+    level.amount += amount
+    level.orders += orders
+    level.empty_orders += empty_orders
+    if level.orders <= 0:
+        levels.erase(price)
+    elif level.empty_orders >= level.orders or level.amount < L3_AMOUNT_EPSILON:
+        level.amount = 0.0
+
+
+cdef np.ndarray c_entries_to_level_array(vector[OrderBookEntry] &entries, double timestamp):
+    cdef:
+        np.ndarray[np.float64_t, ndim=2] array = np.empty((entries.size(), 4), dtype="float64")
+        double[:, :] view = array
+        size_t i
+
+    for i in range(entries.size()):
+        view[i, 0] = timestamp
+        view[i, 1] = entries[i].getPrice()
+        view[i, 2] = entries[i].getAmount()
+        view[i, 3] = entries[i].getUpdateId()
+    return array
+
+
+cdef class L3OrderBook:
+    """
+    Order by order (level 3) book of an exchange that publishes individual orders, for the active order trackers.
+
+    The orders are kept in a C++ hash map by order id, and the total amount of each price level is maintained as orders
+    are added, changed and removed, so updating a level costs the same however many orders rest on it. The levels
+    touched since the last pop are collected and handed to the OrderBook in one batch of diffs, so a tracker can apply
+    any number of messages before updating its order book.
+    """
+
+    def __len__(self) -> int:
+        return self._orders.size()
+
+    @property
+    def bid_level_count(self) -> int:
+        return self._bid_levels.size()
+
+    @property
+    def ask_level_count(self) -> int:
+        return self._ask_levels.size()
+
+    def add_order(self, order_id: str, is_bid: bool, price: float, amount: float):
+        """
+        Adds an order to the book, replacing any order with the same id.
+        """
+        self.c_add_order(order_id.encode("utf8"), is_bid, price, amount)
+
+    def set_order_amount(self, order_id: str, amount: float) -> bool:
+        """
+        Sets the remaining amount of an order.
+        :returns: False if the order is not in the book
+        """
+        return self.c_set_order_amount(order_id.encode("utf8"), amount)
+
+    def reduce_order_amount(self, order_id: str, amount: float) -> bool:
+        """
+        Reduces the remaining amount of an order, e.g. by the amount of a fill.
+        :returns: False if the order is not in the book
+        """
+        return self.c_reduce_order_amount(order_id.encode("utf8"), amount)
+
+    def remove_order(self, order_id: str) -> bool:
+        """
+        Removes an order from the book.
+        :returns: False if the order is not in the book
+        """
+        return self.c_remove_order(order_id.encode("utf8"))
+
+    def get_order(self, order_id: str) -> Optional[Tuple[bool, float, float]]:
+        """
+        :returns: (is_bid, price, amount) of the order, or None if the order is not in the book
+        """
+        cdef L3Order order
+        if not self.c_get_order(order_id.encode("utf8"), &order):
+            return None
+        return order.is_bid, order.price, order.amount
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        """
+        :returns: the total amount of the orders at a price level, 0 if there are none
+        """
+        return self.c_get_level_amount(is_bid, price)
+
+    def clear(self):
+        self.c_clear()
+
+    def pop_level_updates(self, timestamp: float, update_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the levels updated since the last pop, as the active order trackers return their rows.
+        :returns: Tuple(np.array (bids), np.array (asks)) of [timestamp, price, amount, update_id] rows, where an amount
+        of 0 removes the level
+        """
+        return self.c_pop_level_update_arrays(timestamp, update_id)
+
+    def get_level_arrays(self, timestamp: float, update_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns all the levels of the book.
+        :returns: Tuple(np.array (bids), np.array (asks)) of [timestamp, price, amount, update_id] rows
+        """
+        return self.c_get_level_arrays(timestamp, update_id)
+
+    def apply_level_updates(self, order_book: OrderBook, update_id: int):
+        """
+        Applies the levels updated since the last pop to an order book, as a single batch of diffs.
+        """
+        self.c_apply_level_updates(order_book, update_id)
+
+    def apply_snapshot(self, order_book: OrderBook, update_id: int):
+        """
+        Replaces the content of an order book with all the levels of the book.
+        """
+        self.c_apply_snapshot(order_book, update_id)
+
+    cdef c_add_order(self, string order_id, bint is_bid, double price, double amount):
+        cdef L3Order order
+        self.c_remove_order(order_id)
+        order.price = price
+        order.amount = amount
+        order.is_bid = is_bid
+        self._orders[order_id] = order
+        if is_bid:
+            c_add_to_level(self._bid_levels, price, amount, 1, amount <= 0)
+            self._updated_bids.insert(price)
+        else:
+            c_add_to_level(self._ask_levels, price, amount, 1, amount <= 0)
+            self._updated_asks.insert(price)
+
+    cdef bint c_set_order_amount(self, string order_id, double amount):
+        cdef unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+        if it == self._orders.end():
+            return False
+        return self.c_reduce_order_amount(order_id, deref(it).second.amount - amount)
+
+    cdef bint c_reduce_order_amount(self, string order_id, double amount):
+        cdef:
+            unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+            L3Order *order
+            int64_t empty_orders
+        if it == self._orders.end():
+            return False
+        order = &deref(it).second
+        empty_orders = -<int64_t>(order.amount <= 0)
+        order.amount -= amount
+        empty_orders += order.amount <= 0
+        if order.is_bid:
+            c_add_to_level(self._bid_levels, order.price, -amount, 0, empty_orders)
+            self._updated_bids.insert(order.price)
+        else:
+            c_add_to_level(self._ask_levels, order.price, -amount, 0, empty_orders)
+            self._updated_asks.insert(order.price)
+        return True
+
+    cdef bint c_remove_order(self, string order_id):
+        cdef:
+            unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+            L3Order order
+        if it == self._orders.end():
+            return False
+        order = deref(it).second
+        self._orders.erase(order_id)
+        if order.is_bid:
+            c_add_to_level(self._bid_levels, order.price, -order.amount, -1, -<int64_t>(order.amount <= 0))
+            self._updated_bids.insert(order.price)
+        else:
+            c_add_to_level(self._ask_levels, order.price, -order.amount, -1, -<int64_t>(order.amount <= 0))
+            self._updated_asks.insert(order.price)
+        return True
+
+    cdef bint c_get_order(self, string order_id, L3Order *order):
+        cdef unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+        if it == self._orders.end():
+            return False
+        order[0] = deref(it).second
+        return True
+
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        cdef unordered_map[double, L3Level].iterator it
+        if is_bid:
+            it = self._bid_levels.find(price)
+            return deref(it).second.amount if it != self._bid_levels.end() else 0.0
+        it = self._ask_levels.find(price)
+        return deref(it).second.amount if it != self._ask_levels.end() else 0.0
+
+    cdef c_clear(self):
+        self._orders.clear()
+        self._bid_levels.clear()
+        self._ask_levels.clear()
+        self._updated_bids.clear()
+        self._updated_asks.clear()
+
+    cdef c_pop_level_updates(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        cdef double price
+        for price in self._updated_bids:
+            bids.push_back(OrderBookEntry(price, self.c_get_level_amount(True, price), update_id))
+        for price in self._updated_asks:
+            asks.push_back(OrderBookEntry(price, self.c_get_level_amount(False, price), update_id))
+        self._updated_bids.clear()
+        self._updated_asks.clear()
+
+    cdef c_get_levels(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        for level in self._bid_levels:
+            bids.push_back(OrderBookEntry(level.first, level.second.amount, update_id))
+        for level in self._ask_levels:
+            asks.push_back(OrderBookEntry(level.first, level.second.amount, update_id))
+
+    cdef c_apply_level_updates(self, OrderBook order_book, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        self.c_pop_level_updates(bids, asks, update_id)
+        if bids.size() > 0 or asks.size() > 0:
+            order_book.c_apply_diffs(bids, asks, update_id)
+
+    cdef c_apply_snapshot(self, OrderBook order_book, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        self._updated_bids.clear()
+        self._updated_asks.clear()
+        self.c_get_levels(bids, asks, update_id)
+        order_book.c_apply_snapshot(bids, asks, update_id)
+
+    cdef tuple c_pop_level_update_arrays(self, double timestamp, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        self.c_pop_level_updates(bids, asks, update_id)
+        return c_entries_to_level_array(bids, timestamp), c_entries_to_level_array(asks, timestamp)
+
+    cdef tuple c_get_level_arrays(self, double timestamp, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        self._updated_bids.clear()
+        self._updated_asks.clear()
+        self.c_get_levels(bids, asks, update_id)
+        return c_entries_to_level_array(bids, timestamp), c_entries_to_level_array(asks, timestamp)
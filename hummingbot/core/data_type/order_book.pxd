@@ -9,6 +9,28 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef class OrderBookDepthIndex:
+    cdef:
+        readonly bint descending
+        readonly bint complete
+        readonly object prices
+        readonly object cumulative_base
+        readonly object cumulative_quote
+        double[::1] _prices
+        double[::1] _cumulative_base
+        double[::1] _cumulative_quote
+        Py_ssize_t _size
+
+    cdef Py_ssize_t c_level_for_volume(self, const double[::1] cumulative_volume, double volume)
+    cdef Py_ssize_t c_levels_within_price(self, double price)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, double volume)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, double quote_volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, double base_amount)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, double price)
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,16 +42,24 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy, Py_ssize_t depth=*)
+    cdef OrderBookDepthIndex c_get_depth_index_for_volume(self, bint is_buy, double volume, bint is_quote_volume)
+    cdef OrderBookDepthIndex c_get_depth_index_for_price(self, bint is_buy, double price)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
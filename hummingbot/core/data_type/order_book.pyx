@@ -31,6 +31,218 @@ import logging
 cimport numpy as np
 ob_logger = None
 NaN = float("nan")
+# Number of levels the depth index of a side covers at first, multiplied by 4 each time a query needs more
+DEPTH_INDEX_MIN_LEVELS = 64
+
+
+cdef void c_np_array_to_entries(const double[:, :] array,
+                                vector[OrderBookEntry] &entries,
+                                int64_t *last_update_id):
+    cdef:
+        Py_ssize_t i
+        int64_t row_update_id
+
+    entries.reserve(array.shape[0])
+    for i in range(array.shape[0]):
+        row_update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], row_update_id))
+        if row_update_id > last_update_id[0]:
+            last_update_id[0] = row_update_id
+
+
+cdef np.ndarray c_entries_to_np_array(set[OrderBookEntry] &book, bint descending, Py_ssize_t depth):
+    """
+    Copies the first `depth` entries of a book side (all of them if depth is negative) into a preallocated
+    [price, amount, update_id] float64 array, in ascending or descending price order.
+    """
+    cdef:
+        Py_ssize_t size = book.size()
+        Py_ssize_t i = 0
+        np.ndarray[np.float64_t, ndim=2] array
+        double[:, ::1] view
+        set[OrderBookEntry].iterator it
+        set[OrderBookEntry].reverse_iterator rit
+
+    if 0 <= depth < size:
+        size = depth
+    array = np.empty((size, 3), dtype=np.float64)
+    view = array
+    if descending:
+        rit = book.rbegin()
+        while i < size:
+            view[i, 0] = deref(rit).getPrice()
+            view[i, 1] = deref(rit).getAmount()
+            view[i, 2] = <double>deref(rit).getUpdateId()
+            inc(rit)
+            i += 1
+    else:
+        it = book.begin()
+        while i < size:
+            view[i, 0] = deref(it).getPrice()
+            view[i, 1] = deref(it).getAmount()
+            view[i, 2] = <double>deref(it).getUpdateId()
+            inc(it)
+            i += 1
+    return array
+
+
+cdef class OrderBookDepthIndex:
+    """
+    Cumulative depth of the top levels of one side of an order book, in book order (best price first), which
+    answers the volume and VWAP queries of OrderBook with binary searches instead of walking the book from the top.
+
+    prices[i] is the price of level i, cumulative_base[i] and cumulative_quote[i] the base and quote volumes of the
+    levels before it (both arrays start with 0 and have one more element than prices).
+    """
+    def __init__(self, entries: np.ndarray, descending: bool, complete: bool):
+        """
+        :param entries: the [price, amount, update_id] rows of the top levels of the side, in book order
+        :param descending: True for the bids, whose prices are descending
+        :param complete: whether the entries are all the levels of the side
+        """
+        cdef:
+            const double[:, :] entries_view = entries
+            Py_ssize_t i
+
+        self.descending = descending
+        self.complete = complete
+        self._size = entries_view.shape[0]
+        self.prices = np.empty(self._size, dtype=np.float64)
+        self.cumulative_base = np.empty(self._size + 1, dtype=np.float64)
+        self.cumulative_quote = np.empty(self._size + 1, dtype=np.float64)
+        self._prices = self.prices
+        self._cumulative_base = self.cumulative_base
+        self._cumulative_quote = self.cumulative_quote
+        self._cumulative_base[0] = 0
+        self._cumulative_quote[0] = 0
+        for i in range(self._size):
+            self._prices[i] = entries_view[i, 0]
+            self._cumulative_base[i + 1] = self._cumulative_base[i] + entries_view[i, 1]
+            self._cumulative_quote[i + 1] = self._cumulative_quote[i] + entries_view[i, 1] * entries_view[i, 0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    cdef Py_ssize_t c_level_for_volume(self, const double[::1] cumulative_volume, double volume):
+        """
+        Returns the first level at which the cumulative volume reaches the volume, or -1 if the side doesn't have
+        enough volume.
+        """
+        cdef:
+            Py_ssize_t low = 1
+            Py_ssize_t high = self._size
+            Py_ssize_t middle
+
+        if self._size == 0 or not (volume <= cumulative_volume[self._size]):
+            return -1
+        while low < high:
+            middle = (low + high) >> 1
+            if cumulative_volume[middle] < volume:
+                low = middle + 1
+            else:
+                high = middle
+        return low - 1
+
+    cdef Py_ssize_t c_levels_within_price(self, double price):
+        """
+        Returns the number of levels at the price or better.
+        """
+        cdef:
+            Py_ssize_t low = 0
+            Py_ssize_t high = self._size
+            Py_ssize_t middle
+
+        while low < high:
+            middle = (low + high) >> 1
+            if (self._prices[middle] < price) if self.descending else (self._prices[middle] > price):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, double volume):
+        cdef Py_ssize_t level = self.c_level_for_volume(self._cumulative_base, volume)
+        if level < 0:
+            return OrderBookQueryResult(NaN, volume, NaN, min(self._cumulative_base[self._size], volume))
+        return OrderBookQueryResult(NaN, volume, self._prices[level], volume)
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, double volume):
+        cdef:
+            Py_ssize_t level = self.c_level_for_volume(self._cumulative_base, volume)
+            double incremental_amount
+            double total_cost
+            double total_volume
+
+        if level < 0:
+            return OrderBookQueryResult(NaN, volume, NaN, min(self._cumulative_base[self._size], volume))
+        incremental_amount = volume - self._cumulative_base[level]
+        total_cost = self._cumulative_quote[level] + incremental_amount * self._prices[level]
+        total_volume = self._cumulative_base[level] + incremental_amount
+        return OrderBookQueryResult(NaN, volume, total_cost / total_volume, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, double quote_volume):
+        cdef Py_ssize_t level = self.c_level_for_volume(self._cumulative_quote, quote_volume)
+        if level < 0:
+            return OrderBookQueryResult(NaN, quote_volume, NaN,
+                                        min(self._cumulative_quote[self._size], quote_volume))
+        return OrderBookQueryResult(NaN, quote_volume, self._prices[level], quote_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, double base_amount):
+        cdef Py_ssize_t level = self.c_level_for_volume(self._cumulative_base, base_amount)
+        if level < 0:
+            return OrderBookQueryResult(NaN, base_amount, NaN, self._cumulative_quote[self._size])
+        return OrderBookQueryResult(NaN, base_amount, NaN,
+                                    self._cumulative_quote[level] +
+                                    (base_amount - self._cumulative_base[level]) * self._prices[level])
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, double price):
+        cdef Py_ssize_t levels = self.c_levels_within_price(price)
+        return OrderBookQueryResult(price, NaN, self._prices[levels - 1] if levels > 0 else NaN,
+                                    self._cumulative_base[levels])
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, double price):
+        cdef Py_ssize_t levels = self.c_levels_within_price(price)
+        return OrderBookQueryResult(price, NaN, self._prices[levels - 1] if levels > 0 else NaN,
+                                    self._cumulative_quote[levels])
+
+    def prices_for_volumes(self, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of OrderBook.get_price_for_volume: the price reached by each volume, NaN where the side
+        doesn't have enough volume.
+        """
+        volumes = np.asarray(volumes, dtype=np.float64)
+        levels = np.searchsorted(self.cumulative_base[1:], volumes, side="left")
+        found = levels < self._size
+        result = np.full_like(volumes, NaN)
+        result[found] = self.prices[levels[found]]
+        return result
+
+    def vwaps_for_volumes(self, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of OrderBook.get_vwap_for_volume: the VWAP of each volume, NaN where the side doesn't have
+        enough volume (or for 0 volumes).
+        """
+        volumes = np.asarray(volumes, dtype=np.float64)
+        levels = np.searchsorted(self.cumulative_base[1:], volumes, side="left")
+        found = levels < self._size
+        levels = levels[found]
+        incremental_amounts = volumes[found] - self.cumulative_base[levels]
+        result = np.full_like(volumes, NaN)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[found] = ((self.cumulative_quote[levels] + incremental_amounts * self.prices[levels]) /
+                             (self.cumulative_base[levels] + incremental_amounts))
+        return result
+
+    def volumes_for_prices(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Batch version of OrderBook.get_volume_for_price: the base volume available at each price or better.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if self.descending:
+            levels = np.searchsorted(-self.prices, -prices, side="right")
+        else:
+            levels = np.searchsorted(self.prices, prices, side="right")
+        return self.cumulative_base[levels]
 
 
 cdef class OrderBook(PubSub):
@@ -52,6 +264,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = False
+        self._bid_depth_index = None
+        self._ask_depth_index = None
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -63,6 +278,9 @@ cdef class OrderBook(PubSub):
             OrderBookEntry top_bid
             OrderBookEntry top_ask
 
+        self._bid_depth_index = None
+        self._ask_depth_index = None
+
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
             result = self._bid_book.find(bid)
@@ -102,6 +320,9 @@ cdef class OrderBook(PubSub):
             OrderBookEntry top_bid
             OrderBookEntry top_ask
 
+        self._bid_depth_index = None
+        self._ask_depth_index = None
+
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
@@ -168,11 +389,27 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        return self.snapshot_frames()
+
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bids (best first, i.e. descending prices) and the asks (ascending prices) as float64 arrays with
+        3 columns, [price, amount, update_id], the format apply_numpy_snapshot takes. The arrays are filled directly
+        from the book, without building any OrderBookRow.
+
+        :param depth: the number of levels to return on each side, all of them if None
+        """
+        cdef Py_ssize_t c_depth = -1 if depth is None else max(depth, 0)
+        return (c_entries_to_np_array(self._bid_book, True, c_depth),
+                c_entries_to_np_array(self._ask_book, False, c_depth))
+
+    def snapshot_frames(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Same as snapshot_arrays, as [price, amount, update_id] data frames.
+        """
+        bids_array, asks_array = self.snapshot_arrays(depth)
+        return (pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False),
+                pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False))
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
@@ -205,16 +442,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is given, the largest update_id of the rows is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -224,24 +463,22 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        c_np_array_to_entries(bids_array, cpp_bids, &last_update_id)
+        c_np_array_to_entries(asks_array, cpp_asks, &last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is given, the largest update_id of the rows is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -251,13 +488,28 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        c_np_array_to_entries(bids_array, cpp_bids, &last_update_id)
+        c_np_array_to_entries(asks_array, cpp_asks, &last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, through the numpy path when the message carries its entries as numpy arrays
+        (see `OrderBookMessage.has_np_arrays`), without building any OrderBookRow.
+        """
+        if message.has_np_arrays:
+            self.c_apply_numpy_diffs(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, through the numpy path when the message carries its entries as numpy arrays.
+        """
+        if message.has_np_arrays:
+            self.c_apply_numpy_snapshot(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -315,11 +567,92 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        Whether the volume and VWAP queries are answered from a cumulative depth index of the book (see
+        OrderBookDepthIndex), rebuilt on the first query after each diff or snapshot, only as deep as the queries
+        reach. It pays off when the book is queried several times between updates, e.g. at different sizes in the same
+        tick.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy, Py_ssize_t depth=-1):
+        """
+        Returns a depth index of at least `depth` levels of the asks (is_buy) or of the bids, of all of them if depth
+        is negative. The index is kept until the book changes, and rebuilt deeper when more levels are asked for.
+        """
+        cdef:
+            OrderBookDepthIndex index = self._ask_depth_index if is_buy else self._bid_depth_index
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+
+        if index is not None and (index.complete or 0 <= depth <= index._size):
+            return index
+        if depth >= 0 and index is not None:
+            depth = max(depth, index._size * 4)
+        if depth >= <Py_ssize_t>deref(book).size():
+            depth = -1
+        index = OrderBookDepthIndex(c_entries_to_np_array(deref(book), not is_buy, depth), not is_buy, depth < 0)
+        if is_buy:
+            self._ask_depth_index = index
+        else:
+            self._bid_depth_index = index
+        return index
+
+    cdef OrderBookDepthIndex c_get_depth_index_for_volume(self, bint is_buy, double volume, bint is_quote_volume):
+        """
+        Returns a depth index deep enough for the base (or quote) volume, or complete.
+        """
+        cdef OrderBookDepthIndex index = self.c_get_depth_index(is_buy, DEPTH_INDEX_MIN_LEVELS)
+        while not index.complete and not (
+                volume <= (index._cumulative_quote if is_quote_volume else index._cumulative_base)[index._size]):
+            index = self.c_get_depth_index(is_buy, index._size + 1)
+        return index
+
+    cdef OrderBookDepthIndex c_get_depth_index_for_price(self, bint is_buy, double price):
+        """
+        Returns a depth index deep enough to have a level beyond the price, or complete.
+        """
+        cdef OrderBookDepthIndex index = self.c_get_depth_index(is_buy, DEPTH_INDEX_MIN_LEVELS)
+        while not index.complete and index.c_levels_within_price(price) == index._size:
+            index = self.c_get_depth_index(is_buy, index._size + 1)
+        return index
+
+    def depth_index(self, is_buy: bool) -> OrderBookDepthIndex:
+        """
+        Returns the cumulative depth index of all the asks (is_buy) or of all the bids, whether depth_index_enabled
+        is set or not.
+        """
+        return self.c_get_depth_index(is_buy)
+
+    def get_prices_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        volumes = np.asarray(volumes, dtype=np.float64)
+        return self.c_get_depth_index_for_volume(is_buy, volumes.max(initial=0), False).prices_for_volumes(volumes)
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        volumes = np.asarray(volumes, dtype=np.float64)
+        return self.c_get_depth_index_for_volume(is_buy, volumes.max(initial=0), False).vwaps_for_volumes(volumes)
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.size == 0:
+            return np.empty_like(prices)
+        # The index needs the levels up to the furthest price from the top
+        furthest_price = prices.max() if is_buy else prices.min()
+        return self.c_get_depth_index_for_price(is_buy, furthest_price).volumes_for_prices(prices)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_get_depth_index_for_volume(is_buy, volume, False).c_get_price_for_volume(volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
@@ -340,6 +673,10 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+
+        if self._depth_index_enabled:
+            return self.c_get_depth_index_for_volume(is_buy, volume, False).c_get_vwap_for_volume(volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
@@ -372,6 +709,10 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return (self.c_get_depth_index_for_volume(is_buy, quote_volume, True)
+                    .c_get_price_for_quote_volume(quote_volume))
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
@@ -393,6 +734,10 @@ cdef class OrderBook(PubSub):
             double cumulative_base_amount = 0
             double row_amount = 0
 
+        if self._depth_index_enabled:
+            return (self.c_get_depth_index_for_volume(is_buy, base_amount, False)
+                    .c_get_quote_volume_for_base_amount(base_amount))
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
@@ -419,6 +764,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_get_depth_index_for_price(is_buy, price).c_get_volume_for_price(price)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
@@ -439,6 +787,9 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            return self.c_get_depth_index_for_price(is_buy, price).c_get_quote_volume_for_price(price)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
@@ -495,6 +846,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
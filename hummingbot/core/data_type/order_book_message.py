@@ -4,11 +4,14 @@ from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
 )
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -70,6 +73,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_np_arrays(self) -> bool:
+        """
+        True if the message carries its entries as [price, amount, update_id] float64 arrays (see
+        `order_book_entries_to_np_array`), which order books apply without building OrderBookRow objects.
+        """
+        return isinstance(self.content.get("bids"), np.ndarray)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -97,3 +108,51 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             else:
                 # For messages of same timestamp, order book messages come before trade messages.
                 return self.has_update_id
+
+
+def order_book_entries_to_np_array(entries: List[List[Any]], update_id: int) -> np.ndarray:
+    """
+    Converts the [[price, amount], ...] entries of an exchange message, prices and amounts given as numbers or
+    strings, into a float64 array with the [price, amount, update_id] columns expected by
+    `OrderBook.apply_numpy_diffs()` and `OrderBook.apply_numpy_snapshot()`.
+    """
+    array: np.ndarray = np.empty((len(entries), 3), dtype=np.float64)
+    if len(entries) > 0:
+        array[:, :2] = np.array(entries, dtype=np.float64)[:, :2]
+    array[:, 2] = update_id
+    return array
+
+
+def _entries_np_array(message: OrderBookMessage, side: str) -> np.ndarray:
+    if message.has_np_arrays:
+        return message.content[side]
+    rows: List[OrderBookRow] = message.bids if side == "bids" else message.asks
+    return np.array([[row.price, row.amount, row.update_id] for row in rows], dtype=np.float64).reshape(-1, 3)
+
+
+def _latest_entry_per_price(arrays: List[np.ndarray]) -> np.ndarray:
+    entries: np.ndarray = np.concatenate(arrays)
+    if len(entries) == 0:
+        return entries
+    # lexsort is stable: within a price level, rows with the same update_id keep the order of the messages
+    entries = entries[np.lexsort((entries[:, 2], entries[:, 0]))]
+    is_last_of_level: np.ndarray = np.empty(len(entries), dtype=bool)
+    is_last_of_level[:-1] = entries[1:, 0] != entries[:-1, 0]
+    is_last_of_level[-1] = True
+    return entries[is_last_of_level]
+
+
+def coalesce_diff_messages(messages: List[OrderBookMessage]) -> OrderBookMessage:
+    """
+    Merges consecutive diff messages of a trading pair into one net diff message carrying numpy arrays. For each price
+    level only the entry with the highest update_id is kept (the latest message wins on ties), so the merged diff sets
+    every level to the amount it would have after applying the messages one by one.
+    """
+    last_message: OrderBookMessage = messages[-1]
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": last_message.trading_pair,
+        "first_update_id": messages[0].first_update_id,
+        "update_id": last_message.update_id,
+        "bids": _latest_entry_per_price([_entries_np_array(message, "bids") for message in messages]),
+        "asks": _latest_entry_per_price([_entries_np_array(message, "asks") for message in messages]),
+    }, timestamp=last_message.timestamp)
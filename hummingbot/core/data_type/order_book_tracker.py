@@ -2,8 +2,10 @@
 import asyncio
 from abc import ABC
 from collections import deque
+from dataclasses import dataclass
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 from typing import (
@@ -13,13 +15,16 @@ from typing import (
     Tuple,
     List)
 import time
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.weighted_api_throttler import WeightedAPIThrottler
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
+    coalesce_diff_messages,
 )
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
@@ -32,8 +37,27 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookDiffQueueMetrics:
+    """
+    Diff processing statistics of a trading pair. A coalesce ratio above 1 means diffs piled up in the tracking queue
+    while the order book was busy; a growing queue depth means the order book is falling behind the diff stream.
+    max_queue_depth covers the last minute.
+    """
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    diff_messages: int = 0
+    diff_updates: int = 0
+
+    @property
+    def coalesce_ratio(self) -> float:
+        return self.diff_messages / self.diff_updates if self.diff_updates > 0 else 1.0
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    SAVED_MESSAGES_QUEUE_SIZE: int = 1000
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -47,10 +71,18 @@ class OrderBookTracker(ABC):
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        # Readiness events and saved diff messages of the tracked trading pairs only
+        self._order_book_ready_events: Dict[str, asyncio.Event] = {
+            trading_pair: asyncio.Event() for trading_pair in trading_pairs or []
+        }
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = {
+            trading_pair: deque(maxlen=self.SAVED_MESSAGES_QUEUE_SIZE) for trading_pair in trading_pairs or []
+        }
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._diff_queue_metrics: Dict[str, OrderBookDiffQueueMetrics] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -73,10 +105,30 @@ class OrderBookTracker(ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def diff_queue_metrics(self) -> Dict[str, OrderBookDiffQueueMetrics]:
+        return self._diff_queue_metrics
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair, event in self._order_book_ready_events.items() if event.is_set()]
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        event: Optional[asyncio.Event] = self._order_book_ready_events.get(trading_pair)
+        return event is not None and event.is_set()
+
+    async def wait_for_trading_pair(self, trading_pair: str):
+        """
+        Waits until the order book for the trading pair is initialized, without waiting for the other pairs.
+        """
+        if trading_pair not in self._order_book_ready_events:
+            raise ValueError(f"{trading_pair} is not tracked.")
+        await self._order_book_ready_events[trading_pair].wait()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +136,15 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Same as snapshot, with each book as the [price, amount, update_id] arrays of OrderBook.snapshot_arrays.
+        """
+        return {
+            trading_pair: order_book.snapshot_arrays(depth)
+            for trading_pair, order_book in self._order_books.items()
+        }
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -142,13 +203,14 @@ class OrderBookTracker(ABC):
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
         fall-back mechanism for when the web socket update channel fails.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
@@ -172,32 +234,77 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. If the data source declares the rate limit of its snapshot requests, the snapshots
+        are fetched concurrently within that limit. Otherwise they are fetched one at a time.
+        Each trading pair is tracked as soon as its own order book is ready.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        rate_limit: Optional[RateLimit] = self._data_source.snapshot_rate_limit
+        if rate_limit is None:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                await self._init_order_book(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await asyncio.sleep(1)
+        else:
+            throttler: WeightedAPIThrottler = WeightedAPIThrottler(rate_limit_list=[rate_limit],
+                                                                   retry_interval=0.1)
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+            await safe_gather(*[
+                self._init_order_book_throttled(trading_pair, throttler, rate_limit.path_url, semaphore)
+                for trading_pair in self._trading_pairs
+            ])
         self._order_books_initialized.set()
 
+    async def _init_order_book_throttled(self,
+                                         trading_pair: str,
+                                         throttler: WeightedAPIThrottler,
+                                         path_url: str,
+                                         semaphore: asyncio.Semaphore):
+        while True:
+            try:
+                async with semaphore:
+                    async with throttler.execute_task(path_url=path_url):
+                        await self._init_order_book(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(self.ready_trading_pairs)}/{len(self._trading_pairs)} completed.")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not fetch the order book snapshot for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    async def _init_order_book(self, trading_pair: str):
+        self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair not in self._order_book_ready_events:
+                        messages_rejected += 1
+                        continue
+                    messages_queued += 1
+                    # Save diff messages received before the order book snapshot is ready
+                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -212,9 +319,11 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
+                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -227,7 +336,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -248,24 +356,61 @@ class OrderBookTracker(ABC):
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        metrics: OrderBookDiffQueueMetrics = OrderBookDiffQueueMetrics()
+        self._diff_queue_metrics[trading_pair] = metrics
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        diff_updates_applied: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                message: OrderBookMessage = None
+                saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+
+                # Process saved messages first if there are any, skipping the ones older than the snapshot
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
+                    message = saved_messages.popleft()
+                    if order_book.snapshot_uid > message.update_id:
+                        continue
+                else:
+                    message = await message_queue.get()
+
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    diffs: List[OrderBookMessage] = [message]
+                    metrics.queue_depth = message_queue.qsize()
+                    metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+                    # Diffs that piled up while the order book was busy are merged and applied as one net update
+                    if len(saved_messages) == 0:
+                        while not message_queue.empty():
+                            next_message: OrderBookMessage = message_queue.get_nowait()
+                            if next_message.type is not OrderBookMessageType.DIFF:
+                                pending_message = next_message
+                                break
+                            diffs.append(next_message)
+                    if len(diffs) > 1:
+                        order_book.apply_diff_message(coalesce_diff_messages(diffs))
+                    else:
+                        order_book.apply_diff_message(message)
+                    past_diffs_window.extend(diffs)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted += len(diffs)
+                    diff_updates_applied += 1
+                    metrics.diff_messages += len(diffs)
+                    metrics.diff_updates += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair} "
+                                            f"in {diff_updates_applied} updates. "
+                                            f"Max queue depth: {metrics.max_queue_depth}.")
                         diff_messages_accepted = 0
+                        diff_updates_applied = 0
+                        metrics.max_queue_depth = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
@@ -281,7 +426,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -9,7 +9,9 @@ from typing import (
     Callable,
     Dict,
     List,
+    Optional,
 )
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.order_book import OrderBook
 
 
@@ -36,6 +38,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def snapshot_rate_limit(self) -> Optional[RateLimit]:
+        """
+        Rate limit of the REST request behind `get_new_order_book()`. When a data source declares it, the order book
+        tracker fetches the initial snapshots of all trading pairs concurrently within that limit.
+        """
+        return None
+
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         raise NotImplementedError
@@ -21,6 +21,7 @@ from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrde
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 
 class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -53,7 +54,7 @@ class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_client_session(self) -> aiohttp.ClientSession:
         if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
+            self._client_session = get_shared_client()
         return self._client_session
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -0,0 +1,151 @@
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Union,
+)
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_entries_to_np_array,
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils.json_decoder import (
+    JsonDecoder,
+    get_json_decoder,
+)
+
+MessageExtractor = Callable[[Dict[str, Any], float], Optional[OrderBookMessage]]
+
+s_float_buy = float(TradeType.BUY.value)
+s_float_sell = float(TradeType.SELL.value)
+
+
+class WebsocketMessageParser:
+    """
+    Turns the raw frames of an exchange websocket into order book messages. Each frame is decoded once, with the JSON
+    decoder chosen at startup, then handed to the extractor registered for its message type, the value of `type_key`
+    in the decoded message. Frames of other types (subscription replies, heartbeats...) are parsed to None.
+
+    The extractors of diff_message_extractor and trade_message_extractor parse each price and amount once, into the
+    float64 arrays order books apply (see `OrderBookMessage.has_np_arrays`) or into floats.
+    """
+
+    def __init__(self, type_key: str, decoder: Optional[JsonDecoder] = None):
+        self._type_key: str = type_key
+        self._decoder: JsonDecoder = decoder or get_json_decoder()
+        self._extractors: Dict[Any, MessageExtractor] = {}
+
+    def add_extractor(self, message_type: Any, extractor: MessageExtractor):
+        self._extractors[message_type] = extractor
+
+    def decode(self, raw_msg: Union[str, bytes]) -> Any:
+        return self._decoder(raw_msg)
+
+    def extract(self, msg: Any, timestamp: Optional[float] = None) -> Optional[OrderBookMessage]:
+        """
+        Extracts the order book message of a decoded message.
+        :param msg: The decoded message
+        :param timestamp: The time the message was received, now by default
+        """
+        if type(msg) is not dict:
+            return None
+        extractor: Optional[MessageExtractor] = self._extractors.get(msg.get(self._type_key))
+        if extractor is None:
+            return None
+        return extractor(msg, time.time() if timestamp is None else timestamp)
+
+    def parse(self, raw_msg: Union[str, bytes], timestamp: Optional[float] = None) -> Optional[OrderBookMessage]:
+        return self.extract(self._decoder(raw_msg), timestamp)
+
+
+def cached_trading_pair_converter(convert: Callable[[str], Optional[str]]) -> Callable[[str], Optional[str]]:
+    """
+    Caches the conversions of exchange symbols into trading pairs, which often run a regular expression.
+    """
+    trading_pairs: Dict[str, Optional[str]] = {}
+
+    def cached_convert(symbol: str) -> Optional[str]:
+        trading_pair: Optional[str] = trading_pairs.get(symbol)
+        if trading_pair is None:
+            trading_pair = convert(symbol)
+            trading_pairs[symbol] = trading_pair
+        return trading_pair
+
+    return cached_convert
+
+
+def diff_message_extractor(symbol_key: str,
+                           update_id_key: str,
+                           bids_key: str,
+                           asks_key: str,
+                           convert_trading_pair: Callable[[str], Optional[str]],
+                           first_update_id_key: Optional[str] = None,
+                           message_type: OrderBookMessageType = OrderBookMessageType.DIFF) -> MessageExtractor:
+    """
+    Extractor of the order book diff (or snapshot) messages whose bids and asks are [[price, amount], ...] entries.
+    :param symbol_key: The key of the exchange symbol, converted with convert_trading_pair (cached)
+    :param update_id_key: The key of the update id
+    :param bids_key: The key of the bid entries
+    :param asks_key: The key of the ask entries
+    :param convert_trading_pair: Converts an exchange symbol into a trading pair
+    :param first_update_id_key: The key of the first update id of the diff, if the exchange sends it
+    :param message_type: The type of the order book messages extracted
+    """
+    convert: Callable[[str], Optional[str]] = cached_trading_pair_converter(convert_trading_pair)
+
+    def extract(msg: Dict[str, Any], timestamp: float) -> OrderBookMessage:
+        update_id: int = msg[update_id_key]
+        content: Dict[str, Any] = {
+            "trading_pair": convert(msg[symbol_key]),
+            "update_id": update_id,
+            "bids": order_book_entries_to_np_array(msg[bids_key], update_id),
+            "asks": order_book_entries_to_np_array(msg[asks_key], update_id),
+        }
+        if first_update_id_key is not None:
+            content["first_update_id"] = msg[first_update_id_key]
+        return OrderBookMessage(message_type, content, timestamp=timestamp)
+
+    return extract
+
+
+def trade_message_extractor(symbol_key: str,
+                            trade_id_key: str,
+                            price_key: str,
+                            amount_key: str,
+                            is_sell: Callable[[Dict[str, Any]], bool],
+                            convert_trading_pair: Callable[[str], Optional[str]],
+                            timestamp_key: Optional[str] = None,
+                            timestamp_scale: float = 1e-3) -> MessageExtractor:
+    """
+    Extractor of the trade messages, the price and amount are parsed into floats.
+    :param symbol_key: The key of the exchange symbol, converted with convert_trading_pair (cached)
+    :param trade_id_key: The key of the trade id
+    :param price_key: The key of the price
+    :param amount_key: The key of the amount
+    :param is_sell: True if the taker of the trade sold
+    :param convert_trading_pair: Converts an exchange symbol into a trading pair
+    :param timestamp_key: The key of the exchange timestamp, also the update id of the message. Without it the time
+    the message was received is used.
+    :param timestamp_scale: The scale of the exchange timestamp in seconds, e.g. 1e-3 for milliseconds
+    """
+    convert: Callable[[str], Optional[str]] = cached_trading_pair_converter(convert_trading_pair)
+
+    def extract(msg: Dict[str, Any], timestamp: float) -> OrderBookMessage:
+        update_id: float = timestamp
+        if timestamp_key is not None:
+            update_id = msg[timestamp_key]
+            timestamp = update_id * timestamp_scale
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": convert(msg[symbol_key]),
+            "trade_type": s_float_sell if is_sell(msg) else s_float_buy,
+            "trade_id": msg[trade_id_key],
+            "update_id": update_id,
+            "price": float(msg[price_key]),
+            "amount": float(msg[amount_key])
+        }, timestamp=timestamp)
+
+    return extract
@@ -5,6 +5,10 @@ cdef class EventLogger(EventListener):
     cdef:
         str _event_source
         object _logged_events
-        dict _waiting
-        dict _wait_returns
+        dict _events_by_type
+        object _max_events
+        object _max_age
+        double _last_timestamp
+        readonly dict _waiting
     cdef c_call(self, object event_object)
+    cdef c_evict(self)
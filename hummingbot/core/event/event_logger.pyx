@@ -1,57 +1,114 @@
 #!/usr/bin/env python
 
 import asyncio
+import math
 from async_timeout import timeout
+from collections import deque
 from typing import (
+    Iterator,
     List,
     Optional,
+    Type,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Keeps the events it receives in arrival order, with an index per event type, under an optional retention policy:
+    at most `max_events` events, and no event older than `max_age` seconds before the latest one. Events are timed by
+    their `timestamp` field, or by the latest timestamp seen for events without one.
+    iter_events() reads the log without copying it. event_log copies it and is kept for callers that need a list.
+    """
+
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_events: Optional[int] = None,
+                 max_age: Optional[float] = None):
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._logged_events = deque()
+        self._events_by_type = {}
+        self._max_events = max_events
+        self._max_age = max_age
+        self._last_timestamp = -math.inf
         self._waiting = {}
-        self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        return [event for _, event in self._logged_events]
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    def event_count(self, event_type: Optional[Type] = None) -> int:
+        if event_type is None:
+            return len(self._logged_events)
+        return len(self._events_by_type.get(event_type, ()))
+
+    def iter_events(self, event_type: Optional[Type] = None, since_timestamp: Optional[float] = None) -> Iterator[any]:
+        """
+        Iterates over the logged events, oldest first, optionally only those of one type and those timed after the
+        timestamp. The log must not receive events while the iterator is in use.
+        """
+        entries = self._logged_events if event_type is None else self._events_by_type.get(event_type, ())
+        if since_timestamp is None:
+            return (event for _, event in entries)
+        return (event for event_timestamp, event in entries if event_timestamp > since_timestamp)
+
     def clear(self):
         self._logged_events.clear()
+        self._events_by_type.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
-        notifier = asyncio.Event()
-        self._waiting[notifier] = event_type
-
-        async with timeout(timeout_seconds):
-            await notifier.wait()
-
-        retval = self._wait_returns.get(notifier)
-        if notifier in self._wait_returns:
-            del self._wait_returns[notifier]
-        return retval
+        future = asyncio.get_event_loop().create_future()
+        waiters = self._waiting.setdefault(event_type, [])
+        waiters.append(future)
+        try:
+            async with timeout(timeout_seconds):
+                return await future
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+                if len(waiters) == 0 and self._waiting.get(event_type) is waiters:
+                    del self._waiting[event_type]
 
     def __call__(self, event_object):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.append(event_object)
-        event_object_type = type(event_object)
-
-        should_notify = []
-        for notifier, waiting_event_type in self._waiting.items():
-            if event_object_type is waiting_event_type:
-                should_notify.append(notifier)
-                self._wait_returns[notifier] = event_object
-        for notifier in should_notify:
-            notifier.set()
+        cdef:
+            object event_type = type(event_object)
+            object event_timestamp = getattr(event_object, "timestamp", None)
+            tuple entry
+            list waiters
+
+        if isinstance(event_timestamp, (int, float)) and not math.isnan(event_timestamp):
+            self._last_timestamp = max(self._last_timestamp, event_timestamp)
+        else:
+            event_timestamp = self._last_timestamp
+        entry = (event_timestamp, event_object)
+        self._logged_events.append(entry)
+        if event_type not in self._events_by_type:
+            self._events_by_type[event_type] = deque()
+        self._events_by_type[event_type].append(entry)
+        self.c_evict()
+
+        waiters = self._waiting.pop(event_type, None)
+        if waiters is not None:
+            for future in waiters:
+                if not future.done():
+                    future.set_result(event_object)
+
+    cdef c_evict(self):
+        cdef:
+            object logged_events = self._logged_events
+            tuple entry
+        while len(logged_events) > 0 and (
+                (self._max_events is not None and len(logged_events) > self._max_events)
+                or (self._max_age is not None and self._last_timestamp - logged_events[0][0] > self._max_age)):
+            entry = logged_events.popleft()
+            # Both logs are in arrival order, so the oldest event overall is the oldest of its type.
+            self._events_by_type[type(entry[1])].popleft()
@@ -1,20 +1,12 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
 
 from cpython cimport(
-    PyObject,
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
+from libc.stdint cimport int64_t
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +16,36 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class _ListenerFinalizer:
+    """
+    Weak reference callback removing a collected listener from the PubSub it was added to.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_weakref
+        int64_t _event_tag
+        object _listener_key
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag, object listener_key):
+        self._pubsub_weakref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
+        self._listener_key = listener_key
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, listener_weakref):
+        pubsub = <object>PyWeakref_GetObject(self._pubsub_weakref)
+        if pubsub is not None:
+            (<PubSub>pubsub).c_remove_listener_weakref(self._event_tag, self._listener_key, listener_weakref)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the listeners once they are
+    garbage collected.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Every listener is held through a weak reference with a callback, which removes the listener when it is collected.
+    For each event tag, the weak references of the listeners are also kept in an immutable tuple snapshot. The
+    snapshot is rebuilt only when a listener is added, removed or collected, so c_trigger_event() only loops over the
+    snapshot, with no scan for dead listeners.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +54,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self):
+        # Set up in __cinit__ since many subclasses, e.g. TimeIterator, don't call PubSub.__init__()
+        self._listeners = {}
+        self._listener_snapshots = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -72,94 +76,81 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
+            dict listeners = self._listeners.get(event_tag)
+            object listener_key = id(listener)
+            object listener_weakref
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        if listeners is None:
+            listeners = {}
+            self._listeners[event_tag] = listeners
+        listener_weakref = listeners.get(listener_key)
+        if listener_weakref is not None and <object>PyWeakref_GetObject(listener_weakref) is listener:
+            return
+        listeners[listener_key] = PyWeakref_NewRef(listener, _ListenerFinalizer(self, event_tag, listener_key))
+        self.c_update_listener_snapshot(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            dict listeners = self._listeners.get(event_tag)
+            object listener_key = id(listener)
+            object listener_weakref
+
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        listener_weakref = listeners.get(listener_key)
+        if listener_weakref is not None and <object>PyWeakref_GetObject(listener_weakref) is listener:
+            self.c_remove_listener_weakref(event_tag, listener_key, listener_weakref)
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_remove_listener_weakref(self, int64_t event_tag, object listener_key, object listener_weakref):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+            dict listeners = self._listeners.get(event_tag)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+        # The listener may have been removed, and another one added under the same key, before the weak reference
+        # callback runs.
+        if listeners is None or listeners.get(listener_key) is not listener_weakref:
+            return
+        del listeners[listener_key]
+        self.c_update_listener_snapshot(event_tag)
 
+    cdef c_update_listener_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            dict listeners = self._listeners.get(event_tag)
 
-        if it == self._events.end():
-            return []
+        if listeners is None or len(listeners) < 1:
+            self._listeners.pop(event_tag, None)
+            self._listener_snapshots.pop(event_tag, None)
+        else:
+            self._listener_snapshots[event_tag] = tuple(listeners.values())
+
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._listener_snapshots.get(event_tag, ())
+            object listener
 
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            object snapshot = self._listener_snapshots.get(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
+
+        if snapshot is None:
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The snapshot is immutable, so listeners are allowed to call c_add_listener() or c_remove_listener() while
+        # the event is dispatched.
+        for listener_weakref in <tuple>snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # Collected, but the weak reference callback has not run yet.
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -1,12 +1,20 @@
 import asyncio
 import logging
+import time
 from typing import (
+    Any,
     Dict,
+    Iterable,
     Optional,
-    List
+    List,
+    Set,
+    Tuple,
 )
 from decimal import Decimal
 import aiohttp
+import ujson
+import websockets
+from websockets.exceptions import ConnectionClosed
 from enum import Enum
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
@@ -14,13 +22,16 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 import hummingbot.client.settings # noqa
 from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair as \
     binance_convert_from_exchange_pair
+from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair as \
+    binance_convert_to_exchange_pair
 from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_exchange_trading_pair as \
     kucoin_convert_from_exchange_pair
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import convert_from_exchange_trading_pair as \
     ascend_ex_convert_from_exchange_pair
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import find_rate, find_rate_pairs
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_client_registry import get_shared_client
 
 
 class RateOracleSource(Enum):
@@ -38,6 +49,11 @@ class RateOracle(NetworkBase):
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+
+    Consumers subscribe to the pairs they need. With the Binance source, the prices their rates are found from are
+    streamed from the book ticker websocket, and the REST endpoint of all the prices is then only polled every
+    STREAM_FALLBACK_INTERVAL seconds. Prices are updated only when they change, and wait_for_rate_change lets a
+    subscriber await the next change of a rate.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -46,7 +62,6 @@ class RateOracle(NetworkBase):
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -56,6 +71,11 @@ class RateOracle(NetworkBase):
     coingecko_supported_vs_tokens_url = "https://api.coingecko.com/api/v3/simple/supported_vs_currencies"
     kucoin_price_url = "https://api.kucoin.com/api/v1/market/allTickers"
     ascend_ex_price_url = "https://ascendex.com/api/pro/v1/ticker"
+    binance_ws_url = "wss://stream.binance.com:9443/ws"
+
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    STREAM_FALLBACK_INTERVAL = 30.0
 
     @classmethod
     def get_instance(cls) -> "RateOracle":
@@ -76,15 +96,24 @@ class RateOracle(NetworkBase):
         self._prices: Dict[str, Decimal] = {}
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
+        self._prices_changed_event = asyncio.Event()
+        self._subscriptions: Dict[str, int] = {}
+        self._stream_task: Optional[asyncio.Task] = None
+        self._stream_ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._stream_pairs: Dict[str, str] = {}
+        self._stream_pairs_event = asyncio.Event()
+        self._stream_tickers: Dict[str, Tuple[str, str]] = {}
+        self._stream_request_id = 0
+        self._last_rest_update = 0.0
+        # Trading pairs missing from the last REST refresh
+        self._missing_pairs: Set[str] = set()
 
     def __str__(self):
         return f"{self.source.name.title()} rate oracle"
 
     @classmethod
     async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+        return get_shared_client()
 
     async def get_ready(self):
         """
@@ -110,6 +139,48 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def subscriptions(self) -> List[str]:
+        return list(self._subscriptions.keys())
+
+    @property
+    def streamed_pairs(self) -> List[str]:
+        """
+        Trading pairs whose prices are streamed, those the rates of the subscribed pairs are found from
+        """
+        return list(self._stream_pairs.values())
+
+    def subscribe(self, pairs: Iterable[str]):
+        """
+        Registers trading pairs a consumer needs the rates of, until it unsubscribes from them.
+        :param pairs: Trading pairs, e.g. ["BTC-USDT"]
+        """
+        for pair in pairs:
+            self._subscriptions[pair] = self._subscriptions.get(pair, 0) + 1
+        self._update_stream_pairs()
+
+    def unsubscribe(self, pairs: Iterable[str]):
+        for pair in pairs:
+            count = self._subscriptions.get(pair, 0) - 1
+            if count > 0:
+                self._subscriptions[pair] = count
+            else:
+                self._subscriptions.pop(pair, None)
+        self._update_stream_pairs()
+
+    async def wait_for_rate_change(self, pair: str) -> Decimal:
+        """
+        Waits for the rate of a trading pair to change.
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return The new rate
+        """
+        rate = self.rate(pair)
+        while True:
+            await self._prices_changed_event.wait()
+            new_rate = self.rate(pair)
+            if new_rate != rate:
+                return new_rate
+
     def rate(self, pair: str) -> Decimal:
         """
         Finds a conversion rate for a given symbol, this can be direct or indirect prices as long as it can find a route
@@ -153,12 +224,56 @@ class RateOracle(NetworkBase):
         rate = Decimal("0") if rate is None else rate
         return amount * rate
 
+    def _update_prices(self, prices: Dict[str, Decimal], skip: Iterable[str] = (), removed: Iterable[str] = ()):
+        """
+        Updates the prices that changed, and wakes up the subscribers waiting for a change.
+        :param prices: A dictionary of trading pairs and prices
+        :param skip: Trading pairs not to update, e.g. those the stream keeps up to date
+        :param removed: Trading pairs no longer priced by the source, e.g. delisted ones
+        """
+        changed = False
+        for pair, price in prices.items():
+            if self._prices.get(pair) != price and pair not in skip:
+                self._prices[pair] = price
+                changed = True
+        for pair in removed:
+            if self._prices.pop(pair, None) is not None:
+                changed = True
+        if changed:
+            # Every waiter is woken up by the current event, later waiters wait on a new one
+            self._prices_changed_event.set()
+            self._prices_changed_event = asyncio.Event()
+
+    def _delisted_pairs(self, prices: Dict[str, Decimal]) -> Set[str]:
+        """
+        Trading pairs missing from the REST refresh of all the prices, and from the one before, as a refresh misses the
+        prices of any of its requests that failed.
+        :param prices: The prices of the REST refresh
+        """
+        if len(prices) == 0:
+            return set()
+        missing = set(self._prices.keys()).difference(prices.keys())
+        delisted = missing.intersection(self._missing_pairs)
+        self._missing_pairs = missing.difference(delisted)
+        return delisted
+
+    @property
+    def _stream_connected(self) -> bool:
+        return self._stream_ws is not None
+
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
-                if self._prices:
-                    self._ready_event.set()
+                if not self._stream_connected or \
+                        time.time() - self._last_rest_update >= self.STREAM_FALLBACK_INTERVAL:
+                    prices = await self.get_prices()
+                    self._last_rest_update = time.time()
+                    self._update_prices(prices,
+                                        skip=set(self._stream_pairs.values()) if self._stream_connected else (),
+                                        removed=self._delisted_pairs(prices))
+                    if self._prices:
+                        self._ready_event.set()
+                        self._update_stream_pairs()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -217,15 +332,17 @@ class RateOracle(NetworkBase):
         async with client.request("GET", url) as resp:
             records = await resp.json()
             for record in records:
+                if record["bidPrice"] is None or record["askPrice"] is None:
+                    continue
+                if quote_symbol is not None and not record["symbol"].endswith(quote_symbol):
+                    continue
                 trading_pair = binance_convert_from_exchange_pair(record["symbol"])
-                if quote_symbol is not None:
-                    base, quote = trading_pair.split("-")
-                    if quote != quote_symbol:
-                        continue
-                if trading_pair and record["bidPrice"] is not None and record["askPrice"] is not None and \
-                        Decimal(record["bidPrice"]) > 0 and Decimal(record["askPrice"]):
-                    results[trading_pair] = (Decimal(record["bidPrice"]) + Decimal(record["askPrice"])) / Decimal(
-                        "2")
+                if quote_symbol is not None and (trading_pair is None or trading_pair.split("-")[1] != quote_symbol):
+                    continue
+                bid_price = Decimal(record["bidPrice"])
+                ask_price = Decimal(record["askPrice"])
+                if trading_pair and bid_price > 0 and ask_price:
+                    results[trading_pair] = (bid_price + ask_price) / Decimal("2")
         return results
 
     @classmethod
@@ -310,14 +427,111 @@ class RateOracle(NetworkBase):
                     results[pair] = Decimal(str(record["current_price"]))
         return results
 
+    def _update_stream_pairs(self):
+        """
+        Streams the prices the rates of the subscribed pairs are found from, as found from the current prices.
+        USD pairs come from binance.us and are left to the REST polling.
+        """
+        if self.source != RateOracleSource.binance:
+            return
+        stream_pairs: Dict[str, str] = {}
+        for subscription in self._subscriptions:
+            for pair in find_rate_pairs(self._prices, subscription):
+                if pair.split("-")[1] != "USD":
+                    stream_pairs[binance_convert_to_exchange_pair(pair)] = pair
+        added = [symbol for symbol in stream_pairs if symbol not in self._stream_pairs]
+        removed = [symbol for symbol in self._stream_pairs if symbol not in stream_pairs]
+        self._stream_pairs = stream_pairs
+        for symbol in removed:
+            self._stream_tickers.pop(symbol, None)
+        if self._stream_connected:
+            if added:
+                safe_ensure_future(self._send_stream_request("SUBSCRIBE", added))
+            if removed:
+                safe_ensure_future(self._send_stream_request("UNSUBSCRIBE", removed))
+        if stream_pairs:
+            self._stream_pairs_event.set()
+        else:
+            self._stream_pairs_event.clear()
+
+    async def _send_stream_request(self, method: str, symbols: List[str]):
+        self._stream_request_id += 1
+        try:
+            await self._stream_ws.send(ujson.dumps({"method": method,
+                                                    "params": [f"{symbol.lower()}@bookTicker" for symbol in symbols],
+                                                    "id": self._stream_request_id}))
+        except ConnectionClosed:
+            # Subscribed again when reconnecting
+            pass
+
+    def _process_book_ticker(self, msg: Dict[str, Any]):
+        symbol = msg.get("s")
+        pair = self._stream_pairs.get(symbol)
+        if pair is None:
+            return
+        # Most updates only change the amounts at the best prices
+        ticker = (msg["b"], msg["a"])
+        if self._stream_tickers.get(symbol) == ticker:
+            return
+        self._stream_tickers[symbol] = ticker
+        bid_price = Decimal(ticker[0])
+        ask_price = Decimal(ticker[1])
+        if bid_price > 0 and ask_price > 0:
+            self._update_prices({pair: (bid_price + ask_price) / Decimal("2")})
+
+    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol):
+        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+        try:
+            while True:
+                try:
+                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                    yield msg
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+        finally:
+            await ws.close()
+
+    async def stream_price_loop(self):
+        while True:
+            try:
+                await self._stream_pairs_event.wait()
+                async with websockets.connect(self.binance_ws_url) as ws:
+                    self._stream_ws = ws
+                    self._stream_tickers.clear()
+                    await self._send_stream_request("SUBSCRIBE", list(self._stream_pairs.keys()))
+                    async for raw_msg in self._inner_messages(ws):
+                        msg = ujson.loads(raw_msg)
+                        if "s" in msg:
+                            self._process_book_ticker(msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error with the rate oracle price stream.", exc_info=True,
+                                      app_warning_msg="Couldn't stream prices from binance, polling them instead. "
+                                                      "Retrying after 30 seconds...")
+                await asyncio.sleep(30.0)
+            finally:
+                self._stream_ws = None
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
+        if self.source == RateOracleSource.binance:
+            self._stream_task = safe_ensure_future(self.stream_price_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
 
     async def check_network(self) -> NetworkStatus:
         try:
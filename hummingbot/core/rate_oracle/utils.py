@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from decimal import Decimal
 
 
@@ -30,3 +30,32 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = f"{quote}-{link_quote}"
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+def find_rate_pairs(prices: Dict[str, Decimal], pair: str) -> List[str]:
+    '''
+    Finds the trading pairs of the prices find_rate uses for a given trading pair, following the same route
+    For example, given prices of {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+    The pairs for HBOT-AAVE will be ["HBOT-USDT", "AAVE-USDT"]
+    :param prices: The dictionary of trading pairs and their prices
+    :param pair: The trading pair
+    :return The trading pairs, empty if the rate is not found
+    '''
+    if pair in prices:
+        return [pair]
+    base, quote = pair.split("-")
+    if base == quote:
+        return []
+    reverse_pair = f"{quote}-{base}"
+    if reverse_pair in prices:
+        return [reverse_pair]
+    base_pairs = [k for k in prices.keys() if k.startswith(f"{base}-")]
+    for base_pair in base_pairs:
+        link_quote = base_pair.split("-")[1]
+        link_pair = f"{link_quote}-{quote}"
+        if link_pair in prices:
+            return [base_pair, link_pair]
+        common_denom_pair = f"{quote}-{link_quote}"
+        if common_denom_pair in prices:
+            return [base_pair, common_denom_pair]
+    return []
@@ -27,6 +27,14 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_wake_up_time(self, timestamp: float) -> float:
+        """
+        The earliest time after `timestamp` at which the iterator's tick can do anything, for fast forward back tests.
+        Ticks before then must not change anything, unless another iterator or a data feed acts first, in which case
+        the clock ticks every iterator at that earlier time anyway. NaN means the iterator needs every tick.
+        """
+        return NaN
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
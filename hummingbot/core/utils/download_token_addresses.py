@@ -5,7 +5,6 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
 
 import os
 import json
-import aiohttp
 import asyncio
 import logging
 from typing import (
@@ -13,6 +12,7 @@ from typing import (
 )
 from web3 import Web3
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 RADAR_RELAY_ENDPOINT = "https://api.radarrelay.com/v2/markets"
 BAMBOO_RELAY_ENDPOINT = "https://rest.bamboorelay.com/main/0x/markets"
@@ -21,7 +21,7 @@ API_CALL_TIMEOUT = 5
 
 
 async def download_dolomite_token_addresses(token_dict: Dict[str, str]):
-    async with aiohttp.ClientSession() as client:
+    async with shared_client_session() as client:
         async with client.get(DOLOMITE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
             if response.status == 200:
                 try:
@@ -42,7 +42,7 @@ async def download_radar_relay_token_addresses(token_dict: Dict[str, str]):
     page_count = 1
     while True:
         url = f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}"
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(url, timeout=API_CALL_TIMEOUT) as response:
                 page_count += 1
                 try:
@@ -68,7 +68,7 @@ async def download_bamboo_relay_token_addresses(token_dict: Dict[str, str]):
     page_count = 1
     while True:
         url = f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}"
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(url, timeout=API_CALL_TIMEOUT) as response:
                 page_count += 1
                 try:
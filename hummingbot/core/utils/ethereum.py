@@ -2,9 +2,9 @@
 A collection of utility functions for querying and checking Ethereum data
 """
 
-import aiohttp
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_client_registry import shared_client_session
 import itertools as it
 import logging
 from typing import List
@@ -81,7 +81,7 @@ async def get_token_list():
     This is abstracted out of fetch_trading_pairs to make mock testing easier
     """
     token_list_url = global_config_map.get("ethereum_token_list_url").value
-    async with aiohttp.ClientSession() as client:
+    async with shared_client_session() as client:
         resp = await client.get(token_list_url)
         return await resp.json()
 
@@ -0,0 +1,170 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+)
+
+import aiohttp
+import pandas as pd
+
+
+class HostConnectionMetrics:
+    """
+    Requests sent to one host by the shared sessions, and whether each of them opened a new connection or reused a
+    pooled one.
+    """
+
+    def __init__(self):
+        self.requests: int = 0
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.dns_cache_hits: int = 0
+        self.dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        connections: int = self.connections_created + self.connections_reused
+        return self.connections_reused / connections if connections > 0 else 0.0
+
+
+class HttpClientRegistry:
+    """
+    Process wide registry of pooled aiohttp sessions, one per event loop. Connections are kept alive and pooled per
+    host, and host names are resolved through the connector's DNS cache, so repeated calls to an exchange skip the TCP
+    and TLS handshakes. The shared sessions are only closed by close(), never by their users.
+    """
+    DEFAULT_LIMIT: int = 100
+    DEFAULT_LIMIT_PER_HOST: int = 20
+    DEFAULT_TTL_DNS_CACHE: int = 300
+    DEFAULT_KEEPALIVE_TIMEOUT: float = 30.0
+
+    _shared_instance: Optional["HttpClientRegistry"] = None
+
+    @classmethod
+    def shared_instance(cls) -> "HttpClientRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = HttpClientRegistry()
+        return cls._shared_instance
+
+    def __init__(self,
+                 limit: int = DEFAULT_LIMIT,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 ttl_dns_cache: int = DEFAULT_TTL_DNS_CACHE,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT):
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._keepalive_timeout: float = keepalive_timeout
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._metrics: Dict[str, HostConnectionMetrics] = {}
+
+    @property
+    def metrics(self) -> Dict[str, HostConnectionMetrics]:
+        return self._metrics
+
+    def configure(self,
+                  limit: Optional[int] = None,
+                  limit_per_host: Optional[int] = None,
+                  ttl_dns_cache: Optional[int] = None,
+                  keepalive_timeout: Optional[float] = None):
+        """
+        Changes the pool limits of the sessions created from now on. Sessions already open keep their limits until
+        they are closed.
+        """
+        if limit is not None:
+            self._limit = limit
+        if limit_per_host is not None:
+            self._limit_per_host = limit_per_host
+        if ttl_dns_cache is not None:
+            self._ttl_dns_cache = ttl_dns_cache
+        if keepalive_timeout is not None:
+            self._keepalive_timeout = keepalive_timeout
+
+    def client(self) -> aiohttp.ClientSession:
+        """
+        The shared session of the current event loop. Must be called from a coroutine.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        session: Optional[aiohttp.ClientSession] = self._sessions.get(loop)
+        if session is None or session.closed:
+            for stale_loop in [stale_loop for stale_loop in self._sessions if stale_loop.is_closed()]:
+                del self._sessions[stale_loop]
+            session = self._create_session()
+            self._sessions[loop] = session
+        return session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=self._limit,
+                                         limit_per_host=self._limit_per_host,
+                                         ttl_dns_cache=self._ttl_dns_cache,
+                                         keepalive_timeout=self._keepalive_timeout)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+
+    def _host_metrics(self, host: Optional[str]) -> HostConnectionMetrics:
+        host = host or ""
+        if host not in self._metrics:
+            self._metrics[host] = HostConnectionMetrics()
+        return self._metrics[host]
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        # The trace context is created per request and shared by all the signals of that request.
+        async def on_request_start(session, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams):
+            context.metrics = self._host_metrics(params.url.host)
+            context.metrics.requests += 1
+
+        async def on_connection_create_end(session, context: SimpleNamespace, params):
+            context.metrics.connections_created += 1
+
+        async def on_connection_reuseconn(session, context: SimpleNamespace, params):
+            context.metrics.connections_reused += 1
+
+        async def on_dns_cache_hit(session, context: SimpleNamespace, params: aiohttp.TraceDnsCacheHitParams):
+            self._host_metrics(params.host).dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, context: SimpleNamespace, params: aiohttp.TraceDnsCacheMissParams):
+            self._host_metrics(params.host).dns_cache_misses += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def metrics_df(self) -> pd.DataFrame:
+        data: List[List] = [
+            [host, metrics.requests, metrics.connections_created, metrics.connections_reused,
+             f"{metrics.reuse_ratio:.1%}", metrics.dns_cache_hits, metrics.dns_cache_misses]
+            for host, metrics in sorted(self._metrics.items())
+        ]
+        return pd.DataFrame(data=data, columns=["Host", "Requests", "New connections", "Reused connections",
+                                                "Reuse ratio", "DNS cache hits", "DNS cache misses"])
+
+    def reset_metrics(self):
+        self._metrics.clear()
+
+    async def close(self):
+        """
+        Closes the shared session of the current event loop.
+        """
+        session: Optional[aiohttp.ClientSession] = self._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+def get_shared_client() -> aiohttp.ClientSession:
+    return HttpClientRegistry.shared_instance().client()
+
+
+@asynccontextmanager
+async def shared_client_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Drop in replacement of `async with aiohttp.ClientSession() as client:` that hands out the shared session and leaves
+    it open on exit.
+    """
+    yield get_shared_client()
@@ -0,0 +1,116 @@
+import importlib.abc
+import sys
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler.enter()
+        start: float = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.exit(module.__name__, time.perf_counter() - start)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Times the modules imported while it is started, as python -X importtime does, to find what slows down the startup.
+    It is started by bin/path_util.py, before anything else is imported, when the HUMMINGBOT_PROFILE_IMPORTS environment
+    variable is set, and the startup logs its report.
+    """
+    _shared_instance: Optional["ImportProfiler"] = None
+
+    @classmethod
+    def get_instance(cls) -> "ImportProfiler":
+        if cls._shared_instance is None:
+            cls._shared_instance = ImportProfiler()
+        return cls._shared_instance
+
+    def __init__(self):
+        # Module name -> (self time, cumulative time) in seconds
+        self._times: Dict[str, Tuple[float, float]] = {}
+        # Cumulative time of the modules imported by each module being imported
+        self._children_times: List[float] = []
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+    @property
+    def started(self) -> bool:
+        return self in sys.meta_path
+
+    @property
+    def times(self) -> Dict[str, Tuple[float, float]]:
+        return self._times.copy()
+
+    def start(self):
+        if not self.started:
+            sys.meta_path.insert(0, self)
+            self._started_at = time.perf_counter()
+            self._stopped_at = None
+
+    def stop(self):
+        if self.started:
+            sys.meta_path.remove(self)
+            self._stopped_at = time.perf_counter()
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def enter(self):
+        self._children_times.append(0.0)
+
+    def exit(self, module_name: str, elapsed: float):
+        children_time: float = self._children_times.pop()
+        self._times[module_name] = (elapsed - children_time, elapsed)
+        if self._children_times:
+            self._children_times[-1] += elapsed
+
+    def report(self, limit: int = 20) -> str:
+        """
+        :param limit: The number of modules listed
+        :return: The modules that took the longest to import, with their own time and the time of the modules they
+        imported, and the top level packages that took the longest
+        """
+        end: float = self._stopped_at if self._stopped_at is not None else time.perf_counter()
+        total: float = end - self._started_at if self._started_at is not None else 0.0
+        packages: Dict[str, float] = {}
+        for module_name, (self_time, _) in self._times.items():
+            package: str = module_name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + self_time
+        lines: List[str] = [f"Imported {len(self._times)} modules, "
+                            f"{sum(self_time for self_time, _ in self._times.values()):.3f}s of {total:.3f}s "
+                            f"since the start.",
+                            f"{'self (s)':>10}  {'cumulative (s)':>14}  module"]
+        for module_name, (self_time, cumulative_time) in sorted(self._times.items(), key=lambda item: item[1][1],
+                                                                reverse=True)[:limit]:
+            lines.append(f"{self_time:10.3f}  {cumulative_time:14.3f}  {module_name}")
+        lines.append(f"{'self (s)':>10}  package")
+        for package, self_time in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            lines.append(f"{self_time:10.3f}  {package}")
+        return "\n".join(lines)
@@ -0,0 +1,64 @@
+import json
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Union,
+)
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonDecoder = Callable[[Union[str, bytes]], Any]
+
+# In order of preference, only the installed ones
+JSON_DECODERS: Dict[str, JsonDecoder] = {}
+if orjson is not None:
+    JSON_DECODERS["orjson"] = orjson.loads
+JSON_DECODERS["ujson"] = ujson.loads
+JSON_DECODERS["json"] = json.loads
+
+_decoder_name: str = next(iter(JSON_DECODERS))
+_decoder: JsonDecoder = JSON_DECODERS[_decoder_name]
+
+
+def available_json_decoders() -> List[str]:
+    return list(JSON_DECODERS.keys())
+
+
+def json_decoder_name() -> str:
+    return _decoder_name
+
+
+def get_json_decoder() -> JsonDecoder:
+    """
+    The JSON decoder chosen at startup, the fastest installed one unless the HUMMINGBOT_JSON_DECODER environment
+    variable names another. Parsers looking it up once, instead of calling json_loads, save a function call per message.
+    """
+    return _decoder
+
+
+def set_json_decoder(name: str):
+    """
+    Chooses the JSON decoder of the messages parsed from now on.
+    :param name: One of available_json_decoders()
+    """
+    global _decoder_name, _decoder
+    if name not in JSON_DECODERS:
+        raise ValueError(f"JSON decoder {name} is not available, the available ones are {available_json_decoders()}.")
+    _decoder_name = name
+    _decoder = JSON_DECODERS[name]
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    return _decoder(data)
+
+
+if os.environ.get("HUMMINGBOT_JSON_DECODER"):
+    set_json_decoder(os.environ["HUMMINGBOT_JSON_DECODER"])
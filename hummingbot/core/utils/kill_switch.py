@@ -1,8 +1,12 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import Optional
 from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.profitability_tracker import ProfitabilityTracker
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -27,22 +31,70 @@ class KillSwitch:
         self._update_interval = 10.0
         self._check_profitability_task: Optional[asyncio.Task] = None
         self._profitability: Optional[Decimal] = None
+        self._profitability_tracker: Optional[ProfitabilityTracker] = None
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    def create_profitability_tracker(self) -> ProfitabilityTracker:
+        """
+        Creates the running profitability of the markets, from the trades recorded since the application started
+        (kept in memory by the performance tracker of the markets recorder) and the fills to come.
+        """
+        tracker: ProfitabilityTracker = ProfitabilityTracker(self._hummingbot_application.markets.values())
+        performance_tracker = self._hummingbot_application.get_performance_tracker()
+        if performance_tracker is not None:
+            start_timestamp: int = int(self._hummingbot_application.init_time * 1e3)
+            end_timestamp: int = int(time.time() * 1e3)
+            for market, trading_pair in performance_tracker.markets(start_timestamp):
+                if performance_tracker.has_positions(market, trading_pair):
+                    # The profitability of positions comes from the history report
+                    tracker.mark_has_positions()
+                    continue
+                aggregates = performance_tracker.aggregates(market, trading_pair, start_timestamp, end_timestamp)
+                if aggregates is not None:
+                    tracker.add_aggregates(market, trading_pair, aggregates)
+        return tracker
+
+    def _did_fill_order(self, event_tag: int, market: "ConnectorBase", event: OrderFilledEvent):  # noqa F821
+        if self._profitability_tracker is None:
+            return
+        self._profitability_tracker.add_fill(market.display_name, event)
+        if not self._profitability_tracker.has_positions:
+            self.check_profitability()
+
+    def check_profitability(self) -> bool:
+        """
+        Checks the running profitability against the kill switch rate, and stops the bot if it is reached.
+        :returns: True if the kill switch was triggered
+        """
+        if any(not market.ready for market in self._hummingbot_application.markets.values()):
+            return False
+        self._profitability = self._profitability_tracker.profitability()
+        return self._check_kill_switch_rate()
+
+    def _check_kill_switch_rate(self) -> bool:
+        # Stop the bot if losing too much money, or if gained a certain amount of profit
+        if (self._profitability <= self._kill_switch_rate < Decimal("0.0")) or \
+                (self._profitability >= self._kill_switch_rate > Decimal("0.0")):
+            self.logger().info("Kill switch threshold reached. Stopping the bot...")
+            self._hummingbot_application._notify(f"\n[Kill switch triggered]\n"
+                                                 f"Current profitability "
+                                                 f"is {self._profitability}. Stopping the bot...")
+            self.stop()
+            self._hummingbot_application.stop()
+            return True
+        return False
 
     async def check_profitability_loop(self):
+        # Fills are checked as they come, the loop follows the price moves between them. Derivative positions need
+        # the trades, so they are checked from the history report.
         while True:
             try:
-                if self._kill_switch_enabled:
-                    self._profitability: Decimal = await self._hummingbot_application.calculate_profitability()
-
-                    # Stop the bot if losing too much money, or if gained a certain amount of profit
-                    if (self._profitability <= self._kill_switch_rate < Decimal("0.0")) or \
-                            (self._profitability >= self._kill_switch_rate > Decimal("0.0")):
-                        self.logger().info("Kill switch threshold reached. Stopping the bot...")
-                        self._hummingbot_application._notify(f"\n[Kill switch triggered]\n"
-                                                             f"Current profitability "
-                                                             f"is {self._profitability}. Stopping the bot...")
-                        self._hummingbot_application.stop()
+                if self._profitability_tracker.has_positions:
+                    self._profitability = await self._hummingbot_application.calculate_profitability()
+                    if self._check_kill_switch_rate():
                         break
+                elif self.check_profitability():
+                    break
 
             except asyncio.CancelledError:
                 raise
@@ -56,10 +108,18 @@ class KillSwitch:
 
     async def start_loop(self):
         self.stop()
-        self._check_profitability_task = safe_ensure_future(self.check_profitability_loop())
+        if self._kill_switch_enabled:
+            self._profitability_tracker = self.create_profitability_tracker()
+            for market in self._hummingbot_application.markets.values():
+                market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+            self._check_profitability_task = safe_ensure_future(self.check_profitability_loop())
         self._started = True
 
     def stop(self):
         if self._check_profitability_task and not self._check_profitability_task.done():
             self._check_profitability_task.cancel()
+        if self._profitability_tracker is not None:
+            for market in self._hummingbot_application.markets.values():
+                market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+            self._profitability_tracker = None
         self._started = False
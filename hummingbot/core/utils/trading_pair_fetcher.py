@@ -1,23 +1,43 @@
+import asyncio
 import importlib
+import json
+import time
+from os.path import join
 from typing import (
     Dict,
     Any,
     Optional,
-    Callable,
     Awaitable,
-    List
+    List,
+    Set,
+)
+from hummingbot import (
+    data_path,
+    get_executor,
 )
 from hummingbot.logger import HummingbotLogger
-from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
+from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorSetting, ConnectorType
 import logging
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
 
 
 class TradingPairFetcher:
+    """
+    Fetches the trading pairs of every connector, for the autocompletion and validation of trading pairs.
+
+    The trading pairs are cached on disk for CACHE_TTL seconds, so that they are available as soon as the application
+    starts. Only the connectors missing from the cache are imported at the start, off the event loop, and their trading
+    pairs are fetched concurrently, each within FETCH_TIMEOUT seconds. trading_pairs is filled as they come, ready is set
+    once every connector is done. The cached connectors are imported and refreshed on their first use, see refresh.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CACHE_FILE_NAME = "trading_pairs_cache.json"
+    CACHE_TTL = 24 * 60 * 60
+    FETCH_TIMEOUT = 20.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -33,29 +53,130 @@ class TradingPairFetcher:
     def __init__(self):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        # Connector name -> time its trading pairs were fetched
+        self._fetch_timestamps: Dict[str, float] = {}
+        # Connectors whose trading pairs were fetched since the start, rather than only read from the cache
+        self._fetched: Set[str] = set()
+        # Connectors imported to fetch their trading pairs in this run
+        self._fetching: Set[str] = set()
+        self._load_cache()
         safe_ensure_future(self.fetch_all())
 
+    @classmethod
+    def cache_path(cls) -> str:
+        return join(data_path(), cls.CACHE_FILE_NAME)
+
+    def is_fetched(self, exchange_name: str) -> bool:
+        """
+        Whether the trading pairs of a connector were fetched since the start. Cached trading pairs may miss the
+        markets listed since they were fetched.
+        """
+        return exchange_name in self._fetched
+
+    def refresh(self, exchange_name: str):
+        """
+        Fetches the trading pairs of a connector served from the cache, on its first use (autocompletion, validation of
+        its trading pairs or start), so that its module is only imported then.
+        """
+        conn_setting: Optional[ConnectorSetting] = CONNECTOR_SETTINGS.get(exchange_name)
+        if conn_setting is None or exchange_name in self._fetching:
+            return
+        safe_ensure_future(self._refresh(conn_setting))
+
+    async def _refresh(self, conn_setting: ConnectorSetting):
+        fetch_task: Optional[asyncio.Task] = await self._fetch_connector(conn_setting)
+        if fetch_task is not None:
+            await fetch_task
+            self._save_cache()
+
     async def fetch_all(self):
+        fetch_tasks: List[asyncio.Task] = []
         for conn_setting in CONNECTOR_SETTINGS.values():
-            module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
-                else f"{conn_setting.base_name()}_api_order_book_data_source"
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{conn_setting.base_name()}.{module_name}"
-            class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
-                         "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
-                         else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
-            module = getattr(importlib.import_module(module_path), class_name)
-            args = {}
-            args = conn_setting.add_domain_parameter(args)
-            safe_ensure_future(self.call_fetch_pairs(module.fetch_trading_pairs(**args), conn_setting.name))
-
+            if conn_setting.name in self.trading_pairs:
+                continue
+            fetch_task: Optional[asyncio.Task] = await self._fetch_connector(conn_setting)
+            if fetch_task is not None:
+                fetch_tasks.append(fetch_task)
+        if len(fetch_tasks) > 0:
+            await safe_gather(*fetch_tasks)
+            self._save_cache()
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    async def _fetch_connector(self, conn_setting: ConnectorSetting) -> Optional[asyncio.Task]:
+        # Imports the connector and starts fetching its trading pairs, once per run
+        if conn_setting.name in self._fetching:
+            return None
+        self._fetching.add(conn_setting.name)
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         try:
-            self.trading_pairs[exchange_name] = await fetch_fn
+            # Connector modules import heavy dependencies, they are imported one by one outside the event loop
+            connector_class: Any = await ev_loop.run_in_executor(get_executor(), self._connector_class, conn_setting)
+        except Exception:
+            self.logger().error(f"Connector {conn_setting.name} could not be imported. "
+                                f"Trading pairs autocompletion won't work.", exc_info=True)
+            self.trading_pairs.setdefault(conn_setting.name, [])
+            return None
+        args = {}
+        args = conn_setting.add_domain_parameter(args)
+        return safe_ensure_future(self.call_fetch_pairs(connector_class.fetch_trading_pairs(**args),
+                                                        conn_setting.name))
+
+    async def call_fetch_pairs(self, fetch_fn: Awaitable[List[str]], exchange_name: str):
+        try:
+            self.trading_pairs[exchange_name] = await asyncio.wait_for(fetch_fn, timeout=self.FETCH_TIMEOUT)
+            self._fetch_timestamps[exchange_name] = time.time()
+            self._fetched.add(exchange_name)
+        except asyncio.TimeoutError:
+            self.logger().warning(f"Connector {exchange_name} did not retrieve its trading pairs within "
+                                  f"{self.FETCH_TIMEOUT} seconds. Trading pairs autocompletion won't work.")
+            self.trading_pairs.setdefault(exchange_name, [])
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cached trading pairs or assign empty list, this is st. the bot won't stop
+            # working
+            self.trading_pairs.setdefault(exchange_name, [])
+
+    @staticmethod
+    def _connector_class(conn_setting: ConnectorSetting) -> Any:
+        module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
+            else f"{conn_setting.base_name()}_api_order_book_data_source"
+        module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                      f"{conn_setting.base_name()}.{module_name}"
+        class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
+                     "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
+                     else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
+        return getattr(importlib.import_module(module_path), class_name)
+
+    def _load_cache(self):
+        # Only the trading pairs fetched less than CACHE_TTL seconds ago, of the current connectors, are used
+        try:
+            with open(self.cache_path()) as fd:
+                cache: Dict[str, Any] = json.load(fd)
+        except (OSError, ValueError):
+            return
+        if not isinstance(cache, dict):
+            return
+        now: float = time.time()
+        for exchange_name, entry in cache.items():
+            try:
+                timestamp: float = float(entry["timestamp"])
+                trading_pairs: List[str] = entry["trading_pairs"]
+            except (KeyError, TypeError, ValueError):
+                # Malformed entries are discarded, their connectors are fetched again
+                continue
+            if exchange_name in CONNECTOR_SETTINGS and now - timestamp < self.CACHE_TTL:
+                self.trading_pairs[exchange_name] = trading_pairs
+                self._fetch_timestamps[exchange_name] = timestamp
+
+    def _save_cache(self):
+        # Connectors that failed to retrieve their trading pairs are fetched again at the next start
+        cache: Dict[str, Any] = {exchange_name: {"timestamp": timestamp,
+                                                 "trading_pairs": self.trading_pairs[exchange_name]}
+                                 for exchange_name, timestamp in self._fetch_timestamps.items()
+                                 if len(self.trading_pairs.get(exchange_name, [])) > 0}
+        try:
+            with open(self.cache_path(), "w") as fd:
+                json.dump(cache, fd)
+        except OSError:
+            self.logger().warning("Could not write the trading pairs cache.", exc_info=True)
@@ -5,6 +5,7 @@ from typing import Optional
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import get_shared_client
 from decimal import Decimal
 
 
@@ -38,7 +39,7 @@ class CustomAPIDataFeed(NetworkBase):
 
     def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_shared_client()
         return self._shared_client
 
     async def check_network(self) -> NetworkStatus:
@@ -3,7 +3,10 @@ from abc import ABC, abstractmethod
 import functools
 from sqlalchemy import (
     Column,
+    Index,
+    inspect,
 )
+from sqlalchemy.schema import CreateIndex
 
 
 @functools.total_ordering
@@ -55,3 +58,13 @@ class DatabaseTransformation(ABC):
             logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
         else:
             engine.execute(query_to_execute)
+
+    def add_index(self, engine, index: Index, dry_run=True):
+        existing_indexes = [i["name"] for i in inspect(engine).get_indexes(index.table.name)]
+        if index.name in existing_indexes:
+            return
+        query_to_execute = str(CreateIndex(index).compile(dialect=engine.dialect))
+        if dry_run:
+            logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
+        else:
+            engine.execute(query_to_execute)
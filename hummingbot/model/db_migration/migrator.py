@@ -25,11 +25,12 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        db_handle.get_shared_session().close()
+        db_handle.checkpoint()
+        db_handle.engine.dispose()
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
 
-        db_handle.get_shared_session().close()
-        db_handle.engine.dispose()
         new_db_handle = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, new_db_path, original_db_name, True)
 
         relevant_transformations = [t for t in self.transformations if t.does_apply_to_version(from_version, to_version)]
@@ -50,6 +51,7 @@ class Migrator:
         finally:
             try:
                 new_db_handle.get_shared_session().close()
+                new_db_handle.checkpoint()
                 new_db_handle.engine.dispose()
                 if migration_succesful:
                     move(new_db_path, original_db_path)
@@ -1,7 +1,11 @@
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 from sqlalchemy import (
     Column,
+    JSON,
     Text,
     Integer
 )
@@ -45,3 +49,52 @@ class AddLeverageAndPositionColumns(DatabaseTransformation):
     @property
     def to_version(self):
         return 20210119
+
+
+class AddTradeCursorsColumnToMarketState(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        trade_cursors_column = Column("trade_cursors", JSON, nullable=True)
+        self.add_column(db_handle.engine, "MarketState", trade_cursors_column, dry_run=False)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddTradeCursorsColumnToMarketState"
+
+    @property
+    def to_version(self):
+        return 20210601
+
+
+class AddMarketsRecorderQueryIndexes(DatabaseTransformation):
+    """
+    Indexes for the queries of MarketsRecorder and of the history command, for databases created before the indexes
+    were declared on the models.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        # The MarketState index is unique, only the newest state of each config file and market is kept
+        db_handle.engine.execute(
+            'DELETE FROM "MarketState" WHERE EXISTS (SELECT 1 FROM "MarketState" AS newer '
+            'WHERE newer.config_file_path = "MarketState".config_file_path AND newer.market = "MarketState".market '
+            'AND (newer.timestamp > "MarketState".timestamp '
+            'OR (newer.timestamp = "MarketState".timestamp AND newer.id > "MarketState".id)))')
+        for table, index_name in ((TradeFill.__table__, "tf_timestamp_index"),
+                                  (Order.__table__, "o_config_market_timestamp_index"),
+                                  (MarketState.__table__, "ms_config_market_index")):
+            index = next(i for i in table.indexes if i.name == index_name)
+            self.add_index(db_handle.engine, index, dry_run=False)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddMarketsRecorderQueryIndexes"
+
+    @property
+    def to_version(self):
+        return 20210901
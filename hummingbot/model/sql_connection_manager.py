@@ -5,10 +5,12 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import (
     sessionmaker,
     Session,
@@ -46,7 +48,18 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20210119"
+    LOCAL_DB_VERSION_VALUE = "20210901"
+
+    # Applied to every SQLite connection. In WAL mode readers and the writer don't block each other and a commit only
+    # appends to the log, which with synchronous=NORMAL is synced at checkpoints only. A crash of the process can't
+    # lose a commit, a power loss can lose the last ones but can't corrupt the database.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # in KiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # in milliseconds
+    }
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -87,7 +100,13 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            # Connections are kept open in a pool, since closing the last one checkpoints the write ahead log. A
+            # connection is only used by one thread at a time, but not always by the thread that opened it.
+            engine: Engine = create_engine(f"{dialect}:///{db_path}",
+                                           poolclass=QueuePool,
+                                           connect_args={"check_same_thread": False})
+            event.listen(engine, "connect", cls._apply_sqlite_pragmas)
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -97,6 +116,15 @@ class SQLConnectionManager:
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @classmethod
+    def _apply_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in cls.SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None,
@@ -150,6 +178,12 @@ class SQLConnectionManager:
     def get_shared_session(self) -> Session:
         return self._shared_session
 
+    def new_session(self) -> Session:
+        """
+        Creates a session of its own, for threads other than the main one.
+        """
+        return self._session_cls()
+
     def get_local_db_version(self):
         query: Query = (self._shared_session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -177,5 +211,14 @@ class SQLConnectionManager:
     def commit(self):
         self._shared_session.commit()
 
+    def checkpoint(self):
+        """
+        Moves the content of the SQLite write ahead log into the database file, so that the file can be copied or moved
+        on its own.
+        """
+        if self._engine.dialect.name == "sqlite":
+            with self._engine.connect() as conn:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def begin(self) -> SQLSessionWrapper:
         return SQLSessionWrapper(self._session_cls())
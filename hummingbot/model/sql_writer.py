@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+import logging
+import queue
+import threading
+import time
+from typing import (
+    Callable,
+    List,
+    Optional,
+)
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write adds or updates records in the writer session. It may return a function to run on the writer thread once
+# the write is committed.
+SQLWrite = Callable[[Session], Optional[Callable[[], None]]]
+
+
+class SQLWriterMetrics:
+    """
+    Writes queued to a SQLWriter, and the commits of their batches.
+    """
+
+    def __init__(self):
+        self.writes_queued: int = 0
+        self.writes_committed: int = 0
+        self.writes_failed: int = 0
+        self.batches_committed: int = 0
+        self.last_commit_latency: float = 0.0
+        self.max_commit_latency: float = 0.0
+        self.total_commit_latency: float = 0.0
+
+    @property
+    def average_commit_latency(self) -> float:
+        return self.total_commit_latency / self.batches_committed if self.batches_committed > 0 else 0.0
+
+
+class SQLWriter:
+    """
+    Runs database writes queued from the event loop on a dedicated thread, so that the event loop never waits for a
+    commit. The queued writes are committed together, in one transaction per `batch_interval` seconds or per
+    `max_batch_size` writes, whichever comes first. If a batch fails, its writes are committed one by one and only the
+    failing ones are dropped.
+    stop() and flush() return once every write queued before them is committed.
+    """
+    DEFAULT_BATCH_INTERVAL: float = 0.5
+    DEFAULT_MAX_BATCH_SIZE: int = 500
+
+    _sw_logger: Optional[HummingbotLogger] = None
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sw_logger is None:
+            cls._sw_logger = logging.getLogger(__name__)
+        return cls._sw_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 batch_interval: float = DEFAULT_BATCH_INTERVAL,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        self._sql: SQLConnectionManager = sql
+        self._batch_interval: float = batch_interval
+        self._max_batch_size: int = max_batch_size
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics: SQLWriterMetrics = SQLWriterMetrics()
+
+    @property
+    def metrics(self) -> SQLWriterMetrics:
+        return self._metrics
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.started:
+            self._thread = threading.Thread(target=self._run, name="SQLWriter", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        if self.started:
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+        self._thread = None
+        # Writes queued after the writer thread has exited
+        self._write_queued()
+
+    def put(self, write: SQLWrite):
+        self._metrics.writes_queued += 1
+        self._queue.put(write)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the writes queued so far are committed. Without a writer thread, they are committed on the calling
+        thread. Returns False if the timeout expired first.
+        """
+        if not self.started:
+            self._write_queued()
+            return True
+        flushed: threading.Event = threading.Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def _run(self):
+        stopping: bool = False
+        while not stopping:
+            batch: List[SQLWrite] = []
+            flushed: List[threading.Event] = []
+            item = self._queue.get()
+            deadline: float = time.monotonic() + self._batch_interval
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    flushed.append(item)
+                    break
+                batch.append(item)
+                remaining: float = deadline - time.monotonic()
+                if len(batch) >= self._max_batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if len(batch) > 0:
+                self._commit(batch)
+            for event in flushed:
+                event.set()
+
+    def _write_queued(self):
+        batch: List[SQLWrite] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not self._STOP:
+                batch.append(item)
+        if len(batch) > 0:
+            self._commit(batch)
+
+    def _commit(self, batch: List[SQLWrite]):
+        start: float = time.perf_counter()
+        session: Session = self._sql.new_session()
+        try:
+            try:
+                after_commit = [write(session) for write in batch]
+                session.commit()
+                self._metrics.writes_committed += len(batch)
+            except Exception:
+                session.rollback()
+                self.logger().warning(f"Failed to commit a batch of {len(batch)} database writes. "
+                                      f"Committing them one by one.", exc_info=True)
+                after_commit = [self._commit_one(session, write) for write in batch]
+            latency: float = time.perf_counter() - start
+            self._metrics.batches_committed += 1
+            self._metrics.last_commit_latency = latency
+            self._metrics.max_commit_latency = max(self._metrics.max_commit_latency, latency)
+            self._metrics.total_commit_latency += latency
+
+            # Records are only readable while the session is open
+            for callback in after_commit:
+                if callback is not None:
+                    try:
+                        callback()
+                    except Exception:
+                        self.logger().error("Unexpected error running a database write callback.", exc_info=True)
+        finally:
+            session.close()
+
+    def _commit_one(self, session: Session, write: SQLWrite) -> Optional[Callable[[], None]]:
+        try:
+            callback = write(session)
+            session.commit()
+            self._metrics.writes_committed += 1
+            return callback
+        except Exception:
+            session.rollback()
+            self._metrics.writes_failed += 1
+            self.logger().error("Failed to commit a database write.", exc_info=True)
+            return None
@@ -30,6 +30,8 @@ class TradeFill(HummingbotBase):
     __tablename__ = "TradeFill"
     __table_args__ = (Index("tf_config_timestamp_index",
                             "config_file_path", "timestamp"),
+                      Index("tf_timestamp_index",
+                            "timestamp"),
                       Index("tf_market_trading_pair_timestamp_index",
                             "market", "symbol", "timestamp"),
                       Index("tf_market_base_asset_timestamp_index",
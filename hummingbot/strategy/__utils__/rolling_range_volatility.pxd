@@ -0,0 +1,22 @@
+from libc.stdint cimport int64_t
+cimport numpy as np
+
+cdef class RollingRangeVolatility:
+    cdef:
+        int64_t _markets
+        int64_t _interval
+        int64_t _periods
+        int64_t _samples
+        int64_t[:, :] _max_indexes
+        double[:, :] _max_values
+        int64_t[:] _max_heads
+        int64_t[:] _max_sizes
+        int64_t[:, :] _min_indexes
+        double[:, :] _min_values
+        int64_t[:] _min_heads
+        int64_t[:] _min_sizes
+        object _ranges
+        double[:, :] _ranges_view
+
+    cdef c_add_samples(self, const double[:] prices)
+    cdef np.ndarray c_volatility(self)
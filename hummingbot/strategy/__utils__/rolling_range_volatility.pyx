@@ -0,0 +1,127 @@
+import warnings
+
+import numpy as np
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+cimport numpy as np
+
+NaN = float("nan")
+
+
+cdef class RollingRangeVolatility:
+    """
+    Rolling price range volatility of several markets sampled together: the average, over the last `periods`
+    intervals of `interval` samples, of (max - min) / min of each market's prices in the interval.
+
+    The max and min of the latest interval of each market are kept in monotonic deques (fixed size ring buffers of
+    sample indexes and values), so adding a sample is O(1) amortized per market. The range of the interval ending at
+    each sample goes into a ring buffer of `interval * periods` samples per market, which volatility() reads for all
+    markets at once.
+    """
+    def __init__(self, markets: int, interval: int, periods: int):
+        """
+        :param markets: The number of markets, each sample has one price per market
+        :param interval: The number of samples in an interval
+        :param periods: The number of intervals averaged
+        """
+        if markets < 0 or interval < 1 or periods < 1:
+            raise ValueError("At least one sample per interval and one interval are required.")
+        self._markets = markets
+        self._interval = interval
+        self._periods = periods
+        self._samples = 0
+        self._max_indexes = np.zeros((markets, interval), dtype=np.int64)
+        self._max_values = np.zeros((markets, interval), dtype=np.float64)
+        self._max_heads = np.zeros(markets, dtype=np.int64)
+        self._max_sizes = np.zeros(markets, dtype=np.int64)
+        self._min_indexes = np.zeros((markets, interval), dtype=np.int64)
+        self._min_values = np.zeros((markets, interval), dtype=np.float64)
+        self._min_heads = np.zeros(markets, dtype=np.int64)
+        self._min_sizes = np.zeros(markets, dtype=np.int64)
+        self._ranges = np.full((markets, interval * periods), NaN, dtype=np.float64)
+        self._ranges_view = self._ranges
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    def add_samples(self, prices):
+        """
+        Adds a sample of the prices of all the markets, NaN where a market has no price.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.shape != (self._markets,):
+            raise ValueError(f"Expected {self._markets} prices, got {prices.shape}.")
+        self.c_add_samples(prices)
+
+    def volatility(self) -> np.ndarray:
+        """
+        Returns the volatility of each market, NaN where it can't be computed yet.
+        """
+        return self.c_volatility()
+
+    cdef c_add_samples(self, const double[:] prices):
+        cdef:
+            int64_t market
+            int64_t index = self._samples
+            int64_t interval = self._interval
+            int64_t head
+            int64_t size
+            int64_t position
+            double price
+            double max_price
+            double min_price
+
+        for market in range(self._markets):
+            price = prices[market]
+
+            # Max deque: decreasing values, the max of the interval at the head
+            head = self._max_heads[market]
+            size = self._max_sizes[market]
+            while size > 0 and self._max_indexes[market, head] <= index - interval:
+                head = (head + 1) % interval
+                size -= 1
+            if not isnan(price):
+                while size > 0 and self._max_values[market, (head + size - 1) % interval] <= price:
+                    size -= 1
+                position = (head + size) % interval
+                self._max_indexes[market, position] = index
+                self._max_values[market, position] = price
+                size += 1
+            self._max_heads[market] = head
+            self._max_sizes[market] = size
+            max_price = self._max_values[market, head] if size > 0 else NaN
+
+            # Min deque: increasing values, the min of the interval at the head
+            head = self._min_heads[market]
+            size = self._min_sizes[market]
+            while size > 0 and self._min_indexes[market, head] <= index - interval:
+                head = (head + 1) % interval
+                size -= 1
+            if not isnan(price):
+                while size > 0 and self._min_values[market, (head + size - 1) % interval] >= price:
+                    size -= 1
+                position = (head + size) % interval
+                self._min_indexes[market, position] = index
+                self._min_values[market, position] = price
+                size += 1
+            self._min_heads[market] = head
+            self._min_sizes[market] = size
+            min_price = self._min_values[market, head] if size > 0 else NaN
+
+            self._ranges_view[market, index % (interval * self._periods)] = (
+                (max_price - min_price) / min_price if min_price > 0 else NaN
+            )
+        self._samples += 1
+
+    cdef np.ndarray c_volatility(self):
+        periods = np.arange(self._periods)
+        indexes = self._samples - 1 - periods * self._interval
+        # Intervals are complete, except the latest one before the first interval is
+        indexes = indexes[((indexes >= self._interval - 1) | (periods == 0)) & (indexes >= 1)]
+        if len(indexes) == 0:
+            return np.full(self._markets, NaN)
+        with warnings.catch_warnings():
+            # All NaN markets
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return np.nanmean(self._ranges[:, indexes % (self._interval * self._periods)], axis=1)
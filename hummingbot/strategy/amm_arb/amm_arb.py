@@ -1,8 +1,10 @@
 from decimal import Decimal
 import logging
 import asyncio
+import time
+from collections import deque
 import pandas as pd
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Deque, Tuple, Optional, Any
 from hummingbot.client.settings import ETH_WALLET_CONNECTORS
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_base import ConnectorBase
@@ -13,7 +15,7 @@ from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.fixed_rate_source import FixedRateSource
 from hummingbot.logger import HummingbotLogger
-from hummingbot.strategy.amm_arb.utils import create_arb_proposals, ArbProposal
+from hummingbot.strategy.amm_arb.utils import create_arb_proposals, ArbProposal, QuoteCache
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
@@ -88,6 +90,9 @@ class AmmArbStrategy(StrategyPyBase):
         self._market_2_quote_eth_rate = None
 
         self._rate_source = rate_source
+        self._quote_cache = QuoteCache()
+        # Durations (in seconds) of the last arbitrage cycles, from fetching the quotes to building the proposals
+        self._cycle_latencies: Deque[float] = deque(maxlen=20)
 
     @property
     def min_profitability(self) -> Decimal:
@@ -127,7 +132,10 @@ class AmmArbStrategy(StrategyPyBase):
         min profitability required, applies the slippage buffer, applies budget constraint, then finally execute the
         arbitrage.
         """
-        self._arb_proposals = await create_arb_proposals(self._market_info_1, self._market_info_2, self._order_amount)
+        start_time = time.perf_counter()
+        self._arb_proposals = await create_arb_proposals(self._market_info_1, self._market_info_2, self._order_amount,
+                                                         self._quote_cache)
+        self._cycle_latencies.append(time.perf_counter() - start_time)
         arb_proposals = [
             t.copy() for t in self._arb_proposals
             if t.profit_pct(
@@ -264,10 +272,12 @@ class AmmArbStrategy(StrategyPyBase):
         # active_orders = self.market_info_to_active_orders.get(self._market_info, [])
         columns = ["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"]
         data = []
-        for market_info in [self._market_info_1, self._market_info_2]:
+        quote_prices = await asyncio.gather(*[self._quote_cache.get_quote_price(market_info, is_buy, self._order_amount)
+                                              for market_info in [self._market_info_1, self._market_info_2]
+                                              for is_buy in (True, False)])
+        for index, market_info in enumerate([self._market_info_1, self._market_info_2]):
             market, trading_pair, base_asset, quote_asset = market_info
-            buy_price = await market.get_quote_price(trading_pair, True, self._order_amount)
-            sell_price = await market.get_quote_price(trading_pair, False, self._order_amount)
+            buy_price, sell_price = quote_prices[index * 2:(index + 1) * 2]
 
             # check for unavailable price data
             buy_price = PerformanceMetrics.smart_round(Decimal(str(buy_price)), 8) if buy_price is not None else '-'
@@ -291,6 +301,12 @@ class AmmArbStrategy(StrategyPyBase):
 
         lines.extend(["", "  Profitability:"] + self.short_proposal_msg(self._arb_proposals))
 
+        if len(self._cycle_latencies) > 0:
+            lines.extend(["", "  Arbitrage cycle latency:",
+                          f"    last: {self._cycle_latencies[-1] * 1e3:.0f} ms, "
+                          f"average of last {len(self._cycle_latencies)}: "
+                          f"{sum(self._cycle_latencies) / len(self._cycle_latencies) * 1e3:.0f} ms"])
+
         quotes_rates_df = self.quotes_rate_df()
         lines.extend(["", f"  Quotes Rates ({str(self._rate_source)})"] +
                      ["    " + line for line in str(quotes_rates_df).split("\n")])
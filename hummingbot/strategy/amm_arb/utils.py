@@ -1,29 +1,112 @@
+import asyncio
+import time
 from decimal import Decimal
-from typing import List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import ArbProposal, ArbProposalSide
 
 s_decimal_nan = Decimal("NaN")
 
 
+class QuoteCache:
+    """
+    Keeps the quote and order prices of the connectors for a short time, keyed on (connector, trading pair, side,
+    amount), so that the requests for a price already being fetched or just fetched share one call. For connectors
+    whose order price is their quote price (see ConnectorBase.order_price_is_quote_price), the order price is
+    answered with the quote price.
+    """
+    def __init__(self, ttl: float = 0.5):
+        """
+        :param ttl: How long (in seconds) a fetched price is reused for
+        """
+        self._ttl = ttl
+        # (connector, trading_pair, is_buy, amount, is_order_price) -> (fetch time, fetch task)
+        self._entries: Dict[Tuple[Any, str, bool, Decimal, bool], Tuple[float, asyncio.Future]] = {}
+
+    async def get_quote_price(self, market_info: MarketTradingPairTuple, is_buy: bool,
+                              amount: Decimal) -> Optional[Decimal]:
+        return await self._get_price(market_info, is_buy, amount, False)
+
+    async def get_order_price(self, market_info: MarketTradingPairTuple, is_buy: bool,
+                              amount: Decimal) -> Optional[Decimal]:
+        return await self._get_price(market_info, is_buy, amount, not market_info.market.order_price_is_quote_price)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def _get_price(self, market_info: MarketTradingPairTuple, is_buy: bool, amount: Decimal,
+                         is_order_price: bool) -> Optional[Decimal]:
+        key = (market_info.market, market_info.trading_pair, is_buy, amount, is_order_price)
+        now = time.perf_counter()
+        entry = self._entries.get(key)
+        if entry is None or (entry[1].done() and now - entry[0] > self._ttl):
+            self._remove_expired(now)
+            fetch: Callable[[str, bool, Decimal], Awaitable[Decimal]] = market_info.market.get_quote_price
+            if is_order_price:
+                fetch = market_info.market.get_order_price
+            entry = (now, safe_ensure_future(fetch(market_info.trading_pair, is_buy, amount)))
+            self._entries[key] = entry
+        try:
+            # A caller cancelled while waiting doesn't cancel the fetch shared with the other callers
+            return await asyncio.shield(entry[1])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Failed fetches aren't reused
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            raise
+
+    def _remove_expired(self, now: float):
+        expired = [key for key, (fetch_time, task) in self._entries.items()
+                   if task.done() and now - fetch_time > self._ttl]
+        for key in expired:
+            del self._entries[key]
+
+
 async def create_arb_proposals(market_info_1: MarketTradingPairTuple,
                                market_info_2: MarketTradingPairTuple,
-                               order_amount: Decimal) -> List[ArbProposal]:
+                               order_amount: Decimal,
+                               quote_cache: Optional[QuoteCache] = None) -> List[ArbProposal]:
     """
-    Creates base arbitrage proposals for given markets without any filtering.
+    Creates base arbitrage proposals for given markets without any filtering. The quote and order prices of both
+    directions are fetched concurrently.
     :param market_info_1: The first market
     :param market_info_2: The second market
     :param order_amount: The required order amount.
+    :param quote_cache: The cache to fetch the prices through, if any
     :return A list of 2 proposal - (market_1 buy, market_2 sell) and (market_1 sell, market_2 buy)
     """
     order_amount = Decimal(str(order_amount))
+
+    def quote_price(market_info: MarketTradingPairTuple, is_buy: bool) -> Awaitable[Decimal]:
+        if quote_cache is not None:
+            return quote_cache.get_quote_price(market_info, is_buy, order_amount)
+        return market_info.market.get_quote_price(market_info.trading_pair, is_buy, order_amount)
+
+    def order_price(market_info: MarketTradingPairTuple, is_buy: bool) -> Awaitable[Decimal]:
+        if quote_cache is not None:
+            return quote_cache.get_order_price(market_info, is_buy, order_amount)
+        return market_info.market.get_order_price(market_info.trading_pair, is_buy, order_amount)
+
+    price_requests = []
+    for is_buy in (True, False):
+        price_requests.extend([quote_price(market_info_1, is_buy), order_price(market_info_1, is_buy),
+                               quote_price(market_info_2, not is_buy), order_price(market_info_2, not is_buy)])
+    prices = await asyncio.gather(*price_requests)
     results = []
     for index in range(0, 2):
         is_buy = not bool(index)  # bool(0) is False, so start with buy first
-        m_1_q_price = await market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_1_o_price = await market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_2_q_price = await market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount)
-        m_2_o_price = await market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount)
+        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = prices[index * 4:(index + 1) * 4]
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
         first_side = ArbProposalSide(
@@ -1,3 +1,4 @@
+import math
 from abc import ABC, abstractmethod
 from datetime import datetime
 
@@ -14,6 +15,15 @@ class ConditionalExecutionState(ABC):
     def process_tick(self, strategy: StrategyBase):
         pass
 
+    @abstractmethod
+    def next_wake_up_time(self, timestamp: float, strategy: StrategyBase) -> float:
+        """
+        The strategy's next wake up time for fast forward back tests (see TimeIterator.next_wake_up_time()), from the
+        earliest time after `timestamp` at which the strategy's process_tick() can do anything, which the strategy
+        reports in next_process_tick_time().
+        """
+        pass
+
 
 class RunAlwaysExecutionState(ConditionalExecutionState):
     """
@@ -26,6 +36,9 @@ class RunAlwaysExecutionState(ConditionalExecutionState):
     def process_tick(self, timestamp: float, strategy: StrategyBase):
         strategy.process_tick(timestamp)
 
+    def next_wake_up_time(self, timestamp: float, strategy: StrategyBase) -> float:
+        return strategy.next_process_tick_time(timestamp)
+
 
 class RunInTimeSpanExecutionState(ConditionalExecutionState):
     """
@@ -51,3 +64,14 @@ class RunInTimeSpanExecutionState(ConditionalExecutionState):
             strategy.logger().debug("Time span execution: tick will not be processed "
                                     f"(executing between {self._start_timestamp.isoformat(sep=' ')} "
                                     f"and {self._end_timestamp.isoformat(sep=' ')})")
+
+    def next_wake_up_time(self, timestamp: float, strategy: StrategyBase) -> float:
+        start_timestamp = self._start_timestamp.timestamp()
+        end_timestamp = self._end_timestamp.timestamp()
+        if timestamp >= end_timestamp:
+            return math.inf
+        wake_up_time = strategy.next_process_tick_time(timestamp)
+        if timestamp < start_timestamp and not (wake_up_time > start_timestamp):
+            # Ticks before the time span are not processed
+            wake_up_time = start_timestamp
+        return math.inf if wake_up_time >= end_timestamp else wake_up_time
@@ -341,6 +341,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     # Markets are ready, ok to proceed.
                     if self.OPTION_LOG_STATUS_REPORT:
                         self.logger().info(f"Markets are ready. Trading started.")
+                    # The taker order books are queried at several sizes on every tick
+                    for market_pair in self._market_pairs.values():
+                        market_pair.taker.order_book.depth_index_enabled = True
 
             if should_report_warnings:
                 # Check if all markets are still connected or not. If not, log a warning.
@@ -55,9 +55,10 @@ class GetOrderBookStrategy(StrategyPyBase):
 
         order_book = self._exchange.order_books[self._trading_pair]
 
-        best_bid = order_book.snapshot[0][['price']].head(1)
+        best_bid, best_ask = order_book.snapshot_frames(1)
+        best_bid = best_bid[['price']]
         best_bid.rename(columns={'price': 'best_bid_price'}, inplace=True)
-        best_ask = order_book.snapshot[1][['price']].head(1)
+        best_ask = best_ask[['price']]
         best_ask.rename(columns={'price': 'best_ask_price'}, inplace=True)
         joined_df = pd.concat([best_bid, best_ask], axis=1)
 
@@ -69,9 +70,10 @@ class GetOrderBookStrategy(StrategyPyBase):
     def get_order_book(self):
         order_book = self._exchange.order_books[self._trading_pair]
 
-        bids = order_book.snapshot[0][['price', 'amount']].head(self._lines)
+        bids, asks = order_book.snapshot_frames(self._lines)
+        bids = bids[['price', 'amount']]
         bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-        asks = order_book.snapshot[1][['price', 'amount']].head(self._lines)
+        asks = asks[['price', 'amount']]
         asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
         joined_df = pd.concat([bids, asks], axis=1)
         text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
@@ -123,6 +123,14 @@ cdef class OrderTracker(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
 
+    def next_wake_up_time(self, timestamp: float) -> float:
+        """
+        Shadow records are cleaned up on the first tick after their keep alive duration, nothing else happens on tick.
+        """
+        if len(self._shadow_gc_requests) > 0:
+            return self._shadow_gc_requests[0][0]
+        return float("inf")
+
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
 
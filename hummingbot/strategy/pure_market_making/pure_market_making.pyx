@@ -153,7 +153,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
-        return all([market.ready for market in self._sb_markets])
+        # Only the order book of the strategy's trading pair is needed, not all the order books of the market
+        return self._market_info.market.is_trading_pair_ready(self._market_info.trading_pair)
 
     @property
     def market_info(self) -> MarketTradingPairTuple:
@@ -646,7 +647,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             cdef object proposal
         try:
             if not self._all_markets_ready:
-                self._all_markets_ready = all([market.ready for market in self._sb_markets])
+                self._all_markets_ready = self.all_markets_ready()
                 if self._asset_price_delegate is not None and self._all_markets_ready:
                     self._all_markets_ready = self._asset_price_delegate.ready
                 if not self._all_markets_ready:
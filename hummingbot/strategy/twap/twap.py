@@ -1,6 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 import logging
+import math
 import statistics
 from typing import (
     List,
@@ -311,6 +312,39 @@ class TwapTradeStrategy(StrategyPyBase):
         finally:
             self._last_timestamp = timestamp
 
+    def next_wake_up_time(self, timestamp: float) -> float:
+        """
+        For fast forward back tests, the next order placement or cancellation, or the order tracker's next clean up.
+        """
+        wake_up_times = [self.order_tracker.next_wake_up_time(timestamp),
+                         self._execution_state.next_wake_up_time(timestamp, self)]
+        if any(math.isnan(wake_up_time) for wake_up_time in wake_up_times):
+            return math.nan
+        return min(wake_up_times)
+
+    def next_process_tick_time(self, timestamp: float) -> float:
+        """
+        The earliest time after timestamp at which process_tick() can place or cancel orders, NaN until the markets are
+        ready since their readiness is checked on every tick.
+        """
+        if not self._all_markets_ready:
+            return math.nan
+
+        wake_up_times = [math.inf]
+        if self._quantity_remaining > 0:
+            # process_market() places orders once the current timestamp is past these
+            wake_up_times.append(self._previous_timestamp if self._first_order
+                                 else self._previous_timestamp + self._order_delay_time)
+        in_flight_cancels = self.in_flight_cancels
+        for _, limit_order in self.order_tracker.tracked_limit_orders:
+            order_id = limit_order.client_order_id
+            cancel_time = self._time_to_cancel[order_id]
+            if order_id in in_flight_cancels:
+                # The order is cancelled again if the in flight cancel expires
+                cancel_time = max(cancel_time, in_flight_cancels[order_id] + self.order_tracker.CANCEL_EXPIRY_DURATION)
+            wake_up_times.append(cancel_time)
+        return min(wake_up_times)
+
     def process_tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -22,6 +22,7 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
     convert_order_to_tuple,
     fix_signature
 )
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 with open(os.path.join(os.path.dirname(__file__), "zero_ex_exchange_abi_v3.json")) as exchange_abi_json:
     exchange_abi: List[any] = ujson.load(exchange_abi_json)
@@ -420,7 +421,7 @@ class ZeroExCoordinator:
         return result
 
     async def _post_request(self, url, data, timeout=10):
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.request('POST',
                                       url=url,
                                       timeout=timeout,
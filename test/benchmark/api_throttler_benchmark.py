@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency a throttler adds to each request under a steady request rate, comparing AsyncThrottler with the
+polling throttlers built on APIRequestContextBase (FixedRateThrottler).
+
+    python -m test.benchmark.api_throttler_benchmark --rate 1000 --duration 5
+
+Two scenarios run for each throttler: a rate limit above the offered rate, where any latency is pure overhead, and a
+rate limit below it, where requests queue and the latency shows how promptly the throttler releases them.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.api_throttler_base import APIThrottlerBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.fixed_rate_api_throttler import FixedRateThrottler
+
+
+async def run_load(throttler: APIThrottlerBase, rate: float, duration: float) -> List[float]:
+    loop = asyncio.get_event_loop()
+    latencies: List[float] = []
+    tasks: List[asyncio.Task] = []
+
+    async def request(issued: float):
+        async with throttler.execute_task():
+            latencies.append(time.perf_counter() - issued)
+
+    def issue():
+        tasks.append(loop.create_task(request(time.perf_counter())))
+
+    start: float = loop.time() + 0.1
+    count: int = int(rate * duration)
+    for i in range(count):
+        loop.call_at(start + i / rate, issue)
+    await asyncio.sleep(duration + 0.2)
+    while len(tasks) < count:
+        await asyncio.sleep(0.1)
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def report(name: str, latencies: List[float], cpu: float):
+    latencies = sorted(latencies)
+    p99: float = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"  {name:<20} mean {statistics.mean(latencies) * 1e3:8.3f}ms  "
+          f"p50 {statistics.median(latencies) * 1e3:8.3f}ms  p99 {p99 * 1e3:8.3f}ms  "
+          f"cpu {cpu:.2f}s for {len(latencies)} requests")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=1000, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per run")
+    args = parser.parse_args()
+
+    scenarios = [("limit above rate", int(args.rate * 2)), ("limit below rate", int(args.rate * 0.8))]
+    for scenario, limit in scenarios:
+        print(f"{args.rate:.0f} req/s, {scenario} ({limit} req/s):")
+        for name, throttler_class in [("AsyncThrottler", AsyncThrottler), ("FixedRateThrottler", FixedRateThrottler)]:
+            throttler = throttler_class([RateLimit(limit=limit, time_interval=1.0)])
+            cpu_start: float = time.process_time()
+            latencies: List[float] = await run_load(throttler, args.rate, args.duration)
+            report(name, latencies, time.process_time() - cpu_start)
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
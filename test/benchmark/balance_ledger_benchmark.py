@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""
+Compares the cost of an available balance query on a connector without real time balance updates, after 100k fills,
+between the full recomputation ConnectorBase used to do (in flight orders scanned twice, every fill of the event log
+filtered) and the BalanceLedger.
+
+    python -m test.benchmark.balance_ledger_benchmark --fills 100000 --orders 20
+"""
+
+import argparse
+import copy
+import random
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+FEE_PCT = Decimal("0.001")
+TRADING_PAIR = "ETH-USDT"
+QUERIES = 1000
+
+
+class BenchmarkOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return False
+
+    @property
+    def is_cancelled(self) -> bool:
+        return False
+
+    @property
+    def is_failure(self) -> bool:
+        return False
+
+
+def in_flight_asset_balances(in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
+    asset_balances = {}
+    for order in [o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)]:
+        if order.trade_type is TradeType.BUY:
+            outstanding_value = (order.amount * order.price - order.executed_amount_quote) * (Decimal(1) + FEE_PCT)
+            asset_balances[order.quote_asset] = asset_balances.get(order.quote_asset, s_decimal_0) + outstanding_value
+        else:
+            outstanding_value = order.amount - order.executed_amount_base
+            asset_balances[order.base_asset] = asset_balances.get(order.base_asset, s_decimal_0) + outstanding_value
+    return asset_balances
+
+
+def order_filled_balances(event_logs: List[any], starting_timestamp: float = 0) -> Dict[str, Decimal]:
+    order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
+    order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+    balances = {}
+    for event in order_filled_events:
+        base, quote = event.trading_pair.split("-")
+        sign = Decimal(1) if event.trade_type is TradeType.BUY else Decimal(-1)
+        balances[base] = balances.get(base, s_decimal_0) + sign * event.amount
+        balances[quote] = balances.get(quote, s_decimal_0) - sign * event.price * event.amount
+    return balances
+
+
+def recomputed_available_balance(event_logger: EventLogger,
+                                 orders: Dict[str, InFlightOrderBase],
+                                 snapshot: Dict[str, InFlightOrderBase],
+                                 snapshot_timestamp: float,
+                                 currency: str,
+                                 available_balance: Decimal) -> Decimal:
+    snapshot_bal = in_flight_asset_balances(snapshot).get(currency, s_decimal_0)
+    in_flight_bal = in_flight_asset_balances(orders).get(currency, s_decimal_0)
+    orders_filled_bal = order_filled_balances(event_logger.event_log, snapshot_timestamp).get(currency, s_decimal_0)
+    return available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
+
+
+def ledger_available_balance(ledger: BalanceLedger,
+                             orders: Dict[str, InFlightOrderBase],
+                             snapshot: Dict[str, InFlightOrderBase],
+                             snapshot_timestamp: float,
+                             currency: str,
+                             available_balance: Decimal) -> Decimal:
+    return (available_balance + ledger.snapshot_balance(snapshot, currency) - ledger.in_flight_balance(orders, currency)
+            + ledger.filled_balance(currency, snapshot_timestamp))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fills", type=int, default=100000)
+    parser.add_argument("--orders", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    orders: Dict[str, InFlightOrderBase] = {
+        str(i): BenchmarkOrder(str(i), None, TRADING_PAIR, OrderType.LIMIT, rng.choice([TradeType.BUY, TradeType.SELL]),
+                               Decimal(rng.randint(2000, 3000)), Decimal(rng.randint(1, 100)) / 10, "open")
+        for i in range(args.orders)
+    }
+    event_logger = EventLogger()
+    ledger = BalanceLedger(in_flight_asset_balances)
+    for i in range(args.fills):
+        fill = OrderFilledEvent(i + 1.0, str(i), TRADING_PAIR, rng.choice([TradeType.BUY, TradeType.SELL]),
+                                OrderType.LIMIT, Decimal(rng.randint(2000, 3000)), Decimal(rng.randint(1, 100)) / 100,
+                                TradeFee(0))
+        event_logger(fill)
+        ledger(fill)
+    snapshot: Dict[str, InFlightOrderBase] = {k: copy.copy(v) for k, v in orders.items()}
+    # The last balance snapshot was taken a few fills ago
+    snapshot_timestamp: float = args.fills - 10.0
+    available_balance = Decimal(100000)
+    # The first query after a snapshot moves the ledger window over the fills since the previous snapshot, which the
+    # connector does once per balance update.
+    ledger.filled_balance("ETH", snapshot_timestamp)
+
+    print(f"Fills: {args.fills}, in flight orders: {args.orders}")
+    for currency in ("ETH", "USDT"):
+        start: float = time.perf_counter()
+        for _ in range(10):
+            expected = recomputed_available_balance(event_logger, orders, snapshot, snapshot_timestamp, currency,
+                                                    available_balance)
+        recomputed_time: float = (time.perf_counter() - start) / 10
+
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            actual = ledger_available_balance(ledger, orders, snapshot, snapshot_timestamp, currency,
+                                              available_balance)
+        ledger_time: float = (time.perf_counter() - start) / QUERIES
+
+        print(f"{currency:<5} recomputed {recomputed_time * 1e3:9.3f}ms  ledger {ledger_time * 1e6:7.3f}us  "
+              f"speedup {recomputed_time / ledger_time:9.0f}x  equal: {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
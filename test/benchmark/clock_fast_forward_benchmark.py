@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+"""
+Compares the wall clock time of a stepwise back test and a fast forward back test over a week of trades, and checks
+that both make the same decisions at the same timestamps.
+
+A recording of trades can be replayed, one `timestamp,price,amount` line per trade (timestamps in seconds, sorted):
+
+    python -m test.benchmark.clock_fast_forward_benchmark --recording binance_trades_BTCUSDT.csv
+
+Without a recording, a week of trades arriving in bursts, with quiet periods in between, is generated.
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import (
+    List,
+    Tuple,
+)
+
+import pandas as pd
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+Trade = Tuple[float, float, float]
+START_TIMESTAMP: float = pd.Timestamp("2021-01-04", tz="UTC").timestamp()
+WEEK: float = 7 * 24 * 60 * 60
+
+
+class TradeReplayFeed(PyTimeIterator):
+    def __init__(self, trades: List[Trade]):
+        super().__init__()
+        self._trades: List[Trade] = trades
+        self._next_trade: int = 0
+        self.last_price: float = math.nan
+
+    def tick(self, timestamp: float):
+        while self._next_trade < len(self._trades) and self._trades[self._next_trade][0] <= timestamp:
+            self.last_price = self._trades[self._next_trade][1]
+            self._next_trade += 1
+
+    def next_wake_up_time(self, timestamp: float) -> float:
+        if self._next_trade < len(self._trades):
+            return self._trades[self._next_trade][0]
+        return math.inf
+
+
+class QuoteRefreshStrategy(PyTimeIterator):
+    """
+    Re-quotes around the last trade price when it moves more than `price_threshold`, or every `refresh_interval`.
+    """
+
+    def __init__(self, feed: TradeReplayFeed, refresh_interval: float = 60.0, price_threshold: float = 0.001):
+        super().__init__()
+        self._feed: TradeReplayFeed = feed
+        self._refresh_interval: float = refresh_interval
+        self._price_threshold: float = price_threshold
+        self._quote_price: float = math.nan
+        self._next_refresh: float = -math.inf
+        self.quotes: List[Tuple[float, float]] = []
+
+    def tick(self, timestamp: float):
+        price: float = self._feed.last_price
+        if math.isnan(price):
+            return
+        if timestamp >= self._next_refresh or abs(price / self._quote_price - 1) > self._price_threshold:
+            self._quote_price = price
+            self._next_refresh = timestamp + self._refresh_interval
+            self.quotes.append((timestamp, price))
+
+    def next_wake_up_time(self, timestamp: float) -> float:
+        if math.isnan(self._feed.last_price):
+            return math.inf
+        return self._next_refresh
+
+
+def generate_trades(seed: int = 42) -> List[Trade]:
+    rng = random.Random(seed)
+    trades: List[Trade] = []
+    timestamp: float = START_TIMESTAMP
+    price: float = 30000.0
+    while timestamp < START_TIMESTAMP + WEEK:
+        # A burst of trades a few seconds apart, then a quiet period of up to half an hour
+        for _ in range(rng.randint(1, 50)):
+            timestamp += rng.expovariate(1 / 3)
+            price *= math.exp(rng.gauss(0, 0.0005))
+            trades.append((timestamp, price, rng.uniform(0.001, 1)))
+        timestamp += rng.uniform(60, 1800)
+    return [trade for trade in trades if trade[0] < START_TIMESTAMP + WEEK]
+
+
+def load_trades(path: str) -> List[Trade]:
+    trades_df = pd.read_csv(path, names=["timestamp", "price", "amount"])
+    return list(trades_df.itertuples(index=False, name=None))
+
+
+def run_backtest(trades: List[Trade], tick_size: float, fast_forward: bool) -> Tuple[float, List[Tuple[float, float]]]:
+    start_time: float = trades[0][0] // tick_size * tick_size
+    end_time: float = start_time + WEEK
+    clock = Clock(ClockMode.BACKTEST, tick_size, start_time, end_time, fast_forward=fast_forward)
+    feed = TradeReplayFeed(trades)
+    strategy = QuoteRefreshStrategy(feed)
+    clock.add_iterator(feed)
+    clock.add_iterator(strategy)
+
+    start: float = time.perf_counter()
+    clock.backtest()
+    return time.perf_counter() - start, strategy.quotes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recording", type=str, default=None, help="CSV of timestamp,price,amount trades")
+    parser.add_argument("--tick-size", type=float, default=1.0)
+    args = parser.parse_args()
+
+    trades: List[Trade] = load_trades(args.recording) if args.recording else generate_trades()
+    print(f"Trades: {len(trades)}, ticks: {int(WEEK / args.tick_size)}")
+
+    stepwise_time, stepwise_quotes = run_backtest(trades, args.tick_size, fast_forward=False)
+    fast_forward_time, fast_forward_quotes = run_backtest(trades, args.tick_size, fast_forward=True)
+
+    print(f"Stepwise:     {stepwise_time:8.3f}s")
+    print(f"Fast forward: {fast_forward_time:8.3f}s")
+    print(f"Speedup:      {stepwise_time / fast_forward_time:8.1f}x")
+    print(f"Quotes: {len(fast_forward_quotes)}, identical: {stepwise_quotes == fast_forward_quotes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Compares the latency of REST calls made with a new aiohttp session per call, the way most connectors used to query
+snapshots and prices, against calls made with the pooled session of the HttpClientRegistry. The calls go to the local
+mock web server, so the difference is the TCP handshake and session setup alone; a TLS handshake to a real exchange
+adds more.
+
+    python -m test.benchmark.http_client_registry_benchmark --requests 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import unittest.mock
+from typing import List
+
+import aiohttp
+
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+
+HOST: str = "api.binance.com"
+PATH: str = "/api/v3/ticker/price"
+
+
+async def new_session_per_call(url: str, n: int) -> List[float]:
+    latencies: List[float] = []
+    for _ in range(n):
+        start: float = time.perf_counter()
+        async with aiohttp.ClientSession() as client:
+            async with client.get(url) as response:
+                await response.json()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def shared_session(registry: HttpClientRegistry, url: str, n: int) -> List[float]:
+    latencies: List[float] = []
+    for _ in range(n):
+        start: float = time.perf_counter()
+        async with registry.client().get(url) as response:
+            await response.json()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def print_latencies(name: str, latencies: List[float]):
+    latencies_ms: List[float] = sorted(latency * 1e3 for latency in latencies)
+    p99: float = latencies_ms[int(len(latencies_ms) * 0.99) - 1]
+    print(f"{name:<22} total {sum(latencies_ms):9.1f}ms  mean {statistics.mean(latencies_ms):6.3f}ms  "
+          f"median {statistics.median(latencies_ms):6.3f}ms  p99 {p99:6.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    web_app: MockWebServer = MockWebServer.get_instance()
+    web_app.add_host_to_mock(HOST)
+    web_app.start()
+    ev_loop.run_until_complete(web_app.wait_til_started())
+    web_app.update_response("get", HOST, PATH, data={"symbol": "BTCUSDT", "price": "35000.00"})
+    url: str = f"https://{HOST}{PATH}"
+
+    registry: HttpClientRegistry = HttpClientRegistry()
+    with unittest.mock.patch("aiohttp.client.URL") as url_mock:
+        url_mock.side_effect = MockWebServer.reroute_local
+        try:
+            per_call: List[float] = ev_loop.run_until_complete(new_session_per_call(url, args.requests))
+            pooled: List[float] = ev_loop.run_until_complete(shared_session(registry, url, args.requests))
+            ev_loop.run_until_complete(registry.close())
+        finally:
+            web_app.stop()
+
+    print_latencies("New session per call:", per_call)
+    print_latencies("Shared session:", pooled)
+    print(f"Speedup: {sum(per_call) / sum(pooled):.1f}x")
+    print(registry.metrics_df().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
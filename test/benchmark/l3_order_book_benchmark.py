@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+"""
+Replays a Coinbase Pro full channel (open, change, match and done messages of individual orders) through:
+- the former active order tracker, which kept Decimal price -> order id -> dict and summed every order of a level on
+  each message (reproduced below as DictActiveOrderTracker), one OrderBook diff per message,
+- CoinbaseProActiveOrderTracker on the shared L3OrderBook, one OrderBook diff per message,
+- CoinbaseProActiveOrderTracker on the shared L3OrderBook, the levels changed by a batch of messages applied as one
+  OrderBook diff, as CoinbaseProOrderBookTracker does on bursts.
+
+A recording of the full channel can be replayed, one raw JSON message per line, the first one being the level 3
+REST snapshot ({"sequence": ..., "bids": [[price, size, order_id], ...], "asks": [...]}):
+
+    python -m test.benchmark.l3_order_book_benchmark --recording coinbase_full_BTC-USD.jsonl
+
+Without a recording, a book of 20000 orders and messages with the full channel's shape are generated.
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+import numpy as np
+import ujson
+
+from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
+from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+TRADING_PAIR = "BTC-USD"
+
+
+class DictActiveOrderTracker:
+    def __init__(self):
+        self._active_bids = {}
+        self._active_asks = {}
+
+    def convert_snapshot_message_to_np_arrays(self, message) -> Tuple[np.ndarray, np.ndarray]:
+        self._active_bids.clear()
+        self._active_asks.clear()
+        for orders, active_orders in [(message.content["bids"], self._active_bids),
+                                      (message.content["asks"], self._active_asks)]:
+            for price, amount, order_id in orders:
+                active_orders.setdefault(Decimal(price), {})[order_id] = {"order_id": order_id,
+                                                                          "remaining_size": amount}
+        return tuple(np.array([[message.timestamp, float(price),
+                                sum([float(order["remaining_size"]) for order in active_orders[price].values()]),
+                                message.update_id] for price in sorted(active_orders.keys(), reverse=True)],
+                              dtype="float64").reshape((-1, 4))
+                     for active_orders in (self._active_bids, self._active_asks))
+
+    def convert_diff_message_to_np_arrays(self, message) -> Tuple[np.ndarray, np.ndarray]:
+        content = message.content
+        order_id = content.get("order_id") or content.get("maker_order_id")
+        price_raw = content.get("price")
+        empty = np.ndarray(shape=(0, 4), dtype="float64")
+        if price_raw == "null":
+            return empty, empty
+        price = Decimal(price_raw)
+        is_bid = content["side"] == "buy"
+        active_orders = self._active_bids if is_bid else self._active_asks
+        if content["type"] == "open":
+            active_orders.setdefault(price, {})[order_id] = {"order_id": order_id,
+                                                             "remaining_size": content["remaining_size"]}
+        elif price in active_orders and order_id in active_orders[price]:
+            if content["type"] == "change":
+                active_orders[price][order_id]["remaining_size"] = content["new_size"]
+            elif content["type"] == "match":
+                remaining_size = active_orders[price][order_id]["remaining_size"]
+                active_orders[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
+            else:
+                del active_orders[price][order_id]
+                if len(active_orders[price]) < 1:
+                    del active_orders[price]
+        else:
+            return empty, empty
+        quantity = sum([float(order["remaining_size"]) for order in active_orders.get(price, {}).values()])
+        row = np.array([[message.timestamp, float(price), quantity, message.update_id]], dtype="float64")
+        return (row, empty) if is_bid else (empty, row)
+
+
+def generate_full_channel(orders: int, count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    live: Dict[str, Tuple[str, str, float]] = {}
+    next_id = 0
+
+    def new_order() -> Tuple[str, str, str, str]:
+        nonlocal next_id
+        side = rng.choice(["buy", "sell"])
+        ticks = int(rng.expovariate(1 / 50)) + 1
+        price = 10000.0 - ticks * 0.01 if side == "buy" else 10000.0 + ticks * 0.01
+        next_id += 1
+        return f"order-{next_id}", side, f"{price:.2f}", f"{rng.uniform(0.001, 2):.8f}"
+
+    snapshot = {"sequence": 0, "bids": [], "asks": []}
+    for _ in range(orders):
+        order_id, side, price, size = new_order()
+        live[order_id] = (side, price, float(size))
+        snapshot["bids" if side == "buy" else "asks"].append([price, size, order_id])
+    messages = [snapshot]
+    for sequence in range(1, count + 1):
+        kind = rng.random()
+        msg = {"sequence": sequence, "product_id": TRADING_PAIR, "time": "2021-09-01T00:00:00.000000Z"}
+        if kind < 0.45 or len(live) == 0:
+            order_id, side, price, size = new_order()
+            live[order_id] = (side, price, float(size))
+            msg.update(type="open", order_id=order_id, side=side, price=price, remaining_size=size)
+        else:
+            order_id = rng.choice(list(live.keys())) if sequence % 64 == 0 else next(iter(live))
+            side, price, size = live[order_id]
+            if kind < 0.9:
+                del live[order_id]
+                msg.update(type="done", order_id=order_id, side=side, price=price, reason="canceled",
+                           remaining_size=f"{size:.8f}")
+            elif kind < 0.95:
+                fill = size / 2
+                live[order_id] = (side, price, size - fill)
+                msg.update(type="match", maker_order_id=order_id, taker_order_id="taker", side=side, price=price,
+                           size=f"{fill:.8f}")
+            else:
+                live[order_id] = (side, price, size / 2)
+                msg.update(type="change", order_id=order_id, side=side, price=price, new_size=f"{size / 2:.8f}",
+                           old_size=f"{size:.8f}")
+        messages.append(msg)
+    return messages
+
+
+def load_full_channel(path: str) -> List[Dict[str, Any]]:
+    with open(path) as fd:
+        return [ujson.loads(line) for line in fd if line.strip()]
+
+
+def to_messages(raw: List[Dict[str, Any]]) -> Tuple[OrderBookMessage, List[OrderBookMessage]]:
+    snapshot = CoinbaseProOrderBook.snapshot_message_from_exchange(raw[0], 1600000000.0,
+                                                                   metadata={"trading_pair": TRADING_PAIR})
+    diffs = [CoinbaseProOrderBook.diff_message_from_exchange(msg, 1600000000.0 + i * 1e-3)
+             for i, msg in enumerate(raw[1:])
+             if msg.get("type") in ("open", "change", "match", "done") and "price" in msg]
+    return snapshot, diffs
+
+
+def run_dict_tracker(snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> Tuple[float, OrderBook]:
+    tracker = DictActiveOrderTracker()
+    order_book = OrderBook()
+    bids, asks = tracker.convert_snapshot_message_to_np_arrays(snapshot)
+    order_book.apply_numpy_snapshot(bids[:, 1:], asks[:, 1:], snapshot.update_id)
+    start = time.perf_counter()
+    for message in diffs:
+        bids, asks = tracker.convert_diff_message_to_np_arrays(message)
+        order_book.apply_numpy_diffs(bids[:, 1:], asks[:, 1:], message.update_id)
+    return len(diffs) / (time.perf_counter() - start), order_book
+
+
+def run_l3_tracker(snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> Tuple[float, OrderBook]:
+    tracker = CoinbaseProActiveOrderTracker()
+    order_book = OrderBook()
+    tracker.apply_snapshot_message(snapshot, order_book)
+    start = time.perf_counter()
+    for message in diffs:
+        tracker.apply_diff_message(message)
+        tracker.apply_level_updates(order_book, message.update_id)
+    return len(diffs) / (time.perf_counter() - start), order_book
+
+
+def run_l3_tracker_batched(snapshot: OrderBookMessage, diffs: List[OrderBookMessage],
+                           batch_size: int) -> Tuple[float, OrderBook]:
+    tracker = CoinbaseProActiveOrderTracker()
+    order_book = OrderBook()
+    tracker.apply_snapshot_message(snapshot, order_book)
+    start = time.perf_counter()
+    for i, message in enumerate(diffs):
+        tracker.apply_diff_message(message)
+        if (i + 1) % batch_size == 0:
+            tracker.apply_level_updates(order_book, message.update_id)
+    tracker.apply_level_updates(order_book, diffs[-1].update_id)
+    return len(diffs) / (time.perf_counter() - start), order_book
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recording", type=str, default=None)
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    raw = load_full_channel(args.recording) if args.recording else generate_full_channel(args.orders, args.messages)
+    snapshot, diffs = to_messages(raw)
+    print(f"{len(snapshot.content['bids']) + len(snapshot.content['asks'])} orders in the snapshot, "
+          f"{len(diffs)} messages")
+
+    dict_rate, dict_book = run_dict_tracker(snapshot, diffs)
+    l3_rate, l3_book = run_l3_tracker(snapshot, diffs)
+    batched_rate, batched_book = run_l3_tracker_batched(snapshot, diffs, args.batch_size)
+    print(f"dict tracker          {dict_rate:12,.0f} msg/s")
+    print(f"L3 book               {l3_rate:12,.0f} msg/s ({l3_rate / dict_rate:.1f}x)")
+    print(f"L3 book, batch of {args.batch_size:<3} {batched_rate:12,.0f} msg/s ({batched_rate / dict_rate:.1f}x)")
+
+    # The three books end up with the same levels
+    for book in (l3_book, batched_book):
+        for expected, actual in zip(dict_book.snapshot_arrays(), book.snapshot_arrays()):
+            np.testing.assert_allclose(expected[:, :2], actual[:, :2], rtol=1e-9, atol=1e-9)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+"""
+Compares the order book volume and VWAP queries walking the book from the top with the same queries answered from
+the cumulative depth index, the way a strategy queries a taker book at several sizes between two diffs.
+
+    python -m test.benchmark.order_book_depth_index_benchmark --levels 5000 --queries 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def make_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    update_ids = np.arange(levels, dtype=np.float64)
+    bids = np.column_stack([9999 - np.arange(levels) * 0.5, np.random.uniform(0.1, 5, levels), update_ids])
+    asks = np.column_stack([10000 + np.arange(levels) * 0.5, np.random.uniform(0.1, 5, levels), update_ids])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def time_ticks(order_book: OrderBook, volumes: np.ndarray, ticks: int, batch: bool = False) -> float:
+    diff = np.array([[10000, 1, 0]], dtype=np.float64)
+    empty = np.empty((0, 3), dtype=np.float64)
+    start = time.perf_counter()
+    for i in range(ticks):
+        # Invalidates the index, as a diff between two ticks would
+        diff[0, 2] = i
+        order_book.apply_numpy_diffs(empty, diff)
+        if batch:
+            order_book.get_vwaps_for_volumes(True, volumes)
+            order_book.get_vwaps_for_volumes(False, volumes)
+        else:
+            for volume in volumes:
+                order_book.get_vwap_for_volume(True, volume)
+                order_book.get_vwap_for_volume(False, volume)
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=5000, help="Levels per side")
+    parser.add_argument("--queries", type=int, default=20, help="VWAP queries per side and tick")
+    parser.add_argument("--max-volume", type=float, default=2000, help="Largest queried volume")
+    parser.add_argument("--ticks", type=int, default=100)
+    args = parser.parse_args()
+
+    order_book = make_order_book(args.levels)
+    volumes = np.linspace(args.max_volume / args.queries, args.max_volume, args.queries)
+    walk_time = time_ticks(order_book, volumes, args.ticks)
+    order_book.depth_index_enabled = True
+    index_time = time_ticks(order_book, volumes, args.ticks)
+    batch_time = time_ticks(order_book, volumes, args.ticks, batch=True)
+    print(f"{args.levels} levels per side, {args.queries} VWAP queries per side and tick, up to {args.max_volume}")
+    print(f"{'book walk':<15} {walk_time * 1e6:10.1f}us per tick")
+    print(f"{'depth index':<15} {index_time * 1e6:10.1f}us per tick ({walk_time / index_time:.1f}x)")
+    print(f"{'batch query':<15} {batch_time * 1e6:10.1f}us per tick ({walk_time / batch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+"""
+Compares the diff messages/sec an order book sustains through the OrderBookRow path (message entries kept as
+lists, converted into one OrderBookRow per level) and through the numpy path (entries converted once into float64
+arrays by the data source and applied with c_apply_numpy_diffs).
+
+A recording of Binance depth stream messages can be replayed, one raw `depthUpdate` JSON message per line:
+
+    python -m test.benchmark.order_book_diff_benchmark --recording binance_depth_BTCUSDT.jsonl
+
+Without a recording, depth updates with Binance's shape and a 1000 level snapshot are generated.
+"""
+
+import argparse
+import random
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import ujson
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+
+
+def generate_depth_updates(count: int, levels_per_update: int) -> List[Dict[str, Any]]:
+    updates: List[Dict[str, Any]] = []
+    for i in range(count):
+        bids = [[f"{random.uniform(9000, 9999):.2f}", f"{random.choice([0, random.uniform(0, 5)]):.6f}"]
+                for _ in range(levels_per_update)]
+        asks = [[f"{random.uniform(10000, 11000):.2f}", f"{random.choice([0, random.uniform(0, 5)]):.6f}"]
+                for _ in range(levels_per_update)]
+        updates.append({"e": "depthUpdate", "E": 1600000000000 + i, "s": "BTCUSDT",
+                        "U": 1000 + i * 10, "u": 1000 + i * 10 + 9, "b": bids, "a": asks})
+    return updates
+
+
+def load_depth_updates(path: str) -> List[Dict[str, Any]]:
+    with open(path) as fd:
+        messages = [ujson.loads(line) for line in fd if line.strip()]
+    # Combined stream recordings wrap the update in a "data" field
+    return [msg.get("data", msg) for msg in messages]
+
+
+def snapshot_message() -> OrderBookMessage:
+    return BinanceOrderBook.snapshot_message_from_exchange({
+        "lastUpdateId": 999,
+        "bids": [[f"{9999 - i * 0.5:.2f}", "1.0"] for i in range(1000)],
+        "asks": [[f"{10000 + i * 0.5:.2f}", "1.0"] for i in range(1000)],
+    }, time.time(), metadata={"trading_pair": "BTC-USDT"})
+
+
+def run_rows_path(updates: List[Dict[str, Any]]) -> float:
+    order_book = OrderBook()
+    order_book.apply_snapshot_message(snapshot_message())
+    start: float = time.perf_counter()
+    for msg in updates:
+        message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "first_update_id": msg["U"],
+            "update_id": msg["u"],
+            "bids": msg["b"],
+            "asks": msg["a"]
+        }, timestamp=msg["E"] * 1e-3)
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    return len(updates) / (time.perf_counter() - start)
+
+
+def run_np_arrays_path(updates: List[Dict[str, Any]]) -> float:
+    order_book = OrderBook()
+    order_book.apply_snapshot_message(snapshot_message())
+    start: float = time.perf_counter()
+    for msg in updates:
+        message = BinanceOrderBook.diff_message_from_exchange(msg, msg["E"] * 1e-3)
+        order_book.apply_diff_message(message)
+    return len(updates) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recording", type=str, default=None)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--levels", type=int, default=20, help="Levels per side in each generated update")
+    args = parser.parse_args()
+
+    if args.recording is not None:
+        updates = load_depth_updates(args.recording)
+    else:
+        updates = generate_depth_updates(args.messages, args.levels)
+
+    # Both paths consume the raw messages, the message dicts are copied so each run starts from the same input.
+    rows_rate: float = run_rows_path([dict(msg) for msg in updates])
+    np_rate: float = run_np_arrays_path([dict(msg) for msg in updates])
+    print(f"{len(updates)} depth updates")
+    print(f"OrderBookRow path: {rows_rate:,.0f} messages/sec")
+    print(f"numpy path:        {np_rate:,.0f} messages/sec ({np_rate / rows_rate:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Compares OrderBook snapshot exports on a book of 5k levels per side: the former path (one OrderBookRow per level,
+then two data frames built from the rows), the arrays filled directly from the book by snapshot_arrays, and the
+data frames wrapping them.
+
+    python -m test.benchmark.order_book_snapshot_benchmark --levels 5000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+def make_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    update_ids = np.arange(levels, dtype=np.float64)
+    bids = np.column_stack([9999 - np.arange(levels) * 0.5, np.random.uniform(0.1, 5, levels), update_ids])
+    asks = np.column_stack([10000 + np.arange(levels) * 0.5, np.random.uniform(0.1, 5, levels), update_ids])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def rows_snapshot(order_book: OrderBook):
+    bids_rows = list(order_book.bid_entries())
+    asks_rows = list(order_book.ask_entries())
+    return (pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64"),
+            pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64"))
+
+
+def time_export(export: Callable[[], object], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        export()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=5000, help="Levels per side")
+    parser.add_argument("--depth", type=int, default=20, help="Depth of the limited exports")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    order_book = make_order_book(args.levels)
+    rows_time = time_export(lambda: rows_snapshot(order_book), args.repeats)
+    print(f"{args.levels} levels per side")
+    print(f"{'OrderBookRow + data frames':<30} {rows_time * 1e6:10.1f}us")
+    for name, export in [("snapshot_frames", lambda: order_book.snapshot_frames()),
+                         ("snapshot_arrays", lambda: order_book.snapshot_arrays()),
+                         (f"snapshot_frames({args.depth})", lambda: order_book.snapshot_frames(args.depth)),
+                         (f"snapshot_arrays({args.depth})", lambda: order_book.snapshot_arrays(args.depth))]:
+        export_time = time_export(export, args.repeats)
+        print(f"{name:<30} {export_time * 1e6:10.1f}us ({rows_time / export_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
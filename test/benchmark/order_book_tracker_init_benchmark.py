@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""
+Measures the time it takes for OrderBookTracker to initialize the order books of N trading pairs, fetching the
+snapshots one at a time (no rate limit declared by the data source) and concurrently within a rate limit.
+
+    python -m test.benchmark.order_book_tracker_init_benchmark --pairs 80 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import time
+from typing import (
+    List,
+    Optional,
+)
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from test.mock.mock_order_book_data_source import MockOrderBookDataSource
+
+
+async def time_init(trading_pairs: List[str], latency: float, rate_limit: Optional[RateLimit]) -> float:
+    data_source = MockOrderBookDataSource(trading_pairs, snapshot_latency=latency, snapshot_rate_limit=rate_limit)
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+    start: float = time.perf_counter()
+    first_ready: Optional[float] = None
+    tracker.start()
+    try:
+        await tracker.wait_for_trading_pair(trading_pairs[0])
+        first_ready = time.perf_counter() - start
+        await tracker._order_books_initialized.wait()
+        total: float = time.perf_counter() - start
+    finally:
+        tracker.stop()
+    print(f"  first pair ready after {first_ready:.2f}s, all {len(trading_pairs)} pairs ready after {total:.2f}s")
+    return total
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=80)
+    parser.add_argument("--latency", type=float, default=0.3, help="Snapshot request latency in seconds")
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+
+    trading_pairs: List[str] = [f"COIN{i}-USDT" for i in range(args.pairs)]
+    # Same budget as the Binance data source: 1000 weight per minute, 10 weight per snapshot.
+    rate_limit = RateLimit(limit=1000, time_interval=60, weight=10)
+
+    print("Concurrent, rate limited initialization:")
+    concurrent: float = await time_init(trading_pairs, args.latency, rate_limit)
+    if not args.skip_serial:
+        print("Serial initialization:")
+        serial: float = await time_init(trading_pairs, args.latency, None)
+        print(f"Speedup: {serial / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
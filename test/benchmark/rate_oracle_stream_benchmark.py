@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+"""
+Compares the CPU time and the bandwidth of the rate oracle:
+- polling the all tickers REST endpoints of binance.com and binance.us every second, as it does without subscriptions,
+- streaming the book tickers of the prices the subscribed rates are found from, polling the REST endpoints every
+  RateOracle.STREAM_FALLBACK_INTERVAL seconds.
+
+A local mock feed serves both, from another process so that only the oracle's CPU time is measured: the REST
+endpoints return --symbols tickers, and the websocket pushes --updates-per-second book ticker updates per subscribed
+symbol, of which 1 in 5 change the best prices.
+
+    python -m test.benchmark.rate_oracle_stream_benchmark --duration 60
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+import ujson
+from aiohttp import web, WSMsgType
+
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+
+PORT = 18765
+QUOTES = ["USDT", "BTC", "ETH", "BNB", "BUSD"]
+
+
+def make_symbols(count: int) -> List[str]:
+    symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ETHBTC", "BNBBTC"]
+    i = 0
+    while len(symbols) < count:
+        symbols.append(f"TKN{i}{QUOTES[i % len(QUOTES)]}")
+        i += 1
+    return symbols
+
+
+def run_feed(symbol_count: int, updates_per_second: float, counters: Dict[str, multiprocessing.Value]):
+    rng = random.Random(0)
+    symbols = make_symbols(symbol_count)
+    prices: Dict[str, float] = {symbol: rng.uniform(1, 1000) for symbol in symbols}
+    prices.update(BTCUSDT=40000.0, ETHUSDT=3000.0, BNBUSDT=400.0, ETHBTC=0.075, BNBBTC=0.01)
+
+    def tickers(symbols_: List[str]) -> bytes:
+        return ujson.dumps([{"symbol": symbol, "bidPrice": f"{prices[symbol] * 0.999:.8f}", "bidQty": "1.00000000",
+                             "askPrice": f"{prices[symbol] * 1.001:.8f}", "askQty": "1.00000000"}
+                            for symbol in symbols_]).encode()
+
+    async def com_tickers(request):
+        body = tickers(symbols)
+        with counters["rest"].get_lock():
+            counters["rest"].value += len(body)
+        return web.Response(body=body, content_type="application/json")
+
+    async def us_tickers(request):
+        body = tickers([])
+        with counters["rest"].get_lock():
+            counters["rest"].value += len(body)
+        return web.Response(body=body, content_type="application/json")
+
+    async def stream(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscribed: List[str] = []
+
+        async def push():
+            update_id = 0
+            while True:
+                await asyncio.sleep(1 / updates_per_second)
+                for symbol in subscribed:
+                    update_id += 1
+                    if rng.random() < 0.2:
+                        prices[symbol] *= 1 + rng.uniform(-1e-4, 1e-4)
+                    msg = ujson.dumps({"u": update_id, "s": symbol,
+                                       "b": f"{prices[symbol] * 0.999:.8f}", "B": f"{rng.uniform(0, 10):.8f}",
+                                       "a": f"{prices[symbol] * 1.001:.8f}", "A": f"{rng.uniform(0, 10):.8f}"})
+                    with counters["ws"].get_lock():
+                        counters["ws"].value += len(msg)
+                    await ws.send_str(msg)
+
+        push_task = asyncio.ensure_future(push())
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    request_ = ujson.loads(msg.data)
+                    streams = [stream_name.split("@")[0].upper() for stream_name in request_["params"]]
+                    if request_["method"] == "SUBSCRIBE":
+                        subscribed.extend(streams)
+                    else:
+                        subscribed[:] = [symbol for symbol in subscribed if symbol not in streams]
+                    await ws.send_str(ujson.dumps({"result": None, "id": request_["id"]}))
+        finally:
+            push_task.cancel()
+        return ws
+
+    app = web.Application()
+    app.add_routes([web.get("/api/v3/ticker/bookTicker", com_tickers),
+                    web.get("/us/api/v3/ticker/bookTicker", us_tickers),
+                    web.get("/ws", stream)])
+    web.run_app(app, host="127.0.0.1", port=PORT, print=None)
+
+
+async def measure(oracle: RateOracle, duration: float, counters: Dict[str, multiprocessing.Value],
+                  subscriptions: List[str]) -> Dict[str, float]:
+    oracle.subscribe(subscriptions)
+    await oracle.start_network()
+    await oracle.get_ready()
+    changes = 0
+
+    async def count_changes():
+        nonlocal changes
+        while True:
+            await oracle.wait_for_rate_change("ETH-BTC")
+            changes += 1
+
+    counting_task = asyncio.ensure_future(count_changes())
+    # Let the stream connect before measuring
+    await asyncio.sleep(2)
+    start_rest, start_ws = counters["rest"].value, counters["ws"].value
+    start_cpu, start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - start
+    result = {"cpu": (time.process_time() - start_cpu) / elapsed,
+              "rest": (counters["rest"].value - start_rest) / elapsed,
+              "ws": (counters["ws"].value - start_ws) / elapsed,
+              "changes": changes / elapsed,
+              "rate": oracle.rate("ETH-BTC")}
+    counting_task.cancel()
+    await oracle.stop_network()
+    oracle.unsubscribe(subscriptions)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--symbols", type=int, default=2000)
+    parser.add_argument("--updates-per-second", type=float, default=10.0)
+    args = parser.parse_args()
+
+    counters = {"rest": multiprocessing.Value("q", 0), "ws": multiprocessing.Value("q", 0)}
+    feed = multiprocessing.Process(target=run_feed, args=(args.symbols, args.updates_per_second, counters),
+                                   daemon=True)
+    feed.start()
+    time.sleep(2)
+    RateOracle.binance_price_url = f"http://127.0.0.1:{PORT}/api/v3/ticker/bookTicker"
+    RateOracle.binance_us_price_url = f"http://127.0.0.1:{PORT}/us/api/v3/ticker/bookTicker"
+    RateOracle.binance_ws_url = f"ws://127.0.0.1:{PORT}/ws"
+
+    ev_loop = asyncio.get_event_loop()
+    polling = ev_loop.run_until_complete(measure(RateOracle(), args.duration, counters, []))
+    streaming = ev_loop.run_until_complete(measure(RateOracle(), args.duration, counters,
+                                                   ["ETH-BTC", "BNB-USDT"]))
+    feed.terminate()
+
+    print(f"{args.symbols} tickers, {args.updates_per_second} book ticker updates/s per symbol, "
+          f"{args.duration:.0f}s each")
+    for name, result in (("polling", polling), ("streaming", streaming)):
+        print(f"{name:10} CPU {result['cpu'] * 100:6.2f}%  REST {result['rest'] / 1024:8.1f} KB/s  "
+              f"websocket {result['ws'] / 1024:6.1f} KB/s  ETH-BTC changes {result['changes']:5.1f}/s  "
+              f"rate {result['rate']:.6f}")
+    print(f"CPU {polling['cpu'] / streaming['cpu']:.1f}x lower, bandwidth "
+          f"{polling['rest'] / (streaming['rest'] + streaming['ws']):.1f}x lower when streaming")
+    assert isinstance(streaming["rate"], Decimal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+"""
+Compares the trade history database with its former profile (default journaling and pragmas, without the indexes added
+in version 20210901) and with the managed profile of SQLConnectionManager, on a generated database of 1M fills.
+
+    python -m test.benchmark.sqlite_profile_benchmark --fills 1000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import (
+    Session,
+    sessionmaker,
+)
+
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIGS = [f"conf_pure_mm_{i}.yml" for i in range(20)]
+MARKETS = ["binance", "kucoin", "ascend_ex", "gate_io", "huobi"]
+START_TIMESTAMP = 1600000000000
+CHUNK_SIZE = 50000
+NEW_INDEXES = ["tf_timestamp_index", "o_config_market_timestamp_index", "ms_config_market_index"]
+
+
+def generate_db(db_path: str, fills: int):
+    sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    sql.get_shared_session().close()
+    rng = random.Random(42)
+    # A fill every 30 seconds on average, over about a year for 1M fills
+    orders, trade_fills = [], []
+    with sql.engine.begin() as conn:
+        for i in range(fills):
+            timestamp = START_TIMESTAMP + i * 30000
+            config, market = rng.choice(CONFIGS), rng.choice(MARKETS)
+            if i % 5 == 0:
+                orders.append(dict(id=f"order_{i}", config_file_path=config, strategy="pure_market_making",
+                                   market=market, symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT",
+                                   creation_timestamp=timestamp, order_type="LIMIT", amount=1.0, leverage=1,
+                                   price=2000.0, last_status="BuyOrderCompleted", last_update_timestamp=timestamp,
+                                   exchange_order_id=str(i)))
+            trade_fills.append(dict(config_file_path=config, strategy="pure_market_making", market=market,
+                                    symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT", timestamp=timestamp,
+                                    order_id=f"order_{i - i % 5}", trade_type="BUY", order_type="LIMIT",
+                                    price=2000.0, amount=0.2, leverage=1, trade_fee={"percent": 0.001},
+                                    exchange_trade_id=str(i), position="NILL"))
+            if len(trade_fills) == CHUNK_SIZE:
+                conn.execute(Order.__table__.insert(), orders)
+                conn.execute(TradeFill.__table__.insert(), trade_fills)
+                orders, trade_fills = [], []
+        if len(trade_fills) > 0:
+            conn.execute(Order.__table__.insert(), orders)
+            conn.execute(TradeFill.__table__.insert(), trade_fills)
+        conn.execute(MarketState.__table__.insert(),
+                     [dict(config_file_path=config, market=market, timestamp=START_TIMESTAMP, saved_state={})
+                      for config in CONFIGS for market in MARKETS])
+    sql.checkpoint()
+
+
+def make_former_db(db_path: str, former_db_path: str):
+    shutil.copyfile(db_path, former_db_path)
+    engine = create_engine(f"sqlite:///{former_db_path}")
+    with engine.begin() as conn:
+        for index in NEW_INDEXES:
+            conn.execute(f"DROP INDEX {index}")
+    with engine.connect() as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+    engine.dispose()
+
+
+def queries(end_timestamp: int) -> List[Tuple[str, Callable[[Session], any]]]:
+    config, market = CONFIGS[0], MARKETS[0]
+
+    def history(session: Session):
+        # As the history command reads them
+        return (session.query(TradeFill)
+                .filter(TradeFill.timestamp >= end_timestamp - 86400000,
+                        TradeFill.config_file_path.like(f"%{config}%"))
+                .order_by(TradeFill.timestamp.desc())
+                .all())
+
+    def trades_for_config(session: Session):
+        return (session.query(TradeFill)
+                .filter(TradeFill.config_file_path == config)
+                .order_by(TradeFill.timestamp.desc())
+                .limit(2000)
+                .all())
+
+    def orders_for_market(session: Session):
+        return (session.query(Order)
+                .filter(Order.config_file_path == config,
+                        Order.market == market,
+                        Order.exchange_order_id.isnot(None))
+                .order_by(Order.creation_timestamp)
+                .limit(2000)
+                .all())
+
+    def market_states(session: Session):
+        return (session.query(MarketState)
+                .filter(MarketState.config_file_path == config, MarketState.market == market)
+                .one_or_none())
+
+    return [("history (last day)", history),
+            ("trades for config", trades_for_config),
+            ("orders for market", orders_for_market),
+            ("market states", market_states)]
+
+
+def time_query(session_cls: sessionmaker, query: Callable[[Session], any], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        session: Session = session_cls()
+        query(session)
+        session.close()
+    return (time.perf_counter() - start) / repeats
+
+
+def time_commits(session_cls: sessionmaker, repeats: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeats):
+        session: Session = session_cls()
+        session.add(TradeFill(config_file_path=CONFIGS[0], strategy="pure_market_making", market=MARKETS[0],
+                              symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT", timestamp=START_TIMESTAMP,
+                              order_id="order_0", trade_type="BUY", order_type="LIMIT", price=2000.0, amount=0.2,
+                              leverage=1, trade_fee={"percent": 0.001}, exchange_trade_id=f"bench_{i}",
+                              position="NILL"))
+        session.commit()
+        session.close()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fills", type=int, default=1000000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(db_dir, "managed.sqlite")
+        former_db_path = os.path.join(db_dir, "former.sqlite")
+        start = time.perf_counter()
+        generate_db(db_path, args.fills)
+        make_former_db(db_path, former_db_path)
+        print(f"Generated {args.fills} fills in {time.perf_counter() - start:.1f}s")
+
+        former_engine = create_engine(f"sqlite:///{former_db_path}")
+        managed = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+        managed.get_shared_session().close()
+        former_sessions = sessionmaker(bind=former_engine)
+        managed_sessions = sessionmaker(bind=managed.engine)
+
+        end_timestamp = START_TIMESTAMP + args.fills * 30000
+        for name, query in queries(end_timestamp):
+            former_time = time_query(former_sessions, query, args.repeats)
+            managed_time = time_query(managed_sessions, query, args.repeats)
+            print(f"{name:<20} former {former_time * 1e3:9.2f}ms  managed {managed_time * 1e3:9.2f}ms  "
+                  f"speedup {former_time / managed_time:7.1f}x")
+        former_time = time_commits(former_sessions, 100)
+        managed_time = time_commits(managed_sessions, 100)
+        print(f"{'fill commit':<20} former {former_time * 1e3:9.2f}ms  managed {managed_time * 1e3:9.2f}ms  "
+              f"speedup {former_time / managed_time:7.1f}x")
+    finally:
+        shutil.rmtree(db_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+"""
+Replays websocket frames through the ingestion of each connector and reports the frames parsed per second and the
+memory allocated for the parsed messages, for:
+- the former pipeline of the connector (Binance: ujson.loads then BinanceOrderBook.*_message_from_exchange, Gate.io:
+  json.loads then GateIoOrderBook.diff_message_from_exchange),
+- the connector's pipeline on the shared ingestion layer (Binance: WebsocketMessageParser, Gate.io: the decoder
+  only), with each installed JSON decoder.
+
+Captured frames can be replayed, one raw frame per line, per connector:
+
+    python -m test.benchmark.websocket_ingestion_benchmark --recording binance=binance_frames.txt
+
+Without a recording, depth update and trade frames with the shape of the exchange's are generated.
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import ujson
+
+from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.connector.exchange.gate_io.gate_io_order_book import GateIoOrderBook
+from hummingbot.connector.exchange.gate_io.gate_io_utils import convert_from_exchange_trading_pair as \
+    gate_io_convert_from_exchange_pair
+from hummingbot.core.utils.json_decoder import JSON_DECODERS
+
+Pipeline = Callable[[str], Any]
+
+
+def entries(rng: random.Random, mid: float, side: int, count: int) -> List[List[str]]:
+    return [[f"{mid + side * rng.randint(1, 500) * 0.01:.2f}", f"{rng.choice([0, rng.uniform(0, 5)]):.8f}"]
+            for _ in range(count)]
+
+
+def generate_binance_frames(count: int) -> List[str]:
+    rng = random.Random(0)
+    frames = []
+    for i in range(count):
+        symbol = rng.choice(["BTCUSDT", "ETHUSDT", "ETHBTC"])
+        if rng.random() < 0.8:
+            frames.append(ujson.dumps({"e": "depthUpdate", "E": 1600000000000 + i, "s": symbol, "U": i * 10,
+                                       "u": i * 10 + 9, "b": entries(rng, 1000, -1, rng.randint(1, 30)),
+                                       "a": entries(rng, 1000, 1, rng.randint(1, 30))}))
+        else:
+            frames.append(ujson.dumps({"e": "trade", "E": 1600000000000 + i, "s": symbol, "t": i,
+                                       "p": f"{1000 + rng.uniform(-1, 1):.2f}", "q": f"{rng.uniform(0, 2):.8f}",
+                                       "b": i, "a": i + 1, "T": 1600000000000 + i, "m": rng.random() < 0.5,
+                                       "M": True}))
+    return frames
+
+
+def generate_gate_io_frames(count: int) -> List[str]:
+    rng = random.Random(0)
+    return [json.dumps({"time": 1600000000, "channel": "spot.order_book_update", "event": "update",
+                        "result": {"t": 1600000000000 + i, "e": "depthUpdate", "E": 1600000000 + i,
+                                   "s": rng.choice(["BTC_USDT", "ETH_USDT"]), "U": i * 10, "u": i * 10 + 9,
+                                   "b": entries(rng, 1000, -1, rng.randint(1, 30)),
+                                   "a": entries(rng, 1000, 1, rng.randint(1, 30))}})
+            for i in range(count)]
+
+
+def binance_former_pipeline(raw_msg: str) -> Any:
+    msg = ujson.loads(raw_msg)
+    if msg.get("e") == "trade":
+        return BinanceOrderBook.trade_message_from_exchange(msg)
+    return BinanceOrderBook.diff_message_from_exchange(msg, time.time())
+
+
+def binance_pipeline(decoder: str) -> Pipeline:
+    parser = BinanceAPIOrderBookDataSource._create_ws_message_parser()
+    parser._decoder = JSON_DECODERS[decoder]
+    return parser.parse
+
+
+def gate_io_pipeline(loads: Callable[[str], Any]) -> Pipeline:
+    def parse(raw_msg: str) -> Any:
+        order_book_data = loads(raw_msg)["result"]
+        return GateIoOrderBook.diff_message_from_exchange(
+            order_book_data, order_book_data["t"],
+            metadata={"trading_pair": gate_io_convert_from_exchange_pair(order_book_data["s"])})
+    return parse
+
+
+def run(pipeline: Pipeline, frames: List[str]) -> Tuple[float, float, float]:
+    """
+    :return: frames per second, KiB allocated per 1000 parsed messages kept (as queued), peak KiB while parsing
+    """
+    # Best of 3 runs, the first one also warms up the pipeline
+    durations = []
+    for _ in range(3):
+        gc.collect()
+        start = time.perf_counter()
+        for frame in frames:
+            pipeline(frame)
+        durations.append(time.perf_counter() - start)
+    rate = len(frames) / min(durations)
+
+    tracemalloc.start()
+    messages = [pipeline(frame) for frame in frames]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del messages
+    return rate, retained / 1024 / len(frames) * 1000, peak / 1024
+
+
+def load_recording(path: str) -> List[str]:
+    with open(path) as fd:
+        return [line.rstrip("\n") for line in fd if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--recording", action="append", default=[],
+                        help="connector=path of the recorded frames, one per line")
+    args = parser.parse_args()
+    recordings: Dict[str, str] = dict(recording.split("=", 1) for recording in args.recording)
+
+    connectors: Dict[str, Tuple[Callable[[int], List[str]], List[Tuple[str, Pipeline]]]] = {
+        "binance": (generate_binance_frames,
+                    [("former (ujson)", binance_former_pipeline)] +
+                    [(f"parser ({name})", binance_pipeline(name)) for name in JSON_DECODERS]),
+        "gate_io": (generate_gate_io_frames,
+                    [("former (json)", gate_io_pipeline(json.loads))] +
+                    [(f"decoder ({name})", gate_io_pipeline(loads)) for name, loads in JSON_DECODERS.items()]),
+    }
+    for connector, (generate, pipelines) in connectors.items():
+        path: Optional[str] = recordings.get(connector)
+        frames: List[str] = load_recording(path) if path else generate(args.frames)
+        print(f"{connector}: {len(frames)} frames{' from ' + path if path else ''}")
+        base_rate: Optional[float] = None
+        for name, pipeline in pipelines:
+            rate, retained, peak = run(pipeline, frames)
+            base_rate = base_rate or rate
+            print(f"  {name:16} {rate:10,.0f} frames/s ({rate / base_rate:.2f}x)  "
+                  f"{retained:8.1f} KiB per 1000 messages  peak {peak:10,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -121,6 +121,10 @@ class BinanceExchangeUnitTest(unittest.TestCase):
                                         {}, params={'symbol': 'ZRXETH'})
             cls.web_app.update_response("get", cls.base_api_url, "/api/v3/myTrades",
                                         {}, params={'symbol': 'LINKETH'})
+            cls.web_app.update_response("get", cls.base_api_url, "/api/v3/openOrders",
+                                        [], params={'symbol': 'ZRXETH'})
+            cls.web_app.update_response("get", cls.base_api_url, "/api/v3/openOrders",
+                                        [], params={'symbol': 'LINKETH'})
             ws_base_url = "wss://stream.binance.com:9443/ws"
             cls._ws_user_url = f"{ws_base_url}/{FixtureBinance.LISTEN_KEY['listenKey']}"
             MockWebSocketServerFactory.start_new_server(cls._ws_user_url)
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import (
+    PerformanceAccumulator,
+    PerformanceTracker,
+)
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "conf_pure_mm_1.yml"
+METRICS = ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base", "b_vol_quote",
+           "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price", "start_base_bal",
+           "start_quote_bal", "start_price", "cur_price", "hold_value", "cur_value", "trade_pnl", "fee_in_quote",
+           "total_pnl", "return_pct"]
+
+
+def make_fills(rng: random.Random, count: int, first_id: int = 1, market: str = "binance",
+               symbol: str = "HBOT-USDT") -> List[TradeFill]:
+    fills = []
+    for i in range(count):
+        trade_fee = {"percent": rng.choice([0.0, 0.001]), "flat_fees": []}
+        if rng.random() < 0.1:
+            trade_fee["flat_fees"].append({"asset": "BNB", "amount": "0.01"})
+        fills.append(TradeFill(id=first_id + i, config_file_path=CONFIG_FILE_PATH, strategy="pure_market_making",
+                               market=market, symbol=symbol, base_asset=symbol.split("-")[0],
+                               quote_asset=symbol.split("-")[1], timestamp=1000 * (first_id + i),
+                               order_id=f"order_{first_id + i}", trade_type=rng.choice(["BUY", "SELL"]),
+                               order_type="LIMIT", price=rng.randint(900, 1100) / 100,
+                               amount=rng.randint(1, 1000) / 10, leverage=1, trade_fee=trade_fee,
+                               exchange_trade_id=str(first_id + i), position="NILL"))
+    return fills
+
+
+@patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock, return_value=None)
+class PerformanceAccumulatorUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.balances = {"HBOT": Decimal("1000"), "USDT": Decimal("10000")}
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, actual: PerformanceMetrics):
+        for metric in METRICS:
+            self.assertAlmostEqual(float(getattr(expected, metric)), float(getattr(actual, metric)), places=6,
+                                   msg=metric)
+        self.assertEqual(expected.fees.keys(), actual.fees.keys())
+        for token, amount in expected.fees.items():
+            self.assertAlmostEqual(float(amount), float(actual.fees[token]), places=6)
+
+    def metrics_from_trades(self, trades: List[TradeFill]) -> PerformanceMetrics:
+        return self.ev_loop.run_until_complete(
+            PerformanceMetrics.create("binance", "HBOT-USDT", trades, self.balances))
+
+    def metrics_from_aggregates(self, aggregates) -> PerformanceMetrics:
+        return self.ev_loop.run_until_complete(
+            PerformanceMetrics.create_from_aggregates("binance", "HBOT-USDT", aggregates, self.balances))
+
+    def test_windows_match_full_computation(self, _):
+        rng = random.Random(0)
+        fills = make_fills(rng, 500)
+        accumulator = PerformanceAccumulator("binance", "HBOT-USDT")
+        # Fills recorded one by one, some of them late
+        shuffled = fills[:]
+        for i in range(0, len(shuffled) - 1, 7):
+            shuffled[i], shuffled[i + 1] = shuffled[i + 1], shuffled[i]
+        for fill in shuffled:
+            accumulator.add_trade_fill(fill)
+
+        self.assertEqual(500, len(accumulator))
+        self.assertIsNone(accumulator.aggregates(1000 * 501))
+        for _ in range(20):
+            start = rng.randint(0, 500)
+            end = rng.randint(start + 1, 501)
+            window = [f for f in fills if 1000 * start <= f.timestamp < 1000 * end]
+            self.assertEqual(len(window), accumulator.trade_count(1000 * start, 1000 * end))
+            self.assert_same_metrics(self.metrics_from_trades(window),
+                                     self.metrics_from_aggregates(accumulator.aggregates(1000 * start, 1000 * end)))
+
+    def test_tracker_resumes_from_checkpoint(self, _):
+        rng = random.Random(1)
+        with tempfile.TemporaryDirectory() as db_dir:
+            sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=os.path.join(db_dir, "test.sqlite"))
+            checkpoint_path = os.path.join(db_dir, "performance.npz")
+            fills = make_fills(rng, 300) + make_fills(rng, 100, first_id=301, market="kucoin")
+            session = sql.get_shared_session()
+            session.add_all(fills[:200])
+            session.commit()
+
+            # Cold start from the database
+            tracker = PerformanceTracker(sql, CONFIG_FILE_PATH, checkpoint_path)
+            tracker.load()
+            self.assertEqual(200, tracker.trade_count())
+            # Fills recorded while running
+            for fill in fills[200:300]:
+                tracker.add_trade_fill(fill)
+            tracker.save_checkpoint()
+
+            # Fills recorded after the checkpoint was saved
+            session.add_all(fills[200:])
+            session.commit()
+            tracker = PerformanceTracker(sql, CONFIG_FILE_PATH, checkpoint_path)
+            tracker.load()
+
+            self.assertEqual(400, tracker.trade_count())
+            self.assertEqual({("binance", "HBOT-USDT"), ("kucoin", "HBOT-USDT")}, set(tracker.markets()))
+            self.assertEqual([("kucoin", "HBOT-USDT")], tracker.markets(1000 * 301))
+            self.assertFalse(tracker.has_positions("binance", "HBOT-USDT"))
+            self.assert_same_metrics(self.metrics_from_trades(fills[49:300]),
+                                     self.metrics_from_aggregates(tracker.aggregates("binance", "HBOT-USDT", 50000)))
+            session.close()
+            sql.engine.dispose()
@@ -0,0 +1,112 @@
+import asyncio
+import random
+import unittest
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import PerformanceAccumulator
+from hummingbot.client.profitability_tracker import ProfitabilityTracker
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model import get_declarative_base
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MockConnector:
+    def __init__(self, display_name: str, balances: Dict[str, Decimal]):
+        self.display_name = display_name
+        self.balances = balances
+        self.mid_price = Decimal("NaN")
+        self.order_books = {"HBOT-USDT": None}
+
+    def get_balance(self, asset: str) -> Decimal:
+        return self.balances.get(asset, Decimal("0"))
+
+    def get_mid_price(self, trading_pair: str) -> Decimal:
+        return self.mid_price
+
+
+def make_fill_events(rng: random.Random, count: int) -> List[OrderFilledEvent]:
+    events = []
+    for i in range(count):
+        flat_fees = [("HBOT", Decimal("0.01"))] if rng.random() < 0.1 else []
+        events.append(OrderFilledEvent(timestamp=1000 + i, order_id=f"order_{i}", trading_pair="HBOT-USDT",
+                                       trade_type=rng.choice([TradeType.BUY, TradeType.SELL]),
+                                       order_type=OrderType.LIMIT,
+                                       price=Decimal(rng.randint(900, 1100)) / 100,
+                                       amount=Decimal(rng.randint(1, 1000)) / 10,
+                                       trade_fee=TradeFee(percent=rng.choice([Decimal("0"), Decimal("0.001")]),
+                                                          flat_fees=flat_fees),
+                                       exchange_trade_id=str(i)))
+    return events
+
+
+def to_trade_fill(trade_id: int, event: OrderFilledEvent) -> TradeFill:
+    return TradeFill(id=trade_id, config_file_path="conf_pure_mm_1.yml", strategy="pure_market_making",
+                     market="binance", symbol=event.trading_pair, base_asset="HBOT", quote_asset="USDT",
+                     timestamp=int(event.timestamp * 1e3), order_id=event.order_id, trade_type=event.trade_type.name,
+                     order_type=event.order_type.name, price=float(event.price), amount=float(event.amount),
+                     leverage=1, trade_fee=TradeFee.to_json(event.trade_fee), exchange_trade_id=event.exchange_trade_id,
+                     position="NILL")
+
+
+class ProfitabilityTrackerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Maps the models TradeFill relates to
+        get_declarative_base()
+
+    def setUp(self):
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.connector = MockConnector("binance", {"HBOT": Decimal("1000"), "USDT": Decimal("10000")})
+
+    def history_return(self, trades: List[TradeFill], last_price: Decimal) -> Decimal:
+        with patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock, return_value=last_price):
+            metrics = self.ev_loop.run_until_complete(
+                PerformanceMetrics.create("binance", "HBOT-USDT", trades, self.connector.balances))
+        return metrics.return_pct
+
+    def test_matches_history_report(self):
+        events = make_fill_events(random.Random(0), 200)
+        trades = [to_trade_fill(i + 1, event) for i, event in enumerate(events)]
+        tracker = ProfitabilityTracker([self.connector])
+        for event in events:
+            tracker.add_fill("binance", event)
+
+        # Without an order book price, the last fill price is used
+        self.assertAlmostEqual(float(self.history_return(trades, events[-1].price)),
+                               float(tracker.profitability()), places=9)
+        self.connector.mid_price = Decimal("10.5")
+        self.assertAlmostEqual(float(self.history_return(trades, Decimal("10.5"))),
+                               float(tracker.profitability()), places=9)
+        self.assertFalse(tracker.has_positions)
+
+    def test_resumes_from_aggregates(self):
+        events = make_fill_events(random.Random(1), 100)
+        trades = [to_trade_fill(i + 1, event) for i, event in enumerate(events)]
+        accumulator = PerformanceAccumulator("binance", "HBOT-USDT")
+        for trade in trades[:60]:
+            accumulator.add_trade_fill(trade)
+        tracker = ProfitabilityTracker([self.connector])
+        tracker.add_aggregates("binance", "HBOT-USDT", accumulator.aggregates())
+        for event in events[60:]:
+            tracker.add_fill("binance", event)
+
+        self.connector.mid_price = Decimal("9.5")
+        self.assertAlmostEqual(float(self.history_return(trades, Decimal("9.5"))),
+                               float(tracker.profitability()), places=9)
+        self.assertEqual([("binance", "HBOT-USDT")], list(tracker.markets))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+import copy
+import random
+import unittest
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+FEE_PCT = Decimal("0.001")
+TRADING_PAIRS = ["HBOT-USDT", "ETH-USDT", "HBOT-ETH"]
+
+
+class LedgerTestOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state == "filled"
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.last_state == "cancelled"
+
+    @property
+    def is_failure(self) -> bool:
+        return False
+
+
+def in_flight_asset_balances(in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
+    # Same math as ConnectorBase.in_flight_asset_balances(), with a fixed fee
+    asset_balances = {}
+    for order in [o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)]:
+        if order.trade_type is TradeType.BUY:
+            outstanding_value = (order.amount * order.price - order.executed_amount_quote) * (Decimal(1) + FEE_PCT)
+            asset_balances[order.quote_asset] = asset_balances.get(order.quote_asset, s_decimal_0) + outstanding_value
+        else:
+            outstanding_value = order.amount - order.executed_amount_base
+            asset_balances[order.base_asset] = asset_balances.get(order.base_asset, s_decimal_0) + outstanding_value
+    return asset_balances
+
+
+def order_filled_balances(events: List[OrderFilledEvent], starting_timestamp: float = 0) -> Dict[str, Decimal]:
+    # Same math as ConnectorBase.order_filled_balances(), over a list of events
+    balances = {}
+    for event in [e for e in events if e.timestamp > starting_timestamp]:
+        base, quote = event.trading_pair.split("-")
+        sign = Decimal(1) if event.trade_type is TradeType.BUY else Decimal(-1)
+        balances[base] = balances.get(base, s_decimal_0) + sign * event.amount
+        balances[quote] = balances.get(quote, s_decimal_0) - sign * event.price * event.amount
+    return balances
+
+
+class BalanceLedgerUnitTest(unittest.TestCase):
+    def test_fills_before_and_after_window(self):
+        ledger = BalanceLedger(in_flight_asset_balances)
+        fills = [
+            OrderFilledEvent(10, "1", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal(2), Decimal(5), TradeFee(0)),
+            OrderFilledEvent(20, "2", "HBOT-USDT", TradeType.SELL, OrderType.LIMIT, Decimal(3), Decimal(1), TradeFee(0)),
+            # Out of order fill
+            OrderFilledEvent(15, "3", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal(1), Decimal(1), TradeFee(0)),
+        ]
+        for fill in fills:
+            ledger(fill)
+
+        self.assertEqual(Decimal(5), ledger.filled_balance("HBOT"))
+        self.assertEqual(Decimal(-8), ledger.filled_balance("USDT"))
+        self.assertEqual(Decimal(0), ledger.filled_balance("HBOT", 12))
+        self.assertEqual(Decimal(2), ledger.filled_balance("USDT", 12))
+        self.assertEqual(Decimal(3), ledger.filled_balance("USDT", 15))
+        self.assertEqual(Decimal(0), ledger.filled_balance("USDT", 20))
+        self.assertEqual(Decimal(0), ledger.filled_balance("ETH", 20))
+
+    def test_fills_not_recorded(self):
+        ledger = BalanceLedger(in_flight_asset_balances)
+        ledger.record_fills = False
+        for i in range(1, 11):
+            ledger(OrderFilledEvent(i, str(i), "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal(2), Decimal(1),
+                                    TradeFee(0)))
+
+        # The totals are still kept, the fills themselves are not
+        self.assertEqual(Decimal(10), ledger.filled_balance("HBOT"))
+        self.assertEqual(Decimal(-20), ledger.filled_balance("USDT"))
+        self.assertEqual(Decimal(0), ledger.filled_balance("HBOT", 5))
+
+        ledger.record_fills = True
+        ledger(OrderFilledEvent(11, "11", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal(2), Decimal(1),
+                                TradeFee(0)))
+        self.assertEqual(Decimal(11), ledger.filled_balance("HBOT"))
+        self.assertEqual(Decimal(1), ledger.filled_balance("HBOT", 5))
+
+    def test_ledger_matches_full_recomputation(self):
+        for seed in range(20):
+            self.check_random_session(random.Random(seed), steps=500)
+
+    def check_random_session(self, rng: random.Random, steps: int):
+        ledger = BalanceLedger(in_flight_asset_balances)
+        orders: Dict[str, LedgerTestOrder] = {}
+        snapshot: Dict[str, LedgerTestOrder] = {}
+        snapshot_timestamp: float = 0.0
+        fills: List[OrderFilledEvent] = []
+        timestamp: float = 1000.0
+        assets = {asset for trading_pair in TRADING_PAIRS for asset in trading_pair.split("-")}
+
+        for step in range(steps):
+            timestamp += rng.choice([0, 0.5, 1])
+            action: float = rng.random()
+            open_orders = [o for o in orders.values() if not (o.is_done or o.is_cancelled)]
+            if action < 0.3:
+                # A new order is tracked before its created event comes in
+                order_id = f"order_{step}"
+                orders[order_id] = LedgerTestOrder(order_id, None, rng.choice(TRADING_PAIRS), OrderType.LIMIT,
+                                                   rng.choice([TradeType.BUY, TradeType.SELL]),
+                                                   Decimal(rng.randint(1, 1000)) / 100,
+                                                   Decimal(rng.randint(1, 100)) / 10, "open")
+            elif action < 0.6 and open_orders:
+                order = rng.choice(open_orders)
+                amount = min(order.amount - order.executed_amount_base, Decimal(rng.randint(1, 50)) / 10)
+                order.executed_amount_base += amount
+                order.executed_amount_quote += amount * order.price
+                if order.executed_amount_base == order.amount:
+                    order.last_state = "filled"
+                # Fills may come in slightly out of order
+                fill = OrderFilledEvent(timestamp - rng.choice([0, 0, 0, 1]), order.client_order_id,
+                                        order.trading_pair, order.trade_type, order.order_type, order.price,
+                                        amount, TradeFee(0))
+                fills.append(fill)
+                ledger(fill)
+            elif action < 0.7 and open_orders:
+                order = rng.choice(open_orders)
+                order.last_state = "cancelled"
+                ledger(OrderCancelledEvent(timestamp, order.client_order_id))
+            elif action < 0.8:
+                for order_id in [o.client_order_id for o in orders.values() if o.is_done or o.is_cancelled]:
+                    del orders[order_id]
+            elif action < 0.9:
+                snapshot = {k: copy.copy(v) for k, v in orders.items()}
+                snapshot_timestamp = timestamp
+
+            expected_in_flight = in_flight_asset_balances(orders)
+            expected_snapshot = in_flight_asset_balances(snapshot)
+            expected_filled = order_filled_balances(fills, snapshot_timestamp)
+            expected_total_filled = order_filled_balances(fills)
+            for asset in assets:
+                self.assertEqual(expected_in_flight.get(asset, s_decimal_0), ledger.in_flight_balance(orders, asset))
+                self.assertEqual(expected_snapshot.get(asset, s_decimal_0), ledger.snapshot_balance(snapshot, asset))
+                self.assertEqual(expected_filled.get(asset, s_decimal_0),
+                                 ledger.filled_balance(asset, snapshot_timestamp))
+                self.assertEqual(expected_total_filled.get(asset, s_decimal_0), ledger.filled_balance(asset))
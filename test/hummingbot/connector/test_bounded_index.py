@@ -0,0 +1,47 @@
+import unittest
+from collections import namedtuple
+
+from hummingbot.connector.bounded_index import BoundedIndex
+
+# Same fields as hummingbot.connector.utils.TradeFillOrderDetails, which can't be imported without zero_ex
+TradeFillOrderDetails = namedtuple("TradeFillOrderDetails", "market exchange_trade_id symbol")
+
+
+class BoundedIndexUnitTest(unittest.TestCase):
+    def test_trade_fills(self):
+        index = BoundedIndex()
+        index.update({TradeFillOrderDetails("binance", str(i), "HBOT-USDT") for i in range(3)})
+
+        self.assertEqual(3, len(index))
+        self.assertIn(TradeFillOrderDetails("binance", "1", "HBOT-USDT"), index)
+        self.assertNotIn(TradeFillOrderDetails("binance", "1", "HBOT-ETH"), index)
+        self.assertNotIn(TradeFillOrderDetails("binance", "3", "HBOT-USDT"), index)
+
+    def test_exchange_order_ids(self):
+        index = BoundedIndex()
+        index.update({"100": "buy-HBOT-USDT-1", "101": "sell-HBOT-USDT-2"})
+
+        self.assertIn("100", index)
+        self.assertNotIn("102", index)
+        self.assertEqual("sell-HBOT-USDT-2", index["101"])
+        self.assertEqual("sell-HBOT-USDT-2", index.get("101"))
+        self.assertEqual("none", index.get("102", "none"))
+        self.assertEqual(["100", "101"], list(index.keys()))
+
+    def test_oldest_entries_are_dropped(self):
+        index = BoundedIndex(max_entries=3)
+        index.update({"1": "a", "2": "b", "3": "c"})
+        # Adding a key again makes it the newest
+        index.add("1", "a")
+        index.update({"4": "d"})
+
+        self.assertEqual(3, len(index))
+        self.assertEqual(["3", "1", "4"], list(index))
+        self.assertNotIn("2", index)
+
+        index.update(str(i) for i in range(10, 20))
+        self.assertEqual(["17", "18", "19"], list(index))
+        self.assertIsNone(index.get("19", "missing"))
+
+        index.clear()
+        self.assertEqual(0, len(index))
@@ -0,0 +1,137 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler, RateLimitWindow
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.fixed_rate_api_throttler import FixedRateThrottler
+
+TEST_PATH_URL = "/hummingbot"
+OTHER_PATH_URL = "/other"
+GLOBAL_LIMIT = "global"
+
+
+class AsyncThrottlerUnitTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    async def execute_requests(self, throttler: AsyncThrottler, path_url: str, n: int, executed: List[float]):
+        for _ in range(n):
+            async with throttler.execute_task(path_url=path_url):
+                executed.append(time.monotonic())
+
+    def test_rate_limit_window_running_weight(self):
+        window = RateLimitWindow(RateLimit(limit=5, time_interval=1.0, path_url=TEST_PATH_URL),
+                                 period_safety_margin=0.0)
+        window.add(10.0, 2)
+        window.add(10.5, 2)
+        self.assertEqual(4, window.used_weight)
+        self.assertTrue(window.has_capacity(1))
+        self.assertFalse(window.has_capacity(2))
+        self.assertAlmostEqual(0.8, window.time_until_capacity(2, 10.2))
+
+        window.flush(11.0)
+        self.assertEqual(2, window.used_weight)
+        window.flush(11.5)
+        self.assertEqual(0, window.used_weight)
+
+    def test_requests_within_capacity_do_not_wait(self):
+        throttler = AsyncThrottler([RateLimit(limit=10, time_interval=5.0, path_url=TEST_PATH_URL, weight=2)])
+        executed: List[float] = []
+        start: float = time.monotonic()
+        self.ev_loop.run_until_complete(self.execute_requests(throttler, TEST_PATH_URL, 5, executed))
+
+        self.assertEqual(5, len(executed))
+        self.assertLess(executed[-1] - start, 0.1)
+        self.assertEqual(10, throttler.used_weight(TEST_PATH_URL))
+
+    def test_waiter_woken_when_capacity_frees(self):
+        throttler = AsyncThrottler([RateLimit(limit=2, time_interval=0.5, path_url=TEST_PATH_URL)],
+                                   period_safety_margin=0.0)
+        executed: List[float] = []
+        start: float = time.monotonic()
+        self.ev_loop.run_until_complete(self.execute_requests(throttler, TEST_PATH_URL, 3, executed))
+
+        self.assertEqual(3, len(executed))
+        # The third request goes through as soon as the first one leaves the window, not on a polling interval
+        self.assertGreaterEqual(executed[2] - start, 0.5)
+        self.assertLess(executed[2] - start, 0.6)
+
+    def test_waiters_are_served_in_order(self):
+        throttler = AsyncThrottler([RateLimit(limit=1, time_interval=0.1, path_url=TEST_PATH_URL)],
+                                   period_safety_margin=0.0)
+        order: List[int] = []
+
+        async def request(i: int):
+            async with throttler.execute_task(path_url=TEST_PATH_URL):
+                order.append(i)
+
+        self.ev_loop.run_until_complete(asyncio.gather(*[request(i) for i in range(5)]))
+        self.assertEqual(list(range(5)), order)
+
+    def test_cancelled_waiter_does_not_block_queue(self):
+        throttler = AsyncThrottler([RateLimit(limit=1, time_interval=0.3, path_url=TEST_PATH_URL)],
+                                   period_safety_margin=0.0)
+        self.ev_loop.run_until_complete(throttler.acquire(TEST_PATH_URL))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(asyncio.wait_for(throttler.acquire(TEST_PATH_URL), 0.1))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(throttler.acquire(TEST_PATH_URL), 0.5))
+        self.assertEqual(0, len(throttler._waiters[TEST_PATH_URL]))
+
+    def test_linked_limits(self):
+        rate_limits = [
+            RateLimit(limit=3, time_interval=60, path_url=GLOBAL_LIMIT),
+            RateLimit(limit=10, time_interval=60, path_url=TEST_PATH_URL,
+                      linked_limits=[LinkedLimitWeightPair(GLOBAL_LIMIT, 1)]),
+            RateLimit(limit=10, time_interval=60, path_url=OTHER_PATH_URL,
+                      linked_limits=[LinkedLimitWeightPair(GLOBAL_LIMIT, 2)]),
+        ]
+        throttler = AsyncThrottler(rate_limits)
+        executed: List[float] = []
+
+        self.ev_loop.run_until_complete(self.execute_requests(throttler, OTHER_PATH_URL, 1, executed))
+        self.ev_loop.run_until_complete(self.execute_requests(throttler, TEST_PATH_URL, 1, executed))
+        self.assertEqual(3, throttler.used_weight(GLOBAL_LIMIT))
+
+        # The global pool is full, even though TEST_PATH_URL's own limit is not.
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.execute_requests(throttler, TEST_PATH_URL, 1, executed), 0.2)
+            )
+        self.assertEqual(2, len(executed))
+        self.assertEqual(1, throttler.used_weight(TEST_PATH_URL))
+
+    def test_invalid_rate_limits(self):
+        with self.assertRaises(ValueError):
+            AsyncThrottler([RateLimit(limit=1, time_interval=1, path_url=TEST_PATH_URL, weight=2)])
+        with self.assertRaises(ValueError):
+            AsyncThrottler([RateLimit(limit=10, time_interval=1, path_url=TEST_PATH_URL,
+                                      linked_limits=[LinkedLimitWeightPair(GLOBAL_LIMIT)])])
+
+    def test_throttlers_do_not_share_lock(self):
+        full_throttler = FixedRateThrottler([RateLimit(limit=1, time_interval=60)], retry_interval=0.05)
+        free_throttler = FixedRateThrottler([RateLimit(limit=10, time_interval=60)], retry_interval=0.05)
+
+        async def blocked_request():
+            async with full_throttler.execute_task():
+                pass
+
+        self.ev_loop.run_until_complete(blocked_request())
+        blocked_task = self.ev_loop.create_task(blocked_request())
+        try:
+            # The second request of the full throttler holds its lock while waiting for capacity.
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+            async def free_request():
+                async with free_throttler.execute_task():
+                    pass
+
+            self.ev_loop.run_until_complete(asyncio.wait_for(free_request(), 0.5))
+        finally:
+            blocked_task.cancel()
+            self.ev_loop.run_until_complete(asyncio.sleep(0))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+import unittest
+from collections import namedtuple
+
+import numpy as np
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.event.events import TradeType
+
+FillEvent = namedtuple("FillEvent", "timestamp trade_type price amount")
+
+
+class CompositeOrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(0)
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_numpy_snapshot(
+            np.column_stack([99.95 - np.arange(100) * 0.05, rng.uniform(0.1, 2, 100), np.ones(100)]),
+            np.column_stack([100.05 + np.arange(100) * 0.05, rng.uniform(0.1, 2, 100), np.ones(100)]))
+        self.volumes = list(rng.uniform(0, 120, 20)) + [0, 1e6]
+
+    def query_all(self):
+        return [(r.result_price, r.result_volume)
+                for is_buy in (True, False)
+                for r in [self.order_book.get_price_for_volume(is_buy, v) for v in self.volumes] +
+                         [self.order_book.get_volume_for_price(is_buy, p) for p in (95.0, 100.0, 105.0)]]
+
+    def assert_index_matches_book_walk(self):
+        walked = self.query_all()
+        self.order_book.depth_index_enabled = True
+        indexed = self.query_all()
+        self.order_book.depth_index_enabled = False
+        np.testing.assert_allclose(np.array(walked), np.array(indexed), rtol=1e-9)
+
+    def test_depth_index_follows_traded_order_book(self):
+        self.assert_index_matches_book_walk()
+        ask_index = self.order_book.depth_index(True)
+        # The index is kept until the composite entries change
+        self.assertIs(ask_index, self.order_book.depth_index(True))
+
+        self.order_book.record_filled_order(FillEvent(1, TradeType.BUY, 100.05, 5.0))
+        self.order_book.record_filled_order(FillEvent(1, TradeType.SELL, 99.95, 0.05))
+        self.assertIsNot(ask_index, self.order_book.depth_index(True))
+        self.assertEqual(100.1, self.order_book.depth_index(True).prices[0])
+        self.assert_index_matches_book_walk()
+
+        self.order_book.clear_traded_order_book()
+        self.assert_index_matches_book_walk()
+
+
+if __name__ == "__main__":
+    unittest.main()
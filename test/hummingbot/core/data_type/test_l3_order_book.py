@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.l3_order_book import L3OrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class L3OrderBookUnitTest(unittest.TestCase):
+    def test_level_amounts(self):
+        book = L3OrderBook()
+        book.add_order("a", True, 100.0, 1.0)
+        book.add_order("b", True, 100.0, 2.0)
+        book.add_order("c", False, 101.0, 3.0)
+        self.assertEqual(3, len(book))
+        self.assertEqual(3.0, book.get_level_amount(True, 100.0))
+        self.assertEqual(3.0, book.get_level_amount(False, 101.0))
+        self.assertEqual(0.0, book.get_level_amount(False, 100.0))
+
+        self.assertTrue(book.reduce_order_amount("a", 0.25))
+        self.assertTrue(book.set_order_amount("b", 1.5))
+        self.assertEqual(2.25, book.get_level_amount(True, 100.0))
+        self.assertEqual((True, 100.0, 0.75), book.get_order("a"))
+
+        self.assertTrue(book.remove_order("a"))
+        self.assertTrue(book.remove_order("b"))
+        self.assertFalse(book.remove_order("b"))
+        self.assertFalse(book.reduce_order_amount("b", 1.0))
+        self.assertIsNone(book.get_order("b"))
+        self.assertEqual(0, book.bid_level_count)
+        self.assertEqual(1, book.ask_level_count)
+
+        # An order added again with the same id replaces the former one
+        book.add_order("c", True, 99.0, 1.0)
+        self.assertEqual(0, book.ask_level_count)
+        self.assertEqual(1.0, book.get_level_amount(True, 99.0))
+
+    def test_levels_reduced_to_zero(self):
+        book = L3OrderBook()
+        book.add_order("a", True, 100.0, 0.1)
+        book.add_order("b", True, 100.0, 0.2)
+        book.pop_level_updates(1.0, 1)
+        # 0.1 + 0.2 - 0.1 - 0.2 is not 0 in floating point, the level is emptied with its orders
+        self.assertTrue(book.reduce_order_amount("a", 0.1))
+        self.assertTrue(book.reduce_order_amount("b", 0.2))
+        self.assertEqual(0.0, book.get_level_amount(True, 100.0))
+        bids, _ = book.pop_level_updates(2.0, 2)
+        np.testing.assert_array_equal([[2.0, 100.0, 0.0, 2]], bids)
+
+        book.add_order("c", True, 100.0, 0.3)
+        self.assertEqual(0.3, book.get_level_amount(True, 100.0))
+        book.set_order_amount("c", 0.0)
+        self.assertTrue(book.set_order_amount("a", 0.7))
+        self.assertEqual(0.7, book.get_level_amount(True, 100.0))
+
+    def test_level_updates(self):
+        book = L3OrderBook()
+        book.add_order("a", True, 100.0, 1.0)
+        book.add_order("b", True, 100.0, 2.0)
+        book.add_order("c", False, 101.0, 3.0)
+        bids, asks = book.pop_level_updates(1.0, 5)
+        np.testing.assert_array_equal([[1.0, 100.0, 3.0, 5]], bids)
+        np.testing.assert_array_equal([[1.0, 101.0, 3.0, 5]], asks)
+
+        bids, asks = book.pop_level_updates(2.0, 6)
+        self.assertEqual((0, 4), bids.shape)
+        self.assertEqual((0, 4), asks.shape)
+
+        book.remove_order("c")
+        bids, asks = book.pop_level_updates(3.0, 7)
+        self.assertEqual((0, 4), bids.shape)
+        np.testing.assert_array_equal([[3.0, 101.0, 0.0, 7]], asks)
+
+    def test_apply_to_order_book(self):
+        book = L3OrderBook()
+        order_book = OrderBook()
+        for i in range(10):
+            book.add_order(f"bid_{i}", True, 100.0 - i % 5, 1.0)
+            book.add_order(f"ask_{i}", False, 101.0 + i % 5, 1.0)
+        book.apply_snapshot(order_book, 1)
+        self.assertEqual(5, len(order_book.snapshot_arrays()[0]))
+        self.assertEqual(2.0, order_book.get_volume_for_price(False, 100.0).result_volume)
+
+        # Several orders changed, applied as one diff
+        book.remove_order("bid_0")
+        book.remove_order("bid_5")
+        book.reduce_order_amount("bid_1", 0.5)
+        book.add_order("ask_10", False, 100.5, 1.0)
+        book.apply_level_updates(order_book, 2)
+        bids, asks = order_book.snapshot_arrays()
+        self.assertEqual([99.0, 98.0, 97.0, 96.0], list(bids[:, 0]))
+        self.assertEqual(1.5, bids[0, 1])
+        self.assertEqual(100.5, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
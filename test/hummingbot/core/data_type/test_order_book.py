@@ -3,6 +3,11 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_entries_to_np_array,
+)
 import numpy as np
 
 
@@ -50,6 +55,118 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_numpy_diffs_with_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.array([[1.5, 2, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(3, order_book.last_diff_uid)
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.float64), 7)
+        self.assertEqual(7, order_book.last_diff_uid)
+        self.assertEqual([1.5, 1.], [row.price for row in order_book.bid_entries()])
+
+    def test_apply_np_array_messages_matches_row_messages(self):
+        snapshot_content = {"trading_pair": "COINALPHA-HBOT", "update_id": 10,
+                            "bids": [["0.98", "3"], ["0.99", "2"]],
+                            "asks": [["1.01", "1"], ["1.02", "4"]]}
+        diff_contents = [{"trading_pair": "COINALPHA-HBOT", "update_id": 11,
+                          "bids": [["0.99", "0"], ["1.00", "1.5"]],
+                          "asks": [["1.03", "2"]]},
+                         {"trading_pair": "COINALPHA-HBOT", "update_id": 12,
+                          "bids": [],
+                          "asks": [["1.01", "0"], ["1.00", "0.5"]]}]
+
+        rows_book = OrderBook()
+        arrays_book = OrderBook()
+        rows_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot_content))
+        arrays_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            **snapshot_content,
+            "bids": order_book_entries_to_np_array(snapshot_content["bids"], 10),
+            "asks": order_book_entries_to_np_array(snapshot_content["asks"], 10),
+        }))
+        for content in diff_contents:
+            rows_message = OrderBookMessage(OrderBookMessageType.DIFF, content)
+            arrays_message = OrderBookMessage(OrderBookMessageType.DIFF, {
+                **content,
+                "bids": order_book_entries_to_np_array(content["bids"], content["update_id"]),
+                "asks": order_book_entries_to_np_array(content["asks"], content["update_id"]),
+            })
+            self.assertFalse(rows_message.has_np_arrays)
+            self.assertTrue(arrays_message.has_np_arrays)
+            rows_book.apply_diff_message(rows_message)
+            arrays_book.apply_diff_message(arrays_message)
+
+        self.assertEqual(list(rows_book.bid_entries()), list(arrays_book.bid_entries()))
+        self.assertEqual(list(rows_book.ask_entries()), list(arrays_book.ask_entries()))
+        self.assertEqual(rows_book.get_price(True), arrays_book.get_price(True))
+        self.assertEqual(rows_book.get_price(False), arrays_book.get_price(False))
+        self.assertEqual(12, arrays_book.last_diff_uid)
+
+    def test_snapshot_arrays(self):
+        order_book = OrderBook()
+        bids, asks = order_book.snapshot_arrays()
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+        order_book.apply_numpy_snapshot(np.array([[0.98, 3, 1], [0.99, 2, 2], [0.97, 1, 3]], dtype=np.float64),
+                                        np.array([[1.02, 4, 1], [1.01, 1, 2]], dtype=np.float64))
+        bids, asks = order_book.snapshot_arrays()
+        self.assertEqual([list(row) for row in order_book.bid_entries()], bids.tolist())
+        self.assertEqual([list(row) for row in order_book.ask_entries()], asks.tolist())
+
+        bids, asks = order_book.snapshot_arrays(depth=2)
+        self.assertEqual([[0.99, 2, 2], [0.98, 3, 1]], bids.tolist())
+        self.assertEqual([[1.01, 1, 2], [1.02, 4, 1]], asks.tolist())
+        bids_df, asks_df = order_book.snapshot_frames(depth=1)
+        self.assertEqual([0.99], list(bids_df.price))
+        self.assertEqual([1.01], list(asks_df.price))
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(["price", "amount", "update_id"], list(bids_df.columns))
+        self.assertEqual(3, len(bids_df))
+
+    def test_depth_index_matches_book_walk(self):
+        rng = np.random.RandomState(0)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.column_stack([99.95 - np.arange(200) * 0.05, rng.uniform(0.1, 2, 200), np.ones(200)]),
+            np.column_stack([100.05 + np.arange(200) * 0.05, rng.uniform(0.1, 2, 200), np.ones(200)]))
+        volumes = list(rng.uniform(0, 250, 50)) + [0, 1e6]
+        prices = list(rng.uniform(85, 115, 50)) + [0, 1e6]
+
+        def query_all():
+            results = []
+            for is_buy in (True, False):
+                for volume in volumes:
+                    results.append(order_book.get_price_for_volume(is_buy, volume))
+                    results.append(order_book.get_price_for_quote_volume(is_buy, volume * 100))
+                    results.append(order_book.get_quote_volume_for_base_amount(is_buy, volume))
+                    if volume > 0:
+                        results.append(order_book.get_vwap_for_volume(is_buy, volume))
+                for price in prices:
+                    results.append(order_book.get_volume_for_price(is_buy, price))
+                    results.append(order_book.get_quote_volume_for_price(is_buy, price))
+            return [(r.query_price, r.query_volume, r.result_price, r.result_volume) for r in results]
+
+        for _ in range(2):
+            walked = query_all()
+            order_book.depth_index_enabled = True
+            indexed = query_all()
+            order_book.depth_index_enabled = False
+            np.testing.assert_allclose(np.array(walked), np.array(indexed), rtol=1e-9)
+            # The index is rebuilt after the book changes
+            order_book.apply_numpy_diffs(np.array([[99.95, 0, 2], [99.97, 5, 2]], dtype=np.float64),
+                                         np.array([[100.1, 0, 2]], dtype=np.float64))
+
+        for is_buy in (True, False):
+            np.testing.assert_array_equal([order_book.get_price_for_volume(is_buy, v).result_price for v in volumes],
+                                          order_book.get_prices_for_volumes(is_buy, np.array(volumes)))
+            np.testing.assert_allclose([order_book.get_vwap_for_volume(is_buy, v).result_price for v in volumes[:-2]],
+                                       order_book.get_vwaps_for_volumes(is_buy, np.array(volumes[:-2])), rtol=1e-9)
+            np.testing.assert_allclose([order_book.get_volume_for_price(is_buy, p).result_volume for p in prices],
+                                       order_book.get_volumes_for_prices(is_buy, np.array(prices)), rtol=1e-9)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    coalesce_diff_messages,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from test.mock.mock_order_book_data_source import MockOrderBookDataSource
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.trading_pairs: List[str] = [f"COIN{i}-USDT" for i in range(20)]
+
+    def setUp(self):
+        super().setUp()
+        self.tracker = None
+
+    def tearDown(self):
+        if self.tracker is not None:
+            self.tracker.stop()
+        super().tearDown()
+
+    def start_tracker(self, data_source: MockOrderBookDataSource) -> OrderBookTracker:
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs)
+        self.tracker.start()
+        return self.tracker
+
+    def test_concurrent_init_order_books(self):
+        data_source = MockOrderBookDataSource(self.trading_pairs,
+                                              snapshot_latency=0.2,
+                                              snapshot_rate_limit=RateLimit(limit=100, time_interval=1))
+        tracker = self.start_tracker(data_source)
+
+        start: float = time.perf_counter()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), timeout=5))
+        elapsed: float = time.perf_counter() - start
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(set(self.trading_pairs), set(tracker.order_books.keys()))
+        self.assertEqual(set(self.trading_pairs), set(tracker.ready_trading_pairs))
+        # 20 snapshots with 0.2s latency each, at most 10 in flight at once
+        self.assertLess(elapsed, 2.0)
+
+    def test_concurrent_init_respects_rate_limit(self):
+        data_source = MockOrderBookDataSource(self.trading_pairs,
+                                              snapshot_rate_limit=RateLimit(limit=10, time_interval=60, weight=2))
+        tracker = self.start_tracker(data_source)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(1))
+
+        self.assertEqual(5, len(data_source.snapshot_requests))
+        self.assertEqual(5, len(tracker.ready_trading_pairs))
+        self.assertFalse(tracker.ready)
+
+    def test_trading_pair_ready_before_all_order_books(self):
+        blocked_pair: str = self.trading_pairs[0]
+        data_source = MockOrderBookDataSource(self.trading_pairs,
+                                              snapshot_rate_limit=RateLimit(limit=100, time_interval=1))
+        data_source.block_trading_pair(blocked_pair)
+        tracker = self.start_tracker(data_source)
+
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(tracker.wait_for_trading_pair(self.trading_pairs[1]), timeout=1)
+        )
+        self.assertTrue(tracker.is_trading_pair_ready(self.trading_pairs[1]))
+        self.assertFalse(tracker.is_trading_pair_ready(blocked_pair))
+        self.assertFalse(tracker.ready)
+
+        data_source.unblock_trading_pair(blocked_pair)
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker.wait_for_trading_pair(blocked_pair), timeout=1))
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(tracker.ready)
+
+    def test_diffs_received_before_snapshot_are_applied(self):
+        blocked_pair: str = self.trading_pairs[0]
+        data_source = MockOrderBookDataSource(self.trading_pairs,
+                                              snapshot_rate_limit=RateLimit(limit=100, time_interval=1))
+        data_source.block_trading_pair(blocked_pair)
+        tracker = self.start_tracker(data_source)
+
+        stale_diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": blocked_pair, "update_id": 0, "bids": [["1.0", "5.0"]], "asks": []
+        }, timestamp=time.time())
+        new_diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": blocked_pair, "update_id": 2, "bids": [["0.9", "1.0"]], "asks": [["1.1", "2.0"]]
+        }, timestamp=time.time())
+        data_source.diff_messages.put_nowait(stale_diff)
+        data_source.diff_messages.put_nowait(new_diff)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        data_source.unblock_trading_pair(blocked_pair)
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker.wait_for_trading_pair(blocked_pair), timeout=1))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        order_book = tracker.order_books[blocked_pair]
+        self.assertEqual([0.9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([1.1], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_untracked_trading_pairs_are_ignored(self):
+        data_source = MockOrderBookDataSource(self.trading_pairs,
+                                              snapshot_rate_limit=RateLimit(limit=100, time_interval=1))
+        tracker = self.start_tracker(data_source)
+        data_source.diff_messages.put_nowait(self.diff_message("UNTRACKED-USDT", 1, [["1.0", "5.0"]], []))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertFalse(tracker.is_trading_pair_ready("UNTRACKED-USDT"))
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(tracker.wait_for_trading_pair("UNTRACKED-USDT"))
+        self.assertEqual(set(self.trading_pairs), set(tracker._saved_message_queues.keys()))
+        self.assertEqual(set(self.trading_pairs), set(tracker._order_book_ready_events.keys()))
+
+    @staticmethod
+    def diff_message(trading_pair: str, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks
+        }, timestamp=time.time())
+
+    def test_coalesce_diff_messages(self):
+        diffs = [
+            self.diff_message("COIN0-USDT", 2, [["1.0", "5"], ["0.9", "1"]], [["1.2", "1"]]),
+            self.diff_message("COIN0-USDT", 3, [["1.0", "0"]], [["1.3", "2"]]),
+            self.diff_message("COIN0-USDT", 4, [["0.9", "3"]], [["1.2", "0"], ["1.3", "4"]]),
+        ]
+        merged = coalesce_diff_messages(diffs)
+
+        self.assertEqual(4, merged.update_id)
+        self.assertEqual(2, merged.first_update_id)
+        self.assertEqual([[0.9, 3, 4], [1.0, 0, 3]], merged.content["bids"].tolist())
+        self.assertEqual([[1.2, 0, 4], [1.3, 4, 4]], merged.content["asks"].tolist())
+
+        sequential_book = OrderBook()
+        merged_book = OrderBook()
+        for diff in diffs:
+            sequential_book.apply_diff_message(diff)
+        merged_book.apply_diff_message(merged)
+        self.assertEqual(list(sequential_book.bid_entries()), list(merged_book.bid_entries()))
+        self.assertEqual(list(sequential_book.ask_entries()), list(merged_book.ask_entries()))
+        self.assertEqual(sequential_book.last_diff_uid, merged_book.last_diff_uid)
+
+    def test_queued_diffs_are_coalesced(self):
+        trading_pair: str = self.trading_pairs[0]
+        data_source = MockOrderBookDataSource([trading_pair],
+                                              snapshot_rate_limit=RateLimit(limit=100, time_interval=1))
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=[trading_pair])
+        self.tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.tracker.wait_for_trading_pair(trading_pair), 1))
+
+        expected_book = OrderBook()
+        message_queue: asyncio.Queue = self.tracker._tracking_message_queues[trading_pair]
+        for update_id in range(2, 52):
+            diff = self.diff_message(trading_pair,
+                                     update_id,
+                                     [[str(1 - (update_id % 5) * 0.01), str(update_id % 3)]],
+                                     [[str(1.1 + (update_id % 7) * 0.01), str(update_id % 2)]])
+            expected_book.apply_diff_message(diff)
+            message_queue.put_nowait(diff)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        order_book = self.tracker.order_books[trading_pair]
+        metrics = self.tracker.diff_queue_metrics[trading_pair]
+        self.assertEqual(list(expected_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(expected_book.ask_entries()), list(order_book.ask_entries()))
+        self.assertEqual(51, order_book.last_diff_uid)
+        self.assertEqual(50, metrics.diff_messages)
+        self.assertEqual(1, metrics.diff_updates)
+        self.assertEqual(50, metrics.coalesce_ratio)
+        self.assertEqual(49, metrics.max_queue_depth)
+        self.assertEqual(self.tracker.PAST_DIFF_WINDOW_SIZE, len(self.tracker._past_diffs_windows[trading_pair]))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import json
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.websocket_message_parser import (
+    WebsocketMessageParser,
+    diff_message_extractor,
+    trade_message_extractor,
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils import json_decoder
+
+
+class WebsocketMessageParserUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.conversions = []
+
+        def convert(symbol: str) -> str:
+            self.conversions.append(symbol)
+            return f"{symbol[:-4]}-{symbol[-4:]}"
+
+        self.parser = WebsocketMessageParser(type_key="e")
+        self.parser.add_extractor("depthUpdate", diff_message_extractor(symbol_key="s",
+                                                                        update_id_key="u",
+                                                                        bids_key="b",
+                                                                        asks_key="a",
+                                                                        convert_trading_pair=convert,
+                                                                        first_update_id_key="U"))
+        self.parser.add_extractor("trade", trade_message_extractor(symbol_key="s",
+                                                                   trade_id_key="t",
+                                                                   price_key="p",
+                                                                   amount_key="q",
+                                                                   is_sell=lambda msg: msg["m"],
+                                                                   convert_trading_pair=convert,
+                                                                   timestamp_key="E"))
+
+    def test_diff_message(self):
+        raw_msg = json.dumps({"e": "depthUpdate", "E": 1600000000000, "s": "BTCUSDT", "U": 10, "u": 12,
+                              "b": [["100.5", "1.25"], ["100.0", "0"]], "a": []})
+        for _ in range(2):
+            message = self.parser.parse(raw_msg, timestamp=1600000000.5)
+            self.assertEqual(OrderBookMessageType.DIFF, message.type)
+            self.assertEqual("BTC-USDT", message.trading_pair)
+            self.assertEqual(10, message.first_update_id)
+            self.assertEqual(12, message.update_id)
+            self.assertEqual(1600000000.5, message.timestamp)
+            self.assertTrue(message.has_np_arrays)
+            np.testing.assert_array_equal([[100.5, 1.25, 12], [100.0, 0, 12]], message.content["bids"])
+            self.assertEqual((0, 3), message.content["asks"].shape)
+        # The trading pair of a symbol is converted once
+        self.assertEqual(["BTCUSDT"], self.conversions)
+
+    def test_trade_message(self):
+        message = self.parser.parse(json.dumps({"e": "trade", "E": 1600000000123, "s": "ETHUSDT", "t": 42,
+                                                "p": "3000.10", "q": "0.5", "m": True}))
+        self.assertEqual(OrderBookMessageType.TRADE, message.type)
+        self.assertEqual("ETH-USDT", message.trading_pair)
+        self.assertEqual(42, message.trade_id)
+        self.assertEqual(1600000000123, message.content["update_id"])
+        self.assertEqual(1600000000123 * 1e-3, message.timestamp)
+        self.assertEqual(float(TradeType.SELL.value), message.content["trade_type"])
+        self.assertEqual(3000.1, message.content["price"])
+        self.assertEqual(0.5, message.content["amount"])
+
+    def test_other_messages(self):
+        self.assertIsNone(self.parser.parse('{"result": null, "id": 1}'))
+        self.assertIsNone(self.parser.parse('[1, 2]'))
+
+    def test_json_decoders(self):
+        self.assertIn("json", json_decoder.available_json_decoders())
+        self.assertIn(json_decoder.json_decoder_name(), json_decoder.available_json_decoders())
+        name = json_decoder.json_decoder_name()
+        try:
+            json_decoder.set_json_decoder("json")
+            self.assertEqual({"a": [1, "2"]}, json_decoder.json_loads('{"a": [1, "2"]}'))
+            self.assertEqual("json", WebsocketMessageParser("e")._decoder.__module__)
+            with self.assertRaises(ValueError):
+                json_decoder.set_json_decoder("no_such_decoder")
+        finally:
+            json_decoder.set_json_decoder(name)
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+def fill(timestamp: float) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp, f"order_{timestamp}", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT,
+                            Decimal(1), Decimal(1), TradeFee(0))
+
+
+def cancel(timestamp: float) -> OrderCancelledEvent:
+    return OrderCancelledEvent(timestamp, f"order_{timestamp}")
+
+
+class EventLoggerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_iter_events(self):
+        event_logger = EventLogger()
+        events = [fill(1), cancel(2), fill(3), cancel(4), fill(5)]
+        for event in events:
+            event_logger(event)
+
+        self.assertEqual(events, list(event_logger.iter_events()))
+        self.assertEqual(events, event_logger.event_log)
+        self.assertEqual([events[0], events[2], events[4]], list(event_logger.iter_events(OrderFilledEvent)))
+        self.assertEqual([events[2], events[4]], list(event_logger.iter_events(OrderFilledEvent, 1)))
+        self.assertEqual(events[3:], list(event_logger.iter_events(since_timestamp=3)))
+        self.assertEqual([], list(event_logger.iter_events(BuyOrderCreatedEvent)))
+        self.assertEqual(3, event_logger.event_count(OrderFilledEvent))
+        self.assertEqual(5, event_logger.event_count())
+
+        event_logger.clear()
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual(0, event_logger.event_count(OrderFilledEvent))
+
+    def test_max_events_retention(self):
+        event_logger = EventLogger(max_events=3)
+        events = [fill(1), cancel(2), fill(3), cancel(4), fill(5)]
+        for event in events:
+            event_logger(event)
+
+        self.assertEqual(events[2:], event_logger.event_log)
+        self.assertEqual([events[2], events[4]], list(event_logger.iter_events(OrderFilledEvent)))
+        self.assertEqual([events[3]], list(event_logger.iter_events(OrderCancelledEvent)))
+
+    def test_max_age_retention(self):
+        event_logger = EventLogger(max_age=10)
+        events = [fill(100), cancel(105), fill(111), cancel(116)]
+        for event in events:
+            event_logger(event)
+
+        # The age is measured from the latest event, at 116
+        self.assertEqual(events[2:], event_logger.event_log)
+        self.assertEqual([events[2]], list(event_logger.iter_events(OrderFilledEvent)))
+
+    def test_wait_for_event_type(self):
+        event_logger = EventLogger()
+
+        async def log_events():
+            await asyncio.sleep(0.01)
+            event_logger(cancel(1))
+            event_logger(fill(2))
+            event_logger(fill(3))
+
+        fill_waiter = asyncio.ensure_future(event_logger.wait_for(OrderFilledEvent, 1))
+        cancel_waiter = asyncio.ensure_future(event_logger.wait_for(OrderCancelledEvent, 1))
+        self.ev_loop.run_until_complete(log_events())
+        self.assertEqual(fill(2), self.ev_loop.run_until_complete(fill_waiter))
+        self.assertEqual(cancel(1), self.ev_loop.run_until_complete(cancel_waiter))
+        self.assertEqual({}, event_logger._waiting)
+
+    def test_wait_for_timeout_removes_waiter(self):
+        event_logger = EventLogger()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(event_logger.wait_for(OrderFilledEvent, 0.01))
+        self.assertEqual({}, event_logger._waiting)
@@ -6,7 +6,7 @@ import asyncio
 
 from yarl import URL
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import find_rate, find_rate_pairs
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.mock_api.mock_web_server import MockWebServer
 from .fixture import Fixture
@@ -105,6 +105,68 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_pairs(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(["HBOT-USDT"], find_rate_pairs(prices, "HBOT-USDT"))
+        self.assertEqual([], find_rate_pairs(prices, "ZBOT-USDT"))
+        self.assertEqual(["HBOT-USDT"], find_rate_pairs(prices, "USDT-HBOT"))
+        self.assertEqual(["HBOT-USDT", "AAVE-USDT"], find_rate_pairs(prices, "HBOT-AAVE"))
+        self.assertEqual(["HBOT-USDT", "USDT-GBP"], find_rate_pairs(prices, "HBOT-GBP"))
+
+    def test_streamed_rate_changes(self):
+        self.ev_loop.run_until_complete(self._test_streamed_rate_changes())
+
+    async def _test_streamed_rate_changes(self):
+        oracle = RateOracle()
+        oracle._update_prices({"BTC-USDT": Decimal("40000"), "ETH-USDT": Decimal("3000"),
+                               "BTC-USD": Decimal("40001")})
+        oracle.subscribe(["ETH-BTC", "BTC-USD"])
+        # The rate of ETH-BTC is found from the prices of BTC-USDT and ETH-USDT, BTC-USD is polled from binance.us
+        self.assertEqual(["ETH-BTC", "BTC-USD"], oracle.subscriptions)
+        self.assertEqual({"BTC-USDT", "ETH-USDT"}, set(oracle.streamed_pairs))
+
+        waiter = asyncio.ensure_future(oracle.wait_for_rate_change("ETH-BTC"))
+        await asyncio.sleep(0)
+        # Only the amounts at the best prices changed
+        oracle._process_book_ticker({"u": 1, "s": "ETHUSDT", "b": "2999", "B": "1", "a": "3001", "A": "1"})
+        oracle._process_book_ticker({"u": 2, "s": "ETHUSDT", "b": "2999", "B": "2", "a": "3001", "A": "1"})
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        oracle._process_book_ticker({"u": 3, "s": "ETHUSDT", "b": "3999", "B": "2", "a": "4001", "A": "1"})
+        self.assertEqual(Decimal("0.1"), await asyncio.wait_for(waiter, 1))
+        self.assertEqual(Decimal("4000"), oracle.prices["ETH-USDT"])
+
+        oracle.unsubscribe(["ETH-BTC"])
+        self.assertEqual(["BTC-USD"], oracle.subscriptions)
+        self.assertEqual([], oracle.streamed_pairs)
+
+    def test_delisted_pairs_removed(self):
+        self.ev_loop.run_until_complete(self._test_delisted_pairs_removed())
+
+    async def _test_delisted_pairs_removed(self):
+        oracle = RateOracle()
+        oracle._update_prices({"BTC-USDT": Decimal("40000"), "ETH-USDT": Decimal("3000"),
+                               "LUNA-USDT": Decimal("80")})
+        oracle.subscribe(["ETH-BTC", "LUNA-BTC"])
+        self.assertEqual({"BTC-USDT", "ETH-USDT", "LUNA-USDT"}, set(oracle.streamed_pairs))
+
+        refreshed = {"BTC-USDT": Decimal("40000"), "ETH-USDT": Decimal("3000")}
+        # A refresh may miss the prices of a failed request, the pair is only dropped when missing again
+        oracle._update_prices(refreshed, removed=oracle._delisted_pairs(refreshed))
+        self.assertEqual(Decimal("80"), oracle.prices["LUNA-USDT"])
+        waiter = asyncio.ensure_future(oracle.wait_for_rate_change("LUNA-BTC"))
+        await asyncio.sleep(0)
+        oracle._update_prices(refreshed, removed=oracle._delisted_pairs(refreshed))
+        self.assertIsNone(await asyncio.wait_for(waiter, 1))
+        self.assertNotIn("LUNA-USDT", oracle.prices)
+        oracle._update_stream_pairs()
+        self.assertEqual({"BTC-USDT", "ETH-USDT"}, set(oracle.streamed_pairs))
+
+        # An empty refresh drops nothing
+        oracle._update_prices({}, removed=oracle._delisted_pairs({}))
+        oracle._update_prices({}, removed=oracle._delisted_pairs({}))
+        self.assertEqual(refreshed, oracle.prices)
+
     def test_get_binance_prices(self):
         self.ev_loop.run_until_complete(self._test_get_binance_prices())
 
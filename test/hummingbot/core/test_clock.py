@@ -2,14 +2,49 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from typing import List
 
 from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_mode import TickOverrunPolicy
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class SlowTimeIterator(PyTimeIterator):
+    def __init__(self, tick_durations: List[float] = None):
+        super().__init__()
+        self._tick_durations = tick_durations or []
+        self.tick_timestamps: List[float] = []
+
+    def tick(self, timestamp: float):
+        if len(self._tick_durations) > 0:
+            time.sleep(self._tick_durations.pop(0) if len(self._tick_durations) > 1 else self._tick_durations[0])
+        self.tick_timestamps.append(timestamp)
+
+
+class EventTimeIterator(PyTimeIterator):
+    def __init__(self, event_times: List[float]):
+        super().__init__()
+        self._event_times = event_times
+        self._next_event: int = 0
+        self.tick_timestamps: List[float] = []
+        self.event_timestamps: List[float] = []
+
+    def tick(self, timestamp: float):
+        self.tick_timestamps.append(timestamp)
+        while self._next_event < len(self._event_times) and self._event_times[self._next_event] <= timestamp:
+            self._next_event += 1
+            self.event_timestamps.append(timestamp)
+
+    def next_wake_up_time(self, timestamp: float) -> float:
+        if self._next_event < len(self._event_times):
+            return self._event_times[self._next_event]
+        return float("inf")
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +159,103 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def run_realtime_clock(self, clock: Clock, duration: float):
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + duration))
+
+    def test_tick_stats(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        iterator = SlowTimeIterator()
+        clock.add_iterator(iterator)
+        self.run_realtime_clock(clock, 1.0)
+
+        stats = clock.tick_stats
+        self.assertGreaterEqual(len(iterator.tick_timestamps), 8)
+        # No tick is run twice, even if the event loop wakes up before the tick boundary.
+        self.assertEqual(len(set(iterator.tick_timestamps)), len(iterator.tick_timestamps))
+        self.assertEqual(len(iterator.tick_timestamps), stats.ticks)
+        self.assertEqual(stats.ticks, stats.iterator_durations["SlowTimeIterator"].count)
+        self.assertEqual(0, stats.overrun_ticks)
+        self.assertEqual(0, stats.skipped_ticks)
+        self.assertLess(stats.tick_lateness.mean, 0.05)
+        self.assertEqual(3, len(stats.summary_df()))
+
+    def test_overrun_skip(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, tick_overrun_policy=TickOverrunPolicy.SKIP)
+        iterator = SlowTimeIterator([0.25])
+        clock.add_iterator(iterator)
+        self.run_realtime_clock(clock, 1.0)
+
+        stats = clock.tick_stats
+        timestamps: List[float] = iterator.tick_timestamps
+        self.assertGreater(stats.overrun_ticks, 0)
+        self.assertGreater(stats.skipped_ticks, 0)
+        self.assertTrue(all(b - a > 0.25 for a, b in zip(timestamps, timestamps[1:])))
+        self.assertGreaterEqual(stats.tick_duration.max, 0.25)
+
+    def test_overrun_catch_up(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, tick_overrun_policy=TickOverrunPolicy.CATCH_UP)
+        iterator = SlowTimeIterator([0.35, 0.0])
+        clock.add_iterator(iterator)
+        self.run_realtime_clock(clock, 1.0)
+
+        stats = clock.tick_stats
+        timestamps: List[float] = iterator.tick_timestamps
+        self.assertEqual(0, stats.skipped_ticks)
+        self.assertGreaterEqual(stats.caught_up_ticks, 3)
+        # Every tick boundary is run, even the ones that passed during the slow tick.
+        self.assertTrue(all(abs(b - a - 0.1) < 1e-6 for a, b in zip(timestamps, timestamps[1:])))
+
+    def test_overrun_degrade(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, tick_overrun_policy=TickOverrunPolicy.DEGRADE)
+        slow_iterator = SlowTimeIterator([0.15])
+        low_priority_iterator = SlowTimeIterator()
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(low_priority_iterator, low_priority=True)
+        self.run_realtime_clock(clock, 1.0)
+
+        stats = clock.tick_stats
+        self.assertGreater(stats.degraded_ticks, 0)
+        self.assertEqual(len(slow_iterator.tick_timestamps) - stats.degraded_ticks,
+                         len(low_priority_iterator.tick_timestamps))
+        self.assertEqual({"SlowTimeIterator", "SlowTimeIterator #2"}, set(stats.iterator_durations.keys()))
+
+    def test_fast_forward_backtest(self):
+        event_times: List[float] = [self.backtest_start_timestamp + offset for offset in (0.5, 1, 30, 30.2, 1800.7, 3599)]
+        results: List[List[float]] = []
+        for fast_forward in (False, True):
+            clock = Clock(ClockMode.BACKTEST, 0.1, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                          fast_forward=fast_forward)
+            iterator = EventTimeIterator(event_times)
+            clock.add_iterator(iterator)
+            clock.backtest()
+            results.append(iterator.event_timestamps + [clock.current_timestamp])
+            if fast_forward:
+                self.assertEqual(7, len(iterator.tick_timestamps))
+
+        self.assertEqual(results[0], results[1])
+        self.assertGreaterEqual(results[1][-1], self.backtest_end_timestamp)
+
+    def test_fast_forward_needs_every_iterator(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        iterator = EventTimeIterator([])
+        time_iterator = TimeIterator()
+        clock.add_iterator(iterator)
+        clock.add_iterator(time_iterator)
+        clock.backtest_til(self.backtest_start_timestamp + 100)
+        # TimeIterator does not declare its wake up time, so every tick is run.
+        self.assertEqual(100, len(iterator.tick_timestamps))
+
+    def test_schedule_wake_up(self):
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp,
+                      fast_forward=True)
+        iterator = EventTimeIterator([])
+        clock.add_iterator(iterator)
+        clock.schedule_wake_up(self.backtest_start_timestamp + 10.5)
+        clock.schedule_wake_up(self.backtest_start_timestamp + 20)
+        clock.backtest()
+        self.assertEqual([self.backtest_start_timestamp + 11,
+                          self.backtest_start_timestamp + 20,
+                          self.backtest_end_timestamp], iterator.tick_timestamps)
@@ -1,6 +1,9 @@
+import logging
+import time
 import unittest
 import gc
 import weakref
+from typing import List
 
 from hummingbot.core.pubsub import PubSub
 
@@ -89,6 +92,61 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_collect(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_one, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_one)))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self.listener_one.events_count)
+
+    def test_remove_listener_during_trigger_event(self):
+        pubsub = self.pubsub
+        event_tag = self.event_tag_zero
+        listener_one = self.listener_one
+
+        class RemovingListener(MockEventListener):
+            def __call__(self, event):
+                super().__call__(event)
+                pubsub.remove_listener(event_tag, self)
+                pubsub.remove_listener(event_tag, listener_one)
+
+        removing_listener = RemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        # Listeners removed while an event is dispatched still receive that event, but not the next ones.
+        self.assertEqual(1, removing_listener.events_count)
+        self.assertEqual(1, self.listener_one.events_count)
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self.listener_one.events_count)
+
+    def test_trigger_event_dispatch_benchmark(self):
+        listeners: List[MockEventListener] = [MockEventListener() for _ in range(10)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+        # Listeners of other event tags do not slow down the dispatch.
+        other_listeners: List[MockEventListener] = [MockEventListener() for _ in range(1000)]
+        for listener in other_listeners:
+            self.pubsub.add_listener(self.event_tag_one, listener)
+
+        events_count: int = 100000
+        start: float = time.perf_counter()
+        for _ in range(events_count):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        elapsed: float = time.perf_counter() - start
+        logging.getLogger(__name__).info(f"PubSub dispatch: {events_count / elapsed:,.0f} events/s, "
+                                         f"{elapsed / events_count / len(listeners) * 1e9:.0f} ns per listener call")
+
+        self.assertTrue(all(listener.events_count == events_count for listener in listeners))
+        self.assertTrue(all(listener.events_count == 0 for listener in other_listeners))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest.mock
+
+import aiohttp
+
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.utils.http_client_registry import (
+    HttpClientRegistry,
+    shared_client_session,
+)
+
+
+class HttpClientRegistryUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.web_app: MockWebServer = MockWebServer.get_instance()
+        cls.host = "www.hummingbot-test.com"
+        cls.web_app.add_host_to_mock(cls.host)
+        cls.web_app.start()
+        cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
+        cls._patcher = unittest.mock.patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = MockWebServer.reroute_local
+        cls.web_app.update_response("get", cls.host, "/ping", data={"pong": True})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.web_app.stop()
+        cls._patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.registry = HttpClientRegistry()
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.registry.close())
+        super().tearDown()
+
+    async def get_ping(self, n: int):
+        for _ in range(n):
+            async with self.registry.client().get(f"http://{self.host}/ping") as response:
+                self.assertEqual({"pong": True}, await response.json())
+
+    async def get_client(self) -> aiohttp.ClientSession:
+        return self.registry.client()
+
+    def test_connections_are_reused(self):
+        self.ev_loop.run_until_complete(self.get_ping(10))
+
+        metrics = self.registry.metrics[MockWebServer.host]
+        self.assertEqual(10, metrics.requests)
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(9, metrics.connections_reused)
+        self.assertAlmostEqual(0.9, metrics.reuse_ratio)
+        self.assertEqual(1, len(self.registry.metrics_df()))
+
+    def test_one_session_per_event_loop(self):
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.assertIs(client, self.ev_loop.run_until_complete(self.get_client()))
+
+        other_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            other_client: aiohttp.ClientSession = other_loop.run_until_complete(self.get_client())
+            self.assertIsNot(client, other_client)
+            other_loop.run_until_complete(other_client.close())
+        finally:
+            other_loop.close()
+
+        # A closed session is replaced on the next call
+        self.ev_loop.run_until_complete(client.close())
+        self.assertIsNot(client, self.ev_loop.run_until_complete(self.get_client()))
+
+    def test_configure_limits(self):
+        self.registry.configure(limit=7, limit_per_host=3)
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.assertEqual(7, client.connector.limit)
+        self.assertEqual(3, client.connector.limit_per_host)
+
+    def test_shared_client_session_stays_open(self):
+        async def use_shared_client() -> aiohttp.ClientSession:
+            async with shared_client_session() as client:
+                return client
+
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(use_shared_client())
+        self.assertFalse(client.closed)
+        self.assertIs(client, self.ev_loop.run_until_complete(use_shared_client()))
+        self.ev_loop.run_until_complete(HttpClientRegistry.shared_instance().close())
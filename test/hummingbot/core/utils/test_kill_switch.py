@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch,
+)
+
+from hummingbot.client.performance_accumulator import PerformanceAggregates
+from hummingbot.core.utils.kill_switch import KillSwitch
+
+
+class KillSwitchUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.connector = MagicMock()
+        self.connector.display_name = "binance_perpetual"
+        self.connector.ready = True
+        self.connector.order_books = {}
+        self.connector.get_balance.return_value = Decimal("100")
+        self.app = MagicMock()
+        self.app.markets = {"binance_perpetual": self.connector}
+        self.app.init_time = 1000.0
+        self.app.calculate_profitability = AsyncMock(return_value=Decimal("0.01"))
+        self.performance_tracker = MagicMock()
+        self.performance_tracker.markets.return_value = [("binance_perpetual", "ETH-USDT")]
+        self.performance_tracker.aggregates.return_value = PerformanceAggregates()
+        self.app.get_performance_tracker.return_value = self.performance_tracker
+        self.kill_switch = KillSwitch(self.app)
+
+    def run_one_check(self):
+        # Runs a single iteration of the loop, the sleep between checks ends it
+        with patch("hummingbot.core.utils.kill_switch.asyncio.sleep",
+                   new_callable=AsyncMock, side_effect=asyncio.CancelledError):
+            with self.assertRaises(asyncio.CancelledError):
+                self.ev_loop.run_until_complete(self.kill_switch.check_profitability_loop())
+
+    def test_seeded_positions_use_history_report(self):
+        self.performance_tracker.has_positions.return_value = True
+        self.kill_switch._profitability_tracker = self.kill_switch.create_profitability_tracker()
+
+        self.assertTrue(self.kill_switch._profitability_tracker.has_positions)
+        self.performance_tracker.aggregates.assert_not_called()
+        self.run_one_check()
+        self.app.calculate_profitability.assert_awaited_once()
+
+    def test_seeded_spot_trades_use_tracker(self):
+        self.performance_tracker.has_positions.return_value = False
+        self.kill_switch._profitability_tracker = self.kill_switch.create_profitability_tracker()
+
+        self.assertFalse(self.kill_switch._profitability_tracker.has_positions)
+        self.assertEqual([("binance_perpetual", "ETH-USDT")], list(self.kill_switch._profitability_tracker.markets))
+        with patch.object(KillSwitch, "logger") as logger:
+            self.run_one_check()
+        logger.return_value.error.assert_not_called()
+        self.app.calculate_profitability.assert_not_awaited()
@@ -1,6 +1,9 @@
 from unittest import TestCase
 from mock import patch, MagicMock
 import asyncio
+import json
+import tempfile
+import time
 
 
 class TestTradingPairFetcher(TestCase):
@@ -12,6 +15,11 @@ class TestTradingPairFetcher(TestCase):
             else:
                 await asyncio.sleep(0)
 
+    @classmethod
+    async def wait_until_fetched(cls, tpf, exchange_name):
+        while not tpf.is_fetched(exchange_name):
+            await asyncio.sleep(0)
+
     class MockConnectorSetting(MagicMock):
         name = 'mockConnector'
 
@@ -22,11 +30,43 @@ class TestTradingPairFetcher(TestCase):
         async def fetch_trading_pairs(self, *args, **kwargs):
             return 'MOCK-HBOT'
 
+    class MockExpiredConnectorSetting(MagicMock):
+        name = 'mockExpired'
+
+        def base_name(self):
+            return 'mockExpired'
+
+    class MockListingConnectorDataSource(MagicMock):
+        async def fetch_trading_pairs(self, *args, **kwargs):
+            return ['CACHED-HBOT', 'LISTED-HBOT']
+
+    class MockListingConnectorDataSourceModule(MagicMock):
+        @property
+        def MockconnectorAPIOrderBookDataSource(self):
+            return TestTradingPairFetcher.MockListingConnectorDataSource()
+
     class MockConnectorDataSourceModule(MagicMock):
         @property
         def MockconnectorAPIOrderBookDataSource(self):
             return TestTradingPairFetcher.MockConnectorDataSource()
 
+        @property
+        def MockexpiredAPIOrderBookDataSource(self):
+            return TestTradingPairFetcher.MockConnectorDataSource()
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Keeps the trading pairs cache out of the data directory
+        self._data_dir = tempfile.TemporaryDirectory()
+        self._data_path_patcher = patch("hummingbot.core.utils.trading_pair_fetcher.data_path",
+                                        return_value=self._data_dir.name)
+        self._data_path_patcher.start()
+
+    def tearDown(self) -> None:
+        self._data_path_patcher.stop()
+        self._data_dir.cleanup()
+        super().tearDown()
+
     @classmethod
     def tearDownClass(cls) -> None:
         # Need to reset TradingPairFetcher module so next time it gets imported it works as expected
@@ -49,3 +89,94 @@ class TestTradingPairFetcher(TestCase):
             asyncio.get_event_loop().run_until_complete(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
             trading_pairs = trading_pair_fetcher.trading_pairs
             self.assertEqual(trading_pairs, {'mockConnector': 'MOCK-HBOT'})
+
+    def test_trading_pairs_from_cache(self):
+        from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+        with open(TradingPairFetcher.cache_path(), "w") as fd:
+            json.dump({"mockConnector": {"timestamp": time.time() - 60, "trading_pairs": ["CACHED-HBOT"]},
+                       "mockExpired": {"timestamp": time.time() - TradingPairFetcher.CACHE_TTL - 1,
+                                       "trading_pairs": ["EXPIRED-HBOT"]}}, fd)
+        with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS',
+                   {"mockConnector": self.MockConnectorSetting(),
+                    "mockExpired": self.MockExpiredConnectorSetting()}) as _, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.importlib.import_module',
+                      return_value=self.MockConnectorDataSourceModule()) as import_module_mock, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
+            trading_pair_fetcher = TradingPairFetcher()
+            asyncio.get_event_loop().run_until_complete(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
+            # Only the connector whose cached trading pairs expired is imported
+            # (the background fetches of the instances of the other tests may import the real connectors)
+            imported = [call.args[0] for call in import_module_mock.call_args_list if "mock" in call.args[0]]
+            self.assertEqual(1, len(imported))
+            self.assertIn("mockExpired", imported[0])
+            self.assertEqual({"mockConnector": ["CACHED-HBOT"], "mockExpired": "MOCK-HBOT"},
+                             trading_pair_fetcher.trading_pairs)
+            self.assertFalse(trading_pair_fetcher.is_fetched("mockConnector"))
+
+            # The cached connector is imported and refreshed on its first use, once
+            trading_pair_fetcher.refresh("mockConnector")
+            trading_pair_fetcher.refresh("mockConnector")
+            asyncio.get_event_loop().run_until_complete(self.wait_until_fetched(trading_pair_fetcher, "mockConnector"))
+            imported = [call.args[0] for call in import_module_mock.call_args_list if "mock" in call.args[0]]
+            self.assertEqual(2, len(imported))
+            self.assertIn("mockConnector", imported[1])
+            self.assertEqual("MOCK-HBOT", trading_pair_fetcher.trading_pairs["mockConnector"])
+            # Lets the refresh save the cache
+            asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.1))
+        with open(TradingPairFetcher.cache_path()) as fd:
+            cache = json.load(fd)
+        self.assertEqual("MOCK-HBOT", cache["mockConnector"]["trading_pairs"])
+        self.assertEqual("MOCK-HBOT", cache["mockExpired"]["trading_pairs"])
+
+    def test_malformed_cache_entries_discarded(self):
+        from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+        with open(TradingPairFetcher.cache_path(), "w") as fd:
+            json.dump({"mockConnector": {"timestamp": time.time() - 60, "trading_pairs": ["CACHED-HBOT"]},
+                       "mockExpired": {"trading_pairs": ["MALFORMED-HBOT"]},
+                       "mockOther": ["MALFORMED-HBOT"]}, fd)
+        with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS',
+                   {"mockConnector": self.MockConnectorSetting(),
+                    "mockExpired": self.MockExpiredConnectorSetting()}) as _, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.importlib.import_module',
+                      return_value=self.MockConnectorDataSourceModule()) as _, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
+            trading_pair_fetcher = TradingPairFetcher.get_instance()
+            self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+            asyncio.get_event_loop().run_until_complete(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
+            self.assertEqual("MOCK-HBOT", trading_pair_fetcher.trading_pairs["mockExpired"])
+
+    def test_trading_pair_missing_from_cache(self):
+        from hummingbot.client.config.config_validators import validate_market_trading_pair
+        from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+        with open(TradingPairFetcher.cache_path(), "w") as fd:
+            json.dump({"mockConnector": {"timestamp": time.time() - 60, "trading_pairs": ["CACHED-HBOT"]}}, fd)
+        with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS',
+                   {"mockConnector": self.MockConnectorSetting()}) as _, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.importlib.import_module',
+                      return_value=self.MockListingConnectorDataSourceModule()) as _, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
+            trading_pair_fetcher = TradingPairFetcher.get_instance()
+            # The cached trading pairs are served at once, but don't reject the markets listed since
+            self.assertEqual(["CACHED-HBOT"], trading_pair_fetcher.trading_pairs["mockConnector"])
+            trading_pair_fetcher.ready = True
+            # The validation refreshes them
+            self.assertIsNone(validate_market_trading_pair("mockConnector", "LISTED-HBOT"))
+
+            asyncio.get_event_loop().run_until_complete(self.wait_until_fetched(trading_pair_fetcher, "mockConnector"))
+            self.assertIsNone(validate_market_trading_pair("mockConnector", "LISTED-HBOT"))
+            self.assertEqual("UNKNOWN-HBOT is not an active market on mockConnector.",
+                             validate_market_trading_pair("mockConnector", "UNKNOWN-HBOT"))
+
+    def test_fetch_timeout(self):
+        from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+
+        async def never_fetched():
+            await asyncio.sleep(10)
+
+        with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS', {}) as _, \
+                patch.object(TradingPairFetcher, "FETCH_TIMEOUT", 0.01), \
+                patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
+            trading_pair_fetcher = TradingPairFetcher()
+            asyncio.get_event_loop().run_until_complete(trading_pair_fetcher.call_fetch_pairs(never_fetched(),
+                                                                                              "mockConnector"))
+            self.assertEqual([], trading_pair_fetcher.trading_pairs["mockConnector"])
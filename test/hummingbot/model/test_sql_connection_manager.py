@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import inspect
+
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+
+class SQLConnectionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.db_dir.name, "test.sqlite")
+
+    def tearDown(self):
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def index_names(self, sql: SQLConnectionManager, table_name: str):
+        return {i["name"] for i in inspect(sql.engine).get_indexes(table_name)}
+
+    def test_sqlite_pragmas(self):
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        with sql.engine.connect() as conn:
+            self.assertEqual("wal", conn.execute("PRAGMA journal_mode").scalar())
+            # NORMAL
+            self.assertEqual(1, conn.execute("PRAGMA synchronous").scalar())
+            self.assertEqual(-65536, conn.execute("PRAGMA cache_size").scalar())
+        sql.get_shared_session().close()
+        sql.engine.dispose()
+
+    def test_migration_adds_query_indexes(self):
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.assertIn("tf_timestamp_index", self.index_names(sql, "TradeFill"))
+        self.assertIn("o_config_market_timestamp_index", self.index_names(sql, "Order"))
+        self.assertIn("ms_config_market_index", self.index_names(sql, "MarketState"))
+
+        # Rolls the database back to the previous version
+        with sql.engine.begin() as conn:
+            conn.execute("DROP INDEX tf_timestamp_index")
+            conn.execute("DROP INDEX o_config_market_timestamp_index")
+            conn.execute("DROP INDEX ms_config_market_index")
+            # Duplicate market states, which the unique index rejects
+            for market_state_id, timestamp in ((1, 100), (2, 300), (3, 200), (4, 300)):
+                conn.execute("INSERT INTO MarketState (id, config_file_path, market, timestamp, saved_state) "
+                             f"VALUES ({market_state_id}, 'conf.yml', 'binance', {timestamp}, '{{}}')")
+            conn.execute("INSERT INTO MarketState (id, config_file_path, market, timestamp, saved_state) "
+                         "VALUES (5, 'conf.yml', 'kucoin', 100, '{}')")
+            conn.execute("UPDATE Metadata SET value = '20210601' WHERE key = 'local_db_version'")
+        sql.get_shared_session().close()
+        sql.engine.dispose()
+
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, sql.get_local_db_version().value)
+        self.assertIn("tf_timestamp_index", self.index_names(sql, "TradeFill"))
+        self.assertIn("o_config_market_timestamp_index", self.index_names(sql, "Order"))
+        self.assertIn("ms_config_market_index", self.index_names(sql, "MarketState"))
+        # The newest state of each market is kept
+        self.assertEqual([(4, "binance"), (5, "kucoin")],
+                         [tuple(row) for row in sql.engine.execute("SELECT id, market FROM MarketState ORDER BY id")])
+        sql.get_shared_session().close()
+        sql.engine.dispose()
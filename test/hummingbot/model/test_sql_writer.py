@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy.orm import Session
+
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.sql_writer import SQLWriter
+
+
+def add_metadata(key: str, value: str):
+    def write(session: Session):
+        session.add(Metadata(key=key, value=value))
+    return write
+
+
+class SQLWriterUnitTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.db_dir.name, "test.sqlite"))
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def stored_keys(self):
+        session: Session = self.sql.new_session()
+        try:
+            return {m.key for m in session.query(Metadata).filter(Metadata.key.like("test_%"))}
+        finally:
+            session.close()
+
+    def test_writes_are_committed_in_batches(self):
+        writer = SQLWriter(self.sql, batch_interval=60, max_batch_size=10)
+        writer.start()
+        threads = set()
+
+        def record_thread(session: Session):
+            threads.add(threading.current_thread())
+        for i in range(25):
+            writer.put(add_metadata(f"test_{i}", str(i)))
+        writer.put(record_thread)
+        self.assertTrue(writer.flush(5))
+
+        self.assertEqual({f"test_{i}" for i in range(25)}, self.stored_keys())
+        # Two full batches, then the rest on flush
+        self.assertEqual(3, writer.metrics.batches_committed)
+        self.assertEqual(26, writer.metrics.writes_committed)
+        self.assertEqual(0, writer.queue_depth)
+        self.assertNotIn(threading.main_thread(), threads)
+        writer.stop()
+
+    def test_stop_commits_queued_writes(self):
+        writer = SQLWriter(self.sql, batch_interval=60)
+        writer.start()
+        for i in range(5):
+            writer.put(add_metadata(f"test_{i}", str(i)))
+        writer.stop()
+
+        self.assertFalse(writer.started)
+        self.assertEqual({f"test_{i}" for i in range(5)}, self.stored_keys())
+
+        # Without a writer thread, writes are committed on flush
+        writer.put(add_metadata("test_5", "5"))
+        writer.flush()
+        self.assertIn("test_5", self.stored_keys())
+
+    def test_failed_write_is_dropped_alone(self):
+        writer = SQLWriter(self.sql, batch_interval=60)
+        writer.start()
+        committed = []
+        writer.put(add_metadata("test_1", "1"))
+        # The value can't be null
+        writer.put(add_metadata("test_2", None))
+
+        def write_with_callback(session: Session):
+            session.add(Metadata(key="test_3", value="3"))
+            return lambda: committed.append("test_3")
+        writer.put(write_with_callback)
+        writer.stop()
+
+        self.assertEqual({"test_1", "test_3"}, self.stored_keys())
+        self.assertEqual(["test_3"], committed)
+        self.assertEqual(2, writer.metrics.writes_committed)
+        self.assertEqual(1, writer.metrics.writes_failed)
+        self.assertGreater(writer.metrics.max_commit_latency, 0)
@@ -33,6 +33,24 @@ class MockConnector2(ConnectorBase):
         return self.get_quote_price(trading_pair, is_buy, amount)
 
 
+class MockGatewayConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self.quote_requests = 0
+
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.quote_requests += 1
+        await asyncio.sleep(0.1)
+        return Decimal("99") if is_buy else Decimal("98")
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
+
 class AmmArbUtilsUnitTest(unittest.TestCase):
 
     def test_create_arb_proposals(self):
@@ -51,3 +69,27 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+    def test_create_arb_proposals_through_quote_cache(self):
+        asyncio.get_event_loop().run_until_complete(self._test_create_arb_proposals_through_quote_cache())
+
+    async def _test_create_arb_proposals_through_quote_cache(self):
+        gateway = MockGatewayConnector()
+        market_info1 = MarketTradingPairTuple(gateway, trading_pair, base, quote)
+        market_info2 = MarketTradingPairTuple(MockConnector2(), trading_pair, base, quote)
+        quote_cache = utils.QuoteCache(ttl=10)
+        start = asyncio.get_event_loop().time()
+        arb_proposals = await utils.create_arb_proposals(market_info1, market_info2, Decimal("1"), quote_cache)
+        # The requests are concurrent, and the order prices are answered with the quote prices
+        self.assertLess(asyncio.get_event_loop().time() - start, 0.2)
+        self.assertEqual(2, gateway.quote_requests)
+        self.assertEqual(Decimal("99"), arb_proposals[0].first_side.order_price)
+        self.assertEqual(Decimal("98"), arb_proposals[1].first_side.order_price)
+
+        await quote_cache.get_quote_price(market_info1, True, Decimal("1"))
+        self.assertEqual(2, gateway.quote_requests)
+        await quote_cache.get_quote_price(market_info1, True, Decimal("2"))
+        self.assertEqual(3, gateway.quote_requests)
+        quote_cache.clear()
+        await quote_cache.get_quote_price(market_info1, True, Decimal("1"))
+        self.assertEqual(4, gateway.quote_requests)
@@ -1,3 +1,4 @@
+import math
 from datetime import datetime
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -14,6 +15,14 @@ class RunAlwaysExecutionStateTests(TestCase):
 
         strategy.process_tick.assert_called()
 
+    def test_next_wake_up_time(self):
+        strategy = MagicMock()
+        strategy.next_process_tick_time.return_value = 1000.0
+        state = RunAlwaysExecutionState()
+
+        self.assertEqual(1000.0, state.next_wake_up_time(100.0, strategy))
+        strategy.next_process_tick_time.assert_called_with(100.0)
+
 
 class RunInTimeSpanExecutionStateTests(TestCase):
 
@@ -51,3 +60,25 @@ class RunInTimeSpanExecutionStateTests(TestCase):
         self.assertEqual(len(self.debug_logs), 2)
         self.assertEqual(self.debug_logs[1], "Time span execution: tick will not be processed "
                                              f"(executing between {start_timestamp} and {end_timestamp})")
+
+    def test_next_wake_up_time(self):
+        start_timestamp = datetime.fromisoformat("2021-06-22 09:00:00").timestamp()
+        end_timestamp = datetime.fromisoformat("2021-06-22 10:00:00").timestamp()
+        state = RunInTimeSpanExecutionState(start_timestamp=datetime.fromtimestamp(start_timestamp),
+                                            end_timestamp=datetime.fromtimestamp(end_timestamp))
+        strategy = MagicMock()
+
+        # Nothing is processed before the time span starts
+        strategy.next_process_tick_time.return_value = float("nan")
+        self.assertEqual(start_timestamp, state.next_wake_up_time(start_timestamp - 100, strategy))
+        strategy.next_process_tick_time.return_value = start_timestamp + 10
+        self.assertEqual(start_timestamp + 10, state.next_wake_up_time(start_timestamp - 100, strategy))
+
+        self.assertEqual(start_timestamp + 10, state.next_wake_up_time(start_timestamp, strategy))
+        strategy.next_process_tick_time.return_value = float("nan")
+        self.assertTrue(math.isnan(state.next_wake_up_time(start_timestamp, strategy)))
+
+        # Nor after it ends
+        strategy.next_process_tick_time.return_value = end_timestamp + 10
+        self.assertEqual(math.inf, state.next_wake_up_time(start_timestamp, strategy))
+        self.assertEqual(math.inf, state.next_wake_up_time(end_timestamp, strategy))
@@ -472,3 +472,20 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         # Check that check_and_cleanup_shadow_records clears shadow_limit_orders
         self.assertTrue(len(self.order_tracker.shadow_limit_orders) == 0)
+
+    def test_next_wake_up_time(self):
+        order: LimitOrder = self.limit_orders[0]
+        self.assertEqual(float("inf"), self.order_tracker.next_wake_up_time(self.start_timestamp))
+
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+        self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+        cleanup_timestamp: float = self.start_timestamp + OrderTracker.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION
+        self.assertEqual(cleanup_timestamp, self.order_tracker.next_wake_up_time(self.start_timestamp))
+
+        # A fast forward back test stops at the clean up instead of skipping past it
+        clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp,
+                             fast_forward=True)
+        clock.add_iterator(self.order_tracker)
+        clock.backtest_til(cleanup_timestamp + self.clock_tick_size)
+        self.assertEqual(0, len(self.order_tracker.shadow_limit_orders))
+        self.assertEqual(float("inf"), self.order_tracker.next_wake_up_time(clock.current_timestamp))
@@ -2,10 +2,13 @@ import time
 from decimal import Decimal
 from datetime import datetime
 from unittest import TestCase
+from unittest.mock import patch
 
 from hummingbot.core.clock import (
     Clock,
     ClockMode)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.strategy.conditional_execution_state import RunInTimeSpanExecutionState
 
 from hummingbot.strategy.twap import TwapTradeStrategy
@@ -148,3 +151,38 @@ class TwapTradeStrategyTest(TestCase):
                            "Continued trading with these markets may be dangerous.\n")
 
         self.assertEqual(expected_status, status)
+
+    def test_fast_forward_back_test_places_and_cancels_the_same_orders(self):
+        start_timestamp = datetime.fromisoformat("2021-06-24 10:00:00").timestamp()
+        results = []
+        for fast_forward in (False, True):
+            exchange = MockExchange()
+            exchange.ready = True
+            exchange.order_book = OrderBook()
+            exchange.order_book.apply_snapshot([OrderBookRow(24900, 1000, 1)], [OrderBookRow(25100, 1000, 1)], 1)
+            exchange.update_account_balance({"ETH": Decimal("100000"), "USDT": Decimal(10000000)})
+            exchange.update_account_available_balance({"ETH": Decimal("100000"), "USDT": Decimal(10000000)})
+            marketTuple = MarketTradingPairTuple(exchange, "ETH-USDT", "ETH", "USDT")
+            strategy = TwapTradeStrategy(market_infos=[marketTuple],
+                                         is_buy=True,
+                                         target_asset_amount=Decimal(100),
+                                         order_step_size=Decimal(10),
+                                         order_price=Decimal(25000),
+                                         order_delay_time=60,
+                                         cancel_order_wait_time=600)
+            clock = Clock(ClockMode.BACKTEST, 1.0, start_timestamp, start_timestamp + 3600, fast_forward=fast_forward)
+            clock.add_iterator(strategy)
+
+            with patch.object(strategy, "tick", wraps=strategy.tick) as tick_mock:
+                clock.backtest()
+            results.append((tick_mock.call_count, dict(strategy._time_to_cancel), strategy.active_limit_orders))
+
+        (stepwise_ticks, stepwise_orders, stepwise_active_orders), (fast_forward_ticks, fast_forward_orders,
+                                                                    fast_forward_active_orders) = results
+        # Orders are placed every minute, cancelled after 10 minutes and placed again
+        self.assertGreater(len(stepwise_orders), 10)
+        self.assertEqual(stepwise_orders, fast_forward_orders)
+        self.assertEqual([order.client_order_id for _, order in stepwise_active_orders],
+                         [order.client_order_id for _, order in fast_forward_active_orders])
+        self.assertEqual(3600, stepwise_ticks)
+        self.assertLess(fast_forward_ticks, stepwise_ticks / 4)
@@ -8,7 +8,7 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.event.events import OrderType, TradeType, TradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderType, TradeType, TradeFee
 
 s_decimal_NaN = Decimal("nan")
 
@@ -19,6 +19,8 @@ class MockExchange(ExchangeBase):
         super(MockExchange, self).__init__()
         self._buy_price = Decimal(1)
         self._sell_price = Decimal(1)
+        self._order_count = 0
+        self._order_book = None
 
     @property
     def buy_price(self) -> Decimal:
@@ -36,6 +38,14 @@ class MockExchange(ExchangeBase):
     def sell_price(self, price: Decimal):
         self._sell_price = price
 
+    @property
+    def order_book(self) -> OrderBook:
+        return self._order_book
+
+    @order_book.setter
+    def order_book(self, order_book: OrderBook):
+        self._order_book = order_book
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         pass
@@ -66,17 +76,25 @@ class MockExchange(ExchangeBase):
 
     def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = s_decimal_NaN,
             **kwargs) -> str:
-        pass
+        self._order_count += 1
+        return f"buy-{trading_pair}-{self._order_count}"
 
     def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = s_decimal_NaN,
              **kwargs) -> str:
-        pass
+        self._order_count += 1
+        return f"sell-{trading_pair}-{self._order_count}"
 
     def cancel(self, trading_pair: str, client_order_id: str):
-        pass
+        self.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(self.current_timestamp, client_order_id))
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
-        pass
+        return self._order_book
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.01")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("0.01")
 
     def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
                 amount: Decimal, price: Decimal = s_decimal_NaN) -> TradeFee:
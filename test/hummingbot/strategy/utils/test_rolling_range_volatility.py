@@ -0,0 +1,59 @@
+import unittest
+import random
+import math
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.rolling_range_volatility import RollingRangeVolatility
+
+
+def list_volatility(mid_prices, interval, periods):
+    # The former liquidity mining computation, over the whole price history
+    last_index = len(mid_prices) - 1
+    atr = []
+    first_index = max(last_index - (interval * periods), 0)
+    for i in range(last_index, first_index, interval * -1):
+        prices = mid_prices[i - interval + 1: i + 1]
+        if not prices:
+            break
+        atr.append((max(prices) - min(prices)) / min(prices))
+    return mean(atr) if atr else math.nan
+
+
+class RollingRangeVolatilityTest(unittest.TestCase):
+    def test_matches_list_computation(self):
+        rng = random.Random(0)
+        interval, periods, markets = 7, 3, 4
+        engine = RollingRangeVolatility(markets, interval, periods)
+        history = [[] for _ in range(markets)]
+        for sample in range(100):
+            prices = [rng.uniform(90, 110) for _ in range(markets)]
+            engine.add_samples(prices)
+            for market, price in enumerate(prices):
+                history[market].append(price)
+            # Before the first interval is complete, the former slicing started at a negative index and measured only
+            # part of the prices, the engine measures all of them
+            if sample + 1 >= interval:
+                expected = [list_volatility(prices, interval, periods) for prices in history]
+                np.testing.assert_allclose(expected, engine.volatility())
+        self.assertEqual(100, engine.samples)
+
+    def test_first_samples(self):
+        engine = RollingRangeVolatility(1, 300, 10)
+        engine.add_samples([100.])
+        self.assertTrue(np.isnan(engine.volatility()[0]))
+        engine.add_samples([105.])
+        engine.add_samples([110.])
+        self.assertAlmostEqual(0.1, engine.volatility()[0])
+
+    def test_missing_prices(self):
+        engine = RollingRangeVolatility(2, 2, 2)
+        for price in [100., 110., math.nan, 120.]:
+            engine.add_samples([price, math.nan])
+        volatility = engine.volatility()
+        # Ranges of [100, 110] and [120]
+        self.assertAlmostEqual(0.05, volatility[0])
+        self.assertTrue(np.isnan(volatility[1]))
+        with self.assertRaises(ValueError):
+            engine.add_samples([100.])
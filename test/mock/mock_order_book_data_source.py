@@ -0,0 +1,67 @@
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source serving empty order books after a fixed snapshot latency. The listeners only forward the
+    messages put into the `*_messages` queues, so tests can control the message flow.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 snapshot_latency: float = 0.0,
+                 snapshot_rate_limit: Optional[RateLimit] = None):
+        super().__init__(trading_pairs)
+        self._snapshot_latency = snapshot_latency
+        self._snapshot_rate_limit = snapshot_rate_limit
+        self._blocked_trading_pairs: Dict[str, asyncio.Event] = {}
+        self.snapshot_requests: List[str] = []
+        self.diff_messages: asyncio.Queue = asyncio.Queue()
+        self.snapshot_messages: asyncio.Queue = asyncio.Queue()
+        self.trade_messages: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def snapshot_rate_limit(self) -> Optional[RateLimit]:
+        return self._snapshot_rate_limit
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    def block_trading_pair(self, trading_pair: str):
+        self._blocked_trading_pairs[trading_pair] = asyncio.Event()
+
+    def unblock_trading_pair(self, trading_pair: str):
+        self._blocked_trading_pairs.pop(trading_pair).set()
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests.append(trading_pair)
+        if trading_pair in self._blocked_trading_pairs:
+            await self._blocked_trading_pairs[trading_pair].wait()
+        await asyncio.sleep(self._snapshot_latency)
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot([], [], 1)
+        return order_book
+
+    @staticmethod
+    async def _forward(source: asyncio.Queue, output: asyncio.Queue):
+        while True:
+            await output.put(await source.get())
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._forward(self.diff_messages, output)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._forward(self.snapshot_messages, output)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self._forward(self.trade_messages, output)